@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Connections and connection pools for use with asyncio. This module
+requires Python 3.7 or later, and raises :class:`ImportError` when
+imported under earlier versions.
+"""
+
+
+from neobolt.impl.python.aio.direct import (
+    AbstractAsyncConnectionPool,
+    AsyncConnection,
+    AsyncConnectionPool,
+    connect,
+)
+from neobolt.impl.python.aio.routing import (
+    AsyncRoutingConnectionPool,
+)
@@ -19,17 +19,59 @@
 # limitations under the License.
 
 
+from collections import namedtuple
+
+
 DEFAULT_PORT = 7687
 
 # Connection Pool Management
 DEFAULT_MAX_CONNECTION_LIFETIME = 3600  # 1h
 DEFAULT_MAX_CONNECTION_POOL_SIZE = 100
 DEFAULT_CONNECTION_TIMEOUT = 5.0  # 5s
+DEFAULT_CONNECTION_ATTEMPT_DELAY = 0.25  # 250ms between staggered attempts to successive addresses
+DEFAULT_LIVENESS_CHECK_TIMEOUT = None  # never check idle connections before reuse
+DEFAULT_LIVENESS_PROBE_TIMEOUT = 1.0  # 1s for an idle connection to answer replies outstanding on it
+DEFAULT_MIN_IDLE_CONNECTIONS = 0  # open connections only on demand
 
 DEFAULT_KEEP_ALIVE = True
 
+# Socket Tuning
+#: Named sets of socket options, selected with the `socket_profile`
+#: setting. Options given individually take precedence over these.
+SOCKET_PROFILES = {
+    # Many small request/response exchanges: send each write at once
+    # and acknowledge each read at once
+    "latency": {
+        "tcp_nodelay": True,
+        "tcp_quickack": True,
+    },
+    # Large results or parameters: use large kernel buffers so that the
+    # TCP window can open fully
+    "bulk": {
+        "tcp_nodelay": True,
+        "receive_buffer_size": 4194304,  # 4MiB
+        "send_buffer_size": 4194304,  # 4MiB
+    },
+}
+
+# Message Chunking
+MAX_CHUNK_SIZE = 0xFFFF  # largest chunk permitted by Bolt
+DEFAULT_MAX_CHUNK_SIZE = None  # adaptive: chunks grow to fit the data, up to MAX_CHUNK_SIZE
+
+# Flow Control (Bolt v4+)
+DEFAULT_FETCH_SIZE = 1000  # records requested by each PULL; -1 requests all
+
 # Connection Settings
 DEFAULT_CONNECTION_ACQUISITION_TIMEOUT = 60  # 1m
+DEFAULT_READ_TIMEOUT = None  # wait indefinitely for each read from the server
+
+# Address Resolution
+DEFAULT_DNS_CACHE_TTL = 30  # seconds for which resolved addresses are reused
+DEFAULT_DNS_NEGATIVE_CACHE_TTL = 5  # seconds for which resolution failures are reused
+DEFAULT_DNS_STALE_TTL = 300  # seconds past expiry for which addresses being refreshed may be reused
+
+# Pipelining
+DEFAULT_MAX_IN_FLIGHT = 256  # statements sent but not yet fully received
 
 
 class AuthToken(object):
@@ -49,14 +91,51 @@ class AuthToken(object):
             self.parameters = parameters
 
 
+#: Record of the features supported by a server, resolved once from
+#: the INIT or HELLO response so that checks made for each query are
+#: simple attribute lookups. Each field holds the value that
+#: :meth:`.ServerInfo.supports` would return for that feature.
+ServerCapabilities = namedtuple("ServerCapabilities", [
+    "execution_times",
+    "bookmarking",
+    "bytes",
+    "statement_reuse",
+    "routing_context",
+    "spatial_types",
+    "temporal_types",
+    "run_metadata",
+    "flow_control",
+])
+
+
 class ServerInfo(object):
 
-    address = None
+    __slots__ = [
+        "address",
+        "protocol_version",
+        "metadata",
+        "capabilities",
+    ]
 
     def __init__(self, address, protocol_version):
         self.address = address
         self.protocol_version = protocol_version
         self.metadata = {}
+        self.capabilities = self.resolve_capabilities()
+
+    def update(self, metadata):
+        """ Update the server metadata, as received in reply to INIT
+        or HELLO, and resolve the capabilities of the server afresh.
+        """
+        self.metadata.update(metadata)
+        self.capabilities = self.resolve_capabilities()
+
+    def resolve_capabilities(self):
+        """ Work out every feature supported by the server.
+
+        :return: a :class:`.ServerCapabilities` record
+        """
+        return ServerCapabilities._make(map(self._supports, ServerCapabilities._fields))
 
     @property
     def agent(self):
@@ -75,6 +154,9 @@ class ServerInfo(object):
         return tuple(value)
 
     def supports(self, feature):
+        return getattr(self.capabilities, feature, None)
+
+    def _supports(self, feature):
         if not self.agent:
             return None
         if not self.agent.startswith("Neo4j/"):
@@ -87,12 +169,16 @@ class ServerInfo(object):
             return self.version_info() >= (3, 2)
         elif feature == "statement_reuse":
             return self.version_info() >= (3, 2)
+        elif feature == "routing_context":
+            return self.version_info() >= (3, 2)
         elif feature == "spatial_types":
             return self.protocol_version >= 2
         elif feature == "temporal_types":
             return self.protocol_version >= 2
         elif feature == "run_metadata":
             return self.protocol_version >= 3
+        elif feature == "flow_control":
+            return self.protocol_version >= 4
         else:
             return None
 
@@ -100,5 +186,12 @@ class ServerInfo(object):
 from neobolt.impl.python.direct import (
     Connection,
     ConnectionPool,
+    RecordStream,
     connect,
 )
+from neobolt.impl.python.multiplex import (
+    ConnectionMultiplexer,
+)
+from neobolt.impl.python.spool import (
+    RecordSpool,
+)
@@ -55,6 +55,12 @@ class ServiceUnavailable(Exception):
     """
 
 
+class ConnectionTimedOut(ServiceUnavailable):
+    """ Raised when a server does not respond within the time allowed,
+    after which the connection can no longer be used.
+    """
+
+
 class ConnectionExpired(Exception):
     """ Raised when a connection is no longer available for the
     purpose it was originally acquired.
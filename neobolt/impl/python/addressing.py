@@ -20,8 +20,17 @@
 
 
 from collections import namedtuple
+from logging import getLogger
 from socket import getaddrinfo, gaierror, SOCK_STREAM, IPPROTO_TCP
+from threading import Event, Lock, Thread
+from time import perf_counter
 from urllib.parse import urlparse, parse_qs
+from weakref import finalize
+
+
+# Set up logger
+log = getLogger("neobolt")
+log_debug = log.debug
 
 
 VALID_IPv4_SEGMENTS = [str(i).encode("latin1") for i in range(0x100)]
@@ -96,15 +105,164 @@ class SocketAddress(object):
         return context
 
 
+class DNSCache(object):
+    """ Results of address resolution, each stored with the time it was
+    obtained so that resolvers with different time-to-live settings can
+    share the same cache. Failures are stored as well as successes.
+
+    Keys being kept fresh by a :class:`.DNSRefresher` are *watched*.
+    Addresses for a watched key may be served for a while after they
+    expire, and are kept even if a later attempt to resolve it fails.
+
+    Entries that are neither watched nor of use to any resolver are
+    discarded when next looked up, or when the cache is full. Beyond
+    that, the least recently stored entries are discarded first.
+    """
+
+    def __init__(self, capacity=1024, clock=perf_counter):
+        self.capacity = capacity
+        #: Function returning the current time, in seconds
+        self.clock = clock
+        self._entries = {}
+        self._watchers = {}
+        self._owners = set()
+        self._lock = Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key, ttl, negative_ttl, stale_ttl=0):
+        """ Return the resolved addresses stored for a key, or
+        :const:`None` if nothing is stored that is still fresh. If the
+        key is watched, addresses up to `stale_ttl` seconds past expiry
+        are returned as well.
+
+        :raise AddressError: if a failure is stored that is still fresh
+        """
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            watched = key in self._watchers
+            if not watched and now >= entry[4]:
+                del self._entries[key]
+                return None
+        resolved_at, addresses, failed_at, error, _ = entry
+        if addresses is not None:
+            age = now - resolved_at
+            if age < ttl or (watched and age < ttl + stale_ttl):
+                return list(addresses)
+        if error is not None and now - failed_at < negative_ttl:
+            raise AddressError(*error.args)
+        return None
+
+    def put(self, key, addresses=None, error=None, keep_for=0):
+        """ Store the resolved addresses, or the error raised when
+        resolution failed, for a key, for up to `keep_for` seconds
+        unless the key is watched. The last addresses resolved for a
+        key are kept alongside any later failure.
+        """
+        now = self.clock()
+        expires_at = now + keep_for
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if error is None:
+                self._entries[key] = (now, addresses, None, None, expires_at)
+            elif entry is None:
+                self._entries[key] = (None, None, now, error, expires_at)
+            else:
+                resolved_at, addresses, _, _, previous_expires_at = entry
+                self._entries[key] = (resolved_at, addresses, now, error, max(expires_at, previous_expires_at))
+            if len(self._entries) > self.capacity:
+                self._prune(now)
+
+    def _prune(self, now):
+        watchers = self._watchers
+        for key, entry in list(self._entries.items()):
+            if now >= entry[4] and key not in watchers:
+                del self._entries[key]
+        excess = len(self._entries) - self.capacity
+        if excess > 0:
+            for key in list(self._entries):
+                if key not in watchers:
+                    del self._entries[key]
+                    excess -= 1
+                    if excess == 0:
+                        break
+
+    def owner(self, obj):
+        """ Return a key prefix for results that depend on an object,
+        such as a custom resolver, without keeping that object alive.
+        Entries keyed by ``(owner, ...)`` are discarded once the object
+        is garbage collected.
+
+        :return: the prefix, or :const:`None` if the object cannot be
+                 referenced weakly, in which case nothing for it should
+                 be cached
+        """
+        owner = ("owner", id(obj))
+        with self._lock:
+            if owner in self._owners:
+                return owner
+        try:
+            finalize(obj, self._forget, owner)
+        except TypeError:
+            return None
+        with self._lock:
+            self._owners.add(owner)
+        return owner
+
+    def _forget(self, owner):
+        with self._lock:
+            self._owners.discard(owner)
+            for key in [key for key in self._entries if key[0] == owner]:
+                del self._entries[key]
+
+    def watch(self, key):
+        with self._lock:
+            self._watchers[key] = self._watchers.get(key, 0) + 1
+
+    def unwatch(self, key):
+        with self._lock:
+            count = self._watchers.pop(key, 0) - 1
+            if count > 0:
+                self._watchers[key] = count
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+#: Cache shared by all :class:`.Resolver` instances
+dns_cache = DNSCache()
+
+
 class Resolver(object):
     """ A Resolver instance stores a list of addresses, each in a tuple, and
     provides methods to perform resolution on these, thereby replacing them
     with the resolved values.
+
+    Results are cached for `ttl` seconds and failures for `negative_ttl`
+    seconds; a value of zero disables each. Results that are being
+    refreshed in the background may be used for up to `stale_ttl`
+    seconds after they expire. IP addresses are never looked up.
+
+    A resolver created with `refresh` set ignores cached results,
+    replacing them with its own.
     """
 
-    def __init__(self, custom_resolver=None):
+    def __init__(self, custom_resolver=None, ttl=0, negative_ttl=0, stale_ttl=0, refresh=False):
         self.addresses = []
         self.custom_resolver = custom_resolver
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.refresh = refresh
+        #: Cache keys for the addresses this resolver has looked up
+        self.keys = []
+        self._answers = None
 
     def custom_resolve(self):
         """ If a custom resolver is defined, perform custom resolution on
@@ -115,30 +273,184 @@ class Resolver(object):
         if not callable(self.custom_resolver):
             return
         new_addresses = []
+        owner = dns_cache.owner(self.custom_resolver) if self.ttl > 0 else None
         for address in self.addresses:
-            for new_address in self.custom_resolver(address):
-                new_addresses.append(new_address)
+            key = (owner, address)
+            resolved = None if owner is None else self._cached(key)
+            if resolved is None:
+                resolved = list(self.custom_resolver(address))
+                if owner is not None:
+                    self.remember(key, resolved)
+            new_addresses.extend(resolved)
         self.addresses = new_addresses
 
     def dns_resolve(self):
         """ Perform DNS resolution on the contained addresses.
 
-        :return:
+        Resolution without blocking, such as with asyncio, follows the
+        same steps but carries out the queries from
+        :meth:`.dns_queries` itself.
         """
-        new_addresses = []
-        for address in self.addresses:
+        for address in self.dns_queries():
             try:
                 info = getaddrinfo(address[0], address[1], 0, SOCK_STREAM, IPPROTO_TCP)
             except gaierror:
-                raise AddressError("Cannot resolve address {!r}".format(address))
+                raise self.dns_failed(address)
+            self.dns_answered(address, info)
+        self.dns_complete()
+
+    def dns_queries(self):
+        """ Start DNS resolution of the contained addresses, resolving
+        those that can be resolved without a query.
+
+        :return: list of addresses for which a DNS query is required
+        :raise AddressError: if resolution failed recently
+        """
+        self._answers = answers = {}
+        queries = []
+        for address in self.addresses:
+            resolved = self.lookup(address)
+            if resolved is None:
+                queries.append(address)
             else:
-                for _, _, _, _, address in info:
-                    if len(address) == 4 and address[3] != 0:
-                        # skip any IPv6 addresses with a non-zero scope id
-                        # as these appear to cause problems on some platforms
-                        continue
-                    new_addresses.append(address)
-        self.addresses = new_addresses
+                answers[address] = resolved
+        return queries
+
+    def dns_answered(self, address, info):
+        """ Accept the result of a DNS query, as returned by
+        :func:`socket.getaddrinfo`.
+        """
+        resolved = []
+        for _, _, _, _, resolved_address in info:
+            if len(resolved_address) == 4 and resolved_address[3] != 0:
+                # skip any IPv6 addresses with a non-zero scope id
+                # as these appear to cause problems on some platforms
+                continue
+            resolved.append(resolved_address)
+        self.remember(address, resolved)
+        self._answers[address] = resolved
+
+    def dns_failed(self, address):
+        """ Note that a DNS query failed.
+
+        :return: the :class:`.AddressError` to raise
+        """
+        error = AddressError("Cannot resolve address {!r}".format(address))
+        self.remember_failure(address, error)
+        return error
+
+    def dns_complete(self):
+        """ Replace the contained addresses with their resolved values.
+        """
+        answers, self._answers = self._answers, None
+        self.addresses = [resolved_address for address in self.addresses for resolved_address in answers[address]]
+
+    def lookup(self, address):
+        """ Resolve an address without a DNS query, if it is an IP
+        address or has been resolved recently.
+
+        :return: list of resolved addresses, or :const:`None` if a
+                 DNS query is required
+        :raise AddressError: if resolution failed recently
+        """
+        host, port = address[0], address[1]
+        if isinstance(port, int) and is_ip_address(host):
+            if is_ipv4_address(host):
+                return [(host, port)]
+            elif len(address) == 4:
+                return [(host, port, address[2], address[3])]
+            else:
+                return [(host, port, 0, 0)]
+        return self._cached(address)
+
+    def remember(self, key, resolved_addresses):
+        """ Cache the result of resolving an address (or other key).
+        """
+        if self.ttl > 0:
+            dns_cache.put(key, resolved_addresses, keep_for=self.ttl + self.stale_ttl)
+        self.keys.append(key)
+
+    def remember_failure(self, key, error):
+        """ Cache the error raised when resolving an address failed.
+        """
+        if self.negative_ttl > 0:
+            dns_cache.put(key, error=error, keep_for=self.negative_ttl)
+        self.keys.append(key)
+
+    def _cached(self, key):
+        if self.refresh:
+            return None
+        if self.ttl > 0 or self.negative_ttl > 0:
+            return dns_cache.get(key, self.ttl, self.negative_ttl, self.stale_ttl)
+        return None
+
+
+class DNSRefresher(Thread):
+    """ Helper thread, owned by a connection pool, that resolves the
+    addresses it watches again every half `ttl` seconds, so that
+    cached results are replaced before they expire. Should an attempt
+    fail, the addresses last resolved are kept and may still be used,
+    for up to `stale_ttl` seconds past their expiry, while this
+    thread keeps trying.
+    """
+
+    def __init__(self, custom_resolver=None, ttl=0, negative_ttl=0):
+        super(DNSRefresher, self).__init__(name="neobolt-dns-refresher")
+        self.daemon = True
+        self.custom_resolver = custom_resolver
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.addresses = set()
+        self._keys = set()
+        self._lock = Lock()
+        self._stopped = Event()
+
+    def watch(self, address):
+        """ Keep the resolution of an address fresh, from the next
+        refresh onwards.
+        """
+        with self._lock:
+            self.addresses.add(address)
+
+    def run(self):
+        while not self._stopped.wait(self.ttl / 2):
+            self.refresh()
+
+    def refresh(self):
+        """ Resolve each watched address again, once.
+        """
+        with self._lock:
+            addresses = list(self.addresses)
+        for address in addresses:
+            if self._stopped.is_set():
+                break
+            self._refresh(address)
+
+    def _refresh(self, address):
+        resolver = Resolver(custom_resolver=self.custom_resolver, ttl=self.ttl,
+                            negative_ttl=self.negative_ttl, refresh=True)
+        resolver.addresses.append(address)
+        try:
+            resolver.custom_resolve()
+            resolver.dns_resolve()
+        except Exception as error:
+            log_debug("[#0000]  C: <RESOLVE> Failed to refresh %s (%s)", address, error)
+        with self._lock:
+            if self._stopped.is_set():
+                return
+            for key in resolver.keys:
+                if key not in self._keys:
+                    self._keys.add(key)
+                    dns_cache.watch(key)
+
+    def stop(self):
+        """ Stop refreshing, leaving the cached results to expire.
+        """
+        with self._lock:
+            self._stopped.set()
+            for key in self._keys:
+                dns_cache.unwatch(key)
+            self._keys.clear()
 
 
 class AddressError(Exception):
@@ -0,0 +1,882 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+This module contains an asyncio implementation of a Bolt connection,
+allowing statements to be run from coroutines without blocking the
+event loop. It shares its buffers, packer and unpacker with the
+blocking implementation in the `direct` module.
+"""
+
+
+__all__ = [
+    "AbstractAsyncConnectionPool",
+    "AsyncConnection",
+    "AsyncConnectionPool",
+    "connect",
+]
+
+
+from asyncio import BufferedProtocol, CancelledError, FIRST_COMPLETED, get_event_loop, wait, wait_for, \
+    TimeoutError as AsyncTimeoutError
+from collections import deque
+from logging import getLogger, DEBUG
+from socket import SOCK_STREAM, IPPROTO_TCP, gaierror
+from struct import pack as struct_pack, unpack as struct_unpack
+from time import perf_counter
+
+from neobolt.addressing import SocketAddress
+from neobolt.direct import DEFAULT_CONNECTION_TIMEOUT, DEFAULT_MAX_CONNECTION_LIFETIME, \
+    DEFAULT_CONNECTION_ATTEMPT_DELAY, DEFAULT_MIN_IDLE_CONNECTIONS, DEFAULT_MAX_CONNECTION_POOL_SIZE, \
+    DEFAULT_CONNECTION_ACQUISITION_TIMEOUT, DEFAULT_MAX_CHUNK_SIZE, MAX_CHUNK_SIZE, \
+    DEFAULT_DNS_CACHE_TTL, DEFAULT_DNS_NEGATIVE_CACHE_TTL, ServerInfo
+from neobolt.exceptions import ClientError, ProtocolError, ServiceUnavailable, CypherError
+from neobolt.meta import get_user_agent, import_best
+
+from ..addressing import DNSRefresher, is_ip_address
+from ..direct import MAGIC_PREAMBLE, POOLED_CONNECTION_CONFIG_KEYS, Connection, Response, InitResponse, \
+    _auth_dict, _connection_failed, _connection_timed_out, _interleave, _new_socket, _resolver, _socket_options, \
+    _transaction_extra
+from ..packstream import Packer, Unpacker
+from ..security import make_ssl_context
+
+
+ChunkedInputBuffer = import_best("neobolt.impl.python.bolt._io", "neobolt.impl.python.bolt.io").ChunkedInputBuffer
+ChunkedOutputBuffer = import_best("neobolt.impl.python.bolt._io", "neobolt.impl.python.bolt.io").ChunkedOutputBuffer
+
+
+# Minimum free space offered to the transport for each receive
+RECEIVE_SIZE = 8192
+
+
+# Set up logger
+log = getLogger("neobolt")
+log_debug = log.debug
+
+
+class AsyncConnection(BufferedProtocol):
+    """ Server connection for Bolt protocol v3 and above, for use
+    with asyncio.
+
+    Messages are queued by awaiting methods such as :meth:`.run` and
+    :meth:`.pull_all`, which only wait if the transport has asked for
+    writing to be paused. Awaiting :meth:`.sync` then sends all queued
+    messages and receives their responses, which are passed to the
+    same handlers as for a blocking :class:`.Connection`.
+
+    Incoming data is written by the transport directly into the input
+    buffer, without an intermediate copy.
+    """
+
+    #: The protocol version in use on this connection
+    protocol_version = 0
+
+    #: Server details for this connection
+    server = None
+
+    in_use = False
+
+    _closed = False
+
+    _defunct = False
+
+    # Failures are reset as soon as they arrive, so this stays unset
+    # (see :meth:`.Connection._append`)
+    _reset_pending = False
+
+    #: The pool of which this connection is a member
+    pool = None
+
+    #: The address under which the pool holds this connection
+    pool_address = None
+
+    #: Error class used for raising connection errors
+    Error = ServiceUnavailable
+
+    def __init__(self, address, **config):
+        self.address = address
+        self.transport = None
+        self.local_port = 0
+        self.input_buffer = ChunkedInputBuffer()
+        max_chunk_size = config.get("max_chunk_size", DEFAULT_MAX_CHUNK_SIZE)
+        if max_chunk_size is None:
+            max_chunk_size = MAX_CHUNK_SIZE
+        elif not 0 < max_chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError("Maximum chunk size must be between 1 and %d bytes" % MAX_CHUNK_SIZE)
+        self.output_buffer = ChunkedOutputBuffer(max_chunk_size=max_chunk_size)
+        self.packer = Packer(self.output_buffer)
+        self.unpacker = Unpacker()
+        self.responses = deque()
+        self._max_connection_lifetime = config.get("max_connection_lifetime", DEFAULT_MAX_CONNECTION_LIFETIME)
+        self._creation_timestamp = perf_counter()
+
+        # Determine the user agent and ensure it is a Unicode value
+        user_agent = config.get("user_agent", get_user_agent())
+        if isinstance(user_agent, bytes):
+            user_agent = user_agent.decode("UTF-8")
+        self.user_agent = user_agent
+
+        # Determine auth details
+        self.auth_dict = _auth_dict(config.get("auth"))
+
+        self.der_encoded_server_certificate = None
+
+        self._handshake_data = bytearray(4)
+        self._handshake_size = 0
+        self._receive_waiter = None
+        self._drain_waiter = None
+        self._writing_paused = False
+        self._failure = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        self.local_port = sock.getsockname()[1]
+        self.server = ServerInfo(SocketAddress.from_socket(sock), 0)
+
+    def get_buffer(self, sizehint):
+        if self.protocol_version == 0:
+            return memoryview(self._handshake_data)[self._handshake_size:]
+        return self.input_buffer.reserve(max(sizehint, RECEIVE_SIZE))
+
+    def buffer_updated(self, nbytes):
+        if self.protocol_version == 0:
+            self._handshake_size += nbytes
+        else:
+            self.input_buffer.advance(nbytes)
+        self._wake(self._receive_waiter)
+
+    def connection_lost(self, exc):
+        if not self._closed:
+            log_debug("[#%04X]  S: <CLOSE>", self.local_port)
+            self._defunct = True
+        self._wake(self._receive_waiter)
+        self._wake(self._drain_waiter)
+
+    def pause_writing(self):
+        self._writing_paused = True
+
+    def resume_writing(self):
+        self._writing_paused = False
+        self._wake(self._drain_waiter)
+
+    @staticmethod
+    def _wake(waiter):
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def _handshake(self):
+        supported_versions = [4, 3, 0, 0]
+        handshake = [MAGIC_PREAMBLE] + supported_versions
+        log_debug("[#%04X]  C: <MAGIC> 0x%08X", self.local_port, MAGIC_PREAMBLE)
+        log_debug("[#%04X]  C: <HANDSHAKE> 0x%08X 0x%08X 0x%08X 0x%08X", self.local_port, *supported_versions)
+        self.transport.write(b"".join(struct_pack(">I", num) for num in handshake))
+        while self._handshake_size < 4:
+            if self._defunct:
+                raise ServiceUnavailable("Connection to %r closed without handshake response" % (self.address,))
+            await self._receive()
+        agreed_version, = struct_unpack(">I", self._handshake_data)
+        log_debug("[#%04X]  S: <HANDSHAKE> 0x%08X", self.local_port, agreed_version)
+        if agreed_version in (3, 4):
+            self.protocol_version = agreed_version
+            self.server.protocol_version = agreed_version
+        elif agreed_version == 0:
+            raise ServiceUnavailable("Server {!r} does not support Bolt v3 or above".format(self.address))
+        elif agreed_version == 0x48545450:
+            raise ServiceUnavailable("Cannot to connect to Bolt service on {!r} "
+                                     "(looks like HTTP)".format(self.address))
+        else:
+            raise ProtocolError("Unknown Bolt protocol version: {}".format(agreed_version))
+
+    async def hello(self):
+        headers = {"user_agent": self.user_agent}
+        headers.update(self.auth_dict)
+        logged_headers = dict(headers)
+        if "credentials" in logged_headers:
+            logged_headers["credentials"] = "*******"
+        log_debug("[#%04X]  C: HELLO %r", self.local_port, logged_headers)
+        self._append(b"\x01", (headers,),
+                     response=InitResponse(self, on_success=self.server.update))
+        await self.sync()
+        self.packer.supports_bytes = self.server.capabilities.bytes
+
+    async def run(self, statement, parameters=None, bookmarks=None, metadata=None, timeout=None, **handlers):
+        if not parameters:
+            parameters = {}
+        fields = (statement, parameters, _transaction_extra(bookmarks, metadata, timeout))
+        if log.isEnabledFor(DEBUG):
+            log_debug("[#%04X]  C: RUN %s", self.local_port, " ".join(map(repr, fields)))
+        self._append(b"\x10", fields, AsyncResponse(self, **handlers))
+        await self._drain()
+
+    async def discard_all(self, **handlers):
+        if self.protocol_version >= 4:
+            log_debug("[#%04X]  C: DISCARD %r", self.local_port, -1)
+            self._append(b"\x2F", ({"n": -1},), AsyncResponse(self, **handlers))
+        else:
+            log_debug("[#%04X]  C: DISCARD_ALL", self.local_port)
+            self._append(b"\x2F", (), AsyncResponse(self, **handlers))
+        await self._drain()
+
+    async def pull_all(self, **handlers):
+        if self.protocol_version >= 4:
+            log_debug("[#%04X]  C: PULL %r", self.local_port, -1)
+            self._append(b"\x3F", ({"n": -1},), AsyncResponse(self, **handlers))
+        else:
+            log_debug("[#%04X]  C: PULL_ALL", self.local_port)
+            self._append(b"\x3F", (), AsyncResponse(self, **handlers))
+        await self._drain()
+
+    async def begin(self, bookmarks=None, metadata=None, timeout=None, **handlers):
+        extra = _transaction_extra(bookmarks, metadata, timeout)
+        log_debug("[#%04X]  C: BEGIN %r", self.local_port, extra)
+        self._append(b"\x11", (extra,), AsyncResponse(self, **handlers))
+        await self._drain()
+
+    async def commit(self, **handlers):
+        log_debug("[#%04X]  C: COMMIT", self.local_port)
+        self._append(b"\x12", (), AsyncResponse(self, **handlers))
+        await self._drain()
+
+    async def rollback(self, **handlers):
+        log_debug("[#%04X]  C: ROLLBACK", self.local_port)
+        self._append(b"\x13", (), AsyncResponse(self, **handlers))
+        await self._drain()
+
+    _append = Connection._append
+
+    _unpack = Connection._unpack
+
+    async def reset(self):
+        """ Add a RESET message to the outgoing queue, send
+        it and consume all remaining messages.
+        """
+        self._queue_reset()
+        await self.sync()
+
+    def _queue_reset(self):
+
+        def fail(metadata):
+            raise ProtocolError("RESET failed %r" % metadata)
+
+        log_debug("[#%04X]  C: RESET", self.local_port)
+        self._append(b"\x0F", response=AsyncResponse(self, on_failure=fail))
+
+    def _fail(self, error):
+        """ Record a failure, to be raised once all outstanding
+        responses have been received, and queue a RESET to clear
+        the failed state on the server.
+        """
+        if self._failure is None:
+            self._failure = error
+            self._queue_reset()
+            self.send()
+
+    def send(self):
+        try:
+            self._send()
+        except Exception as error:
+            if self.pool:
+                self.pool.handle(error, self)
+            raise
+
+    def _send(self):
+        """ Pass all queued messages to the transport.
+        """
+        views = self.output_buffer.views()
+        if not views:
+            return
+        if self.closed():
+            raise self.Error("Failed to write to closed connection {!r}".format(self.server.address))
+        if self.defunct():
+            raise self.Error("Failed to write to defunct connection {!r}".format(self.server.address))
+        # The transport may keep hold of the data after returning,
+        # so it must be given a copy rather than buffer views
+        self.transport.write(b"".join(views))
+        self.output_buffer.clear()
+
+    async def _drain(self):
+        """ Wait until the transport is ready to accept more data, if
+        writing has been paused.
+        """
+        if self._writing_paused and not self._defunct:
+            self._drain_waiter = get_event_loop().create_future()
+            try:
+                await self._drain_waiter
+            finally:
+                self._drain_waiter = None
+
+    async def _receive(self):
+        """ Wait until more data has been received, or the connection
+        has been lost.
+        """
+        self._receive_waiter = get_event_loop().create_future()
+        try:
+            await self._receive_waiter
+        finally:
+            self._receive_waiter = None
+
+    async def fetch(self):
+        try:
+            return await self._fetch()
+        except Exception as error:
+            if self.pool:
+                self.pool.handle(error, self)
+            raise
+
+    async def _fetch(self):
+        """ Receive at least one message from the server, waiting for
+        data to arrive if necessary.
+
+        :return: 2-tuple of number of detail messages and number of summary messages fetched
+        """
+        if self.closed():
+            raise self.Error("Failed to read from closed connection {!r}".format(self.server.address))
+        if not self.responses:
+            return 0, 0
+
+        input_buffer = self.input_buffer
+        while not input_buffer.frame_message():
+            if self.defunct():
+                self.close()
+                raise self.Error("Failed to read from defunct connection {!r}".format(self.server.address))
+            await self._receive()
+
+        detail_count, details, summary_signature, summary_metadata = self._unpack()
+
+        if detail_count:
+            log_debug("[#%04X]  S: RECORD * %d", self.local_port, detail_count)  # TODO
+        if details:
+            self.responses[0].on_records(details)
+
+        if summary_signature is None:
+            return detail_count, 0
+
+        response = self.responses.popleft()
+        response.complete = True
+        if summary_signature == b"\x70":
+            log_debug("[#%04X]  S: SUCCESS %r", self.local_port, summary_metadata)
+            response.on_success(summary_metadata or {})
+        elif summary_signature == b"\x7E":
+            log_debug("[#%04X]  S: IGNORED", self.local_port)
+            response.on_ignored(summary_metadata or {})
+        elif summary_signature == b"\x7F":
+            log_debug("[#%04X]  S: FAILURE %r", self.local_port, summary_metadata)
+            response.on_failure(summary_metadata or {})
+        else:
+            raise ProtocolError("Unexpected response message with signature %02X" % summary_signature)
+
+        return detail_count, 1
+
+    async def sync(self):
+        """ Send and fetch all outstanding messages.
+
+        If a FAILURE is received, the remaining responses are consumed
+        and the connection is reset before the failure is raised.
+
+        :return: 2-tuple of number of detail messages and number of summary messages fetched
+        """
+        self.send()
+        detail_count = summary_count = 0
+        while self.responses:
+            response = self.responses[0]
+            while not response.complete:
+                detail_delta, summary_delta = await self.fetch()
+                detail_count += detail_delta
+                summary_count += summary_delta
+        failure, self._failure = self._failure, None
+        if failure is not None:
+            raise failure
+        return detail_count, summary_count
+
+    def timedout(self):
+        return 0 <= self._max_connection_lifetime <= perf_counter() - self._creation_timestamp
+
+    def close(self):
+        """ Close the connection.
+        """
+        if not self._closed:
+            if self.protocol_version >= 3 and not self._defunct:
+                log_debug("[#%04X]  C: GOODBYE", self.local_port)
+                self._append(b"\x02", ())
+                try:
+                    self.send()
+                except ServiceUnavailable:
+                    pass
+            log_debug("[#%04X]  C: <CLOSE>", self.local_port)
+            self._closed = True
+            self.transport.close()
+
+    def closed(self):
+        return self._closed
+
+    def defunct(self):
+        return self._defunct
+
+
+class AbstractAsyncConnectionPool(object):
+    """ A collection of :class:`.AsyncConnection` objects to one or more
+    server addresses, for use with asyncio.
+
+    Coroutines waiting for a connection are queued in order of arrival.
+    Each connection released is handed directly to the first coroutine
+    waiting on its address, so only one waiter is woken per release.
+    """
+
+    _closed = False
+
+    def __init__(self, connector, **config):
+        self.connector = connector
+        self.connections = {}
+        self._waiters = {}
+        self._opening = {}
+        self._warming = {}
+        self._warm_tasks = set()
+        self._max_connection_pool_size = config.get("max_connection_pool_size", DEFAULT_MAX_CONNECTION_POOL_SIZE)
+        self._connection_acquisition_timeout = config.get("connection_acquisition_timeout", DEFAULT_CONNECTION_ACQUISITION_TIMEOUT)
+        self._min_idle_connections = config.get("min_idle_connections", DEFAULT_MIN_IDLE_CONNECTIONS)
+        self._connection_config = {key: config[key] for key in POOLED_CONNECTION_CONFIG_KEYS if key in config}
+        self._resolver = config.get("resolver")
+        self._dns_cache_ttl = config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL)
+        self._dns_negative_cache_ttl = config.get("dns_negative_cache_ttl", DEFAULT_DNS_NEGATIVE_CACHE_TTL)
+        self._dns_refresher = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def acquire_direct(self, address):
+        """ Acquire a connection to a given address from the pool.
+        The address supplied should always be an IP address, not
+        a host name.
+        """
+        loop = get_event_loop()
+        deadline = loop.time() + self._connection_acquisition_timeout
+        while True:
+            if self.closed():
+                raise ServiceUnavailable("Connection pool closed")
+            try:
+                connections = self.connections[address]
+            except KeyError:
+                connections = self.connections[address] = deque()
+            # try to find a free connection in pool
+            for connection in list(connections):
+                if connection.closed() or connection.defunct() or connection.timedout():
+                    connections.remove(connection)
+                    continue
+                if not connection.in_use:
+                    connection.in_use = True
+                    if self._min_idle_connections:
+                        self.warm(address)
+                    return connection
+            # all connections in pool are in-use
+            if self._capacity(address) > 0:
+                connection = await self._open(address)
+                if self._min_idle_connections:
+                    self.warm(address)
+                return connection
+            connection = await self._wait(address, deadline)
+            if connection is not None:
+                return connection
+
+    def _capacity(self, address):
+        """ Return the number of further connections that may be opened
+        to a given address, counting those already being opened.
+        """
+        max_connection_pool_size = self._max_connection_pool_size
+        if max_connection_pool_size < 0 or max_connection_pool_size == float("inf"):
+            return float("inf")
+        return (max_connection_pool_size - len(self.connections.get(address, ())) -
+                self._opening.get(address, 0))
+
+    def warm(self, address):
+        """ Top up the idle connections to a given address to the
+        configured minimum, opening each missing connection in parallel
+        as a separate task.
+        """
+        if self._closed:
+            return
+        warming = self._warming.get(address, 0)
+        idle = sum(1 for connection in self.connections.get(address, ()) if not connection.in_use)
+        count = min(self._min_idle_connections - idle - warming, self._capacity(address))
+        if count <= 0:
+            return
+        log_debug("[#0000]  C: <WARM> %s (%d)", address, count)
+        self._warming[address] = warming + count
+        self._opening[address] = self._opening.get(address, 0) + count
+        loop = get_event_loop()
+        for _ in range(count):
+            task = loop.create_task(self._open_idle(address))
+            self._warm_tasks.add(task)
+            task.add_done_callback(self._warm_tasks.discard)
+
+    async def _open_idle(self, address):
+        """ Open a connection to a given address and hand it to the first
+        coroutine waiting on that address or, failing that, add it to the
+        pool as an idle connection.
+        """
+        self._keep_resolved(address)
+        try:
+            connection = await self.connector(address, **self._connection_config)
+        except Exception as error:
+            log_debug("[#0000]  C: <WARM> %s failed: %s", address, error)
+            self._wake(address)
+            return
+        finally:
+            self._warming[address] -= 1
+            self._opening[address] -= 1
+        if self._closed:
+            connection.close()
+            return
+        connection.pool = self
+        connection.pool_address = address
+        connection.in_use = True
+        try:
+            connections = self.connections[address]
+        except KeyError:
+            connections = self.connections[address] = deque()
+        connections.append(connection)
+        if not self._wake(address, connection):
+            connection.in_use = False
+
+    async def _open(self, address):
+        self._opening[address] = self._opening.get(address, 0) + 1
+        self._keep_resolved(address)
+        try:
+            connection = await self.connector(address, **self._connection_config)
+        except ServiceUnavailable:
+            self.remove(address)
+            raise
+        finally:
+            self._opening[address] -= 1
+        connection.pool = self
+        connection.pool_address = address
+        connection.in_use = True
+        try:
+            connections = self.connections[address]
+        except KeyError:
+            connections = self.connections[address] = deque()
+        connections.append(connection)
+        return connection
+
+    def _keep_resolved(self, address):
+        """ Have the pool's DNS refresher keep the resolution of a host
+        name fresh, starting the refresher if this is the first. The
+        refresher runs on its own thread, so that DNS queries never
+        block the event loop.
+        """
+        if self._dns_cache_ttl <= 0 or is_ip_address(address[0]) or self._closed:
+            return
+        if self._dns_refresher is None:
+            self._dns_refresher = DNSRefresher(self._resolver, self._dns_cache_ttl, self._dns_negative_cache_ttl)
+            self._dns_refresher.start()
+        self._dns_refresher.watch(address)
+
+    async def _wait(self, address, deadline):
+        """ Wait for a connection to be released to a given address,
+        returning that connection, or :const:`None` if the caller
+        should try again to find or open a connection.
+        """
+        loop = get_event_loop()
+        timeout = self._connection_acquisition_timeout
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise ClientError("Failed to obtain a connection from pool within {!r}s".format(timeout))
+
+        def expire():
+            if not waiter.done():
+                waiter.set_exception(ClientError("Failed to obtain a connection "
+                                                 "from pool within {!r}s".format(timeout)))
+
+        waiter = loop.create_future()
+        try:
+            waiters = self._waiters[address]
+        except KeyError:
+            waiters = self._waiters[address] = deque()
+        waiters.append(waiter)
+        timer = loop.call_later(remaining, expire)
+        try:
+            return await waiter
+        except CancelledError:
+            # A connection may have been handed over just before
+            # cancellation, in which case it must be passed on
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                connection = waiter.result()
+                if connection is not None:
+                    self.release(connection)
+            raise
+        finally:
+            timer.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    def _wake(self, address, connection=None):
+        """ Hand a connection (or :const:`None`, as a signal to retry) to
+        the first coroutine waiting on a given address.
+
+        :return: :const:`True` if a waiter was woken, :const:`False` otherwise
+        """
+        waiters = self._waiters.get(address)
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(connection)
+                return True
+        return False
+
+    async def acquire(self, access_mode=None):
+        """ Acquire a connection to a server that can satisfy a set of parameters.
+
+        :param access_mode:
+        """
+
+    def release(self, connection):
+        """ Release a connection back into the pool, handing it to the
+        next waiting coroutine, if any.
+        """
+        address = connection.pool_address
+        if connection.closed() or connection.defunct() or connection.timedout():
+            connection.in_use = False
+            connection.close()
+            try:
+                self.connections[address].remove(connection)
+            except (KeyError, ValueError):
+                pass
+            self._wake(address)
+        elif not self._wake(address, connection):
+            connection.in_use = False
+
+    def in_use_connection_count(self, address):
+        """ Count the number of connections currently in use to a given
+        address.
+        """
+        try:
+            connections = self.connections[address]
+        except KeyError:
+            return 0
+        else:
+            return sum(1 if connection.in_use else 0 for connection in connections)
+
+    def deactivate(self, address):
+        """ Deactivate an address from the connection pool, if present, closing
+        all idle connection to that address
+        """
+        try:
+            connections = self.connections[address]
+        except KeyError:  # already removed from the connection pool
+            return
+        for conn in list(connections):
+            if not conn.in_use:
+                connections.remove(conn)
+                conn.close()
+        if not connections:
+            self.remove(address)
+
+    def remove(self, address):
+        """ Remove an address from the connection pool, if present, closing
+        all connections to that address. Any coroutines waiting on that
+        address will try again to open a connection.
+        """
+        for connection in self.connections.pop(address, ()):
+            connection.close()
+        while self._wake(address):
+            pass
+
+    def close(self):
+        """ Close all connections and empty the pool.
+        """
+        if not self._closed:
+            self._closed = True
+            if self._dns_refresher is not None:
+                self._dns_refresher.stop()
+            for task in list(self._warm_tasks):
+                task.cancel()
+            for address in list(self.connections):
+                self.remove(address)
+
+    def closed(self):
+        """ Return :const:`True` if this pool is closed, :const:`False`
+        otherwise.
+        """
+        return self._closed
+
+    def handle(self, error, connection):
+        """ Handle any cleanup or similar activity related to an error
+        occurring on a pooled connection.
+        """
+
+
+class AsyncConnectionPool(AbstractAsyncConnectionPool):
+
+    def __init__(self, connector, address, **config):
+        super(AsyncConnectionPool, self).__init__(connector, **config)
+        self.address = address
+        if self._min_idle_connections:
+            self.warm(address)
+
+    async def acquire(self, access_mode=None):
+        return await self.acquire_direct(self.address)
+
+
+class AsyncResponse(Response):
+    """ Subscriber object for a full response received by an
+    :class:`.AsyncConnection`. Failures are passed back to the
+    connection, to be raised once the connection has been reset.
+    """
+
+    __slots__ = []
+
+    def on_failure(self, metadata):
+        """ Called when a FAILURE message has been received.
+        """
+        handler = self._on_failure
+        if handler is not None:
+            handler(metadata)
+        handler = self._on_summary
+        if handler is not None:
+            handler()
+        self.connection._fail(CypherError.hydrate(**metadata))
+
+
+async def _connect_any(loop, resolved_addresses, **config):
+    """ Open a TCP connection to the first of several resolved addresses
+    to accept one, starting staggered attempts that run in parallel
+    (RFC 8305), as for the blocking connector.
+
+    :return: 2-tuple of socket object and the address it is connected to
+    """
+    options = _socket_options(config)
+    connection_attempt_delay = config.get("connection_attempt_delay", DEFAULT_CONNECTION_ATTEMPT_DELAY)
+    remaining = deque(_interleave(list(resolved_addresses)))
+    attempts = set()
+    last_error = None
+    try:
+        while remaining or attempts:
+            if remaining:
+                attempts.add(loop.create_task(_attempt(loop, remaining.popleft(), options, config)))
+            done, attempts = await wait(attempts, timeout=connection_attempt_delay if remaining else None,
+                                        return_when=FIRST_COMPLETED)
+            connected = None
+            for attempt in done:
+                if attempt.exception() is not None:
+                    last_error = attempt.exception()
+                elif connected is None:
+                    connected = attempt.result()
+                else:
+                    attempt.result()[0].close()
+            if connected is not None:
+                return connected
+    finally:
+        for attempt in attempts:
+            attempt.cancel()
+    if last_error is None:
+        raise ServiceUnavailable("No addresses to connect to")
+    raise last_error
+
+
+async def _attempt(loop, resolved_address, options, config):
+    """ Connect a new non-blocking socket to a resolved address.
+    """
+    s = _new_socket(resolved_address, options, config)
+    try:
+        log_debug("[#0000]  C: <OPEN> %s", resolved_address)
+        await wait_for(loop.sock_connect(s, resolved_address),
+                       config.get("connection_timeout", DEFAULT_CONNECTION_TIMEOUT))
+    except AsyncTimeoutError:
+        s.close()
+        raise _connection_timed_out(resolved_address)
+    except (IOError, OSError) as error:
+        s.close()
+        raise _connection_failed(resolved_address, error)
+    except BaseException:
+        s.close()
+        raise
+    return s, resolved_address
+
+
+async def _connect(loop, address, sock, resolved_address, ssl_context, **config):
+    """ Set up a connection over a connected socket and carry out the
+    Bolt handshake and initialisation.
+    """
+    server_hostname = address[0] if ssl_context else None
+    try:
+        transport, connection = await wait_for(
+            loop.create_connection(lambda: AsyncConnection(resolved_address, **config),
+                                   sock=sock, ssl=ssl_context, server_hostname=server_hostname),
+            config.get("connection_timeout", DEFAULT_CONNECTION_TIMEOUT))
+    except AsyncTimeoutError:
+        sock.close()
+        raise _connection_timed_out(resolved_address)
+    except (IOError, OSError) as error:
+        sock.close()
+        raise _connection_failed(resolved_address, error)
+    ssl_object = transport.get_extra_info("ssl_object")
+    if ssl_object is not None:
+        connection.der_encoded_server_certificate = ssl_object.getpeercert(binary_form=True)
+    try:
+        await connection._handshake()
+        await connection.hello()
+    except Exception:
+        connection._closed = True
+        transport.close()
+        raise
+    return connection
+
+
+async def connect(address, loop=None, **config):
+    """ Connect and perform a handshake and return a valid
+    :class:`.AsyncConnection` object, assuming a protocol version of
+    3 or above can be agreed.
+    """
+    if loop is None:
+        loop = get_event_loop()
+    ssl_context = make_ssl_context(**config)
+    last_error = None
+    log_debug("[#0000]  C: <RESOLVE> %s", address)
+    resolver = _resolver(address, config)
+    for query in resolver.dns_queries():
+        try:
+            info = await loop.getaddrinfo(query[0], query[1], type=SOCK_STREAM, proto=IPPROTO_TCP)
+        except gaierror:
+            raise resolver.dns_failed(query)
+        resolver.dns_answered(query, info)
+    resolver.dns_complete()
+    resolved_addresses = list(resolver.addresses)
+    while resolved_addresses:
+        try:
+            sock, resolved_address = await _connect_any(loop, resolved_addresses, **config)
+        except ServiceUnavailable as error:
+            last_error = error
+            break
+        # Should the server fail the handshake, try the other addresses
+        resolved_addresses.remove(resolved_address)
+        try:
+            return await _connect(loop, address, sock, resolved_address, ssl_context, **config)
+        except Exception as error:
+            last_error = error
+    if last_error is None:
+        raise ServiceUnavailable("Failed to resolve addresses for %s" % (address,))
+    else:
+        raise last_error
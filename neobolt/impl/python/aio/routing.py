@@ -0,0 +1,254 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+__all__ = [
+    "AsyncRoutingConnectionPool",
+]
+
+
+from asyncio import get_event_loop, shield
+from logging import getLogger
+
+from neobolt.exceptions import ConnectionExpired, CypherError, DatabaseUnavailableError, \
+    NotALeaderError, ForbiddenOnReadOnlyDatabaseError, ServiceUnavailable
+from neobolt.routing import READ_ACCESS, WRITE_ACCESS, RoutingProtocolError
+
+from ..routing import RoutingTable, LeastConnectedLoadBalancingStrategy, _routing_table_statement
+from .direct import AbstractAsyncConnectionPool
+
+
+# Set up logger
+log = getLogger("neobolt")
+log_debug = log.debug
+
+
+class AsyncRoutingConnectionPool(AbstractAsyncConnectionPool):
+    """ Connection pool with routing table, for use with asyncio.
+
+    When the routing table needs to be refreshed, a single task is
+    started to carry out the refresh, and every coroutine acquiring a
+    connection in the meantime waits for that same task.
+    """
+
+    def __init__(self, connector, initial_address, routing_context, *routers, **config):
+        super(AsyncRoutingConnectionPool, self).__init__(connector, **config)
+        self.initial_address = initial_address
+        self.routing_context = routing_context
+        self.routing_table = RoutingTable(routers)
+        self.missing_writer = False
+        self.refresh_task = None
+        self.load_balancing_strategy = LeastConnectedLoadBalancingStrategy(connection_pool=self)
+
+    async def fetch_routing_info(self, address):
+        """ Fetch raw routing info from a given router address.
+
+        :param address: router address
+        :return: list of routing records or
+                 None if no connection could be established
+        :raise ServiceUnavailable: if the server does not support routing or
+                                   if routing support is broken
+        """
+        metadata = {}
+        records = []
+        try:
+            cx = await self.acquire_direct(address)
+            try:
+                log_debug("[#%04X]  C: <ROUTING> query=%r", cx.local_port, self.routing_context or {})
+                await cx.run(_routing_table_statement(cx.protocol_version),
+                             {"context": self.routing_context}, on_success=metadata.update)
+                await cx.pull_all(on_success=metadata.update, on_records=records.extend)
+                try:
+                    await cx.sync()
+                except CypherError as error:
+                    if error.code == "Neo.ClientError.Procedure.ProcedureNotFound":
+                        raise RoutingProtocolError("Server {!r} does not support routing".format(address))
+                    else:
+                        raise RoutingProtocolError("Routing support broken on server {!r}".format(address))
+                routing_info = [dict(zip(metadata.get("fields", ()), values)) for values in records]
+                log_debug("[#%04X]  S: <ROUTING> info=%r", cx.local_port, routing_info)
+            finally:
+                self.release(cx)
+            return routing_info
+        except RoutingProtocolError as error:
+            raise ServiceUnavailable(*error.args)
+        except ServiceUnavailable:
+            self.deactivate(address)
+            return None
+
+    async def fetch_routing_table(self, address):
+        """ Fetch a routing table from a given router address.
+
+        :param address: router address
+        :return: a new RoutingTable instance or None if the given router is
+                 currently unable to provide routing information
+        :raise ServiceUnavailable: if no writers are available
+        :raise ProtocolError: if the routing information received is unusable
+        """
+        new_routing_info = await self.fetch_routing_info(address)
+        if new_routing_info is None:
+            return None
+
+        # Parse routing info and count the number of each type of server
+        new_routing_table = RoutingTable.parse_routing_info(new_routing_info)
+        num_routers = len(new_routing_table.routers)
+        num_readers = len(new_routing_table.readers)
+        num_writers = len(new_routing_table.writers)
+
+        # No writers are available. This likely indicates a temporary state,
+        # such as leader switching, so we should not signal an error.
+        # When no writers available, then we flag we are reading in absence of writer
+        self.missing_writer = (num_writers == 0)
+
+        # No routers
+        if num_routers == 0:
+            raise RoutingProtocolError("No routing servers returned from server %r" % (address,))
+
+        # No readers
+        if num_readers == 0:
+            raise RoutingProtocolError("No read servers returned from server %r" % (address,))
+
+        # At least one of each is fine, so return this table
+        return new_routing_table
+
+    async def update_routing_table_from(self, *routers):
+        """ Try to update routing tables with the given routers.
+
+        :return: True if the routing table is successfully updated, otherwise False
+        """
+        for router in routers:
+            new_routing_table = await self.fetch_routing_table(router)
+            if new_routing_table is not None:
+                self.routing_table.update(new_routing_table)
+                return True
+        return False
+
+    async def update_routing_table(self):
+        """ Update the routing table from the first router able to provide
+        valid routing information.
+        """
+        # copied because it can be modified
+        existing_routers = list(self.routing_table.routers)
+
+        has_tried_initial_routers = False
+        if self.missing_writer:
+            has_tried_initial_routers = True
+            if await self.update_routing_table_from(self.initial_address):
+                return
+
+        if await self.update_routing_table_from(*existing_routers):
+            return
+
+        if not has_tried_initial_routers and self.initial_address not in existing_routers:
+            if await self.update_routing_table_from(self.initial_address):
+                return
+
+        # None of the routers have been successful, so just fail
+        raise ServiceUnavailable("Unable to retrieve routing information")
+
+    def update_connection_pool(self):
+        servers = self.routing_table.servers()
+        for address in list(self.connections):
+            if address not in servers:
+                super(AsyncRoutingConnectionPool, self).deactivate(address)
+        if self._min_idle_connections:
+            for address in servers:
+                self.warm(address)
+
+    async def _refresh_routing_table(self):
+        try:
+            await self.update_routing_table()
+            self.update_connection_pool()
+        finally:
+            self.refresh_task = None
+
+    async def ensure_routing_table_is_fresh(self, access_mode):
+        """ Update the routing table if stale.
+
+        If a refresh is already under way, this waits for it to finish
+        instead of starting another. Cancelling one waiting coroutine
+        does not cancel the refresh for the others.
+
+        :return: `True` if an update was required, `False` otherwise.
+        """
+        if self.routing_table.is_fresh(access_mode):
+            return False
+        refresh_task = self.refresh_task
+        if refresh_task is None:
+            refresh_task = self.refresh_task = get_event_loop().create_task(self._refresh_routing_table())
+        await shield(refresh_task)
+        return True
+
+    async def acquire(self, access_mode=None):
+        if access_mode is None:
+            access_mode = WRITE_ACCESS
+        if access_mode == READ_ACCESS:
+            server_list = self.routing_table.readers
+            server_selector = self.load_balancing_strategy.select_reader
+        elif access_mode == WRITE_ACCESS:
+            server_list = self.routing_table.writers
+            server_selector = self.load_balancing_strategy.select_writer
+        else:
+            raise ValueError("Unsupported access mode {}".format(access_mode))
+
+        await self.ensure_routing_table_is_fresh(access_mode)
+        while True:
+            address = server_selector(server_list)
+            if address is None:
+                break
+            try:
+                connection = await self.acquire_direct(address)  # should always be a resolved address
+                connection.Error = ConnectionExpired
+            except ServiceUnavailable:
+                self.deactivate(address)
+            else:
+                return connection
+        raise ConnectionExpired("Failed to obtain connection towards '%s' server." % access_mode)
+
+    def deactivate(self, address):
+        """ Deactivate an address from the connection pool,
+        if present, remove from the routing table and also closing
+        all idle connections to that address.
+        """
+        log_debug("[#0000]  C: <ROUTING> Deactivating address %r", address)
+        # We use `discard` instead of `remove` here since the former
+        # will not fail if the address has already been removed.
+        self.routing_table.routers.discard(address)
+        self.routing_table.readers.discard(address)
+        self.routing_table.writers.discard(address)
+        log_debug("[#0000]  C: <ROUTING> table=%r", self.routing_table)
+        super(AsyncRoutingConnectionPool, self).deactivate(address)
+
+    def remove_writer(self, address):
+        """ Remove a writer address from the routing table, if present.
+        """
+        log_debug("[#0000]  C: <ROUTING> Removing writer %r", address)
+        self.routing_table.writers.discard(address)
+        log_debug("[#0000]  C: <ROUTING> table=%r", self.routing_table)
+
+    def handle(self, error, connection):
+        """ Handle any cleanup or similar activity related to an error
+        occurring on a pooled connection.
+        """
+        error_class = error.__class__
+        if error_class in (ConnectionExpired, ServiceUnavailable, DatabaseUnavailableError):
+            self.deactivate(connection.pool_address)
+        elif error_class in (NotALeaderError, ForbiddenOnReadOnlyDatabaseError):
+            self.remove_writer(connection.pool_address)
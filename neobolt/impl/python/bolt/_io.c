@@ -1,26 +1,17 @@
-/* Generated by Cython 0.28.4 */
-
-/* BEGIN: Cython Metadata
-{
-    "distutils": {
-        "name": "neobolt.bolt._io",
-        "sources": [
-            "/home/technige/work/neobolt/neobolt/bolt/_io.pyx"
-        ]
-    },
-    "module_name": "neobolt.bolt._io"
-}
-END: Cython Metadata */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_28_4"
-#define CYTHON_FUTURE_DIVISION 1
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
+#define CYTHON_FUTURE_DIVISION 0
 #include <stddef.h>
 #ifndef offsetof
   #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
@@ -58,6 +49,7 @@ END: Cython Metadata */
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -86,14 +78,26 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -127,10 +131,63 @@ END: Cython Metadata */
   #define CYTHON_PEP489_MULTI_PHASE_INIT 0
   #undef CYTHON_USE_TP_FINALIZE
   #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -150,7 +207,7 @@ END: Cython Metadata */
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -158,7 +215,7 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -173,27 +230,47 @@ END: Cython Metadata */
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT (0 && PY_VERSION_HEX >= 0x03050000)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
   #endif
   #ifndef CYTHON_USE_TP_FINALIZE
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
 #endif
 #ifndef __has_attribute
   #define __has_attribute(x) 0
@@ -292,9 +369,6 @@ END: Cython Metadata */
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -304,10 +378,79 @@ END: Cython Metadata */
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -320,6 +463,9 @@ END: Cython Metadata */
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
 #if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
   #ifndef METH_FASTCALL
      #define METH_FASTCALL 0x80
@@ -333,7 +479,7 @@ END: Cython Metadata */
 #endif
 #if CYTHON_FAST_PYCCALL
 #define __Pyx_PyFastCFunction_Check(func)\
-    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)))))
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
 #else
 #define __Pyx_PyFastCFunction_Check(func) 0
 #endif
@@ -342,6 +488,11 @@ END: Cython Metadata */
   #define PyObject_Free(p)     PyMem_Free(p)
   #define PyObject_Realloc(p)  PyMem_Realloc(p)
 #endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
 #if CYTHON_COMPILING_IN_PYSTON
   #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
   #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
@@ -364,7 +515,7 @@ END: Cython Metadata */
 typedef int Py_tss_t;
 static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
   *key = PyThread_create_key();
-  return 0; // PyThread_create_key reports success always
+  return 0;
 }
 static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
   Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
@@ -387,7 +538,7 @@ static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
 static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   return PyThread_get_key_value(*key);
 }
-#endif // TSS (Thread Specific Storage) API
+#endif
 #if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
 #define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
 #else
@@ -407,8 +558,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -416,7 +571,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -449,8 +612,8 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
   #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
 #endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
 #else
@@ -465,8 +628,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -477,6 +642,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -510,13 +682,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -538,8 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -557,11 +731,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -571,9 +744,10 @@ static CYTHON_INLINE float __PYX_NAN() {
   #endif
 #endif
 
-#define __PYX_HAVE__neobolt__bolt___io
-#define __PYX_HAVE_API__neobolt__bolt___io
+#define __PYX_HAVE__neobolt__impl__python__bolt___io
+#define __PYX_HAVE_API__neobolt__impl__python__bolt___io
 /* Early includes */
+#include <string.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -586,7 +760,8 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
                 const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
@@ -602,6 +777,9 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
     (sizeof(type) == sizeof(Py_ssize_t) &&\
           (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
                                v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
 #if defined (__cplusplus) && __cplusplus >= 201103L
     #include <cstdlib>
     #define __Pyx_sst_abs(value) std::abs(value)
@@ -660,11 +838,13 @@ static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
 #define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
 static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
 #define __Pyx_PySequence_Tuple(obj)\
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -740,7 +920,7 @@ static int __Pyx_init_sys_getdefaultencoding_params(void) {
     if (!default_encoding) goto bad;
     default_encoding_c = PyBytes_AsString(default_encoding);
     if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
     if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
     strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
     Py_DECREF(default_encoding);
@@ -777,89 +957,101 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
+  "neobolt/impl/python/bolt/_io.pyx",
   "stringsource",
-  "_io.pyx",
 };
 
 /*--- Type declarations ---*/
-struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame;
-struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer;
-struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
 
-/* "neobolt/bolt/_io.pyx":28
+/* "neobolt/impl/python/bolt/_io.pyx":30
  * 
  * 
  * cdef class MessageFrame(object):             # <<<<<<<<<<<<<<
- * 
- *     cdef _view
+ *     """ Read cursor over a message held in one or more panes of a
+ *     buffer. Pane positions are stored in an array that is kept
  */
-struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame {
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame {
   PyObject_HEAD
-  struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *__pyx_vtab;
+  struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_vtab;
   PyObject *_view;
-  PyObject *_panes;
+  int _base;
+  int *_bounds;
+  int _bounds_capacity;
+  int _pane_count;
   int _current_pane;
   int _current_offset;
+  int _pane_start;
+  int _pane_end;
 };
 
 
-/* "neobolt/bolt/_io.pyx":106
+/* "neobolt/impl/python/bolt/_io.pyx":162
  * 
  * 
  * cdef class ChunkedInputBuffer(object):             # <<<<<<<<<<<<<<
  * 
  *     cdef bytearray _data
  */
-struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer {
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer {
   PyObject_HEAD
-  struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_vtab;
+  struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_vtab;
   PyObject *_data;
   PyObject *_view;
   int _extent;
   int _origin;
   int _limit;
-  struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *_frame;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *_frame;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *_message_frame;
 };
 
 
-/* "neobolt/bolt/_io.pyx":258
+/* "neobolt/impl/python/bolt/_io.pyx":373
  * 
  * 
  * cdef class ChunkedOutputBuffer(object):             # <<<<<<<<<<<<<<
  * 
  *     cdef int _max_chunk_size
  */
-struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer {
+struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer {
   PyObject_HEAD
-  struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_vtab;
+  struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_vtab;
   int _max_chunk_size;
   PyObject *_data;
   int _header;
   int _start;
   int _end;
+  PyObject *_segments;
+  int _after_segment;
 };
 
 
 
-/* "neobolt/bolt/_io.pyx":28
+/* "neobolt/impl/python/bolt/_io.pyx":30
  * 
  * 
  * cdef class MessageFrame(object):             # <<<<<<<<<<<<<<
- * 
- *     cdef _view
- */
-
-struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame {
-  PyObject *(*_next_pane)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *);
-  PyObject *(*panes)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
-  PyObject *(*read_int)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
-  PyObject *(*read)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int, int __pyx_skip_dispatch);
-  PyObject *(*close)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
+ *     """ Read cursor over a message held in one or more panes of a
+ *     buffer. Pane positions are stored in an array that is kept
+ */
+
+struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame {
+  PyObject *(*_reserve)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int);
+  PyObject *(*reset)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, PyObject *, int, int, int, int __pyx_skip_dispatch);
+  PyObject *(*_first_pane)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *);
+  PyObject *(*_next_pane)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *);
+  PyObject *(*panes)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
+  PyObject *(*view)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
+  PyObject *(*read_int)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
+  PyObject *(*read)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int, int __pyx_skip_dispatch);
+  PyObject *(*close)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch);
 };
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *__pyx_vtabptr_7neobolt_4bolt_3_io_MessageFrame;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
 
 
-/* "neobolt/bolt/_io.pyx":106
+/* "neobolt/impl/python/bolt/_io.pyx":162
  * 
  * 
  * cdef class ChunkedInputBuffer(object):             # <<<<<<<<<<<<<<
@@ -867,21 +1059,24 @@ static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *__pyx_vtabptr_7
  *     cdef bytearray _data
  */
 
-struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer {
-  PyObject *(*capacity)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*view)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*load)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int __pyx_skip_dispatch);
-  int (*receive)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch);
-  int (*receive_message)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch);
-  PyObject *(*_recycle)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *);
-  PyObject *(*frame)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
-  int (*frame_message)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*discard_message)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
+struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer {
+  PyObject *(*capacity)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*view)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*load)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int __pyx_skip_dispatch);
+  int (*receive)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch);
+  PyObject *(*reserve)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int, int __pyx_skip_dispatch);
+  PyObject *(*advance)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int, int __pyx_skip_dispatch);
+  int (*receive_message)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch);
+  PyObject *(*_recycle)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *);
+  PyObject *(*frame)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
+  int (*frame_message)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
+  int (*_coalesce)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int);
+  PyObject *(*discard_message)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch);
 };
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedInputBuffer;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
 
 
-/* "neobolt/bolt/_io.pyx":258
+/* "neobolt/impl/python/bolt/_io.pyx":373
  * 
  * 
  * cdef class ChunkedOutputBuffer(object):             # <<<<<<<<<<<<<<
@@ -889,14 +1084,16 @@ static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_vta
  *     cdef int _max_chunk_size
  */
 
-struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer {
-  int (*max_chunk_size)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*clear)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*write)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch);
-  PyObject *(*chunk)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
-  PyObject *(*view)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
+struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer {
+  int (*max_chunk_size)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*clear)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*write)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*write_segment)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*chunk)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*view)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
+  PyObject *(*views)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch);
 };
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
 
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
@@ -984,17 +1181,42 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
-/* ArgTypeTest.proto */
-#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
-    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
-        __Pyx__ArgTypeTest(obj, type, name, exact))
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+/* RaiseTooManyValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+/* RaiseNeedMoreValuesToUnpack.proto */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
+
+/* IterFinish.proto */
+static CYTHON_INLINE int __Pyx_IterFinish(void);
+
+/* UnpackItemEndCheck.proto */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
+
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
 #else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
 /* PyFunctionFastCall.proto */
@@ -1002,10 +1224,37 @@ static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObje
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
     __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
 #define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
 #endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
+#endif
+
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
 #endif
 
 /* PyObjectCall.proto */
@@ -1020,9 +1269,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
 #endif
 
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
 /* PyObjectCallNoArg.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
@@ -1030,6 +1276,32 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 #define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
 #endif
 
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        PyList_SET_ITEM(list, len, x);
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
 /* GetItemInt.proto */
 #define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
     (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
@@ -1052,26 +1324,8 @@ static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
 static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
                                                      int is_list, int wraparound, int boundscheck);
 
-/* RaiseTooManyValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
-
-/* RaiseNeedMoreValuesToUnpack.proto */
-static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index);
-
-/* IterFinish.proto */
-static CYTHON_INLINE int __Pyx_IterFinish(void);
-
-/* UnpackItemEndCheck.proto */
-static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
-
-/* GetModuleGlobalName.proto */
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
-
-/* SliceObject.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
-        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
-        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
-        int has_cstart, int has_cstop, int wraparound);
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
 /* UnpackUnboundCMethod.proto */
 typedef struct {
@@ -1090,6 +1344,27 @@ static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction*
 #define __Pyx_CallUnboundCMethod1(cfunc, self, arg)  __Pyx__CallUnboundCMethod1(cfunc, self, arg)
 #endif
 
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1137,6 +1412,11 @@ static CYTHON_INLINE int __Pyx_PyObject_SetSlice(
         PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
         int has_cstart, int has_cstop, int wraparound);
 
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
 /* SaveResetException.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
@@ -1169,6 +1449,12 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely((Py_TYPE(obj) == type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
 /* ListAppend.proto */
 #if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
 static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
@@ -1177,7 +1463,7 @@ static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
     if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
         Py_INCREF(x);
         PyList_SET_ITEM(list, len, x);
-        Py_SIZE(list) = len+1;
+        __Pyx_SET_SIZE(list, len + 1);
         return 0;
     }
     return PyList_Append(list, x);
@@ -1186,6 +1472,37 @@ static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
 #define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
 #endif
 
+/* StringJoin.proto */
+#if PY_MAJOR_VERSION < 3
+#define __Pyx_PyString_Join __Pyx_PyBytes_Join
+#define __Pyx_PyBaseString_Join(s, v) (PyUnicode_CheckExact(s) ? PyUnicode_Join(s, v) : __Pyx_PyBytes_Join(s, v))
+#else
+#define __Pyx_PyString_Join PyUnicode_Join
+#define __Pyx_PyBaseString_Join PyUnicode_Join
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+    #if PY_MAJOR_VERSION < 3
+    #define __Pyx_PyBytes_Join _PyString_Join
+    #else
+    #define __Pyx_PyBytes_Join _PyBytes_Join
+    #endif
+#else
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values);
+#endif
+
+/* ListExtend.proto */
+static CYTHON_INLINE int __Pyx_PyList_Extend(PyObject* L, PyObject* v) {
+#if CYTHON_COMPILING_IN_CPYTHON
+    PyObject* none = _PyList_Extend((PyListObject*)L, v);
+    if (unlikely(!none))
+        return -1;
+    Py_DECREF(none);
+    return 0;
+#else
+    return PyList_SetSlice(L, PY_SSIZE_T_MAX, PY_SSIZE_T_MAX, v);
+#endif
+}
+
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
@@ -1203,6 +1520,9 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
@@ -1238,12 +1558,17 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
@@ -1269,42 +1594,60 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame__next_pane(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_panes(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read_int(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_close(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_capacity(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_load(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch); /* proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_clear(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_write(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-
-/* Module declarations from 'neobolt.bolt._io' */
-static PyTypeObject *__pyx_ptype_7neobolt_4bolt_3_io_MessageFrame = 0;
-static PyTypeObject *__pyx_ptype_7neobolt_4bolt_3_io_ChunkedInputBuffer = 0;
-static PyTypeObject *__pyx_ptype_7neobolt_4bolt_3_io_ChunkedOutputBuffer = 0;
-static PyObject *__pyx_v_7neobolt_4bolt_3_io__empty_view = 0;
-#define __Pyx_MODULE_NAME "neobolt.bolt._io"
-extern int __pyx_module_is_main_neobolt__bolt___io;
-int __pyx_module_is_main_neobolt__bolt___io = 0;
-
-/* Implementation of 'neobolt.bolt._io' */
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_pane_count); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_reset(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, int __pyx_v_base, int __pyx_v_start, int __pyx_v_end, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__first_pane(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__next_pane(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_panes(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read_int(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_close(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_capacity(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_load(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_advance(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__recycle(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__coalesce(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_origin); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_discard_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_clear(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write_segment(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_views(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from 'cpython.mem' */
+
+/* Module declarations from 'libc.string' */
+
+/* Module declarations from 'neobolt.impl.python.bolt._io' */
+static PyTypeObject *__pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_MessageFrame = 0;
+static PyTypeObject *__pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer = 0;
+static PyTypeObject *__pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer = 0;
+static PyObject *__pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view = 0;
+#define __Pyx_MODULE_NAME "neobolt.impl.python.bolt._io"
+extern int __pyx_module_is_main_neobolt__impl__python__bolt___io;
+int __pyx_module_is_main_neobolt__impl__python__bolt___io = 0;
+
+/* Implementation of 'neobolt.impl.python.bolt._io' */
+static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_KeyboardInterrupt;
 static const char __pyx_k_H[] = ">H";
 static const char __pyx_k_n[] = "n";
-static const char __pyx_k__5[] = "\000\000";
-static const char __pyx_k__8[] = "";
+static const char __pyx_k__6[] = "\000\000";
+static const char __pyx_k__7[] = "";
+static const char __pyx_k_end[] = "end";
+static const char __pyx_k_base[] = "base";
+static const char __pyx_k_join[] = "join";
 static const char __pyx_k_load[] = "load";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
@@ -1318,14 +1661,19 @@ static const char __pyx_k_clear[] = "clear";
 static const char __pyx_k_close[] = "close";
 static const char __pyx_k_frame[] = "frame";
 static const char __pyx_k_panes[] = "panes";
+static const char __pyx_k_range[] = "range";
+static const char __pyx_k_reset[] = "reset";
+static const char __pyx_k_start[] = "start";
+static const char __pyx_k_views[] = "views";
 static const char __pyx_k_write[] = "write";
 static const char __pyx_k_extend[] = "extend";
 static const char __pyx_k_import[] = "__import__";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_socket[] = "socket";
 static const char __pyx_k_struct[] = "struct";
-static const char __pyx_k_unpack[] = "unpack";
+static const char __pyx_k_advance[] = "advance";
 static const char __pyx_k_receive[] = "receive";
+static const char __pyx_k_reserve[] = "reserve";
 static const char __pyx_k_tobytes[] = "tobytes";
 static const char __pyx_k_capacity[] = "capacity";
 static const char __pyx_k_getstate[] = "__getstate__";
@@ -1336,33 +1684,45 @@ static const char __pyx_k_recv_into[] = "recv_into";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_memoryview[] = "memoryview";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
+static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_struct_pack[] = "struct_pack";
+static const char __pyx_k_MessageFrame[] = "MessageFrame";
 static const char __pyx_k_frame_message[] = "frame_message";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
-static const char __pyx_k_struct_unpack[] = "struct_unpack";
+static const char __pyx_k_write_segment[] = "write_segment";
 static const char __pyx_k_max_chunk_size[] = "max_chunk_size";
 static const char __pyx_k_discard_message[] = "discard_message";
 static const char __pyx_k_receive_message[] = "receive_message";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_KeyboardInterrupt[] = "KeyboardInterrupt";
+static const char __pyx_k_ChunkedInputBuffer[] = "ChunkedInputBuffer";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
+static const char __pyx_k_ChunkedOutputBuffer[] = "ChunkedOutputBuffer";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
-static PyObject *__pyx_kp_u_H;
+static PyObject *__pyx_n_s_ChunkedInputBuffer;
+static PyObject *__pyx_n_s_ChunkedOutputBuffer;
+static PyObject *__pyx_kp_s_H;
 static PyObject *__pyx_n_s_KeyboardInterrupt;
+static PyObject *__pyx_n_s_MemoryError;
+static PyObject *__pyx_n_s_MessageFrame;
 static PyObject *__pyx_n_s_TypeError;
-static PyObject *__pyx_kp_b__5;
-static PyObject *__pyx_kp_b__8;
+static PyObject *__pyx_kp_b__6;
+static PyObject *__pyx_kp_b__7;
+static PyObject *__pyx_n_s_advance;
+static PyObject *__pyx_n_s_base;
 static PyObject *__pyx_n_s_capacity;
 static PyObject *__pyx_n_s_chunk;
 static PyObject *__pyx_n_s_clear;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_close;
 static PyObject *__pyx_n_s_discard_message;
+static PyObject *__pyx_n_s_end;
 static PyObject *__pyx_n_s_extend;
 static PyObject *__pyx_n_s_frame;
 static PyObject *__pyx_n_s_frame_message;
 static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_join;
 static PyObject *__pyx_n_s_load;
 static PyObject *__pyx_n_s_main;
 static PyObject *__pyx_n_s_max_chunk_size;
@@ -1373,6 +1733,7 @@ static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_pack;
 static PyObject *__pyx_n_s_panes;
 static PyObject *__pyx_n_s_pyx_vtable;
+static PyObject *__pyx_n_s_range;
 static PyObject *__pyx_n_s_read;
 static PyObject *__pyx_n_s_read_int;
 static PyObject *__pyx_n_s_receive;
@@ -1382,47 +1743,57 @@ static PyObject *__pyx_n_s_recv_into;
 static PyObject *__pyx_n_s_reduce;
 static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
+static PyObject *__pyx_n_s_reserve;
+static PyObject *__pyx_n_s_reset;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_socket;
+static PyObject *__pyx_n_s_start;
 static PyObject *__pyx_n_s_struct;
 static PyObject *__pyx_n_s_struct_pack;
-static PyObject *__pyx_n_s_struct_unpack;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_tobytes;
-static PyObject *__pyx_n_s_unpack;
 static PyObject *__pyx_n_s_view;
+static PyObject *__pyx_n_s_views;
 static PyObject *__pyx_n_s_write;
-static int __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, PyObject *__pyx_v_panes); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_2panes(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_4read_int(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_6read(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_8close(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_capacity); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_2__repr__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_4capacity(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_6view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_18discard_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_v_capacity, int __pyx_v_max_chunk_size); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_4clear(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_6write(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_10view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_MessageFrame(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedOutputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_n_s_write_segment;
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, PyObject *__pyx_v_panes); /* proto */
+static void __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_2__dealloc__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_4reset(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, int __pyx_v_base, int __pyx_v_start, int __pyx_v_end); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_6panes(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_8view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_10read_int(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_12read(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_14close(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_capacity); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_2__repr__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_4capacity(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_6view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_8load(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_10receive(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_12reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_14advance(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_16receive_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_18frame(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_20frame_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_22discard_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_v_capacity, int __pyx_v_max_chunk_size); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_4clear(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_6write(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_8write_segment(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_10chunk(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_12view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_14views(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_MessageFrame(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static __Pyx_CachedCFunction __pyx_umethod_PyByteArray_Type_extend = {0, &__pyx_n_s_extend, 0, 0, 0};
 static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_524288;
@@ -1431,24 +1802,28 @@ static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__6;
-static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__10;
 /* Late includes */
 
-/* "neobolt/bolt/_io.pyx":35
- *     cdef int _current_offset
+/* "neobolt/impl/python/bolt/_io.pyx":47
+ *     cdef int _pane_end
  * 
- *     def __cinit__(self, view, list panes):             # <<<<<<<<<<<<<<
- *         self._view = view
- *         self._panes = panes
+ *     def __cinit__(self, view, panes):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         cdef int p
  */
 
 /* Python wrapper */
-static int __pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_view = 0;
   PyObject *__pyx_v_panes = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
@@ -1475,11 +1850,11 @@ static int __pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__py
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_panes)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(1, 35, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, 1); __PYX_ERR(0, 47, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 35, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 47, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -1488,40 +1863,52 @@ static int __pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_1__cinit__(PyObject *__py
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_view = values[0];
-    __pyx_v_panes = ((PyObject*)values[1]);
+    __pyx_v_panes = values[1];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 35, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 47, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_panes), (&PyList_Type), 1, "panes", 1))) __PYX_ERR(1, 35, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame___cinit__(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self), __pyx_v_view, __pyx_v_panes);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame___cinit__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self), __pyx_v_view, __pyx_v_panes);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = -1;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, PyObject *__pyx_v_panes) {
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, PyObject *__pyx_v_panes) {
+  int __pyx_v_i;
+  int __pyx_v_p;
+  int __pyx_v_q;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  long __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *(*__pyx_t_5)(PyObject *);
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *(*__pyx_t_10)(PyObject *);
+  int __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "neobolt/bolt/_io.pyx":36
+  /* "neobolt/impl/python/bolt/_io.pyx":52
+ *         cdef int q
  * 
- *     def __cinit__(self, view, list panes):
  *         self._view = view             # <<<<<<<<<<<<<<
- *         self._panes = panes
- *         if panes:
+ *         self._base = 0
+ *         self._bounds = NULL
  */
   __Pyx_INCREF(__pyx_v_view);
   __Pyx_GIVEREF(__pyx_v_view);
@@ -1529,189 +1916,399 @@ static int __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame___cinit__(struct __pyx_ob
   __Pyx_DECREF(__pyx_v_self->_view);
   __pyx_v_self->_view = __pyx_v_view;
 
-  /* "neobolt/bolt/_io.pyx":37
- *     def __cinit__(self, view, list panes):
+  /* "neobolt/impl/python/bolt/_io.pyx":53
+ * 
  *         self._view = view
- *         self._panes = panes             # <<<<<<<<<<<<<<
- *         if panes:
- *             self._current_pane = 0
+ *         self._base = 0             # <<<<<<<<<<<<<<
+ *         self._bounds = NULL
+ *         self._bounds_capacity = 0
  */
-  __Pyx_INCREF(__pyx_v_panes);
-  __Pyx_GIVEREF(__pyx_v_panes);
-  __Pyx_GOTREF(__pyx_v_self->_panes);
-  __Pyx_DECREF(__pyx_v_self->_panes);
-  __pyx_v_self->_panes = __pyx_v_panes;
+  __pyx_v_self->_base = 0;
 
-  /* "neobolt/bolt/_io.pyx":38
+  /* "neobolt/impl/python/bolt/_io.pyx":54
  *         self._view = view
- *         self._panes = panes
- *         if panes:             # <<<<<<<<<<<<<<
- *             self._current_pane = 0
- *             self._current_offset = 0
- */
-  __pyx_t_1 = (__pyx_v_panes != Py_None)&&(PyList_GET_SIZE(__pyx_v_panes) != 0);
-  if (__pyx_t_1) {
+ *         self._base = 0
+ *         self._bounds = NULL             # <<<<<<<<<<<<<<
+ *         self._bounds_capacity = 0
+ *         self._pane_count = 0
+ */
+  __pyx_v_self->_bounds = NULL;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":55
+ *         self._base = 0
+ *         self._bounds = NULL
+ *         self._bounds_capacity = 0             # <<<<<<<<<<<<<<
+ *         self._pane_count = 0
+ *         self._reserve(max(len(panes), 1))
+ */
+  __pyx_v_self->_bounds_capacity = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":56
+ *         self._bounds = NULL
+ *         self._bounds_capacity = 0
+ *         self._pane_count = 0             # <<<<<<<<<<<<<<
+ *         self._reserve(max(len(panes), 1))
+ *         i = 0
+ */
+  __pyx_v_self->_pane_count = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":57
+ *         self._bounds_capacity = 0
+ *         self._pane_count = 0
+ *         self._reserve(max(len(panes), 1))             # <<<<<<<<<<<<<<
+ *         i = 0
+ *         for p, q in panes:
+ */
+  __pyx_t_1 = 1;
+  __pyx_t_2 = PyObject_Length(__pyx_v_panes); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 57, __pyx_L1_error)
+  if (((__pyx_t_1 > __pyx_t_2) != 0)) {
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+    __pyx_t_3 = __pyx_t_2;
+  }
+  __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_reserve(__pyx_v_self, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "neobolt/bolt/_io.pyx":39
- *         self._panes = panes
- *         if panes:
- *             self._current_pane = 0             # <<<<<<<<<<<<<<
- *             self._current_offset = 0
- *         else:
+  /* "neobolt/impl/python/bolt/_io.pyx":58
+ *         self._pane_count = 0
+ *         self._reserve(max(len(panes), 1))
+ *         i = 0             # <<<<<<<<<<<<<<
+ *         for p, q in panes:
+ *             self._bounds[i] = p
+ */
+  __pyx_v_i = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":59
+ *         self._reserve(max(len(panes), 1))
+ *         i = 0
+ *         for p, q in panes:             # <<<<<<<<<<<<<<
+ *             self._bounds[i] = p
+ *             self._bounds[i + 1] = q
+ */
+  if (likely(PyList_CheckExact(__pyx_v_panes)) || PyTuple_CheckExact(__pyx_v_panes)) {
+    __pyx_t_4 = __pyx_v_panes; __Pyx_INCREF(__pyx_t_4); __pyx_t_3 = 0;
+    __pyx_t_5 = NULL;
+  } else {
+    __pyx_t_3 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_panes); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 59, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 59, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_5)) {
+      if (likely(PyList_CheckExact(__pyx_t_4))) {
+        if (__pyx_t_3 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 59, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 59, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      } else {
+        if (__pyx_t_3 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_6 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_3); __Pyx_INCREF(__pyx_t_6); __pyx_t_3++; if (unlikely(0 < 0)) __PYX_ERR(0, 59, __pyx_L1_error)
+        #else
+        __pyx_t_6 = PySequence_ITEM(__pyx_t_4, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 59, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        #endif
+      }
+    } else {
+      __pyx_t_6 = __pyx_t_5(__pyx_t_4);
+      if (unlikely(!__pyx_t_6)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 59, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    if ((likely(PyTuple_CheckExact(__pyx_t_6))) || (PyList_CheckExact(__pyx_t_6))) {
+      PyObject* sequence = __pyx_t_6;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 59, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_7 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_7 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(__pyx_t_8);
+      #else
+      __pyx_t_7 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 59, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 59, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      #endif
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_9 = PyObject_GetIter(__pyx_t_6); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 59, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_10 = Py_TYPE(__pyx_t_9)->tp_iternext;
+      index = 0; __pyx_t_7 = __pyx_t_10(__pyx_t_9); if (unlikely(!__pyx_t_7)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_7);
+      index = 1; __pyx_t_8 = __pyx_t_10(__pyx_t_9); if (unlikely(!__pyx_t_8)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_8);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_10(__pyx_t_9), 2) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
+      __pyx_t_10 = NULL;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      goto __pyx_L6_unpacking_done;
+      __pyx_L5_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __pyx_t_10 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 59, __pyx_L1_error)
+      __pyx_L6_unpacking_done:;
+    }
+    __pyx_t_11 = __Pyx_PyInt_As_int(__pyx_t_7); if (unlikely((__pyx_t_11 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_12 = __Pyx_PyInt_As_int(__pyx_t_8); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 59, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_v_p = __pyx_t_11;
+    __pyx_v_q = __pyx_t_12;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":60
+ *         i = 0
+ *         for p, q in panes:
+ *             self._bounds[i] = p             # <<<<<<<<<<<<<<
+ *             self._bounds[i + 1] = q
+ *             i += 2
+ */
+    (__pyx_v_self->_bounds[__pyx_v_i]) = __pyx_v_p;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":61
+ *         for p, q in panes:
+ *             self._bounds[i] = p
+ *             self._bounds[i + 1] = q             # <<<<<<<<<<<<<<
+ *             i += 2
+ *         self._pane_count = len(panes)
+ */
+    (__pyx_v_self->_bounds[(__pyx_v_i + 1)]) = __pyx_v_q;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":62
+ *             self._bounds[i] = p
+ *             self._bounds[i + 1] = q
+ *             i += 2             # <<<<<<<<<<<<<<
+ *         self._pane_count = len(panes)
+ *         self._first_pane()
+ */
+    __pyx_v_i = (__pyx_v_i + 2);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":59
+ *         self._reserve(max(len(panes), 1))
+ *         i = 0
+ *         for p, q in panes:             # <<<<<<<<<<<<<<
+ *             self._bounds[i] = p
+ *             self._bounds[i + 1] = q
  */
-    __pyx_v_self->_current_pane = 0;
+  }
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "neobolt/bolt/_io.pyx":40
- *         if panes:
- *             self._current_pane = 0
- *             self._current_offset = 0             # <<<<<<<<<<<<<<
- *         else:
- *             self._current_pane = -1
+  /* "neobolt/impl/python/bolt/_io.pyx":63
+ *             self._bounds[i + 1] = q
+ *             i += 2
+ *         self._pane_count = len(panes)             # <<<<<<<<<<<<<<
+ *         self._first_pane()
+ * 
  */
-    __pyx_v_self->_current_offset = 0;
+  __pyx_t_3 = PyObject_Length(__pyx_v_panes); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_v_self->_pane_count = __pyx_t_3;
 
-    /* "neobolt/bolt/_io.pyx":38
- *         self._view = view
- *         self._panes = panes
- *         if panes:             # <<<<<<<<<<<<<<
- *             self._current_pane = 0
- *             self._current_offset = 0
+  /* "neobolt/impl/python/bolt/_io.pyx":64
+ *             i += 2
+ *         self._pane_count = len(panes)
+ *         self._first_pane()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
  */
-    goto __pyx_L3;
-  }
+  __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_first_pane(__pyx_v_self); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 64, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "neobolt/bolt/_io.pyx":42
- *             self._current_offset = 0
- *         else:
- *             self._current_pane = -1             # <<<<<<<<<<<<<<
- *             self._current_offset = -1
+  /* "neobolt/impl/python/bolt/_io.pyx":47
+ *     cdef int _pane_end
  * 
+ *     def __cinit__(self, view, panes):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ *         cdef int p
  */
-  /*else*/ {
-    __pyx_v_self->_current_pane = -1;
 
-    /* "neobolt/bolt/_io.pyx":43
- *         else:
- *             self._current_pane = -1
- *             self._current_offset = -1             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":66
+ *         self._first_pane()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self._bounds)
  * 
- *     cdef _next_pane(self):
  */
-    __pyx_v_self->_current_offset = -1;
-  }
-  __pyx_L3:;
 
-  /* "neobolt/bolt/_io.pyx":35
- *     cdef int _current_offset
+/* Python wrapper */
+static void __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_3__dealloc__(PyObject *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_2__dealloc__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_2__dealloc__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":67
+ * 
+ *     def __dealloc__(self):
+ *         PyMem_Free(self._bounds)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _reserve(self, int pane_count):
+ */
+  PyMem_Free(__pyx_v_self->_bounds);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":66
+ *         self._first_pane()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self._bounds)
  * 
- *     def __cinit__(self, view, list panes):             # <<<<<<<<<<<<<<
- *         self._view = view
- *         self._panes = panes
  */
 
   /* function exit code */
-  __pyx_r = 0;
   __Pyx_RefNannyFinishContext();
-  return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":45
- *             self._current_offset = -1
+/* "neobolt/impl/python/bolt/_io.pyx":69
+ *         PyMem_Free(self._bounds)
+ * 
+ *     cdef _reserve(self, int pane_count):             # <<<<<<<<<<<<<<
+ *         cdef int* bounds
  * 
- *     cdef _next_pane(self):             # <<<<<<<<<<<<<<
- *         self._current_pane += 1
- *         if self._current_pane < len(self._panes):
  */
 
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame__next_pane(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self) {
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_pane_count) {
+  int *__pyx_v_bounds;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  Py_ssize_t __pyx_t_2;
-  int __pyx_t_3;
-  __Pyx_RefNannySetupContext("_next_pane", 0);
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_reserve", 0);
 
-  /* "neobolt/bolt/_io.pyx":46
+  /* "neobolt/impl/python/bolt/_io.pyx":72
+ *         cdef int* bounds
  * 
- *     cdef _next_pane(self):
- *         self._current_pane += 1             # <<<<<<<<<<<<<<
- *         if self._current_pane < len(self._panes):
- *             self._current_offset = 0
+ *         if 2 * pane_count > self._bounds_capacity:             # <<<<<<<<<<<<<<
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+ *             if bounds == NULL:
  */
-  __pyx_v_self->_current_pane = (__pyx_v_self->_current_pane + 1);
+  __pyx_t_1 = (((2 * __pyx_v_pane_count) > __pyx_v_self->_bounds_capacity) != 0);
+  if (__pyx_t_1) {
 
-  /* "neobolt/bolt/_io.pyx":47
- *     cdef _next_pane(self):
- *         self._current_pane += 1
- *         if self._current_pane < len(self._panes):             # <<<<<<<<<<<<<<
- *             self._current_offset = 0
- *         else:
+    /* "neobolt/impl/python/bolt/_io.pyx":73
+ * 
+ *         if 2 * pane_count > self._bounds_capacity:
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))             # <<<<<<<<<<<<<<
+ *             if bounds == NULL:
+ *                 raise MemoryError()
  */
-  __pyx_t_1 = __pyx_v_self->_panes;
-  __Pyx_INCREF(__pyx_t_1);
-  if (unlikely(__pyx_t_1 == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(1, 47, __pyx_L1_error)
-  }
-  __pyx_t_2 = PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(1, 47, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = ((__pyx_v_self->_current_pane < __pyx_t_2) != 0);
-  if (__pyx_t_3) {
+    __pyx_v_bounds = ((int *)PyMem_Realloc(__pyx_v_self->_bounds, ((2 * __pyx_v_pane_count) * (sizeof(int)))));
 
-    /* "neobolt/bolt/_io.pyx":48
- *         self._current_pane += 1
- *         if self._current_pane < len(self._panes):
- *             self._current_offset = 0             # <<<<<<<<<<<<<<
- *         else:
- *             self._current_pane = -1
+    /* "neobolt/impl/python/bolt/_io.pyx":74
+ *         if 2 * pane_count > self._bounds_capacity:
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+ *             if bounds == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             self._bounds = bounds
  */
-    __pyx_v_self->_current_offset = 0;
+    __pyx_t_1 = ((__pyx_v_bounds == NULL) != 0);
+    if (unlikely(__pyx_t_1)) {
 
-    /* "neobolt/bolt/_io.pyx":47
- *     cdef _next_pane(self):
- *         self._current_pane += 1
- *         if self._current_pane < len(self._panes):             # <<<<<<<<<<<<<<
- *             self._current_offset = 0
- *         else:
+      /* "neobolt/impl/python/bolt/_io.pyx":75
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+ *             if bounds == NULL:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             self._bounds = bounds
+ *             self._bounds_capacity = 2 * pane_count
  */
-    goto __pyx_L3;
-  }
+      PyErr_NoMemory(); __PYX_ERR(0, 75, __pyx_L1_error)
 
-  /* "neobolt/bolt/_io.pyx":50
- *             self._current_offset = 0
- *         else:
- *             self._current_pane = -1             # <<<<<<<<<<<<<<
- *             self._current_offset = -1
+      /* "neobolt/impl/python/bolt/_io.pyx":74
+ *         if 2 * pane_count > self._bounds_capacity:
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+ *             if bounds == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             self._bounds = bounds
+ */
+    }
+
+    /* "neobolt/impl/python/bolt/_io.pyx":76
+ *             if bounds == NULL:
+ *                 raise MemoryError()
+ *             self._bounds = bounds             # <<<<<<<<<<<<<<
+ *             self._bounds_capacity = 2 * pane_count
  * 
  */
-  /*else*/ {
-    __pyx_v_self->_current_pane = -1;
+    __pyx_v_self->_bounds = __pyx_v_bounds;
 
-    /* "neobolt/bolt/_io.pyx":51
- *         else:
- *             self._current_pane = -1
- *             self._current_offset = -1             # <<<<<<<<<<<<<<
+    /* "neobolt/impl/python/bolt/_io.pyx":77
+ *                 raise MemoryError()
+ *             self._bounds = bounds
+ *             self._bounds_capacity = 2 * pane_count             # <<<<<<<<<<<<<<
  * 
- *     cpdef panes(self):
+ *     cpdef reset(self, view, int base, int start, int end):
+ */
+    __pyx_v_self->_bounds_capacity = (2 * __pyx_v_pane_count);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":72
+ *         cdef int* bounds
+ * 
+ *         if 2 * pane_count > self._bounds_capacity:             # <<<<<<<<<<<<<<
+ *             bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+ *             if bounds == NULL:
  */
-    __pyx_v_self->_current_offset = -1;
   }
-  __pyx_L3:;
 
-  /* "neobolt/bolt/_io.pyx":45
- *             self._current_offset = -1
+  /* "neobolt/impl/python/bolt/_io.pyx":69
+ *         PyMem_Free(self._bounds)
+ * 
+ *     cdef _reserve(self, int pane_count):             # <<<<<<<<<<<<<<
+ *         cdef int* bounds
  * 
- *     cdef _next_pane(self):             # <<<<<<<<<<<<<<
- *         self._current_pane += 1
- *         if self._current_pane < len(self._panes):
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame._next_pane", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame._reserve", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -1719,85 +2316,240 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame__next_pane(struct __
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":53
- *             self._current_offset = -1
- * 
- *     cpdef panes(self):             # <<<<<<<<<<<<<<
- *         return self._panes
+/* "neobolt/impl/python/bolt/_io.pyx":79
+ *             self._bounds_capacity = 2 * pane_count
  * 
+ *     cpdef reset(self, view, int base, int start, int end):             # <<<<<<<<<<<<<<
+ *         """ Reframe around a message held in a single pane, spanning
+ *         `start` to `end` of `view` and reported relative to `base`.
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_3panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_panes(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_5reset(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_reset(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, int __pyx_v_base, int __pyx_v_start, int __pyx_v_end, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("panes", 0);
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reset", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_panes); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 53, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_3panes)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_reset); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_5reset)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_base); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_start); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_end); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
+        __pyx_t_8 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
+            __pyx_t_8 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_v_view, __pyx_t_3, __pyx_t_4, __pyx_t_5};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
+          PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_v_view, __pyx_t_3, __pyx_t_4, __pyx_t_5};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_9);
+          if (__pyx_t_7) {
+            __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
+          }
+          __Pyx_INCREF(__pyx_v_view);
+          __Pyx_GIVEREF(__pyx_v_view);
+          PyTuple_SET_ITEM(__pyx_t_9, 0+__pyx_t_8, __pyx_v_view);
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_9, 1+__pyx_t_8, __pyx_t_3);
+          __Pyx_GIVEREF(__pyx_t_4);
+          PyTuple_SET_ITEM(__pyx_t_9, 2+__pyx_t_8, __pyx_t_4);
+          __Pyx_GIVEREF(__pyx_t_5);
+          PyTuple_SET_ITEM(__pyx_t_9, 3+__pyx_t_8, __pyx_t_5);
+          __pyx_t_3 = 0;
+          __pyx_t_4 = 0;
+          __pyx_t_5 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 53, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 53, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":54
- * 
- *     cpdef panes(self):
- *         return self._panes             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":83
+ *         `start` to `end` of `view` and reported relative to `base`.
+ *         """
+ *         self._view = view             # <<<<<<<<<<<<<<
+ *         self._base = base
+ *         if end > start:
+ */
+  __Pyx_INCREF(__pyx_v_view);
+  __Pyx_GIVEREF(__pyx_v_view);
+  __Pyx_GOTREF(__pyx_v_self->_view);
+  __Pyx_DECREF(__pyx_v_self->_view);
+  __pyx_v_self->_view = __pyx_v_view;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":84
+ *         """
+ *         self._view = view
+ *         self._base = base             # <<<<<<<<<<<<<<
+ *         if end > start:
+ *             self._bounds[0] = start
+ */
+  __pyx_v_self->_base = __pyx_v_base;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":85
+ *         self._view = view
+ *         self._base = base
+ *         if end > start:             # <<<<<<<<<<<<<<
+ *             self._bounds[0] = start
+ *             self._bounds[1] = end
+ */
+  __pyx_t_10 = ((__pyx_v_end > __pyx_v_start) != 0);
+  if (__pyx_t_10) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":86
+ *         self._base = base
+ *         if end > start:
+ *             self._bounds[0] = start             # <<<<<<<<<<<<<<
+ *             self._bounds[1] = end
+ *             self._pane_count = 1
+ */
+    (__pyx_v_self->_bounds[0]) = __pyx_v_start;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":87
+ *         if end > start:
+ *             self._bounds[0] = start
+ *             self._bounds[1] = end             # <<<<<<<<<<<<<<
+ *             self._pane_count = 1
+ *         else:
+ */
+    (__pyx_v_self->_bounds[1]) = __pyx_v_end;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":88
+ *             self._bounds[0] = start
+ *             self._bounds[1] = end
+ *             self._pane_count = 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._pane_count = 0
+ */
+    __pyx_v_self->_pane_count = 1;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":85
+ *         self._view = view
+ *         self._base = base
+ *         if end > start:             # <<<<<<<<<<<<<<
+ *             self._bounds[0] = start
+ *             self._bounds[1] = end
+ */
+    goto __pyx_L3;
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":90
+ *             self._pane_count = 1
+ *         else:
+ *             self._pane_count = 0             # <<<<<<<<<<<<<<
+ *         self._first_pane()
  * 
- *     cpdef read_int(self):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v_self->_panes);
-  __pyx_r = __pyx_v_self->_panes;
-  goto __pyx_L0;
+  /*else*/ {
+    __pyx_v_self->_pane_count = 0;
+  }
+  __pyx_L3:;
 
-  /* "neobolt/bolt/_io.pyx":53
- *             self._current_offset = -1
+  /* "neobolt/impl/python/bolt/_io.pyx":91
+ *         else:
+ *             self._pane_count = 0
+ *         self._first_pane()             # <<<<<<<<<<<<<<
  * 
- *     cpdef panes(self):             # <<<<<<<<<<<<<<
- *         return self._panes
+ *     cdef _first_pane(self):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_first_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":79
+ *             self._bounds_capacity = 2 * pane_count
  * 
+ *     cpdef reset(self, view, int base, int start, int end):             # <<<<<<<<<<<<<<
+ *         """ Reframe around a message held in a single pane, spanning
+ *         `start` to `end` of `view` and reported relative to `base`.
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.panes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.reset", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -1806,761 +2558,408 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_panes(struct __pyx_o
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_3panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_3panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_5reset(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_4reset[] = " Reframe around a message held in a single pane, spanning\n        `start` to `end` of `view` and reported relative to `base`.\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_5reset(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_view = 0;
+  int __pyx_v_base;
+  int __pyx_v_start;
+  int __pyx_v_end;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("panes (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_2panes(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_2panes(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("panes", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_12MessageFrame_panes(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 53, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
-
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.panes", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "neobolt/bolt/_io.pyx":56
- *         return self._panes
- * 
- *     cpdef read_int(self):             # <<<<<<<<<<<<<<
- *         cdef int p
- *         cdef int q
- */
-
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_5read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read_int(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
-  int __pyx_v_p;
-  int __pyx_v_q;
-  int __pyx_v_size;
-  int __pyx_v_value;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_t_5;
-  PyObject *(*__pyx_t_6)(PyObject *);
-  int __pyx_t_7;
-  int __pyx_t_8;
-  __Pyx_RefNannySetupContext("read_int", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_int); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 56, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_5read_int)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_view,&__pyx_n_s_base,&__pyx_n_s_start,&__pyx_n_s_end,0};
+    PyObject* values[4] = {0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_view)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_base)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("reset", 1, 4, 4, 1); __PYX_ERR(0, 79, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_start)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("reset", 1, 4, 4, 2); __PYX_ERR(0, 79, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_end)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("reset", 1, 4, 4, 3); __PYX_ERR(0, 79, __pyx_L3_error)
         }
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 56, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 56, __pyx_L1_error)
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "reset") < 0)) __PYX_ERR(0, 79, __pyx_L3_error)
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "neobolt/bolt/_io.pyx":62
- *         cdef int value
- * 
- *         if self._current_pane == -1:             # <<<<<<<<<<<<<<
- *             return -1
- *         p, q = self._panes[self._current_pane]
- */
-  __pyx_t_5 = ((__pyx_v_self->_current_pane == -1L) != 0);
-  if (__pyx_t_5) {
-
-    /* "neobolt/bolt/_io.pyx":63
- * 
- *         if self._current_pane == -1:
- *             return -1             # <<<<<<<<<<<<<<
- *         p, q = self._panes[self._current_pane]
- *         size = q - p
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_int_neg_1);
-    __pyx_r = __pyx_int_neg_1;
-    goto __pyx_L0;
-
-    /* "neobolt/bolt/_io.pyx":62
- *         cdef int value
- * 
- *         if self._current_pane == -1:             # <<<<<<<<<<<<<<
- *             return -1
- *         p, q = self._panes[self._current_pane]
- */
-  }
-
-  /* "neobolt/bolt/_io.pyx":64
- *         if self._current_pane == -1:
- *             return -1
- *         p, q = self._panes[self._current_pane]             # <<<<<<<<<<<<<<
- *         size = q - p
- *         value = self._view[p + self._current_offset]
- */
-  if (unlikely(__pyx_v_self->_panes == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 64, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->_panes, __pyx_v_self->_current_pane, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 64, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
-    PyObject* sequence = __pyx_t_1;
-    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-    if (unlikely(size != 2)) {
-      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(1, 64, __pyx_L1_error)
-    }
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    if (likely(PyTuple_CheckExact(sequence))) {
-      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
-      __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
-    __Pyx_INCREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_t_3);
-    #else
-    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    #endif
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  } else {
-    Py_ssize_t index = -1;
-    __pyx_t_4 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 64, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_6 = Py_TYPE(__pyx_t_4)->tp_iternext;
-    index = 0; __pyx_t_2 = __pyx_t_6(__pyx_t_4); if (unlikely(!__pyx_t_2)) goto __pyx_L4_unpacking_failed;
-    __Pyx_GOTREF(__pyx_t_2);
-    index = 1; __pyx_t_3 = __pyx_t_6(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L4_unpacking_failed;
-    __Pyx_GOTREF(__pyx_t_3);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_6(__pyx_t_4), 2) < 0) __PYX_ERR(1, 64, __pyx_L1_error)
-    __pyx_t_6 = NULL;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    goto __pyx_L5_unpacking_done;
-    __pyx_L4_unpacking_failed:;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_6 = NULL;
-    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(1, 64, __pyx_L1_error)
-    __pyx_L5_unpacking_done:;
+    __pyx_v_view = values[0];
+    __pyx_v_base = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_base == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+    __pyx_v_start = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_start == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
+    __pyx_v_end = __Pyx_PyInt_As_int(values[3]); if (unlikely((__pyx_v_end == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 79, __pyx_L3_error)
   }
-  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 64, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 64, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_v_p = __pyx_t_7;
-  __pyx_v_q = __pyx_t_8;
-
-  /* "neobolt/bolt/_io.pyx":65
- *             return -1
- *         p, q = self._panes[self._current_pane]
- *         size = q - p             # <<<<<<<<<<<<<<
- *         value = self._view[p + self._current_offset]
- *         self._current_offset += 1
- */
-  __pyx_v_size = (__pyx_v_q - __pyx_v_p);
-
-  /* "neobolt/bolt/_io.pyx":66
- *         p, q = self._panes[self._current_pane]
- *         size = q - p
- *         value = self._view[p + self._current_offset]             # <<<<<<<<<<<<<<
- *         self._current_offset += 1
- *         if self._current_offset == size:
- */
-  __pyx_t_8 = (__pyx_v_p + __pyx_v_self->_current_offset);
-  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_self->_view, __pyx_t_8, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 66, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_value = __pyx_t_8;
-
-  /* "neobolt/bolt/_io.pyx":67
- *         size = q - p
- *         value = self._view[p + self._current_offset]
- *         self._current_offset += 1             # <<<<<<<<<<<<<<
- *         if self._current_offset == size:
- *             self._next_pane()
- */
-  __pyx_v_self->_current_offset = (__pyx_v_self->_current_offset + 1);
-
-  /* "neobolt/bolt/_io.pyx":68
- *         value = self._view[p + self._current_offset]
- *         self._current_offset += 1
- *         if self._current_offset == size:             # <<<<<<<<<<<<<<
- *             self._next_pane()
- *         return value
- */
-  __pyx_t_5 = ((__pyx_v_self->_current_offset == __pyx_v_size) != 0);
-  if (__pyx_t_5) {
-
-    /* "neobolt/bolt/_io.pyx":69
- *         self._current_offset += 1
- *         if self._current_offset == size:
- *             self._next_pane()             # <<<<<<<<<<<<<<
- *         return value
- * 
- */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 69, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("reset", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 79, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.reset", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_4reset(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self), __pyx_v_view, __pyx_v_base, __pyx_v_start, __pyx_v_end);
 
-    /* "neobolt/bolt/_io.pyx":68
- *         value = self._view[p + self._current_offset]
- *         self._current_offset += 1
- *         if self._current_offset == size:             # <<<<<<<<<<<<<<
- *             self._next_pane()
- *         return value
- */
-  }
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "neobolt/bolt/_io.pyx":70
- *         if self._current_offset == size:
- *             self._next_pane()
- *         return value             # <<<<<<<<<<<<<<
- * 
- *     cpdef read(self, int n):
- */
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_4reset(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, PyObject *__pyx_v_view, int __pyx_v_base, int __pyx_v_start, int __pyx_v_end) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reset", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 70, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_reset(__pyx_v_self, __pyx_v_view, __pyx_v_base, __pyx_v_start, __pyx_v_end, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":56
- *         return self._panes
- * 
- *     cpdef read_int(self):             # <<<<<<<<<<<<<<
- *         cdef int p
- *         cdef int q
- */
-
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.read_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.reset", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_5read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_5read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read_int (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_4read_int(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+/* "neobolt/impl/python/bolt/_io.pyx":93
+ *         self._first_pane()
+ * 
+ *     cdef _first_pane(self):             # <<<<<<<<<<<<<<
+ *         self._current_pane = -1
+ *         self._next_pane()
+ */
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_4read_int(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self) {
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__first_pane(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("read_int", 0);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read_int(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 56, __pyx_L1_error)
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_first_pane", 0);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":94
+ * 
+ *     cdef _first_pane(self):
+ *         self._current_pane = -1             # <<<<<<<<<<<<<<
+ *         self._next_pane()
+ * 
+ */
+  __pyx_v_self->_current_pane = -1;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":95
+ *     cdef _first_pane(self):
+ *         self._current_pane = -1
+ *         self._next_pane()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _next_pane(self):
+ */
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":93
+ *         self._first_pane()
+ * 
+ *     cdef _first_pane(self):             # <<<<<<<<<<<<<<
+ *         self._current_pane = -1
+ *         self._next_pane()
+ */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.read_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame._first_pane", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":72
- *         return value
+/* "neobolt/impl/python/bolt/_io.pyx":97
+ *         self._next_pane()
  * 
- *     cpdef read(self, int n):             # <<<<<<<<<<<<<<
- *         cdef int p
- *         cdef int q
+ *     cdef _next_pane(self):             # <<<<<<<<<<<<<<
+ *         self._current_pane += 1
+ *         if self._current_pane < self._pane_count:
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_7read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch) {
-  int __pyx_v_p;
-  int __pyx_v_q;
-  int __pyx_v_size;
-  int __pyx_v_start;
-  int __pyx_v_end;
-  int __pyx_v_remaining;
-  PyObject *__pyx_v_value = 0;
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__next_pane(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  int __pyx_t_10;
-  int __pyx_t_11;
-  Py_ssize_t __pyx_t_12;
-  __Pyx_RefNannySetupContext("read", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 72, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_7read)) {
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 72, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
-        }
-      }
-      if (!__pyx_t_5) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_4)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_3};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 72, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-          __Pyx_GIVEREF(__pyx_t_3);
-          PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_3);
-          __pyx_t_3 = 0;
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        }
-      }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "neobolt/bolt/_io.pyx":81
- *         cdef bytearray value
- * 
- *         if n == 0 or self._current_pane == -1:             # <<<<<<<<<<<<<<
- *             return _empty_view
- *         p, q = self._panes[self._current_pane]
- */
-  __pyx_t_8 = ((__pyx_v_n == 0) != 0);
-  if (!__pyx_t_8) {
-  } else {
-    __pyx_t_7 = __pyx_t_8;
-    goto __pyx_L4_bool_binop_done;
-  }
-  __pyx_t_8 = ((__pyx_v_self->_current_pane == -1L) != 0);
-  __pyx_t_7 = __pyx_t_8;
-  __pyx_L4_bool_binop_done:;
-  if (__pyx_t_7) {
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("_next_pane", 0);
 
-    /* "neobolt/bolt/_io.pyx":82
+  /* "neobolt/impl/python/bolt/_io.pyx":98
  * 
- *         if n == 0 or self._current_pane == -1:
- *             return _empty_view             # <<<<<<<<<<<<<<
- *         p, q = self._panes[self._current_pane]
- *         size = q - p
+ *     cdef _next_pane(self):
+ *         self._current_pane += 1             # <<<<<<<<<<<<<<
+ *         if self._current_pane < self._pane_count:
+ *             self._pane_start = self._bounds[2 * self._current_pane]
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_v_7neobolt_4bolt_3_io__empty_view);
-    __pyx_r = __pyx_v_7neobolt_4bolt_3_io__empty_view;
-    goto __pyx_L0;
+  __pyx_v_self->_current_pane = (__pyx_v_self->_current_pane + 1);
 
-    /* "neobolt/bolt/_io.pyx":81
- *         cdef bytearray value
- * 
- *         if n == 0 or self._current_pane == -1:             # <<<<<<<<<<<<<<
- *             return _empty_view
- *         p, q = self._panes[self._current_pane]
+  /* "neobolt/impl/python/bolt/_io.pyx":99
+ *     cdef _next_pane(self):
+ *         self._current_pane += 1
+ *         if self._current_pane < self._pane_count:             # <<<<<<<<<<<<<<
+ *             self._pane_start = self._bounds[2 * self._current_pane]
+ *             self._pane_end = self._bounds[2 * self._current_pane + 1]
  */
-  }
+  __pyx_t_1 = ((__pyx_v_self->_current_pane < __pyx_v_self->_pane_count) != 0);
+  if (__pyx_t_1) {
 
-  /* "neobolt/bolt/_io.pyx":83
- *         if n == 0 or self._current_pane == -1:
- *             return _empty_view
- *         p, q = self._panes[self._current_pane]             # <<<<<<<<<<<<<<
- *         size = q - p
- *         remaining = size - self._current_offset
+    /* "neobolt/impl/python/bolt/_io.pyx":100
+ *         self._current_pane += 1
+ *         if self._current_pane < self._pane_count:
+ *             self._pane_start = self._bounds[2 * self._current_pane]             # <<<<<<<<<<<<<<
+ *             self._pane_end = self._bounds[2 * self._current_pane + 1]
+ *             self._current_offset = 0
  */
-  if (unlikely(__pyx_v_self->_panes == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 83, __pyx_L1_error)
-  }
-  __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_self->_panes, __pyx_v_self->_current_pane, int, 1, __Pyx_PyInt_From_int, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 83, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
-    PyObject* sequence = __pyx_t_1;
-    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-    if (unlikely(size != 2)) {
-      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(1, 83, __pyx_L1_error)
-    }
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    if (likely(PyTuple_CheckExact(sequence))) {
-      __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
-      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
-    } else {
-      __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
-      __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
-    }
-    __Pyx_INCREF(__pyx_t_2);
-    __Pyx_INCREF(__pyx_t_4);
-    #else
-    __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    #endif
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  } else {
-    Py_ssize_t index = -1;
-    __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_9 = Py_TYPE(__pyx_t_6)->tp_iternext;
-    index = 0; __pyx_t_2 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_2)) goto __pyx_L6_unpacking_failed;
-    __Pyx_GOTREF(__pyx_t_2);
-    index = 1; __pyx_t_4 = __pyx_t_9(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L6_unpacking_failed;
-    __Pyx_GOTREF(__pyx_t_4);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_6), 2) < 0) __PYX_ERR(1, 83, __pyx_L1_error)
-    __pyx_t_9 = NULL;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    goto __pyx_L7_unpacking_done;
-    __pyx_L6_unpacking_failed:;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __pyx_t_9 = NULL;
-    if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(1, 83, __pyx_L1_error)
-    __pyx_L7_unpacking_done:;
-  }
-  __pyx_t_10 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_10 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 83, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_11 = __Pyx_PyInt_As_int(__pyx_t_4); if (unlikely((__pyx_t_11 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 83, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_v_p = __pyx_t_10;
-  __pyx_v_q = __pyx_t_11;
+    __pyx_v_self->_pane_start = (__pyx_v_self->_bounds[(2 * __pyx_v_self->_current_pane)]);
 
-  /* "neobolt/bolt/_io.pyx":84
- *             return _empty_view
- *         p, q = self._panes[self._current_pane]
- *         size = q - p             # <<<<<<<<<<<<<<
- *         remaining = size - self._current_offset
- *         if n <= remaining:
+    /* "neobolt/impl/python/bolt/_io.pyx":101
+ *         if self._current_pane < self._pane_count:
+ *             self._pane_start = self._bounds[2 * self._current_pane]
+ *             self._pane_end = self._bounds[2 * self._current_pane + 1]             # <<<<<<<<<<<<<<
+ *             self._current_offset = 0
+ *         else:
  */
-  __pyx_v_size = (__pyx_v_q - __pyx_v_p);
+    __pyx_v_self->_pane_end = (__pyx_v_self->_bounds[((2 * __pyx_v_self->_current_pane) + 1)]);
 
-  /* "neobolt/bolt/_io.pyx":85
- *         p, q = self._panes[self._current_pane]
- *         size = q - p
- *         remaining = size - self._current_offset             # <<<<<<<<<<<<<<
- *         if n <= remaining:
- *             start = p + self._current_offset
+    /* "neobolt/impl/python/bolt/_io.pyx":102
+ *             self._pane_start = self._bounds[2 * self._current_pane]
+ *             self._pane_end = self._bounds[2 * self._current_pane + 1]
+ *             self._current_offset = 0             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._current_pane = -1
  */
-  __pyx_v_remaining = (__pyx_v_size - __pyx_v_self->_current_offset);
+    __pyx_v_self->_current_offset = 0;
 
-  /* "neobolt/bolt/_io.pyx":86
- *         size = q - p
- *         remaining = size - self._current_offset
- *         if n <= remaining:             # <<<<<<<<<<<<<<
- *             start = p + self._current_offset
- *             end = start + n
+    /* "neobolt/impl/python/bolt/_io.pyx":99
+ *     cdef _next_pane(self):
+ *         self._current_pane += 1
+ *         if self._current_pane < self._pane_count:             # <<<<<<<<<<<<<<
+ *             self._pane_start = self._bounds[2 * self._current_pane]
+ *             self._pane_end = self._bounds[2 * self._current_pane + 1]
  */
-  __pyx_t_7 = ((__pyx_v_n <= __pyx_v_remaining) != 0);
-  if (__pyx_t_7) {
+    goto __pyx_L3;
+  }
 
-    /* "neobolt/bolt/_io.pyx":87
- *         remaining = size - self._current_offset
- *         if n <= remaining:
- *             start = p + self._current_offset             # <<<<<<<<<<<<<<
- *             end = start + n
- *             if n < remaining:
+  /* "neobolt/impl/python/bolt/_io.pyx":104
+ *             self._current_offset = 0
+ *         else:
+ *             self._current_pane = -1             # <<<<<<<<<<<<<<
+ *             self._current_offset = -1
+ * 
  */
-    __pyx_v_start = (__pyx_v_p + __pyx_v_self->_current_offset);
+  /*else*/ {
+    __pyx_v_self->_current_pane = -1;
 
-    /* "neobolt/bolt/_io.pyx":88
- *         if n <= remaining:
- *             start = p + self._current_offset
- *             end = start + n             # <<<<<<<<<<<<<<
- *             if n < remaining:
- *                 self._current_offset += n
+    /* "neobolt/impl/python/bolt/_io.pyx":105
+ *         else:
+ *             self._current_pane = -1
+ *             self._current_offset = -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef panes(self):
  */
-    __pyx_v_end = (__pyx_v_start + __pyx_v_n);
+    __pyx_v_self->_current_offset = -1;
+  }
+  __pyx_L3:;
 
-    /* "neobolt/bolt/_io.pyx":89
- *             start = p + self._current_offset
- *             end = start + n
- *             if n < remaining:             # <<<<<<<<<<<<<<
- *                 self._current_offset += n
- *             else:
+  /* "neobolt/impl/python/bolt/_io.pyx":97
+ *         self._next_pane()
+ * 
+ *     cdef _next_pane(self):             # <<<<<<<<<<<<<<
+ *         self._current_pane += 1
+ *         if self._current_pane < self._pane_count:
  */
-    __pyx_t_7 = ((__pyx_v_n < __pyx_v_remaining) != 0);
-    if (__pyx_t_7) {
 
-      /* "neobolt/bolt/_io.pyx":90
- *             end = start + n
- *             if n < remaining:
- *                 self._current_offset += n             # <<<<<<<<<<<<<<
- *             else:
- *                 self._next_pane()
- */
-      __pyx_v_self->_current_offset = (__pyx_v_self->_current_offset + __pyx_v_n);
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "neobolt/bolt/_io.pyx":89
- *             start = p + self._current_offset
- *             end = start + n
- *             if n < remaining:             # <<<<<<<<<<<<<<
- *                 self._current_offset += n
- *             else:
+/* "neobolt/impl/python/bolt/_io.pyx":107
+ *             self._current_offset = -1
+ * 
+ *     cpdef panes(self):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ * 
  */
-      goto __pyx_L9;
-    }
 
-    /* "neobolt/bolt/_io.pyx":92
- *                 self._current_offset += n
- *             else:
- *                 self._next_pane()             # <<<<<<<<<<<<<<
- *             return memoryview(self._view[start:end])
- *         start = p + self._current_offset
- */
-    /*else*/ {
-      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 92, __pyx_L1_error)
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_7panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_panes(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
+  int __pyx_v_i;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  long __pyx_t_5;
+  long __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("panes", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_panes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_7panes)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 107, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __pyx_L9:;
-
-    /* "neobolt/bolt/_io.pyx":93
- *             else:
- *                 self._next_pane()
- *             return memoryview(self._view[start:end])             # <<<<<<<<<<<<<<
- *         start = p + self._current_offset
- *         end = q
- */
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_start, __pyx_v_end, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 93, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_r = __pyx_t_2;
-    __pyx_t_2 = 0;
-    goto __pyx_L0;
+    #endif
+  }
 
-    /* "neobolt/bolt/_io.pyx":86
- *         size = q - p
- *         remaining = size - self._current_offset
- *         if n <= remaining:             # <<<<<<<<<<<<<<
- *             start = p + self._current_offset
- *             end = start + n
+  /* "neobolt/impl/python/bolt/_io.pyx":110
+ *         cdef int i
+ * 
+ *         return [(self._bounds[i] - self._base, self._bounds[i + 1] - self._base)             # <<<<<<<<<<<<<<
+ *                 for i in range(0, 2 * self._pane_count, 2)]
+ * 
  */
-  }
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 110, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-  /* "neobolt/bolt/_io.pyx":94
- *                 self._next_pane()
- *             return memoryview(self._view[start:end])
- *         start = p + self._current_offset             # <<<<<<<<<<<<<<
- *         end = q
- *         value = bytearray(self._view[start:end])
+  /* "neobolt/impl/python/bolt/_io.pyx":111
+ * 
+ *         return [(self._bounds[i] - self._base, self._bounds[i + 1] - self._base)
+ *                 for i in range(0, 2 * self._pane_count, 2)]             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef view(self):
  */
-  __pyx_v_start = (__pyx_v_p + __pyx_v_self->_current_offset);
+  __pyx_t_5 = (2 * __pyx_v_self->_pane_count);
+  __pyx_t_6 = __pyx_t_5;
+  for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=2) {
+    __pyx_v_i = __pyx_t_7;
 
-  /* "neobolt/bolt/_io.pyx":95
- *             return memoryview(self._view[start:end])
- *         start = p + self._current_offset
- *         end = q             # <<<<<<<<<<<<<<
- *         value = bytearray(self._view[start:end])
- *         self._next_pane()
+    /* "neobolt/impl/python/bolt/_io.pyx":110
+ *         cdef int i
+ * 
+ *         return [(self._bounds[i] - self._base, self._bounds[i + 1] - self._base)             # <<<<<<<<<<<<<<
+ *                 for i in range(0, 2 * self._pane_count, 2)]
+ * 
  */
-  __pyx_v_end = __pyx_v_q;
+    __pyx_t_2 = __Pyx_PyInt_From_int(((__pyx_v_self->_bounds[__pyx_v_i]) - __pyx_v_self->_base)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 110, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyInt_From_int(((__pyx_v_self->_bounds[(__pyx_v_i + 1)]) - __pyx_v_self->_base)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 110, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = PyTuple_New(2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 110, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_2);
+    PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_4, 1, __pyx_t_3);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = 0;
+    if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_4))) __PYX_ERR(0, 110, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":96
- *         start = p + self._current_offset
- *         end = q
- *         value = bytearray(self._view[start:end])             # <<<<<<<<<<<<<<
- *         self._next_pane()
- *         if len(value) < n and self._current_pane >= 0:
- */
-  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_start, __pyx_v_end, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_value = ((PyObject*)__pyx_t_4);
-  __pyx_t_4 = 0;
-
-  /* "neobolt/bolt/_io.pyx":97
- *         end = q
- *         value = bytearray(self._view[start:end])
- *         self._next_pane()             # <<<<<<<<<<<<<<
- *         if len(value) < n and self._current_pane >= 0:
- *             value.extend(self.read(n - (end - start)))
- */
-  __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 97, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-
-  /* "neobolt/bolt/_io.pyx":98
- *         value = bytearray(self._view[start:end])
- *         self._next_pane()
- *         if len(value) < n and self._current_pane >= 0:             # <<<<<<<<<<<<<<
- *             value.extend(self.read(n - (end - start)))
- *         return memoryview(value)
- */
-  __pyx_t_12 = PyByteArray_GET_SIZE(__pyx_v_value); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(1, 98, __pyx_L1_error)
-  __pyx_t_8 = ((__pyx_t_12 < __pyx_v_n) != 0);
-  if (__pyx_t_8) {
-  } else {
-    __pyx_t_7 = __pyx_t_8;
-    goto __pyx_L11_bool_binop_done;
-  }
-  __pyx_t_8 = ((__pyx_v_self->_current_pane >= 0) != 0);
-  __pyx_t_7 = __pyx_t_8;
-  __pyx_L11_bool_binop_done:;
-  if (__pyx_t_7) {
-
-    /* "neobolt/bolt/_io.pyx":99
- *         self._next_pane()
- *         if len(value) < n and self._current_pane >= 0:
- *             value.extend(self.read(n - (end - start)))             # <<<<<<<<<<<<<<
- *         return memoryview(value)
- * 
- */
-    __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (__pyx_v_n - (__pyx_v_end - __pyx_v_start)), 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 99, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_2 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyByteArray_Type_extend, __pyx_v_value, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 99, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "neobolt/bolt/_io.pyx":98
- *         value = bytearray(self._view[start:end])
- *         self._next_pane()
- *         if len(value) < n and self._current_pane >= 0:             # <<<<<<<<<<<<<<
- *             value.extend(self.read(n - (end - start)))
- *         return memoryview(value)
- */
-  }
-
-  /* "neobolt/bolt/_io.pyx":100
- *         if len(value) < n and self._current_pane >= 0:
- *             value.extend(self.read(n - (end - start)))
- *         return memoryview(value)             # <<<<<<<<<<<<<<
- * 
- *     cpdef close(self):
- */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_value); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 100, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_4;
-  __pyx_t_4 = 0;
-  goto __pyx_L0;
-
-  /* "neobolt/bolt/_io.pyx":72
- *         return value
- * 
- *     cpdef read(self, int n):             # <<<<<<<<<<<<<<
- *         cdef int p
- *         cdef int q
+  /* "neobolt/impl/python/bolt/_io.pyx":107
+ *             self._current_offset = -1
+ * 
+ *     cpdef panes(self):             # <<<<<<<<<<<<<<
+ *         cdef int i
+ * 
  */
 
   /* function exit code */
@@ -2569,47 +2968,37 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read(struct __pyx_ob
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.panes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_value);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_7read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_7read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n) {
-  int __pyx_v_n;
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_7panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_7panes(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("read (wrapper)", 0);
-  assert(__pyx_arg_n); {
-    __pyx_v_n = __Pyx_PyInt_As_int(__pyx_arg_n); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 72, __pyx_L3_error)
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_6read(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self), ((int)__pyx_v_n));
+  __Pyx_RefNannySetupContext("panes (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_6panes(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_6read(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_6panes(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("read", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("panes", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read(__pyx_v_self, __pyx_v_n, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 72, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_panes(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2618,7 +3007,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_6read(struct __pyx_
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.panes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2626,88 +3015,102 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_6read(struct __pyx_
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":102
- *         return memoryview(value)
+/* "neobolt/impl/python/bolt/_io.pyx":113
+ *                 for i in range(0, 2 * self._pane_count, 2)]
  * 
- *     cpdef close(self):             # <<<<<<<<<<<<<<
- *         self._view = None
+ *     cpdef view(self):             # <<<<<<<<<<<<<<
+ *         return self._view[self._base:]
  * 
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_9close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_close(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_9view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("close", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("view", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_close); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 102, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_9close)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_9view)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 102, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 102, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":103
- * 
- *     cpdef close(self):
- *         self._view = None             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":114
  * 
+ *     cpdef view(self):
+ *         return self._view[self._base:]             # <<<<<<<<<<<<<<
  * 
+ *     cpdef read_int(self):
  */
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(__pyx_v_self->_view);
-  __Pyx_DECREF(__pyx_v_self->_view);
-  __pyx_v_self->_view = Py_None;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_self->_base, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":102
- *         return memoryview(value)
+  /* "neobolt/impl/python/bolt/_io.pyx":113
+ *                 for i in range(0, 2 * self._pane_count, 2)]
  * 
- *     cpdef close(self):             # <<<<<<<<<<<<<<
- *         self._view = None
+ *     cpdef view(self):             # <<<<<<<<<<<<<<
+ *         return self._view[self._base:]
  * 
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.close", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2716,25 +3119,28 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_close(struct __pyx_o
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_9close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_9close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_9view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_9view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("close (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_8close(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("view (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_8view(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_8close(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_8view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("close", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("view", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_12MessageFrame_close(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 102, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_view(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2743,7 +3149,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_8close(struct __pyx
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.close", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -2751,359 +3157,228 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_8close(struct __pyx
   return __pyx_r;
 }
 
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+/* "neobolt/impl/python/bolt/_io.pyx":116
+ *         return self._view[self._base:]
+ * 
+ *     cpdef read_int(self):             # <<<<<<<<<<<<<<
+ *         cdef int value
+ * 
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_11__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_10__reduce_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_11read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read_int(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
+  int __pyx_v_value;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_int", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read_int); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_11read_int)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 116, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "neobolt/impl/python/bolt/_io.pyx":119
+ *         cdef int value
+ * 
+ *         if self._current_pane == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         value = self._view[self._pane_start + self._current_offset]
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_t_5 = ((__pyx_v_self->_current_pane == -1L) != 0);
+  if (__pyx_t_5) {
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+    /* "neobolt/impl/python/bolt/_io.pyx":120
+ * 
+ *         if self._current_pane == -1:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         value = self._view[self._pane_start + self._current_offset]
+ *         self._current_offset += 1
  */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_neg_1);
+    __pyx_r = __pyx_int_neg_1;
+    goto __pyx_L0;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+    /* "neobolt/impl/python/bolt/_io.pyx":119
+ *         cdef int value
+ * 
+ *         if self._current_pane == -1:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         value = self._view[self._pane_start + self._current_offset]
  */
+  }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_13__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_12__setstate_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_12MessageFrame_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
-
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":121
+ *         if self._current_pane == -1:
+ *             return -1
+ *         value = self._view[self._pane_start + self._current_offset]             # <<<<<<<<<<<<<<
+ *         self._current_offset += 1
+ *         if self._current_offset == self._pane_end - self._pane_start:
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_6 = (__pyx_v_self->_pane_start + __pyx_v_self->_current_offset);
+  __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_self->_view, __pyx_t_6, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_v_value = __pyx_t_6;
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "neobolt/impl/python/bolt/_io.pyx":122
+ *             return -1
+ *         value = self._view[self._pane_start + self._current_offset]
+ *         self._current_offset += 1             # <<<<<<<<<<<<<<
+ *         if self._current_offset == self._pane_end - self._pane_start:
+ *             self._next_pane()
  */
+  __pyx_v_self->_current_offset = (__pyx_v_self->_current_offset + 1);
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.MessageFrame.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+  /* "neobolt/impl/python/bolt/_io.pyx":123
+ *         value = self._view[self._pane_start + self._current_offset]
+ *         self._current_offset += 1
+ *         if self._current_offset == self._pane_end - self._pane_start:             # <<<<<<<<<<<<<<
+ *             self._next_pane()
+ *         return value
+ */
+  __pyx_t_5 = ((__pyx_v_self->_current_offset == (__pyx_v_self->_pane_end - __pyx_v_self->_pane_start)) != 0);
+  if (__pyx_t_5) {
 
-/* "neobolt/bolt/_io.pyx":115
- *     cdef MessageFrame _frame
+    /* "neobolt/impl/python/bolt/_io.pyx":124
+ *         self._current_offset += 1
+ *         if self._current_offset == self._pane_end - self._pane_start:
+ *             self._next_pane()             # <<<<<<<<<<<<<<
+ *         return value
  * 
- *     def __cinit__(self, capacity=524288):             # <<<<<<<<<<<<<<
- *         self._data = bytearray(capacity)
- *         self._view = memoryview(self._data)
  */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 124, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-/* Python wrapper */
-static int __pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_capacity = 0;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_capacity,0};
-    PyObject* values[1] = {0};
-    values[0] = ((PyObject *)__pyx_int_524288);
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_capacity);
-          if (value) { values[0] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 115, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_capacity = values[0];
+    /* "neobolt/impl/python/bolt/_io.pyx":123
+ *         value = self._view[self._pane_start + self._current_offset]
+ *         self._current_offset += 1
+ *         if self._current_offset == self._pane_end - self._pane_start:             # <<<<<<<<<<<<<<
+ *             self._next_pane()
+ *         return value
+ */
   }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 115, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer___cinit__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_capacity);
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_capacity) {
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "neobolt/bolt/_io.pyx":116
+  /* "neobolt/impl/python/bolt/_io.pyx":125
+ *         if self._current_offset == self._pane_end - self._pane_start:
+ *             self._next_pane()
+ *         return value             # <<<<<<<<<<<<<<
  * 
- *     def __cinit__(self, capacity=524288):
- *         self._data = bytearray(capacity)             # <<<<<<<<<<<<<<
- *         self._view = memoryview(self._data)
- *         self._extent = 0    # end position of all loaded data
+ *     cpdef read(self, int n):
  */
-  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 116, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v_self->_data);
-  __Pyx_DECREF(__pyx_v_self->_data);
-  __pyx_v_self->_data = ((PyObject*)__pyx_t_1);
+  __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":117
- *     def __cinit__(self, capacity=524288):
- *         self._data = bytearray(capacity)
- *         self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
- *         self._extent = 0    # end position of all loaded data
- *         self._origin = 0    # start position of current frame
- */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 117, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GIVEREF(__pyx_t_2);
-  __Pyx_GOTREF(__pyx_v_self->_view);
-  __Pyx_DECREF(__pyx_v_self->_view);
-  __pyx_v_self->_view = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "neobolt/bolt/_io.pyx":118
- *         self._data = bytearray(capacity)
- *         self._view = memoryview(self._data)
- *         self._extent = 0    # end position of all loaded data             # <<<<<<<<<<<<<<
- *         self._origin = 0    # start position of current frame
- *         self._limit = -1    # end position of current frame
- */
-  __pyx_v_self->_extent = 0;
-
-  /* "neobolt/bolt/_io.pyx":119
- *         self._view = memoryview(self._data)
- *         self._extent = 0    # end position of all loaded data
- *         self._origin = 0    # start position of current frame             # <<<<<<<<<<<<<<
- *         self._limit = -1    # end position of current frame
- *         self._frame = None  # frame object
- */
-  __pyx_v_self->_origin = 0;
-
-  /* "neobolt/bolt/_io.pyx":120
- *         self._extent = 0    # end position of all loaded data
- *         self._origin = 0    # start position of current frame
- *         self._limit = -1    # end position of current frame             # <<<<<<<<<<<<<<
- *         self._frame = None  # frame object
- * 
- */
-  __pyx_v_self->_limit = -1;
-
-  /* "neobolt/bolt/_io.pyx":121
- *         self._origin = 0    # start position of current frame
- *         self._limit = -1    # end position of current frame
- *         self._frame = None  # frame object             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":116
+ *         return self._view[self._base:]
  * 
- *     def __repr__(self):
- */
-  __Pyx_INCREF(Py_None);
-  __Pyx_GIVEREF(Py_None);
-  __Pyx_GOTREF(__pyx_v_self->_frame);
-  __Pyx_DECREF(((PyObject *)__pyx_v_self->_frame));
-  __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)Py_None);
-
-  /* "neobolt/bolt/_io.pyx":115
- *     cdef MessageFrame _frame
+ *     cpdef read_int(self):             # <<<<<<<<<<<<<<
+ *         cdef int value
  * 
- *     def __cinit__(self, capacity=524288):             # <<<<<<<<<<<<<<
- *         self._data = bytearray(capacity)
- *         self._view = memoryview(self._data)
  */
 
   /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.read_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":123
- *         self._frame = None  # frame object
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return repr(self.view().tobytes())
- * 
- */
-
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_3__repr__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_3__repr__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_11read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_11read_int(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_2__repr__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("read_int (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_10read_int(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_2__repr__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_10read_int(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  __Pyx_RefNannySetupContext("__repr__", 0);
-
-  /* "neobolt/bolt/_io.pyx":124
- * 
- *     def __repr__(self):
- *         return repr(self.view().tobytes())             # <<<<<<<<<<<<<<
- * 
- *     cpdef capacity(self):
- */
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_int", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->view(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_tobytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
-    if (likely(__pyx_t_2)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_2);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_3, function);
-    }
-  }
-  if (__pyx_t_2) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 124, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  } else {
-    __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 124, __pyx_L1_error)
-  }
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read_int(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PyObject_Repr(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 124, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":123
- *         self._frame = None  # frame object
- * 
- *     def __repr__(self):             # <<<<<<<<<<<<<<
- *         return repr(self.view().tobytes())
- * 
- */
-
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.read_int", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3111,83 +3386,368 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_2__repr__(str
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":126
- *         return repr(self.view().tobytes())
- * 
- *     cpdef capacity(self):             # <<<<<<<<<<<<<<
- *         return len(self._view)
+/* "neobolt/impl/python/bolt/_io.pyx":127
+ *         return value
  * 
+ *     cpdef read(self, int n):             # <<<<<<<<<<<<<<
+ *         cdef int p
+ *         cdef int q
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_capacity(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_13read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch) {
+  int __pyx_v_p;
+  int __pyx_v_q;
+  int __pyx_v_size;
+  int __pyx_v_start;
+  int __pyx_v_end;
+  int __pyx_v_remaining;
+  PyObject *__pyx_v_value = 0;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  Py_ssize_t __pyx_t_5;
-  __Pyx_RefNannySetupContext("capacity", 0);
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 126, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_5capacity)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_read); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_13read)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 127, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
         }
-      }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 126, __pyx_L1_error)
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 126, __pyx_L1_error)
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":127
- * 
- *     cpdef capacity(self):
- *         return len(self._view)             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":136
+ *         cdef bytearray value
  * 
- *     cpdef view(self):
+ *         if n == 0 or self._current_pane == -1:             # <<<<<<<<<<<<<<
+ *             return _empty_view
+ *         p = self._pane_start
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_v_self->_view;
-  __Pyx_INCREF(__pyx_t_1);
-  __pyx_t_5 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(1, 127, __pyx_L1_error)
+  __pyx_t_7 = ((__pyx_v_n == 0) != 0);
+  if (!__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_7 = ((__pyx_v_self->_current_pane == -1L) != 0);
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":137
+ * 
+ *         if n == 0 or self._current_pane == -1:
+ *             return _empty_view             # <<<<<<<<<<<<<<
+ *         p = self._pane_start
+ *         q = self._pane_end
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view);
+    __pyx_r = __pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view;
+    goto __pyx_L0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":136
+ *         cdef bytearray value
+ * 
+ *         if n == 0 or self._current_pane == -1:             # <<<<<<<<<<<<<<
+ *             return _empty_view
+ *         p = self._pane_start
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":138
+ *         if n == 0 or self._current_pane == -1:
+ *             return _empty_view
+ *         p = self._pane_start             # <<<<<<<<<<<<<<
+ *         q = self._pane_end
+ *         size = q - p
+ */
+  __pyx_t_8 = __pyx_v_self->_pane_start;
+  __pyx_v_p = __pyx_t_8;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":139
+ *             return _empty_view
+ *         p = self._pane_start
+ *         q = self._pane_end             # <<<<<<<<<<<<<<
+ *         size = q - p
+ *         remaining = size - self._current_offset
+ */
+  __pyx_t_8 = __pyx_v_self->_pane_end;
+  __pyx_v_q = __pyx_t_8;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":140
+ *         p = self._pane_start
+ *         q = self._pane_end
+ *         size = q - p             # <<<<<<<<<<<<<<
+ *         remaining = size - self._current_offset
+ *         if n <= remaining:
+ */
+  __pyx_v_size = (__pyx_v_q - __pyx_v_p);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":141
+ *         q = self._pane_end
+ *         size = q - p
+ *         remaining = size - self._current_offset             # <<<<<<<<<<<<<<
+ *         if n <= remaining:
+ *             start = p + self._current_offset
+ */
+  __pyx_v_remaining = (__pyx_v_size - __pyx_v_self->_current_offset);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":142
+ *         size = q - p
+ *         remaining = size - self._current_offset
+ *         if n <= remaining:             # <<<<<<<<<<<<<<
+ *             start = p + self._current_offset
+ *             end = start + n
+ */
+  __pyx_t_6 = ((__pyx_v_n <= __pyx_v_remaining) != 0);
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":143
+ *         remaining = size - self._current_offset
+ *         if n <= remaining:
+ *             start = p + self._current_offset             # <<<<<<<<<<<<<<
+ *             end = start + n
+ *             if n < remaining:
+ */
+    __pyx_v_start = (__pyx_v_p + __pyx_v_self->_current_offset);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":144
+ *         if n <= remaining:
+ *             start = p + self._current_offset
+ *             end = start + n             # <<<<<<<<<<<<<<
+ *             if n < remaining:
+ *                 self._current_offset += n
+ */
+    __pyx_v_end = (__pyx_v_start + __pyx_v_n);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":145
+ *             start = p + self._current_offset
+ *             end = start + n
+ *             if n < remaining:             # <<<<<<<<<<<<<<
+ *                 self._current_offset += n
+ *             else:
+ */
+    __pyx_t_6 = ((__pyx_v_n < __pyx_v_remaining) != 0);
+    if (__pyx_t_6) {
+
+      /* "neobolt/impl/python/bolt/_io.pyx":146
+ *             end = start + n
+ *             if n < remaining:
+ *                 self._current_offset += n             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._next_pane()
+ */
+      __pyx_v_self->_current_offset = (__pyx_v_self->_current_offset + __pyx_v_n);
+
+      /* "neobolt/impl/python/bolt/_io.pyx":145
+ *             start = p + self._current_offset
+ *             end = start + n
+ *             if n < remaining:             # <<<<<<<<<<<<<<
+ *                 self._current_offset += n
+ *             else:
+ */
+      goto __pyx_L7;
+    }
+
+    /* "neobolt/impl/python/bolt/_io.pyx":148
+ *                 self._current_offset += n
+ *             else:
+ *                 self._next_pane()             # <<<<<<<<<<<<<<
+ *             return self._view[start:end]
+ *         start = p + self._current_offset
+ */
+    /*else*/ {
+      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    }
+    __pyx_L7:;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":149
+ *             else:
+ *                 self._next_pane()
+ *             return self._view[start:end]             # <<<<<<<<<<<<<<
+ *         start = p + self._current_offset
+ *         end = q
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_start, __pyx_v_end, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 149, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":142
+ *         size = q - p
+ *         remaining = size - self._current_offset
+ *         if n <= remaining:             # <<<<<<<<<<<<<<
+ *             start = p + self._current_offset
+ *             end = start + n
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":150
+ *                 self._next_pane()
+ *             return self._view[start:end]
+ *         start = p + self._current_offset             # <<<<<<<<<<<<<<
+ *         end = q
+ *         value = bytearray(self._view[start:end])
+ */
+  __pyx_v_start = (__pyx_v_p + __pyx_v_self->_current_offset);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":151
+ *             return self._view[start:end]
+ *         start = p + self._current_offset
+ *         end = q             # <<<<<<<<<<<<<<
+ *         value = bytearray(self._view[start:end])
+ *         self._next_pane()
+ */
+  __pyx_v_end = __pyx_v_q;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":152
+ *         start = p + self._current_offset
+ *         end = q
+ *         value = bytearray(self._view[start:end])             # <<<<<<<<<<<<<<
+ *         self._next_pane()
+ *         if len(value) < n and self._current_pane >= 0:
+ */
+  __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_start, __pyx_v_end, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 127, __pyx_L1_error)
+  __pyx_v_value = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":153
+ *         end = q
+ *         value = bytearray(self._view[start:end])
+ *         self._next_pane()             # <<<<<<<<<<<<<<
+ *         if len(value) < n and self._current_pane >= 0:
+ *             value.extend(self.read(n - (end - start)))
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->_next_pane(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 153, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":154
+ *         value = bytearray(self._view[start:end])
+ *         self._next_pane()
+ *         if len(value) < n and self._current_pane >= 0:             # <<<<<<<<<<<<<<
+ *             value.extend(self.read(n - (end - start)))
+ *         return memoryview(value)
+ */
+  __pyx_t_9 = PyByteArray_GET_SIZE(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 154, __pyx_L1_error)
+  __pyx_t_7 = ((__pyx_t_9 < __pyx_v_n) != 0);
+  if (__pyx_t_7) {
+  } else {
+    __pyx_t_6 = __pyx_t_7;
+    goto __pyx_L9_bool_binop_done;
+  }
+  __pyx_t_7 = ((__pyx_v_self->_current_pane >= 0) != 0);
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_L9_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":155
+ *         self._next_pane()
+ *         if len(value) < n and self._current_pane >= 0:
+ *             value.extend(self.read(n - (end - start)))             # <<<<<<<<<<<<<<
+ *         return memoryview(value)
+ * 
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->__pyx_vtab)->read(__pyx_v_self, (__pyx_v_n - (__pyx_v_end - __pyx_v_start)), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PyByteArray_Type_extend, __pyx_v_value, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":154
+ *         value = bytearray(self._view[start:end])
+ *         self._next_pane()
+ *         if len(value) < n and self._current_pane >= 0:             # <<<<<<<<<<<<<<
+ *             value.extend(self.read(n - (end - start)))
+ *         return memoryview(value)
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":156
+ *         if len(value) < n and self._current_pane >= 0:
+ *             value.extend(self.read(n - (end - start)))
+ *         return memoryview(value)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef close(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 156, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":126
- *         return repr(self.view().tobytes())
- * 
- *     cpdef capacity(self):             # <<<<<<<<<<<<<<
- *         return len(self._view)
+  /* "neobolt/impl/python/bolt/_io.pyx":127
+ *         return value
  * 
+ *     cpdef read(self, int n):             # <<<<<<<<<<<<<<
+ *         cdef int p
+ *         cdef int q
  */
 
   /* function exit code */
@@ -3196,34 +3756,52 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_capacity(struc
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.capacity", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_value);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_13read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_13read(PyObject *__pyx_v_self, PyObject *__pyx_arg_n) {
+  int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("capacity (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_4capacity(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("read (wrapper)", 0);
+  assert(__pyx_arg_n); {
+    __pyx_v_n = __Pyx_PyInt_As_int(__pyx_arg_n); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_12read(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self), ((int)__pyx_v_n));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_4capacity(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_12read(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_v_n) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("capacity", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_capacity(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 126, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read(__pyx_v_self, __pyx_v_n, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3232,7 +3810,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_4capacity(str
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.capacity", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.read", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3240,93 +3818,103 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_4capacity(str
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":129
- *         return len(self._view)
+/* "neobolt/impl/python/bolt/_io.pyx":158
+ *         return memoryview(value)
  * 
- *     cpdef view(self):             # <<<<<<<<<<<<<<
- *         return memoryview(self._view[:self._extent])
+ *     cpdef close(self):             # <<<<<<<<<<<<<<
+ *         self._view = None
  * 
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_15close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_close(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("view", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("close", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 129, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_7view)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_close); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_15close)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 158, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 129, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 129, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":130
- * 
- *     cpdef view(self):
- *         return memoryview(self._view[:self._extent])             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":159
+ * 
+ *     cpdef close(self):
+ *         self._view = None             # <<<<<<<<<<<<<<
+ * 
  * 
- *     cpdef load(self, b):
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, 0, __pyx_v_self->_extent, NULL, NULL, NULL, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 130, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_r = __pyx_t_3;
-  __pyx_t_3 = 0;
-  goto __pyx_L0;
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_view);
+  __Pyx_DECREF(__pyx_v_self->_view);
+  __pyx_v_self->_view = Py_None;
 
-  /* "neobolt/bolt/_io.pyx":129
- *         return len(self._view)
+  /* "neobolt/impl/python/bolt/_io.pyx":158
+ *         return memoryview(value)
  * 
- *     cpdef view(self):             # <<<<<<<<<<<<<<
- *         return memoryview(self._view[:self._extent])
+ *     cpdef close(self):             # <<<<<<<<<<<<<<
+ *         self._view = None
  * 
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.close", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3335,25 +3923,28 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_view(struct __
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_15close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_15close(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("view (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_6view(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("close (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_14close(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_6view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_14close(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("view", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("close", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_view(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 129, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_close(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 158, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3362,7 +3953,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_6view(struct
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.close", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3370,339 +3961,1580 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_6view(struct
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":132
- *         return memoryview(self._view[:self._extent])
- * 
- *     cpdef load(self, b):             # <<<<<<<<<<<<<<
- *         """
- * 
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_load(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_n = NULL;
-  PyObject *__pyx_v_new_extent = NULL;
-  PyObject *__pyx_v_overflow = NULL;
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_16__reduce_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  __Pyx_RefNannySetupContext("load", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 132, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_9load)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-        }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_b); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_b};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_b};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        {
-          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 132, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-          __Pyx_INCREF(__pyx_v_b);
-          __Pyx_GIVEREF(__pyx_v_b);
-          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_b);
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 132, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        }
-      }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
-    }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  }
-
-  /* "neobolt/bolt/_io.pyx":137
- *         Note: may modify buffer size
- *         """
- *         n = len(b)             # <<<<<<<<<<<<<<
- *         new_extent = self._extent + n
- *         overflow = new_extent - len(self._data)
- */
-  __pyx_t_6 = PyObject_Length(__pyx_v_b); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(1, 137, __pyx_L1_error)
-  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 137, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_n = __pyx_t_1;
-  __pyx_t_1 = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
-  /* "neobolt/bolt/_io.pyx":138
- *         """
- *         n = len(b)
- *         new_extent = self._extent + n             # <<<<<<<<<<<<<<
- *         overflow = new_extent - len(self._data)
- *         if overflow > 0:
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_extent); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 138, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 138, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_v_new_extent = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
 
-  /* "neobolt/bolt/_io.pyx":139
- *         n = len(b)
- *         new_extent = self._extent + n
- *         overflow = new_extent - len(self._data)             # <<<<<<<<<<<<<<
- *         if overflow > 0:
- *             if self._recycle():
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_t_2 = __pyx_v_self->_data;
-  __Pyx_INCREF(__pyx_t_2);
-  if (unlikely(__pyx_t_2 == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(1, 139, __pyx_L1_error)
-  }
-  __pyx_t_6 = PyByteArray_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(1, 139, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 139, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyNumber_Subtract(__pyx_v_new_extent, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 139, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_overflow = __pyx_t_1;
-  __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":140
- *         new_extent = self._extent + n
- *         overflow = new_extent - len(self._data)
- *         if overflow > 0:             # <<<<<<<<<<<<<<
- *             if self._recycle():
- *                 return self.load(b)
- */
-  __pyx_t_1 = PyObject_RichCompare(__pyx_v_overflow, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 140, __pyx_L1_error)
-  __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(1, 140, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_7) {
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "neobolt/bolt/_io.pyx":141
- *         overflow = new_extent - len(self._data)
- *         if overflow > 0:
- *             if self._recycle():             # <<<<<<<<<<<<<<
- *                 return self.load(b)
- *             self._view = None
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_recycle(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 141, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_7 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_7 < 0)) __PYX_ERR(1, 141, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (__pyx_t_7) {
 
-      /* "neobolt/bolt/_io.pyx":142
- *         if overflow > 0:
- *             if self._recycle():
- *                 return self.load(b)             # <<<<<<<<<<<<<<
- *             self._view = None
- *             new_extent = self._extent + n
- */
-      __Pyx_XDECREF(__pyx_r);
-      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->load(__pyx_v_self, __pyx_v_b, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 142, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_r = __pyx_t_1;
-      __pyx_t_1 = 0;
-      goto __pyx_L0;
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_18__setstate_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
-      /* "neobolt/bolt/_io.pyx":141
- *         overflow = new_extent - len(self._data)
- *         if overflow > 0:
- *             if self._recycle():             # <<<<<<<<<<<<<<
- *                 return self.load(b)
- *             self._view = None
- */
-    }
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "neobolt/bolt/_io.pyx":143
- *             if self._recycle():
- *                 return self.load(b)
- *             self._view = None             # <<<<<<<<<<<<<<
- *             new_extent = self._extent + n
- *             self._data[self._extent:new_extent] = b
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-    __Pyx_INCREF(Py_None);
-    __Pyx_GIVEREF(Py_None);
-    __Pyx_GOTREF(__pyx_v_self->_view);
-    __Pyx_DECREF(__pyx_v_self->_view);
-    __pyx_v_self->_view = Py_None;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
 
-    /* "neobolt/bolt/_io.pyx":144
- *                 return self.load(b)
- *             self._view = None
- *             new_extent = self._extent + n             # <<<<<<<<<<<<<<
- *             self._data[self._extent:new_extent] = b
- *             self._view = memoryview(self._data)
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_extent); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 144, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF_SET(__pyx_v_new_extent, __pyx_t_2);
-    __pyx_t_2 = 0;
 
-    /* "neobolt/bolt/_io.pyx":145
- *             self._view = None
- *             new_extent = self._extent + n
- *             self._data[self._extent:new_extent] = b             # <<<<<<<<<<<<<<
- *             self._view = memoryview(self._data)
- *         else:
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.MessageFrame.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":172
+ *     cdef MessageFrame _message_frame
+ * 
+ *     def __cinit__(self, capacity=524288):             # <<<<<<<<<<<<<<
+ *         self._data = bytearray(capacity)
+ *         self._view = memoryview(self._data)
  */
-    if (unlikely(__pyx_v_self->_data == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 145, __pyx_L1_error)
-    }
-    __pyx_t_6 = __Pyx_PyIndex_AsSsize_t(__pyx_v_new_extent); if (unlikely((__pyx_t_6 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(1, 145, __pyx_L1_error)
-    if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_v_b, __pyx_v_self->_extent, __pyx_t_6, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 145, __pyx_L1_error)
 
-    /* "neobolt/bolt/_io.pyx":146
- *             new_extent = self._extent + n
- *             self._data[self._extent:new_extent] = b
- *             self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
- *         else:
+/* Python wrapper */
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_capacity = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_capacity,0};
+    PyObject* values[1] = {0};
+    values[0] = ((PyObject *)__pyx_int_524288);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_capacity);
+          if (value) { values[0] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 172, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_capacity = values[0];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 172, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer___cinit__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_capacity);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_capacity) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":173
+ * 
+ *     def __cinit__(self, capacity=524288):
+ *         self._data = bytearray(capacity)             # <<<<<<<<<<<<<<
+ *         self._view = memoryview(self._data)
+ *         self._extent = 0    # end position of all loaded data
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_data);
+  __Pyx_DECREF(__pyx_v_self->_data);
+  __pyx_v_self->_data = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":174
+ *     def __cinit__(self, capacity=524288):
+ *         self._data = bytearray(capacity)
+ *         self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
+ *         self._extent = 0    # end position of all loaded data
+ *         self._origin = 0    # start position of current frame
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->_view);
+  __Pyx_DECREF(__pyx_v_self->_view);
+  __pyx_v_self->_view = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":175
+ *         self._data = bytearray(capacity)
+ *         self._view = memoryview(self._data)
+ *         self._extent = 0    # end position of all loaded data             # <<<<<<<<<<<<<<
+ *         self._origin = 0    # start position of current frame
+ *         self._limit = -1    # end position of current frame
+ */
+  __pyx_v_self->_extent = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":176
+ *         self._view = memoryview(self._data)
+ *         self._extent = 0    # end position of all loaded data
+ *         self._origin = 0    # start position of current frame             # <<<<<<<<<<<<<<
+ *         self._limit = -1    # end position of current frame
+ *         self._frame = None  # frame object
+ */
+  __pyx_v_self->_origin = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":177
+ *         self._extent = 0    # end position of all loaded data
+ *         self._origin = 0    # start position of current frame
+ *         self._limit = -1    # end position of current frame             # <<<<<<<<<<<<<<
+ *         self._frame = None  # frame object
+ *         self._message_frame = MessageFrame(None, ())
+ */
+  __pyx_v_self->_limit = -1;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":178
+ *         self._origin = 0    # start position of current frame
+ *         self._limit = -1    # end position of current frame
+ *         self._frame = None  # frame object             # <<<<<<<<<<<<<<
+ *         self._message_frame = MessageFrame(None, ())
+ * 
+ */
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->_frame);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_frame));
+  __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":179
+ *         self._limit = -1    # end position of current frame
+ *         self._frame = None  # frame object
+ *         self._message_frame = MessageFrame(None, ())             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __pyx_t_2 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_MessageFrame), __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->_message_frame);
+  __Pyx_DECREF(((PyObject *)__pyx_v_self->_message_frame));
+  __pyx_v_self->_message_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":172
+ *     cdef MessageFrame _message_frame
+ * 
+ *     def __cinit__(self, capacity=524288):             # <<<<<<<<<<<<<<
+ *         self._data = bytearray(capacity)
+ *         self._view = memoryview(self._data)
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":181
+ *         self._message_frame = MessageFrame(None, ())
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return repr(self.view().tobytes())
+ * 
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_3__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_3__repr__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_2__repr__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_2__repr__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":182
+ * 
+ *     def __repr__(self):
+ *         return repr(self.view().tobytes())             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef capacity(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->view(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_tobytes); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_2)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_2);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = PyObject_Repr(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":181
+ *         self._message_frame = MessageFrame(None, ())
+ * 
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return repr(self.view().tobytes())
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":184
+ *         return repr(self.view().tobytes())
+ * 
+ *     cpdef capacity(self):             # <<<<<<<<<<<<<<
+ *         return len(self._view)
+ * 
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_capacity(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("capacity", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_5capacity)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":185
+ * 
+ *     cpdef capacity(self):
+ *         return len(self._view)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef view(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_v_self->_view;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_5 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":184
+ *         return repr(self.view().tobytes())
+ * 
+ *     cpdef capacity(self):             # <<<<<<<<<<<<<<
+ *         return len(self._view)
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.capacity", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_5capacity(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("capacity (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_4capacity(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_4capacity(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("capacity", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_capacity(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.capacity", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":187
+ *         return len(self._view)
+ * 
+ *     cpdef view(self):             # <<<<<<<<<<<<<<
+ *         return memoryview(self._view[:self._extent])
+ * 
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("view", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_7view)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":188
+ * 
+ *     cpdef view(self):
+ *         return memoryview(self._view[:self._extent])             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef load(self, b):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, 0, __pyx_v_self->_extent, NULL, NULL, NULL, 0, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 188, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
+  goto __pyx_L0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":187
+ *         return len(self._view)
+ * 
+ *     cpdef view(self):             # <<<<<<<<<<<<<<
+ *         return memoryview(self._view[:self._extent])
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_7view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("view (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_6view(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_6view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("view", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_view(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":190
+ *         return memoryview(self._view[:self._extent])
+ * 
+ *     cpdef load(self, b):             # <<<<<<<<<<<<<<
+ *         """
+ * 
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_load(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_n = NULL;
+  PyObject *__pyx_v_new_extent = NULL;
+  PyObject *__pyx_v_overflow = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("load", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_load); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_9load)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_b) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_b);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":195
+ *         Note: may modify buffer size
+ *         """
+ *         n = len(b)             # <<<<<<<<<<<<<<
+ *         new_extent = self._extent + n
+ *         overflow = new_extent - len(self._data)
+ */
+  __pyx_t_5 = PyObject_Length(__pyx_v_b); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 195, __pyx_L1_error)
+  __pyx_t_1 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_n = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":196
+ *         """
+ *         n = len(b)
+ *         new_extent = self._extent + n             # <<<<<<<<<<<<<<
+ *         overflow = new_extent - len(self._data)
+ *         if overflow > 0:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_extent); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_new_extent = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":197
+ *         n = len(b)
+ *         new_extent = self._extent + n
+ *         overflow = new_extent - len(self._data)             # <<<<<<<<<<<<<<
+ *         if overflow > 0:
+ *             if self._recycle():
+ */
+  __pyx_t_2 = __pyx_v_self->_data;
+  __Pyx_INCREF(__pyx_t_2);
+  if (unlikely(__pyx_t_2 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 197, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyByteArray_GET_SIZE(__pyx_t_2); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = PyInt_FromSsize_t(__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyNumber_Subtract(__pyx_v_new_extent, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_overflow = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":198
+ *         new_extent = self._extent + n
+ *         overflow = new_extent - len(self._data)
+ *         if overflow > 0:             # <<<<<<<<<<<<<<
+ *             if self._recycle():
+ *                 return self.load(b)
+ */
+  __pyx_t_1 = PyObject_RichCompare(__pyx_v_overflow, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 198, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":199
+ *         overflow = new_extent - len(self._data)
+ *         if overflow > 0:
+ *             if self._recycle():             # <<<<<<<<<<<<<<
+ *                 return self.load(b)
+ *             self._view = None
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_recycle(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 199, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (__pyx_t_6) {
+
+      /* "neobolt/impl/python/bolt/_io.pyx":200
+ *         if overflow > 0:
+ *             if self._recycle():
+ *                 return self.load(b)             # <<<<<<<<<<<<<<
+ *             self._view = None
+ *             new_extent = self._extent + n
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->load(__pyx_v_self, __pyx_v_b, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_r = __pyx_t_1;
+      __pyx_t_1 = 0;
+      goto __pyx_L0;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":199
+ *         overflow = new_extent - len(self._data)
+ *         if overflow > 0:
+ *             if self._recycle():             # <<<<<<<<<<<<<<
+ *                 return self.load(b)
+ *             self._view = None
+ */
+    }
+
+    /* "neobolt/impl/python/bolt/_io.pyx":201
+ *             if self._recycle():
+ *                 return self.load(b)
+ *             self._view = None             # <<<<<<<<<<<<<<
+ *             new_extent = self._extent + n
+ *             self._data[self._extent:new_extent] = b
+ */
+    __Pyx_INCREF(Py_None);
+    __Pyx_GIVEREF(Py_None);
+    __Pyx_GOTREF(__pyx_v_self->_view);
+    __Pyx_DECREF(__pyx_v_self->_view);
+    __pyx_v_self->_view = Py_None;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":202
+ *                 return self.load(b)
+ *             self._view = None
+ *             new_extent = self._extent + n             # <<<<<<<<<<<<<<
+ *             self._data[self._extent:new_extent] = b
+ *             self._view = memoryview(self._data)
+ */
+    __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_extent); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 202, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 202, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF_SET(__pyx_v_new_extent, __pyx_t_2);
+    __pyx_t_2 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":203
+ *             self._view = None
+ *             new_extent = self._extent + n
+ *             self._data[self._extent:new_extent] = b             # <<<<<<<<<<<<<<
+ *             self._view = memoryview(self._data)
+ *         else:
+ */
+    if (unlikely(__pyx_v_self->_data == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 203, __pyx_L1_error)
+    }
+    __Pyx_INCREF(__pyx_v_new_extent);
+    __pyx_t_2 = __pyx_v_new_extent;
+    __pyx_t_6 = (__pyx_t_2 == Py_None);
+    if (__pyx_t_6) {
+      __pyx_t_5 = PY_SSIZE_T_MAX;
+    } else {
+      __pyx_t_7 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_7 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 203, __pyx_L1_error)
+      __pyx_t_5 = __pyx_t_7;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_v_b, __pyx_v_self->_extent, __pyx_t_5, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 203, __pyx_L1_error)
+
+    /* "neobolt/impl/python/bolt/_io.pyx":204
+ *             new_extent = self._extent + n
+ *             self._data[self._extent:new_extent] = b
+ *             self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._view[self._extent:new_extent] = b
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_GIVEREF(__pyx_t_1);
+    __Pyx_GOTREF(__pyx_v_self->_view);
+    __Pyx_DECREF(__pyx_v_self->_view);
+    __pyx_v_self->_view = __pyx_t_1;
+    __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":198
+ *         new_extent = self._extent + n
+ *         overflow = new_extent - len(self._data)
+ *         if overflow > 0:             # <<<<<<<<<<<<<<
+ *             if self._recycle():
+ *                 return self.load(b)
+ */
+    goto __pyx_L3;
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":206
+ *             self._view = memoryview(self._data)
+ *         else:
+ *             self._view[self._extent:new_extent] = b             # <<<<<<<<<<<<<<
+ *         self._extent = new_extent
+ * 
+ */
+  /*else*/ {
+    if (__Pyx_PyObject_SetSlice(__pyx_v_self->_view, __pyx_v_b, __pyx_v_self->_extent, 0, NULL, &__pyx_v_new_extent, NULL, 1, 0, 1) < 0) __PYX_ERR(0, 206, __pyx_L1_error)
+  }
+  __pyx_L3:;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":207
+ *         else:
  *             self._view[self._extent:new_extent] = b
+ *         self._extent = new_extent             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef int receive(self, socket, int n) except? -2:
+ */
+  __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_v_new_extent); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 207, __pyx_L1_error)
+  __pyx_v_self->_extent = __pyx_t_8;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":190
+ *         return memoryview(self._view[:self._extent])
+ * 
+ *     cpdef load(self, b):             # <<<<<<<<<<<<<<
+ *         """
+ * 
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_n);
+  __Pyx_XDECREF(__pyx_v_new_extent);
+  __Pyx_XDECREF(__pyx_v_overflow);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_8load[] = "\n\n        Note: may modify buffer size\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("load (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_8load(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_b));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_8load(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("load", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_load(__pyx_v_self, __pyx_v_b, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":209
+ *         self._extent = new_extent
+ * 
+ *     cpdef int receive(self, socket, int n) except? -2:             # <<<<<<<<<<<<<<
+ *         """
+ * 
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch) {
+  int __pyx_v_new_extent;
+  int __pyx_v_overflow;
+  PyObject *__pyx_v_data = 0;
+  int __pyx_v_data_size;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  Py_ssize_t __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("receive", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 209, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_11receive)) {
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 209, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        __pyx_t_6 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+            __pyx_t_6 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          if (__pyx_t_5) {
+            __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+          }
+          __Pyx_INCREF(__pyx_v_socket);
+          __Pyx_GIVEREF(__pyx_v_socket);
+          PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_socket);
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
+          __pyx_t_3 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_6;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":219
+ *         cdef int data_size
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)
+ */
+  {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ExceptionSave(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
+    __Pyx_XGOTREF(__pyx_t_8);
+    __Pyx_XGOTREF(__pyx_t_9);
+    __Pyx_XGOTREF(__pyx_t_10);
+    /*try:*/ {
+
+      /* "neobolt/impl/python/bolt/_io.pyx":220
+ * 
+ *         try:
+ *             new_extent = self._extent + n             # <<<<<<<<<<<<<<
+ *             overflow = new_extent - len(self._data)
+ *             if overflow > 0:
+ */
+      __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_n);
+
+      /* "neobolt/impl/python/bolt/_io.pyx":221
+ *         try:
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)             # <<<<<<<<<<<<<<
+ *             if overflow > 0:
+ *                 if self._recycle():
+ */
+      __pyx_t_1 = __pyx_v_self->_data;
+      __Pyx_INCREF(__pyx_t_1);
+      if (unlikely(__pyx_t_1 == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+        __PYX_ERR(0, 221, __pyx_L3_error)
+      }
+      __pyx_t_11 = PyByteArray_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 221, __pyx_L3_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_v_overflow = (__pyx_v_new_extent - __pyx_t_11);
+
+      /* "neobolt/impl/python/bolt/_io.pyx":222
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)
+ *             if overflow > 0:             # <<<<<<<<<<<<<<
+ *                 if self._recycle():
+ *                     return self.receive(socket, n)
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 146, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_self->_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 146, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_GIVEREF(__pyx_t_1);
-    __Pyx_GOTREF(__pyx_v_self->_view);
-    __Pyx_DECREF(__pyx_v_self->_view);
-    __pyx_v_self->_view = __pyx_t_1;
-    __pyx_t_1 = 0;
+      __pyx_t_12 = ((__pyx_v_overflow > 0) != 0);
+      if (__pyx_t_12) {
 
-    /* "neobolt/bolt/_io.pyx":140
- *         new_extent = self._extent + n
- *         overflow = new_extent - len(self._data)
- *         if overflow > 0:             # <<<<<<<<<<<<<<
- *             if self._recycle():
- *                 return self.load(b)
+        /* "neobolt/impl/python/bolt/_io.pyx":223
+ *             overflow = new_extent - len(self._data)
+ *             if overflow > 0:
+ *                 if self._recycle():             # <<<<<<<<<<<<<<
+ *                     return self.receive(socket, n)
+ *                 self._view = None
  */
-    goto __pyx_L3;
+        __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_recycle(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 223, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 223, __pyx_L3_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        if (__pyx_t_12) {
+
+          /* "neobolt/impl/python/bolt/_io.pyx":224
+ *             if overflow > 0:
+ *                 if self._recycle():
+ *                     return self.receive(socket, n)             # <<<<<<<<<<<<<<
+ *                 self._view = None
+ *                 data = socket.recv(n)
+ */
+          __pyx_t_6 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->receive(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 0); if (unlikely(__pyx_t_6 == ((int)-2) && PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L3_error)
+          __pyx_r = __pyx_t_6;
+          goto __pyx_L7_try_return;
+
+          /* "neobolt/impl/python/bolt/_io.pyx":223
+ *             overflow = new_extent - len(self._data)
+ *             if overflow > 0:
+ *                 if self._recycle():             # <<<<<<<<<<<<<<
+ *                     return self.receive(socket, n)
+ *                 self._view = None
+ */
+        }
+
+        /* "neobolt/impl/python/bolt/_io.pyx":225
+ *                 if self._recycle():
+ *                     return self.receive(socket, n)
+ *                 self._view = None             # <<<<<<<<<<<<<<
+ *                 data = socket.recv(n)
+ *                 data_size = len(data)
+ */
+        __Pyx_INCREF(Py_None);
+        __Pyx_GIVEREF(Py_None);
+        __Pyx_GOTREF(__pyx_v_self->_view);
+        __Pyx_DECREF(__pyx_v_self->_view);
+        __pyx_v_self->_view = Py_None;
+
+        /* "neobolt/impl/python/bolt/_io.pyx":226
+ *                     return self.receive(socket, n)
+ *                 self._view = None
+ *                 data = socket.recv(n)             # <<<<<<<<<<<<<<
+ *                 data_size = len(data)
+ *                 new_extent = self._extent + data_size
+ */
+        __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_socket, __pyx_n_s_recv); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 226, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_2, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_7, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 226, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 226, __pyx_L3_error)
+        __pyx_v_data = ((PyObject*)__pyx_t_1);
+        __pyx_t_1 = 0;
+
+        /* "neobolt/impl/python/bolt/_io.pyx":227
+ *                 self._view = None
+ *                 data = socket.recv(n)
+ *                 data_size = len(data)             # <<<<<<<<<<<<<<
+ *                 new_extent = self._extent + data_size
+ *                 self._data[self._extent:new_extent] = data
+ */
+        if (unlikely(__pyx_v_data == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+          __PYX_ERR(0, 227, __pyx_L3_error)
+        }
+        __pyx_t_11 = PyBytes_GET_SIZE(__pyx_v_data); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 227, __pyx_L3_error)
+        __pyx_v_data_size = __pyx_t_11;
+
+        /* "neobolt/impl/python/bolt/_io.pyx":228
+ *                 data = socket.recv(n)
+ *                 data_size = len(data)
+ *                 new_extent = self._extent + data_size             # <<<<<<<<<<<<<<
+ *                 self._data[self._extent:new_extent] = data
+ *                 self._view = memoryview(self._data)
+ */
+        __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_data_size);
+
+        /* "neobolt/impl/python/bolt/_io.pyx":229
+ *                 data_size = len(data)
+ *                 new_extent = self._extent + data_size
+ *                 self._data[self._extent:new_extent] = data             # <<<<<<<<<<<<<<
+ *                 self._view = memoryview(self._data)
+ *             else:
+ */
+        if (unlikely(__pyx_v_self->_data == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+          __PYX_ERR(0, 229, __pyx_L3_error)
+        }
+        if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_v_data, __pyx_v_self->_extent, __pyx_v_new_extent, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 229, __pyx_L3_error)
+
+        /* "neobolt/impl/python/bolt/_io.pyx":230
+ *                 new_extent = self._extent + data_size
+ *                 self._data[self._extent:new_extent] = data
+ *                 self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
+ *             else:
+ *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_GIVEREF(__pyx_t_2);
+        __Pyx_GOTREF(__pyx_v_self->_view);
+        __Pyx_DECREF(__pyx_v_self->_view);
+        __pyx_v_self->_view = __pyx_t_2;
+        __pyx_t_2 = 0;
+
+        /* "neobolt/impl/python/bolt/_io.pyx":222
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)
+ *             if overflow > 0:             # <<<<<<<<<<<<<<
+ *                 if self._recycle():
+ *                     return self.receive(socket, n)
+ */
+        goto __pyx_L9;
+      }
+
+      /* "neobolt/impl/python/bolt/_io.pyx":232
+ *                 self._view = memoryview(self._data)
+ *             else:
+ *                 data_size = socket.recv_into(self._view[self._extent:new_extent])             # <<<<<<<<<<<<<<
+ *                 new_extent = self._extent + data_size
+ *             self._extent = new_extent
+ */
+      /*else*/ {
+        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_socket, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 232, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __pyx_t_4 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_self->_extent, __pyx_v_new_extent, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 232, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_7 = NULL;
+        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_1);
+          if (likely(__pyx_t_7)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+            __Pyx_INCREF(__pyx_t_7);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_1, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_7, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 232, __pyx_L3_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 232, __pyx_L3_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_v_data_size = __pyx_t_6;
+
+        /* "neobolt/impl/python/bolt/_io.pyx":233
+ *             else:
+ *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
+ *                 new_extent = self._extent + data_size             # <<<<<<<<<<<<<<
+ *             self._extent = new_extent
+ *             return data_size
+ */
+        __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_data_size);
+      }
+      __pyx_L9:;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":234
+ *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
+ *                 new_extent = self._extent + data_size
+ *             self._extent = new_extent             # <<<<<<<<<<<<<<
+ *             return data_size
+ *         except KeyboardInterrupt:
+ */
+      __pyx_v_self->_extent = __pyx_v_new_extent;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":235
+ *                 new_extent = self._extent + data_size
+ *             self._extent = new_extent
+ *             return data_size             # <<<<<<<<<<<<<<
+ *         except KeyboardInterrupt:
+ *             return -1
+ */
+      __pyx_r = __pyx_v_data_size;
+      goto __pyx_L7_try_return;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":219
+ *         cdef int data_size
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)
+ */
+    }
+    __pyx_L3_error:;
+    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":236
+ *             self._extent = new_extent
+ *             return data_size
+ *         except KeyboardInterrupt:             # <<<<<<<<<<<<<<
+ *             return -1
+ * 
+ */
+    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_KeyboardInterrupt);
+    if (__pyx_t_6) {
+      __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
+      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_1, &__pyx_t_4) < 0) __PYX_ERR(0, 236, __pyx_L5_except_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_t_4);
+
+      /* "neobolt/impl/python/bolt/_io.pyx":237
+ *             return data_size
+ *         except KeyboardInterrupt:
+ *             return -1             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef reserve(self, int n):
+ */
+      __pyx_r = -1;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      goto __pyx_L6_except_return;
+    }
+    goto __pyx_L5_except_error;
+    __pyx_L5_except_error:;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":219
+ *         cdef int data_size
+ * 
+ *         try:             # <<<<<<<<<<<<<<
+ *             new_extent = self._extent + n
+ *             overflow = new_extent - len(self._data)
+ */
+    __Pyx_XGIVEREF(__pyx_t_8);
+    __Pyx_XGIVEREF(__pyx_t_9);
+    __Pyx_XGIVEREF(__pyx_t_10);
+    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+    goto __pyx_L1_error;
+    __pyx_L7_try_return:;
+    __Pyx_XGIVEREF(__pyx_t_8);
+    __Pyx_XGIVEREF(__pyx_t_9);
+    __Pyx_XGIVEREF(__pyx_t_10);
+    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+    goto __pyx_L0;
+    __pyx_L6_except_return:;
+    __Pyx_XGIVEREF(__pyx_t_8);
+    __Pyx_XGIVEREF(__pyx_t_9);
+    __Pyx_XGIVEREF(__pyx_t_10);
+    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
+    goto __pyx_L0;
   }
 
-  /* "neobolt/bolt/_io.pyx":148
- *             self._view = memoryview(self._data)
- *         else:
- *             self._view[self._extent:new_extent] = b             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":209
  *         self._extent = new_extent
  * 
- */
-  /*else*/ {
-    if (__Pyx_PyObject_SetSlice(__pyx_v_self->_view, __pyx_v_b, __pyx_v_self->_extent, 0, NULL, &__pyx_v_new_extent, NULL, 1, 0, 1) < 0) __PYX_ERR(1, 148, __pyx_L1_error)
-  }
-  __pyx_L3:;
-
-  /* "neobolt/bolt/_io.pyx":149
- *         else:
- *             self._view[self._extent:new_extent] = b
- *         self._extent = new_extent             # <<<<<<<<<<<<<<
- * 
- *     cpdef int receive(self, socket, int n):
- */
-  __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_v_new_extent); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 149, __pyx_L1_error)
-  __pyx_v_self->_extent = __pyx_t_8;
-
-  /* "neobolt/bolt/_io.pyx":132
- *         return memoryview(self._view[:self._extent])
- * 
- *     cpdef load(self, b):             # <<<<<<<<<<<<<<
+ *     cpdef int receive(self, socket, int n) except? -2:             # <<<<<<<<<<<<<<
  *         """
  * 
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_n);
-  __Pyx_XDECREF(__pyx_v_new_extent);
-  __Pyx_XDECREF(__pyx_v_overflow);
-  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_XDECREF(__pyx_v_data);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
-static char __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load[] = "\n\n        Note: may modify buffer size\n        ";
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_9load(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_10receive[] = "\n\n        Note: may modify buffer size, should error if frame exists\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_socket = 0;
+  int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("load (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_b));
+  __Pyx_RefNannySetupContext("receive (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_socket,&__pyx_n_s_n,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_socket)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("receive", 1, 2, 2, 1); __PYX_ERR(0, 209, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "receive") < 0)) __PYX_ERR(0, 209, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_socket = values[0];
+    __pyx_v_n = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("receive", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 209, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_10receive(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_socket, __pyx_v_n);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_b) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_10receive(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("load", 0);
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("receive", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_load(__pyx_v_self, __pyx_v_b, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 132, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 1); if (unlikely(__pyx_t_1 == ((int)-2) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.load", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3710,581 +5542,476 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load(struct
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":151
- *         self._extent = new_extent
- * 
- *     cpdef int receive(self, socket, int n):             # <<<<<<<<<<<<<<
- *         """
+/* "neobolt/impl/python/bolt/_io.pyx":239
+ *             return -1
  * 
+ *     cpdef reserve(self, int n):             # <<<<<<<<<<<<<<
+ *         """ Return a writable view of at least `n` bytes of free space
+ *         following the loaded data, into which data can be received
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch) {
-  int __pyx_v_new_extent;
-  int __pyx_v_overflow;
-  PyObject *__pyx_v_data = 0;
-  int __pyx_v_data_size;
-  int __pyx_r;
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_13reserve(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch) {
+  int __pyx_v_shortfall;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
-  int __pyx_t_6;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
-  PyObject *__pyx_t_10 = NULL;
-  Py_ssize_t __pyx_t_11;
-  int __pyx_t_12;
-  __Pyx_RefNannySetupContext("receive", 0);
+  Py_ssize_t __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reserve", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 151, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_11receive)) {
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 151, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
-      __pyx_t_6 = 0;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
-          __pyx_t_6 = 1;
-        }
-      }
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 151, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 151, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_reserve); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_13reserve)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 239, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 151, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        }
-        __Pyx_INCREF(__pyx_v_socket);
-        __Pyx_GIVEREF(__pyx_v_socket);
-        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_socket);
-        __Pyx_GIVEREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 151, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 239, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 151, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_6;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":161
- *         cdef int data_size
+  /* "neobolt/impl/python/bolt/_io.pyx":249
+ *         cdef int shortfall
  * 
- *         try:             # <<<<<<<<<<<<<<
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)
+ *         self.discard_message()             # <<<<<<<<<<<<<<
+ *         if self._extent + n > len(self._data):
+ *             self._recycle()
  */
-  {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ExceptionSave(&__pyx_t_8, &__pyx_t_9, &__pyx_t_10);
-    __Pyx_XGOTREF(__pyx_t_8);
-    __Pyx_XGOTREF(__pyx_t_9);
-    __Pyx_XGOTREF(__pyx_t_10);
-    /*try:*/ {
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->discard_message(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/bolt/_io.pyx":162
+  /* "neobolt/impl/python/bolt/_io.pyx":250
  * 
- *         try:
- *             new_extent = self._extent + n             # <<<<<<<<<<<<<<
- *             overflow = new_extent - len(self._data)
- *             if overflow > 0:
- */
-      __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_n);
-
-      /* "neobolt/bolt/_io.pyx":163
- *         try:
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)             # <<<<<<<<<<<<<<
- *             if overflow > 0:
- *                 if self._recycle():
- */
-      __pyx_t_1 = __pyx_v_self->_data;
-      __Pyx_INCREF(__pyx_t_1);
-      if (unlikely(__pyx_t_1 == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-        __PYX_ERR(1, 163, __pyx_L3_error)
-      }
-      __pyx_t_11 = PyByteArray_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(1, 163, __pyx_L3_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_v_overflow = (__pyx_v_new_extent - __pyx_t_11);
-
-      /* "neobolt/bolt/_io.pyx":164
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)
- *             if overflow > 0:             # <<<<<<<<<<<<<<
- *                 if self._recycle():
- *                     return self.receive(socket, n)
- */
-      __pyx_t_12 = ((__pyx_v_overflow > 0) != 0);
-      if (__pyx_t_12) {
-
-        /* "neobolt/bolt/_io.pyx":165
- *             overflow = new_extent - len(self._data)
- *             if overflow > 0:
- *                 if self._recycle():             # <<<<<<<<<<<<<<
- *                     return self.receive(socket, n)
- *                 self._view = None
- */
-        __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_recycle(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 165, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_12 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(1, 165, __pyx_L3_error)
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (__pyx_t_12) {
-
-          /* "neobolt/bolt/_io.pyx":166
- *             if overflow > 0:
- *                 if self._recycle():
- *                     return self.receive(socket, n)             # <<<<<<<<<<<<<<
- *                 self._view = None
- *                 data = socket.recv(n)
- */
-          __pyx_r = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->receive(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 0);
-          goto __pyx_L7_try_return;
-
-          /* "neobolt/bolt/_io.pyx":165
- *             overflow = new_extent - len(self._data)
- *             if overflow > 0:
- *                 if self._recycle():             # <<<<<<<<<<<<<<
- *                     return self.receive(socket, n)
- *                 self._view = None
- */
-        }
-
-        /* "neobolt/bolt/_io.pyx":167
- *                 if self._recycle():
- *                     return self.receive(socket, n)
- *                 self._view = None             # <<<<<<<<<<<<<<
- *                 data = socket.recv(n)
- *                 data_size = len(data)
- */
-        __Pyx_INCREF(Py_None);
-        __Pyx_GIVEREF(Py_None);
-        __Pyx_GOTREF(__pyx_v_self->_view);
-        __Pyx_DECREF(__pyx_v_self->_view);
-        __pyx_v_self->_view = Py_None;
-
-        /* "neobolt/bolt/_io.pyx":168
- *                     return self.receive(socket, n)
- *                 self._view = None
- *                 data = socket.recv(n)             # <<<<<<<<<<<<<<
- *                 data_size = len(data)
- *                 new_extent = self._extent + data_size
- */
-        __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_socket, __pyx_n_s_recv); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 168, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 168, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_7 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-          __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_2);
-          if (likely(__pyx_t_7)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-            __Pyx_INCREF(__pyx_t_7);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_2, function);
-          }
-        }
-        if (!__pyx_t_7) {
-          __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 168, __pyx_L3_error)
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-        } else {
-          #if CYTHON_FAST_PYCALL
-          if (PyFunction_Check(__pyx_t_2)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_4};
-            __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 168, __pyx_L3_error)
-            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          } else
-          #endif
-          #if CYTHON_FAST_PYCCALL
-          if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_7, __pyx_t_4};
-            __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 168, __pyx_L3_error)
-            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-          } else
-          #endif
-          {
-            __pyx_t_3 = PyTuple_New(1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 168, __pyx_L3_error)
-            __Pyx_GOTREF(__pyx_t_3);
-            __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_7); __pyx_t_7 = NULL;
-            __Pyx_GIVEREF(__pyx_t_4);
-            PyTuple_SET_ITEM(__pyx_t_3, 0+1, __pyx_t_4);
-            __pyx_t_4 = 0;
-            __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 168, __pyx_L3_error)
-            __Pyx_GOTREF(__pyx_t_1);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          }
-        }
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(1, 168, __pyx_L3_error)
-        __pyx_v_data = ((PyObject*)__pyx_t_1);
-        __pyx_t_1 = 0;
-
-        /* "neobolt/bolt/_io.pyx":169
- *                 self._view = None
- *                 data = socket.recv(n)
- *                 data_size = len(data)             # <<<<<<<<<<<<<<
- *                 new_extent = self._extent + data_size
- *                 self._data[self._extent:new_extent] = data
+ *         self.discard_message()
+ *         if self._extent + n > len(self._data):             # <<<<<<<<<<<<<<
+ *             self._recycle()
+ *             shortfall = self._extent + n - len(self._data)
  */
-        if (unlikely(__pyx_v_data == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-          __PYX_ERR(1, 169, __pyx_L3_error)
-        }
-        __pyx_t_11 = PyBytes_GET_SIZE(__pyx_v_data); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(1, 169, __pyx_L3_error)
-        __pyx_v_data_size = __pyx_t_11;
+  __pyx_t_1 = __pyx_v_self->_data;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 250, __pyx_L1_error)
+  }
+  __pyx_t_6 = PyByteArray_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = (((__pyx_v_self->_extent + __pyx_v_n) > __pyx_t_6) != 0);
+  if (__pyx_t_7) {
 
-        /* "neobolt/bolt/_io.pyx":170
- *                 data = socket.recv(n)
- *                 data_size = len(data)
- *                 new_extent = self._extent + data_size             # <<<<<<<<<<<<<<
- *                 self._data[self._extent:new_extent] = data
- *                 self._view = memoryview(self._data)
+    /* "neobolt/impl/python/bolt/_io.pyx":251
+ *         self.discard_message()
+ *         if self._extent + n > len(self._data):
+ *             self._recycle()             # <<<<<<<<<<<<<<
+ *             shortfall = self._extent + n - len(self._data)
+ *             if shortfall > 0:
  */
-        __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_data_size);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_recycle(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "neobolt/bolt/_io.pyx":171
- *                 data_size = len(data)
- *                 new_extent = self._extent + data_size
- *                 self._data[self._extent:new_extent] = data             # <<<<<<<<<<<<<<
- *                 self._view = memoryview(self._data)
- *             else:
+    /* "neobolt/impl/python/bolt/_io.pyx":252
+ *         if self._extent + n > len(self._data):
+ *             self._recycle()
+ *             shortfall = self._extent + n - len(self._data)             # <<<<<<<<<<<<<<
+ *             if shortfall > 0:
+ *                 self._view = None
  */
-        if (unlikely(__pyx_v_self->_data == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(1, 171, __pyx_L3_error)
-        }
-        if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_v_data, __pyx_v_self->_extent, __pyx_v_new_extent, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 171, __pyx_L3_error)
+    __pyx_t_1 = __pyx_v_self->_data;
+    __Pyx_INCREF(__pyx_t_1);
+    if (unlikely(__pyx_t_1 == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+      __PYX_ERR(0, 252, __pyx_L1_error)
+    }
+    __pyx_t_6 = PyByteArray_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 252, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_shortfall = ((__pyx_v_self->_extent + __pyx_v_n) - __pyx_t_6);
 
-        /* "neobolt/bolt/_io.pyx":172
- *                 new_extent = self._extent + data_size
- *                 self._data[self._extent:new_extent] = data
- *                 self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
- *             else:
- *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
+    /* "neobolt/impl/python/bolt/_io.pyx":253
+ *             self._recycle()
+ *             shortfall = self._extent + n - len(self._data)
+ *             if shortfall > 0:             # <<<<<<<<<<<<<<
+ *                 self._view = None
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))
  */
-        __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 172, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 172, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_GIVEREF(__pyx_t_2);
-        __Pyx_GOTREF(__pyx_v_self->_view);
-        __Pyx_DECREF(__pyx_v_self->_view);
-        __pyx_v_self->_view = __pyx_t_2;
-        __pyx_t_2 = 0;
+    __pyx_t_7 = ((__pyx_v_shortfall > 0) != 0);
+    if (__pyx_t_7) {
 
-        /* "neobolt/bolt/_io.pyx":164
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)
- *             if overflow > 0:             # <<<<<<<<<<<<<<
- *                 if self._recycle():
- *                     return self.receive(socket, n)
+      /* "neobolt/impl/python/bolt/_io.pyx":254
+ *             shortfall = self._extent + n - len(self._data)
+ *             if shortfall > 0:
+ *                 self._view = None             # <<<<<<<<<<<<<<
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))
+ *                 self._view = memoryview(self._data)
  */
-        goto __pyx_L9;
-      }
+      __Pyx_INCREF(Py_None);
+      __Pyx_GIVEREF(Py_None);
+      __Pyx_GOTREF(__pyx_v_self->_view);
+      __Pyx_DECREF(__pyx_v_self->_view);
+      __pyx_v_self->_view = Py_None;
 
-      /* "neobolt/bolt/_io.pyx":174
+      /* "neobolt/impl/python/bolt/_io.pyx":255
+ *             if shortfall > 0:
+ *                 self._view = None
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))             # <<<<<<<<<<<<<<
  *                 self._view = memoryview(self._data)
- *             else:
- *                 data_size = socket.recv_into(self._view[self._extent:new_extent])             # <<<<<<<<<<<<<<
- *                 new_extent = self._extent + data_size
- *             self._extent = new_extent
+ *         return self._view[self._extent:]
  */
-      /*else*/ {
-        __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_socket, __pyx_n_s_recv_into); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 174, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_t_3 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_self->_extent, __pyx_v_new_extent, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 174, __pyx_L3_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-            __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_1, function);
-          }
-        }
-        if (!__pyx_t_4) {
-          __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 174, __pyx_L3_error)
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else {
-          #if CYTHON_FAST_PYCALL
-          if (PyFunction_Check(__pyx_t_1)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-            __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 174, __pyx_L3_error)
-            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          } else
-          #endif
-          #if CYTHON_FAST_PYCCALL
-          if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
-            PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_3};
-            __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 174, __pyx_L3_error)
-            __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-          } else
-          #endif
-          {
-            __pyx_t_7 = PyTuple_New(1+1); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 174, __pyx_L3_error)
-            __Pyx_GOTREF(__pyx_t_7);
-            __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_4); __pyx_t_4 = NULL;
-            __Pyx_GIVEREF(__pyx_t_3);
-            PyTuple_SET_ITEM(__pyx_t_7, 0+1, __pyx_t_3);
-            __pyx_t_3 = 0;
-            __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 174, __pyx_L3_error)
-            __Pyx_GOTREF(__pyx_t_2);
-            __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-          }
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->_data, __pyx_n_s_extend); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_4 = __pyx_v_self->_data;
+      __Pyx_INCREF(__pyx_t_4);
+      if (unlikely(__pyx_t_4 == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+        __PYX_ERR(0, 255, __pyx_L1_error)
+      }
+      __pyx_t_6 = PyByteArray_GET_SIZE(__pyx_t_4); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_8 = __pyx_v_shortfall;
+      if (((__pyx_t_6 > __pyx_t_8) != 0)) {
+        __pyx_t_9 = __pyx_t_6;
+      } else {
+        __pyx_t_9 = __pyx_t_8;
+      }
+      __pyx_t_4 = PyInt_FromSsize_t(__pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_2, function);
         }
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 174, __pyx_L3_error)
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_v_data_size = __pyx_t_6;
+      }
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 255, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-        /* "neobolt/bolt/_io.pyx":175
- *             else:
- *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
- *                 new_extent = self._extent + data_size             # <<<<<<<<<<<<<<
- *             self._extent = new_extent
- *             return data_size
+      /* "neobolt/impl/python/bolt/_io.pyx":256
+ *                 self._view = None
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))
+ *                 self._view = memoryview(self._data)             # <<<<<<<<<<<<<<
+ *         return self._view[self._extent:]
+ * 
  */
-        __pyx_v_new_extent = (__pyx_v_self->_extent + __pyx_v_data_size);
-      }
-      __pyx_L9:;
+      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_self->_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 256, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_GIVEREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_v_self->_view);
+      __Pyx_DECREF(__pyx_v_self->_view);
+      __pyx_v_self->_view = __pyx_t_2;
+      __pyx_t_2 = 0;
 
-      /* "neobolt/bolt/_io.pyx":176
- *                 data_size = socket.recv_into(self._view[self._extent:new_extent])
- *                 new_extent = self._extent + data_size
- *             self._extent = new_extent             # <<<<<<<<<<<<<<
- *             return data_size
- *         except KeyboardInterrupt:
+      /* "neobolt/impl/python/bolt/_io.pyx":253
+ *             self._recycle()
+ *             shortfall = self._extent + n - len(self._data)
+ *             if shortfall > 0:             # <<<<<<<<<<<<<<
+ *                 self._view = None
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))
  */
-      __pyx_v_self->_extent = __pyx_v_new_extent;
+    }
 
-      /* "neobolt/bolt/_io.pyx":177
- *                 new_extent = self._extent + data_size
- *             self._extent = new_extent
- *             return data_size             # <<<<<<<<<<<<<<
- *         except KeyboardInterrupt:
- *             return -1
+    /* "neobolt/impl/python/bolt/_io.pyx":250
+ * 
+ *         self.discard_message()
+ *         if self._extent + n > len(self._data):             # <<<<<<<<<<<<<<
+ *             self._recycle()
+ *             shortfall = self._extent + n - len(self._data)
  */
-      __pyx_r = __pyx_v_data_size;
-      goto __pyx_L7_try_return;
+  }
 
-      /* "neobolt/bolt/_io.pyx":161
- *         cdef int data_size
+  /* "neobolt/impl/python/bolt/_io.pyx":257
+ *                 self._data.extend(bytes(max(shortfall, len(self._data))))
+ *                 self._view = memoryview(self._data)
+ *         return self._view[self._extent:]             # <<<<<<<<<<<<<<
  * 
- *         try:             # <<<<<<<<<<<<<<
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)
+ *     cpdef advance(self, int n):
  */
-    }
-    __pyx_L3_error:;
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_self->_extent, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
 
-    /* "neobolt/bolt/_io.pyx":178
- *             self._extent = new_extent
- *             return data_size
- *         except KeyboardInterrupt:             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":239
  *             return -1
  * 
+ *     cpdef reserve(self, int n):             # <<<<<<<<<<<<<<
+ *         """ Return a writable view of at least `n` bytes of free space
+ *         following the loaded data, into which data can be received
  */
-    __pyx_t_6 = __Pyx_PyErr_ExceptionMatches(__pyx_builtin_KeyboardInterrupt);
-    if (__pyx_t_6) {
-      __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_1, &__pyx_t_7) < 0) __PYX_ERR(1, 178, __pyx_L5_except_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_t_7);
 
-      /* "neobolt/bolt/_io.pyx":179
- *             return data_size
- *         except KeyboardInterrupt:
- *             return -1             # <<<<<<<<<<<<<<
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.reserve", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_13reserve(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_12reserve[] = " Return a writable view of at least `n` bytes of free space\n        following the loaded data, into which data can be received\n        directly. Any data written is loaded by a subsequent call to\n        :meth:`.advance`. The current frame, if any, is discarded.\n\n        Note: may modify buffer size\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_13reserve(PyObject *__pyx_v_self, PyObject *__pyx_arg_n) {
+  int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reserve (wrapper)", 0);
+  assert(__pyx_arg_n); {
+    __pyx_v_n = __Pyx_PyInt_As_int(__pyx_arg_n); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 239, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.reserve", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_12reserve(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((int)__pyx_v_n));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_12reserve(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("reserve", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_reserve(__pyx_v_self, __pyx_v_n, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.reserve", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":259
+ *         return self._view[self._extent:]
  * 
- *     cpdef int receive_message(self, socket, int n):
+ *     cpdef advance(self, int n):             # <<<<<<<<<<<<<<
+ *         """ Load `n` bytes written into the view returned by
+ *         :meth:`.reserve`.
  */
-      __pyx_r = -1;
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_15advance(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_advance(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("advance", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_advance); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_15advance)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-      goto __pyx_L6_except_return;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    goto __pyx_L5_except_error;
-    __pyx_L5_except_error:;
+    #endif
+  }
 
-    /* "neobolt/bolt/_io.pyx":161
- *         cdef int data_size
+  /* "neobolt/impl/python/bolt/_io.pyx":263
+ *         :meth:`.reserve`.
+ *         """
+ *         self._extent += n             # <<<<<<<<<<<<<<
  * 
- *         try:             # <<<<<<<<<<<<<<
- *             new_extent = self._extent + n
- *             overflow = new_extent - len(self._data)
+ *     cpdef int receive_message(self, socket, int n) except? -2:
  */
-    __Pyx_XGIVEREF(__pyx_t_8);
-    __Pyx_XGIVEREF(__pyx_t_9);
-    __Pyx_XGIVEREF(__pyx_t_10);
-    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-    goto __pyx_L1_error;
-    __pyx_L7_try_return:;
-    __Pyx_XGIVEREF(__pyx_t_8);
-    __Pyx_XGIVEREF(__pyx_t_9);
-    __Pyx_XGIVEREF(__pyx_t_10);
-    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-    goto __pyx_L0;
-    __pyx_L6_except_return:;
-    __Pyx_XGIVEREF(__pyx_t_8);
-    __Pyx_XGIVEREF(__pyx_t_9);
-    __Pyx_XGIVEREF(__pyx_t_10);
-    __Pyx_ExceptionReset(__pyx_t_8, __pyx_t_9, __pyx_t_10);
-    goto __pyx_L0;
-  }
+  __pyx_v_self->_extent = (__pyx_v_self->_extent + __pyx_v_n);
 
-  /* "neobolt/bolt/_io.pyx":151
- *         self._extent = new_extent
- * 
- *     cpdef int receive(self, socket, int n):             # <<<<<<<<<<<<<<
- *         """
+  /* "neobolt/impl/python/bolt/_io.pyx":259
+ *         return self._view[self._extent:]
  * 
+ *     cpdef advance(self, int n):             # <<<<<<<<<<<<<<
+ *         """ Load `n` bytes written into the view returned by
+ *         :meth:`.reserve`.
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_WriteUnraisable("neobolt.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive[] = "\n\n        Note: may modify buffer size, should error if frame exists\n        ";
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_11receive(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_socket = 0;
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_15advance(PyObject *__pyx_v_self, PyObject *__pyx_arg_n); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_14advance[] = " Load `n` bytes written into the view returned by\n        :meth:`.reserve`.\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_15advance(PyObject *__pyx_v_self, PyObject *__pyx_arg_n) {
   int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("receive (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_socket,&__pyx_n_s_n,0};
-    PyObject* values[2] = {0,0};
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_socket)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("receive", 1, 2, 2, 1); __PYX_ERR(1, 151, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "receive") < 0)) __PYX_ERR(1, 151, __pyx_L3_error)
-      }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-    }
-    __pyx_v_socket = values[0];
-    __pyx_v_n = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 151, __pyx_L3_error)
+  __Pyx_RefNannySetupContext("advance (wrapper)", 0);
+  assert(__pyx_arg_n); {
+    __pyx_v_n = __Pyx_PyInt_As_int(__pyx_arg_n); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 259, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("receive", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 151, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_socket, __pyx_v_n);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_14advance(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((int)__pyx_v_n));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_14advance(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_n) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("receive", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("advance", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 151, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_advance(__pyx_v_self, __pyx_v_n, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 259, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4293,7 +6020,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive(str
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.receive", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.advance", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4301,16 +6028,16 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive(str
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":181
- *             return -1
+/* "neobolt/impl/python/bolt/_io.pyx":265
+ *         self._extent += n
  * 
- *     cpdef int receive_message(self, socket, int n):             # <<<<<<<<<<<<<<
+ *     cpdef int receive_message(self, socket, int n) except? -2:             # <<<<<<<<<<<<<<
  *         """
  * 
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_17receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n, int __pyx_skip_dispatch) {
   int __pyx_v_received;
   PyObject *__pyx_v_frame_message = NULL;
   PyObject *__pyx_v_receive = NULL;
@@ -4325,98 +6052,116 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
   PyObject *__pyx_t_7 = NULL;
   int __pyx_t_8;
   int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("receive_message", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 181, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_message)) {
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 181, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
-      __pyx_t_6 = 0;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_5);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
-          __pyx_t_6 = 1;
-        }
-      }
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 181, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 181, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      {
-        __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(1, 181, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_17receive_message)) {
+        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 265, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        __pyx_t_6 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+            __pyx_t_6 = 1;
+          }
         }
-        __Pyx_INCREF(__pyx_v_socket);
-        __Pyx_GIVEREF(__pyx_v_socket);
-        PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_socket);
-        __Pyx_GIVEREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 181, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_v_socket, __pyx_t_3};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 265, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          if (__pyx_t_5) {
+            __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+          }
+          __Pyx_INCREF(__pyx_v_socket);
+          __Pyx_GIVEREF(__pyx_v_socket);
+          PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_v_socket);
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_t_3);
+          __pyx_t_3 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_6;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 181, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_6;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":190
+  /* "neobolt/impl/python/bolt/_io.pyx":274
  *         cdef int received
  * 
  *         frame_message = self.frame_message             # <<<<<<<<<<<<<<
  *         receive = self.receive
  *         while not frame_message():
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 190, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_frame_message = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":191
+  /* "neobolt/impl/python/bolt/_io.pyx":275
  * 
  *         frame_message = self.frame_message
  *         receive = self.receive             # <<<<<<<<<<<<<<
  *         while not frame_message():
  *             received = receive(socket, n)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 191, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_receive); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_receive = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":192
+  /* "neobolt/impl/python/bolt/_io.pyx":276
  *         frame_message = self.frame_message
  *         receive = self.receive
  *         while not frame_message():             # <<<<<<<<<<<<<<
@@ -4435,27 +6180,24 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
         __Pyx_DECREF_SET(__pyx_t_2, function);
       }
     }
-    if (__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 192, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    } else {
-      __pyx_t_1 = __Pyx_PyObject_CallNoArg(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 192, __pyx_L1_error)
-    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(1, 192, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(0, 276, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_9 = ((!__pyx_t_8) != 0);
     if (!__pyx_t_9) break;
 
-    /* "neobolt/bolt/_io.pyx":193
+    /* "neobolt/impl/python/bolt/_io.pyx":277
  *         receive = self.receive
  *         while not frame_message():
  *             received = receive(socket, n)             # <<<<<<<<<<<<<<
  *             if received <= 0:
  *                 return received
  */
-    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 193, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_n); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_INCREF(__pyx_v_receive);
     __pyx_t_4 = __pyx_v_receive; __pyx_t_7 = NULL;
@@ -4473,7 +6215,7 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_socket, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 193, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -4482,14 +6224,14 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
       PyObject *__pyx_temp[3] = {__pyx_t_7, __pyx_v_socket, __pyx_t_2};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 193, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     } else
     #endif
     {
-      __pyx_t_3 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 193, __pyx_L1_error)
+      __pyx_t_3 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 277, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       if (__pyx_t_7) {
         __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -4500,16 +6242,16 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
       __Pyx_GIVEREF(__pyx_t_2);
       PyTuple_SET_ITEM(__pyx_t_3, 1+__pyx_t_6, __pyx_t_2);
       __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 193, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     }
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 193, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_6 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_received = __pyx_t_6;
 
-    /* "neobolt/bolt/_io.pyx":194
+    /* "neobolt/impl/python/bolt/_io.pyx":278
  *         while not frame_message():
  *             received = receive(socket, n)
  *             if received <= 0:             # <<<<<<<<<<<<<<
@@ -4519,7 +6261,7 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
     __pyx_t_9 = ((__pyx_v_received <= 0) != 0);
     if (__pyx_t_9) {
 
-      /* "neobolt/bolt/_io.pyx":195
+      /* "neobolt/impl/python/bolt/_io.pyx":279
  *             received = receive(socket, n)
  *             if received <= 0:
  *                 return received             # <<<<<<<<<<<<<<
@@ -4529,7 +6271,7 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
       __pyx_r = __pyx_v_received;
       goto __pyx_L0;
 
-      /* "neobolt/bolt/_io.pyx":194
+      /* "neobolt/impl/python/bolt/_io.pyx":278
  *         while not frame_message():
  *             received = receive(socket, n)
  *             if received <= 0:             # <<<<<<<<<<<<<<
@@ -4539,7 +6281,7 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
     }
   }
 
-  /* "neobolt/bolt/_io.pyx":196
+  /* "neobolt/impl/python/bolt/_io.pyx":280
  *             if received <= 0:
  *                 return received
  *         return 1             # <<<<<<<<<<<<<<
@@ -4549,10 +6291,10 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
   __pyx_r = 1;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":181
- *             return -1
+  /* "neobolt/impl/python/bolt/_io.pyx":265
+ *         self._extent += n
  * 
- *     cpdef int receive_message(self, socket, int n):             # <<<<<<<<<<<<<<
+ *     cpdef int receive_message(self, socket, int n) except? -2:             # <<<<<<<<<<<<<<
  *         """
  * 
  */
@@ -4565,8 +6307,8 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_WriteUnraisable("neobolt.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  __pyx_r = 0;
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -2;
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_v_frame_message);
   __Pyx_XDECREF(__pyx_v_receive);
@@ -4575,11 +6317,14 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(stru
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_message[] = "\n\n        :param socket:\n        :param n:\n        :return:\n        ";
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_17receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_16receive_message[] = "\n\n        :param socket:\n        :param n:\n        :return:\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_17receive_message(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_socket = 0;
   int __pyx_v_n;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("receive_message (wrapper)", 0);
@@ -4606,11 +6351,11 @@ static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_mes
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_n)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("receive_message", 1, 2, 2, 1); __PYX_ERR(1, 181, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("receive_message", 1, 2, 2, 1); __PYX_ERR(0, 265, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "receive_message") < 0)) __PYX_ERR(1, 181, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "receive_message") < 0)) __PYX_ERR(0, 265, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -4619,39 +6364,44 @@ static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_mes
       values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
     }
     __pyx_v_socket = values[0];
-    __pyx_v_n = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 181, __pyx_L3_error)
+    __pyx_v_n = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_n == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("receive_message", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 181, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("receive_message", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 265, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_message(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_socket, __pyx_v_n);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_16receive_message(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), __pyx_v_socket, __pyx_v_n);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_16receive_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, PyObject *__pyx_v_socket, int __pyx_v_n) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("receive_message", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 181, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive_message(__pyx_v_self, __pyx_v_socket, __pyx_v_n, 1); if (unlikely(__pyx_t_1 == ((int)-2) && PyErr_Occurred())) __PYX_ERR(0, 265, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.receive_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4659,7 +6409,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_mes
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":198
+/* "neobolt/impl/python/bolt/_io.pyx":282
  *         return 1
  * 
  *     cdef _recycle(self):             # <<<<<<<<<<<<<<
@@ -4667,7 +6417,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_mes
  * 
  */
 
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__recycle(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
   int __pyx_v_origin;
   int __pyx_v_available;
   PyObject *__pyx_r = NULL;
@@ -4675,9 +6425,12 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_recycle", 0);
 
-  /* "neobolt/bolt/_io.pyx":206
+  /* "neobolt/impl/python/bolt/_io.pyx":290
  *         cdef int available
  * 
  *         origin = self._origin             # <<<<<<<<<<<<<<
@@ -4687,7 +6440,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   __pyx_t_1 = __pyx_v_self->_origin;
   __pyx_v_origin = __pyx_t_1;
 
-  /* "neobolt/bolt/_io.pyx":207
+  /* "neobolt/impl/python/bolt/_io.pyx":291
  * 
  *         origin = self._origin
  *         if origin == 0:             # <<<<<<<<<<<<<<
@@ -4697,7 +6450,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   __pyx_t_2 = ((__pyx_v_origin == 0) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/bolt/_io.pyx":208
+    /* "neobolt/impl/python/bolt/_io.pyx":292
  *         origin = self._origin
  *         if origin == 0:
  *             return False             # <<<<<<<<<<<<<<
@@ -4709,7 +6462,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
     __pyx_r = Py_False;
     goto __pyx_L0;
 
-    /* "neobolt/bolt/_io.pyx":207
+    /* "neobolt/impl/python/bolt/_io.pyx":291
  * 
  *         origin = self._origin
  *         if origin == 0:             # <<<<<<<<<<<<<<
@@ -4718,7 +6471,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  */
   }
 
-  /* "neobolt/bolt/_io.pyx":209
+  /* "neobolt/impl/python/bolt/_io.pyx":293
  *         if origin == 0:
  *             return False
  *         available = self._extent - origin             # <<<<<<<<<<<<<<
@@ -4727,7 +6480,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  */
   __pyx_v_available = (__pyx_v_self->_extent - __pyx_v_origin);
 
-  /* "neobolt/bolt/_io.pyx":210
+  /* "neobolt/impl/python/bolt/_io.pyx":294
  *             return False
  *         available = self._extent - origin
  *         self._data[:available] = self._data[origin:self._extent]             # <<<<<<<<<<<<<<
@@ -4736,18 +6489,18 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  */
   if (unlikely(__pyx_v_self->_data == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 210, __pyx_L1_error)
+    __PYX_ERR(0, 294, __pyx_L1_error)
   }
-  __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->_data, __pyx_v_origin, __pyx_v_self->_extent); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 210, __pyx_L1_error)
+  __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->_data, __pyx_v_origin, __pyx_v_self->_extent); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 294, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   if (unlikely(__pyx_v_self->_data == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 210, __pyx_L1_error)
+    __PYX_ERR(0, 294, __pyx_L1_error)
   }
-  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_t_3, 0, __pyx_v_available, NULL, NULL, NULL, 0, 1, 1) < 0) __PYX_ERR(1, 210, __pyx_L1_error)
+  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_t_3, 0, __pyx_v_available, NULL, NULL, NULL, 0, 1, 1) < 0) __PYX_ERR(0, 294, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "neobolt/bolt/_io.pyx":211
+  /* "neobolt/impl/python/bolt/_io.pyx":295
  *         available = self._extent - origin
  *         self._data[:available] = self._data[origin:self._extent]
  *         self._extent = available             # <<<<<<<<<<<<<<
@@ -4756,7 +6509,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  */
   __pyx_v_self->_extent = __pyx_v_available;
 
-  /* "neobolt/bolt/_io.pyx":212
+  /* "neobolt/impl/python/bolt/_io.pyx":296
  *         self._data[:available] = self._data[origin:self._extent]
  *         self._extent = available
  *         self._origin = 0             # <<<<<<<<<<<<<<
@@ -4765,7 +6518,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  */
   __pyx_v_self->_origin = 0;
 
-  /* "neobolt/bolt/_io.pyx":214
+  /* "neobolt/impl/python/bolt/_io.pyx":298
  *         self._origin = 0
  *         #log_debug("Recycled %d bytes" % origin)
  *         return True             # <<<<<<<<<<<<<<
@@ -4777,7 +6530,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   __pyx_r = Py_True;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":198
+  /* "neobolt/impl/python/bolt/_io.pyx":282
  *         return 1
  * 
  *     cdef _recycle(self):             # <<<<<<<<<<<<<<
@@ -4788,7 +6541,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer._recycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer._recycle", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4796,7 +6549,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":216
+/* "neobolt/impl/python/bolt/_io.pyx":300
  *         return True
  * 
  *     cpdef frame(self):             # <<<<<<<<<<<<<<
@@ -4804,51 +6557,66 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle(struc
  * 
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_15frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_19frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("frame", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 216, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_15frame)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_19frame)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 216, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 216, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":217
+  /* "neobolt/impl/python/bolt/_io.pyx":301
  * 
  *     cpdef frame(self):
  *         return self._frame             # <<<<<<<<<<<<<<
@@ -4860,7 +6628,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(struct _
   __pyx_r = ((PyObject *)__pyx_v_self->_frame);
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":216
+  /* "neobolt/impl/python/bolt/_io.pyx":300
  *         return True
  * 
  *     cpdef frame(self):             # <<<<<<<<<<<<<<
@@ -4874,7 +6642,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(struct _
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.frame", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.frame", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4883,25 +6651,28 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(struct _
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_15frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_15frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_19frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_19frame(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("frame (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_18frame(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_18frame(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("frame", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 216, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4910,7 +6681,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.frame", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.frame", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -4918,7 +6689,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(struc
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":219
+/* "neobolt/impl/python/bolt/_io.pyx":303
  *         return self._frame
  * 
  *     cpdef bint frame_message(self):             # <<<<<<<<<<<<<<
@@ -4926,15 +6697,16 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_14frame(struc
  *         """
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_17frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_panes = 0;
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_21frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+  unsigned char *__pyx_v_data;
   int __pyx_v_origin;
   int __pyx_v_p;
   int __pyx_v_extent;
-  int __pyx_v_available;
   int __pyx_v_chunk_size;
-  int __pyx_v_q;
+  int __pyx_v_chunk_count;
+  int __pyx_v_start;
+  int __pyx_v_end;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -4943,391 +6715,324 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct
   PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
   int __pyx_t_6;
-  int __pyx_t_7;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  int __pyx_t_10;
+  unsigned char *__pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("frame_message", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 219, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_17frame_message)) {
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_frame_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_21frame_message)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 219, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 219, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 219, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_5;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":230
- *         cdef int q
+  /* "neobolt/impl/python/bolt/_io.pyx":315
+ *         cdef int end
  * 
  *         if self._frame is not None:             # <<<<<<<<<<<<<<
  *             self.discard_message()
- *         panes = []
+ *         data = self._data
  */
   __pyx_t_5 = (((PyObject *)__pyx_v_self->_frame) != Py_None);
   __pyx_t_6 = (__pyx_t_5 != 0);
   if (__pyx_t_6) {
 
-    /* "neobolt/bolt/_io.pyx":231
+    /* "neobolt/impl/python/bolt/_io.pyx":316
  * 
  *         if self._frame is not None:
  *             self.discard_message()             # <<<<<<<<<<<<<<
- *         panes = []
+ *         data = self._data
  *         p = origin = self._origin
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->discard_message(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 231, __pyx_L1_error)
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->discard_message(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/bolt/_io.pyx":230
- *         cdef int q
+    /* "neobolt/impl/python/bolt/_io.pyx":315
+ *         cdef int end
  * 
  *         if self._frame is not None:             # <<<<<<<<<<<<<<
  *             self.discard_message()
- *         panes = []
+ *         data = self._data
  */
   }
 
-  /* "neobolt/bolt/_io.pyx":232
+  /* "neobolt/impl/python/bolt/_io.pyx":317
  *         if self._frame is not None:
  *             self.discard_message()
- *         panes = []             # <<<<<<<<<<<<<<
+ *         data = self._data             # <<<<<<<<<<<<<<
  *         p = origin = self._origin
  *         extent = self._extent
  */
-  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 232, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_panes = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyObject_AsWritableUString(__pyx_v_self->_data); if (unlikely((!__pyx_t_7) && PyErr_Occurred())) __PYX_ERR(0, 317, __pyx_L1_error)
+  __pyx_v_data = __pyx_t_7;
 
-  /* "neobolt/bolt/_io.pyx":233
+  /* "neobolt/impl/python/bolt/_io.pyx":318
  *             self.discard_message()
- *         panes = []
+ *         data = self._data
  *         p = origin = self._origin             # <<<<<<<<<<<<<<
  *         extent = self._extent
- *         while p < extent:
+ *         chunk_count = 0
  */
-  __pyx_t_7 = __pyx_v_self->_origin;
-  __pyx_v_p = __pyx_t_7;
-  __pyx_v_origin = __pyx_t_7;
+  __pyx_t_8 = __pyx_v_self->_origin;
+  __pyx_v_p = __pyx_t_8;
+  __pyx_v_origin = __pyx_t_8;
 
-  /* "neobolt/bolt/_io.pyx":234
- *         panes = []
+  /* "neobolt/impl/python/bolt/_io.pyx":319
+ *         data = self._data
  *         p = origin = self._origin
  *         extent = self._extent             # <<<<<<<<<<<<<<
- *         while p < extent:
- *             available = extent - p
+ *         chunk_count = 0
+ *         while p + 2 <= extent:
  */
-  __pyx_t_7 = __pyx_v_self->_extent;
-  __pyx_v_extent = __pyx_t_7;
+  __pyx_t_8 = __pyx_v_self->_extent;
+  __pyx_v_extent = __pyx_t_8;
 
-  /* "neobolt/bolt/_io.pyx":235
+  /* "neobolt/impl/python/bolt/_io.pyx":320
  *         p = origin = self._origin
  *         extent = self._extent
- *         while p < extent:             # <<<<<<<<<<<<<<
- *             available = extent - p
- *             if available < 2:
+ *         chunk_count = 0             # <<<<<<<<<<<<<<
+ *         while p + 2 <= extent:
+ *             chunk_size = data[p] << 8 | data[p + 1]
  */
-  while (1) {
-    __pyx_t_6 = ((__pyx_v_p < __pyx_v_extent) != 0);
-    if (!__pyx_t_6) break;
+  __pyx_v_chunk_count = 0;
 
-    /* "neobolt/bolt/_io.pyx":236
+  /* "neobolt/impl/python/bolt/_io.pyx":321
  *         extent = self._extent
- *         while p < extent:
- *             available = extent - p             # <<<<<<<<<<<<<<
- *             if available < 2:
- *                 break
+ *         chunk_count = 0
+ *         while p + 2 <= extent:             # <<<<<<<<<<<<<<
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             p += 2
  */
-    __pyx_v_available = (__pyx_v_extent - __pyx_v_p);
+  while (1) {
+    __pyx_t_6 = (((__pyx_v_p + 2) <= __pyx_v_extent) != 0);
+    if (!__pyx_t_6) break;
 
-    /* "neobolt/bolt/_io.pyx":237
- *         while p < extent:
- *             available = extent - p
- *             if available < 2:             # <<<<<<<<<<<<<<
- *                 break
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
+    /* "neobolt/impl/python/bolt/_io.pyx":322
+ *         chunk_count = 0
+ *         while p + 2 <= extent:
+ *             chunk_size = data[p] << 8 | data[p + 1]             # <<<<<<<<<<<<<<
+ *             p += 2
+ *             if chunk_size == 0:
  */
-    __pyx_t_6 = ((__pyx_v_available < 2) != 0);
-    if (__pyx_t_6) {
+    __pyx_v_chunk_size = (((__pyx_v_data[__pyx_v_p]) << 8) | (__pyx_v_data[(__pyx_v_p + 1)]));
 
-      /* "neobolt/bolt/_io.pyx":238
- *             available = extent - p
- *             if available < 2:
- *                 break             # <<<<<<<<<<<<<<
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
- *             p += 2
+    /* "neobolt/impl/python/bolt/_io.pyx":323
+ *         while p + 2 <= extent:
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             p += 2             # <<<<<<<<<<<<<<
+ *             if chunk_size == 0:
+ *                 self._limit = p
  */
-      goto __pyx_L5_break;
+    __pyx_v_p = (__pyx_v_p + 2);
 
-      /* "neobolt/bolt/_io.pyx":237
- *         while p < extent:
- *             available = extent - p
- *             if available < 2:             # <<<<<<<<<<<<<<
- *                 break
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
+    /* "neobolt/impl/python/bolt/_io.pyx":324
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             p += 2
+ *             if chunk_size == 0:             # <<<<<<<<<<<<<<
+ *                 self._limit = p
+ *                 start = origin + 2
  */
-    }
+    __pyx_t_6 = ((__pyx_v_chunk_size == 0) != 0);
+    if (__pyx_t_6) {
 
-    /* "neobolt/bolt/_io.pyx":239
- *             if available < 2:
- *                 break
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])             # <<<<<<<<<<<<<<
+      /* "neobolt/impl/python/bolt/_io.pyx":325
  *             p += 2
  *             if chunk_size == 0:
+ *                 self._limit = p             # <<<<<<<<<<<<<<
+ *                 start = origin + 2
+ *                 if chunk_count == 0:
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_unpack); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 239, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_p, (__pyx_v_p + 2), NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 239, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_2, function);
-        __pyx_t_7 = 1;
-      }
-    }
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_H, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_u_H, __pyx_t_3};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    } else
-    #endif
-    {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
-      }
-      __Pyx_INCREF(__pyx_kp_u_H);
-      __Pyx_GIVEREF(__pyx_kp_u_H);
-      PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_u_H);
-      __Pyx_GIVEREF(__pyx_t_3);
-      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_3);
-      __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    }
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
-      PyObject* sequence = __pyx_t_1;
-      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-      if (unlikely(size != 1)) {
-        if (size > 1) __Pyx_RaiseTooManyValuesError(1);
-        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(1, 239, __pyx_L1_error)
-      }
-      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-      if (likely(PyTuple_CheckExact(sequence))) {
-        __pyx_t_2 = PyTuple_GET_ITEM(sequence, 0); 
-      } else {
-        __pyx_t_2 = PyList_GET_ITEM(sequence, 0); 
-      }
-      __Pyx_INCREF(__pyx_t_2);
-      #else
-      __pyx_t_2 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      #endif
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    } else {
-      Py_ssize_t index = -1;
-      __pyx_t_8 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 239, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __pyx_t_9 = Py_TYPE(__pyx_t_8)->tp_iternext;
-      index = 0; __pyx_t_2 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_2)) goto __pyx_L7_unpacking_failed;
-      __Pyx_GOTREF(__pyx_t_2);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 1) < 0) __PYX_ERR(1, 239, __pyx_L1_error)
-      __pyx_t_9 = NULL;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      goto __pyx_L8_unpacking_done;
-      __pyx_L7_unpacking_failed:;
-      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __pyx_t_9 = NULL;
-      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(1, 239, __pyx_L1_error)
-      __pyx_L8_unpacking_done:;
-    }
-    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 239, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_v_chunk_size = __pyx_t_7;
+      __pyx_v_self->_limit = __pyx_v_p;
 
-    /* "neobolt/bolt/_io.pyx":240
- *                 break
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
- *             p += 2             # <<<<<<<<<<<<<<
+      /* "neobolt/impl/python/bolt/_io.pyx":326
  *             if chunk_size == 0:
  *                 self._limit = p
+ *                 start = origin + 2             # <<<<<<<<<<<<<<
+ *                 if chunk_count == 0:
+ *                     end = start
  */
-    __pyx_v_p = (__pyx_v_p + 2);
+      __pyx_v_start = (__pyx_v_origin + 2);
+
+      /* "neobolt/impl/python/bolt/_io.pyx":327
+ *                 self._limit = p
+ *                 start = origin + 2
+ *                 if chunk_count == 0:             # <<<<<<<<<<<<<<
+ *                     end = start
+ *                 elif chunk_count == 1:
+ */
+      switch (__pyx_v_chunk_count) {
+        case 0:
+
+        /* "neobolt/impl/python/bolt/_io.pyx":328
+ *                 start = origin + 2
+ *                 if chunk_count == 0:
+ *                     end = start             # <<<<<<<<<<<<<<
+ *                 elif chunk_count == 1:
+ *                     end = p - 2
+ */
+        __pyx_v_end = __pyx_v_start;
 
-    /* "neobolt/bolt/_io.pyx":241
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
- *             p += 2
- *             if chunk_size == 0:             # <<<<<<<<<<<<<<
+        /* "neobolt/impl/python/bolt/_io.pyx":327
  *                 self._limit = p
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
- */
-    __pyx_t_6 = ((__pyx_v_chunk_size == 0) != 0);
-    if (__pyx_t_6) {
+ *                 start = origin + 2
+ *                 if chunk_count == 0:             # <<<<<<<<<<<<<<
+ *                     end = start
+ *                 elif chunk_count == 1:
+ */
+        break;
+        case 1:
+
+        /* "neobolt/impl/python/bolt/_io.pyx":330
+ *                     end = start
+ *                 elif chunk_count == 1:
+ *                     end = p - 2             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     end = self._coalesce(origin)
+ */
+        __pyx_v_end = (__pyx_v_p - 2);
+
+        /* "neobolt/impl/python/bolt/_io.pyx":329
+ *                 if chunk_count == 0:
+ *                     end = start
+ *                 elif chunk_count == 1:             # <<<<<<<<<<<<<<
+ *                     end = p - 2
+ *                 else:
+ */
+        break;
+        default:
+
+        /* "neobolt/impl/python/bolt/_io.pyx":332
+ *                     end = p - 2
+ *                 else:
+ *                     end = self._coalesce(origin)             # <<<<<<<<<<<<<<
+ *                 self._frame = self._message_frame
+ *                 self._frame.reset(self._view, origin, start, end)
+ */
+        __pyx_v_end = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self->__pyx_vtab)->_coalesce(__pyx_v_self, __pyx_v_origin);
+        break;
+      }
 
-      /* "neobolt/bolt/_io.pyx":242
- *             p += 2
- *             if chunk_size == 0:
- *                 self._limit = p             # <<<<<<<<<<<<<<
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
+      /* "neobolt/impl/python/bolt/_io.pyx":333
+ *                 else:
+ *                     end = self._coalesce(origin)
+ *                 self._frame = self._message_frame             # <<<<<<<<<<<<<<
+ *                 self._frame.reset(self._view, origin, start, end)
  *                 return True
  */
-      __pyx_v_self->_limit = __pyx_v_p;
+      __pyx_t_1 = ((PyObject *)__pyx_v_self->_message_frame);
+      __Pyx_INCREF(__pyx_t_1);
+      __Pyx_GIVEREF(__pyx_t_1);
+      __Pyx_GOTREF(__pyx_v_self->_frame);
+      __Pyx_DECREF(((PyObject *)__pyx_v_self->_frame));
+      __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_t_1);
+      __pyx_t_1 = 0;
 
-      /* "neobolt/bolt/_io.pyx":243
- *             if chunk_size == 0:
- *                 self._limit = p
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)             # <<<<<<<<<<<<<<
+      /* "neobolt/impl/python/bolt/_io.pyx":334
+ *                     end = self._coalesce(origin)
+ *                 self._frame = self._message_frame
+ *                 self._frame.reset(self._view, origin, start, end)             # <<<<<<<<<<<<<<
  *                 return True
- *             q = p + chunk_size
+ *             chunk_count += 1
  */
-      __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_self->_view, __pyx_v_origin, __pyx_v_self->_limit, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 243, __pyx_L1_error)
+      __pyx_t_1 = __pyx_v_self->_view;
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->_frame->__pyx_vtab)->reset(__pyx_v_self->_frame, __pyx_t_1, __pyx_v_origin, __pyx_v_start, __pyx_v_end, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 334, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_8 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_GIVEREF(__pyx_t_8);
-      PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_8);
-      __Pyx_INCREF(__pyx_v_panes);
-      __Pyx_GIVEREF(__pyx_v_panes);
-      PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_v_panes);
-      __pyx_t_8 = 0;
-      __pyx_t_8 = __Pyx_PyObject_Call(((PyObject *)__pyx_ptype_7neobolt_4bolt_3_io_MessageFrame), __pyx_t_2, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 243, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_GIVEREF(__pyx_t_8);
-      __Pyx_GOTREF(__pyx_v_self->_frame);
-      __Pyx_DECREF(((PyObject *)__pyx_v_self->_frame));
-      __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)__pyx_t_8);
-      __pyx_t_8 = 0;
 
-      /* "neobolt/bolt/_io.pyx":244
- *                 self._limit = p
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
+      /* "neobolt/impl/python/bolt/_io.pyx":335
+ *                 self._frame = self._message_frame
+ *                 self._frame.reset(self._view, origin, start, end)
  *                 return True             # <<<<<<<<<<<<<<
- *             q = p + chunk_size
- *             panes.append((p - origin, q - origin))
+ *             chunk_count += 1
+ *             p += chunk_size
  */
       __pyx_r = 1;
       goto __pyx_L0;
 
-      /* "neobolt/bolt/_io.pyx":241
- *             chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
+      /* "neobolt/impl/python/bolt/_io.pyx":324
+ *             chunk_size = data[p] << 8 | data[p + 1]
  *             p += 2
  *             if chunk_size == 0:             # <<<<<<<<<<<<<<
  *                 self._limit = p
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
+ *                 start = origin + 2
  */
     }
 
-    /* "neobolt/bolt/_io.pyx":245
- *                 self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
- *                 return True
- *             q = p + chunk_size             # <<<<<<<<<<<<<<
- *             panes.append((p - origin, q - origin))
- *             p = q
- */
-    __pyx_v_q = (__pyx_v_p + __pyx_v_chunk_size);
-
-    /* "neobolt/bolt/_io.pyx":246
+    /* "neobolt/impl/python/bolt/_io.pyx":336
+ *                 self._frame.reset(self._view, origin, start, end)
  *                 return True
- *             q = p + chunk_size
- *             panes.append((p - origin, q - origin))             # <<<<<<<<<<<<<<
- *             p = q
+ *             chunk_count += 1             # <<<<<<<<<<<<<<
+ *             p += chunk_size
  *         return False
  */
-    __pyx_t_8 = __Pyx_PyInt_From_int((__pyx_v_p - __pyx_v_origin)); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 246, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_8);
-    __pyx_t_2 = __Pyx_PyInt_From_int((__pyx_v_q - __pyx_v_origin)); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 246, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 246, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_8);
-    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_8);
-    __Pyx_GIVEREF(__pyx_t_2);
-    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
-    __pyx_t_8 = 0;
-    __pyx_t_2 = 0;
-    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_panes, __pyx_t_1); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(1, 246, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_chunk_count = (__pyx_v_chunk_count + 1);
 
-    /* "neobolt/bolt/_io.pyx":247
- *             q = p + chunk_size
- *             panes.append((p - origin, q - origin))
- *             p = q             # <<<<<<<<<<<<<<
+    /* "neobolt/impl/python/bolt/_io.pyx":337
+ *                 return True
+ *             chunk_count += 1
+ *             p += chunk_size             # <<<<<<<<<<<<<<
  *         return False
  * 
  */
-    __pyx_v_p = __pyx_v_q;
+    __pyx_v_p = (__pyx_v_p + __pyx_v_chunk_size);
   }
-  __pyx_L5_break:;
 
-  /* "neobolt/bolt/_io.pyx":248
- *             panes.append((p - origin, q - origin))
- *             p = q
+  /* "neobolt/impl/python/bolt/_io.pyx":338
+ *             chunk_count += 1
+ *             p += chunk_size
  *         return False             # <<<<<<<<<<<<<<
  * 
- *     cpdef discard_message(self):
+ *     cdef int _coalesce(self, int origin):
  */
   __pyx_r = 0;
   goto __pyx_L0;
 
-  /* "neobolt/bolt/_io.pyx":219
+  /* "neobolt/impl/python/bolt/_io.pyx":303
  *         return self._frame
  * 
  *     cpdef bint frame_message(self):             # <<<<<<<<<<<<<<
@@ -5341,36 +7046,37 @@ static int __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message(struct
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_WriteUnraisable("neobolt.bolt._io.ChunkedInputBuffer.frame_message", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_WriteUnraisable("neobolt.impl.python.bolt._io.ChunkedInputBuffer.frame_message", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_panes);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_17frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_message[] = " Construct a frame around the first complete message in the buffer.\n        ";
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_17frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_21frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_20frame_message[] = " Construct a frame around the first complete message in the buffer.\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_21frame_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("frame_message (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_message(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_20frame_message(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_20frame_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("frame_message", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 219, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame_message(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 303, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5379,7 +7085,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_messa
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.frame_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.frame_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5387,16 +7093,178 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_messa
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":250
+/* "neobolt/impl/python/bolt/_io.pyx":340
+ *         return False
+ * 
+ *     cdef int _coalesce(self, int origin):             # <<<<<<<<<<<<<<
+ *         """ Move the data from all chunks of the complete message at
+ *         `origin` into one contiguous region, overwriting the chunk
+ */
+
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__coalesce(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_v_origin) {
+  unsigned char *__pyx_v_data;
+  int __pyx_v_chunk_size;
+  int __pyx_v_end;
+  int __pyx_v_p;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  unsigned char *__pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_coalesce", 0);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":352
+ *         cdef int p
+ * 
+ *         data = self._data             # <<<<<<<<<<<<<<
+ *         chunk_size = data[origin] << 8 | data[origin + 1]
+ *         end = origin + 2 + chunk_size
+ */
+  __pyx_t_1 = __Pyx_PyObject_AsWritableUString(__pyx_v_self->_data); if (unlikely((!__pyx_t_1) && PyErr_Occurred())) __PYX_ERR(0, 352, __pyx_L1_error)
+  __pyx_v_data = __pyx_t_1;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":353
+ * 
+ *         data = self._data
+ *         chunk_size = data[origin] << 8 | data[origin + 1]             # <<<<<<<<<<<<<<
+ *         end = origin + 2 + chunk_size
+ *         p = end
+ */
+  __pyx_v_chunk_size = (((__pyx_v_data[__pyx_v_origin]) << 8) | (__pyx_v_data[(__pyx_v_origin + 1)]));
+
+  /* "neobolt/impl/python/bolt/_io.pyx":354
+ *         data = self._data
+ *         chunk_size = data[origin] << 8 | data[origin + 1]
+ *         end = origin + 2 + chunk_size             # <<<<<<<<<<<<<<
+ *         p = end
+ *         while True:
+ */
+  __pyx_v_end = ((__pyx_v_origin + 2) + __pyx_v_chunk_size);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":355
+ *         chunk_size = data[origin] << 8 | data[origin + 1]
+ *         end = origin + 2 + chunk_size
+ *         p = end             # <<<<<<<<<<<<<<
+ *         while True:
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ */
+  __pyx_v_p = __pyx_v_end;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":356
+ *         end = origin + 2 + chunk_size
+ *         p = end
+ *         while True:             # <<<<<<<<<<<<<<
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             if chunk_size == 0:
+ */
+  while (1) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":357
+ *         p = end
+ *         while True:
+ *             chunk_size = data[p] << 8 | data[p + 1]             # <<<<<<<<<<<<<<
+ *             if chunk_size == 0:
+ *                 return end
+ */
+    __pyx_v_chunk_size = (((__pyx_v_data[__pyx_v_p]) << 8) | (__pyx_v_data[(__pyx_v_p + 1)]));
+
+    /* "neobolt/impl/python/bolt/_io.pyx":358
+ *         while True:
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             if chunk_size == 0:             # <<<<<<<<<<<<<<
+ *                 return end
+ *             p += 2
+ */
+    __pyx_t_2 = ((__pyx_v_chunk_size == 0) != 0);
+    if (__pyx_t_2) {
+
+      /* "neobolt/impl/python/bolt/_io.pyx":359
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             if chunk_size == 0:
+ *                 return end             # <<<<<<<<<<<<<<
+ *             p += 2
+ *             memmove(data + end, data + p, chunk_size)
+ */
+      __pyx_r = __pyx_v_end;
+      goto __pyx_L0;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":358
+ *         while True:
+ *             chunk_size = data[p] << 8 | data[p + 1]
+ *             if chunk_size == 0:             # <<<<<<<<<<<<<<
+ *                 return end
+ *             p += 2
+ */
+    }
+
+    /* "neobolt/impl/python/bolt/_io.pyx":360
+ *             if chunk_size == 0:
+ *                 return end
+ *             p += 2             # <<<<<<<<<<<<<<
+ *             memmove(data + end, data + p, chunk_size)
+ *             end += chunk_size
+ */
+    __pyx_v_p = (__pyx_v_p + 2);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":361
+ *                 return end
+ *             p += 2
+ *             memmove(data + end, data + p, chunk_size)             # <<<<<<<<<<<<<<
+ *             end += chunk_size
+ *             p += chunk_size
+ */
+    (void)(memmove((__pyx_v_data + __pyx_v_end), (__pyx_v_data + __pyx_v_p), __pyx_v_chunk_size));
+
+    /* "neobolt/impl/python/bolt/_io.pyx":362
+ *             p += 2
+ *             memmove(data + end, data + p, chunk_size)
+ *             end += chunk_size             # <<<<<<<<<<<<<<
+ *             p += chunk_size
+ * 
+ */
+    __pyx_v_end = (__pyx_v_end + __pyx_v_chunk_size);
+
+    /* "neobolt/impl/python/bolt/_io.pyx":363
+ *             memmove(data + end, data + p, chunk_size)
+ *             end += chunk_size
+ *             p += chunk_size             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef discard_message(self):
+ */
+    __pyx_v_p = (__pyx_v_p + __pyx_v_chunk_size);
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":340
  *         return False
  * 
+ *     cdef int _coalesce(self, int origin):             # <<<<<<<<<<<<<<
+ *         """ Move the data from all chunks of the complete message at
+ *         `origin` into one contiguous region, overwriting the chunk
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("neobolt.impl.python.bolt._io.ChunkedInputBuffer._coalesce", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":365
+ *             p += chunk_size
+ * 
  *     cpdef discard_message(self):             # <<<<<<<<<<<<<<
  *         if self._frame is not None:
  *             self._frame.close()
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_19discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_23discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_discard_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5406,43 +7274,58 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
   int __pyx_t_5;
   int __pyx_t_6;
   int __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("discard_message", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_discard_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 250, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_19discard_message)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_discard_message); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_23discard_message)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 365, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 250, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 250, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":251
+  /* "neobolt/impl/python/bolt/_io.pyx":366
  * 
  *     cpdef discard_message(self):
  *         if self._frame is not None:             # <<<<<<<<<<<<<<
@@ -5453,18 +7336,18 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
   __pyx_t_6 = (__pyx_t_5 != 0);
   if (__pyx_t_6) {
 
-    /* "neobolt/bolt/_io.pyx":252
+    /* "neobolt/impl/python/bolt/_io.pyx":367
  *     cpdef discard_message(self):
  *         if self._frame is not None:
  *             self._frame.close()             # <<<<<<<<<<<<<<
  *             self._origin = self._limit
  *             self._limit = -1
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame *)__pyx_v_self->_frame->__pyx_vtab)->close(__pyx_v_self->_frame, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 252, __pyx_L1_error)
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)__pyx_v_self->_frame->__pyx_vtab)->close(__pyx_v_self->_frame, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 367, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/bolt/_io.pyx":253
+    /* "neobolt/impl/python/bolt/_io.pyx":368
  *         if self._frame is not None:
  *             self._frame.close()
  *             self._origin = self._limit             # <<<<<<<<<<<<<<
@@ -5474,7 +7357,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
     __pyx_t_7 = __pyx_v_self->_limit;
     __pyx_v_self->_origin = __pyx_t_7;
 
-    /* "neobolt/bolt/_io.pyx":254
+    /* "neobolt/impl/python/bolt/_io.pyx":369
  *             self._frame.close()
  *             self._origin = self._limit
  *             self._limit = -1             # <<<<<<<<<<<<<<
@@ -5483,7 +7366,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
  */
     __pyx_v_self->_limit = -1;
 
-    /* "neobolt/bolt/_io.pyx":255
+    /* "neobolt/impl/python/bolt/_io.pyx":370
  *             self._origin = self._limit
  *             self._limit = -1
  *             self._frame = None             # <<<<<<<<<<<<<<
@@ -5494,9 +7377,9 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
     __Pyx_GIVEREF(Py_None);
     __Pyx_GOTREF(__pyx_v_self->_frame);
     __Pyx_DECREF(((PyObject *)__pyx_v_self->_frame));
-    __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)Py_None);
+    __pyx_v_self->_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None);
 
-    /* "neobolt/bolt/_io.pyx":251
+    /* "neobolt/impl/python/bolt/_io.pyx":366
  * 
  *     cpdef discard_message(self):
  *         if self._frame is not None:             # <<<<<<<<<<<<<<
@@ -5505,8 +7388,8 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
  */
   }
 
-  /* "neobolt/bolt/_io.pyx":250
- *         return False
+  /* "neobolt/impl/python/bolt/_io.pyx":365
+ *             p += chunk_size
  * 
  *     cpdef discard_message(self):             # <<<<<<<<<<<<<<
  *         if self._frame is not None:
@@ -5521,7 +7404,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.discard_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.discard_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5530,25 +7413,28 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_messag
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_19discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_19discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_23discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_23discard_message(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("discard_message (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_18discard_message(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_22discard_message(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_18discard_message(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_22discard_message(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("discard_message", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_message(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 250, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_discard_message(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 365, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5557,7 +7443,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_18discard_mes
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.discard_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.discard_message", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5572,22 +7458,25 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_18discard_mes
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_21__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_25__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_25__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_24__reduce_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -5596,11 +7485,11 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cy
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 2, __pyx_L1_error)
+  __PYX_ERR(1, 2, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
@@ -5611,7 +7500,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cy
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
@@ -5626,22 +7515,25 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_20__reduce_cy
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_23__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_27__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_27__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_26__setstate_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -5649,11 +7541,11 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 4, __pyx_L1_error)
+  __PYX_ERR(1, 4, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -5665,15 +7557,15 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedInputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedInputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":266
- *     cdef int _end
+/* "neobolt/impl/python/bolt/_io.pyx":383
+ *     cdef bint _after_segment
  * 
  *     def __cinit__(self, int capacity=1048576, int max_chunk_size=16384):             # <<<<<<<<<<<<<<
  *         self._max_chunk_size = max_chunk_size
@@ -5681,10 +7573,13 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_18ChunkedInputBuffer_22__setstate_
  */
 
 /* Python wrapper */
-static int __pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   int __pyx_v_capacity;
   int __pyx_v_max_chunk_size;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
@@ -5717,7 +7612,7 @@ static int __pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObjec
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(1, 266, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 383, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -5730,39 +7625,42 @@ static int __pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(PyObjec
       }
     }
     if (values[0]) {
-      __pyx_v_capacity = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_capacity == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 266, __pyx_L3_error)
+      __pyx_v_capacity = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_capacity == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L3_error)
     } else {
       __pyx_v_capacity = ((int)0x100000);
     }
     if (values[1]) {
-      __pyx_v_max_chunk_size = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_max_chunk_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 266, __pyx_L3_error)
+      __pyx_v_max_chunk_size = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_max_chunk_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L3_error)
     } else {
       __pyx_v_max_chunk_size = ((int)0x4000);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 266, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 383, __pyx_L3_error)
   __pyx_L3_error:;
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), __pyx_v_capacity, __pyx_v_max_chunk_size);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer___cinit__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), __pyx_v_capacity, __pyx_v_max_chunk_size);
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_v_capacity, int __pyx_v_max_chunk_size) {
+static int __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_v_capacity, int __pyx_v_max_chunk_size) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "neobolt/bolt/_io.pyx":267
+  /* "neobolt/impl/python/bolt/_io.pyx":384
  * 
  *     def __cinit__(self, int capacity=1048576, int max_chunk_size=16384):
  *         self._max_chunk_size = max_chunk_size             # <<<<<<<<<<<<<<
@@ -5771,7 +7669,7 @@ static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct _
  */
   __pyx_v_self->_max_chunk_size = __pyx_v_max_chunk_size;
 
-  /* "neobolt/bolt/_io.pyx":268
+  /* "neobolt/impl/python/bolt/_io.pyx":385
  *     def __cinit__(self, int capacity=1048576, int max_chunk_size=16384):
  *         self._max_chunk_size = max_chunk_size
  *         self._header = 0             # <<<<<<<<<<<<<<
@@ -5780,7 +7678,7 @@ static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct _
  */
   __pyx_v_self->_header = 0;
 
-  /* "neobolt/bolt/_io.pyx":269
+  /* "neobolt/impl/python/bolt/_io.pyx":386
  *         self._max_chunk_size = max_chunk_size
  *         self._header = 0
  *         self._start = 2             # <<<<<<<<<<<<<<
@@ -5789,25 +7687,25 @@ static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct _
  */
   __pyx_v_self->_start = 2;
 
-  /* "neobolt/bolt/_io.pyx":270
+  /* "neobolt/impl/python/bolt/_io.pyx":387
  *         self._header = 0
  *         self._start = 2
  *         self._end = 2             # <<<<<<<<<<<<<<
  *         self._data = bytearray(capacity)
- * 
+ *         self._segments = []         # (offset, views) for externally held data
  */
   __pyx_v_self->_end = 2;
 
-  /* "neobolt/bolt/_io.pyx":271
+  /* "neobolt/impl/python/bolt/_io.pyx":388
  *         self._start = 2
  *         self._end = 2
  *         self._data = bytearray(capacity)             # <<<<<<<<<<<<<<
- * 
- *     cpdef int max_chunk_size(self):
+ *         self._segments = []         # (offset, views) for externally held data
+ *         self._after_segment = False
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 271, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_capacity); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 388, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 271, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyByteArray_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 388, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_GIVEREF(__pyx_t_2);
@@ -5816,8 +7714,32 @@ static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct _
   __pyx_v_self->_data = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "neobolt/bolt/_io.pyx":266
- *     cdef int _end
+  /* "neobolt/impl/python/bolt/_io.pyx":389
+ *         self._end = 2
+ *         self._data = bytearray(capacity)
+ *         self._segments = []         # (offset, views) for externally held data             # <<<<<<<<<<<<<<
+ *         self._after_segment = False
+ * 
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 389, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->_segments);
+  __Pyx_DECREF(__pyx_v_self->_segments);
+  __pyx_v_self->_segments = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":390
+ *         self._data = bytearray(capacity)
+ *         self._segments = []         # (offset, views) for externally held data
+ *         self._after_segment = False             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef int max_chunk_size(self):
+ */
+  __pyx_v_self->_after_segment = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":383
+ *     cdef bint _after_segment
  * 
  *     def __cinit__(self, int capacity=1048576, int max_chunk_size=16384):             # <<<<<<<<<<<<<<
  *         self._max_chunk_size = max_chunk_size
@@ -5830,23 +7752,23 @@ static int __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer___cinit__(struct _
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":273
- *         self._data = bytearray(capacity)
+/* "neobolt/impl/python/bolt/_io.pyx":392
+ *         self._after_segment = False
  * 
  *     cpdef int max_chunk_size(self):             # <<<<<<<<<<<<<<
  *         return self._max_chunk_size
  * 
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static int __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static int __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -5854,93 +7776,305 @@ static int __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(stru
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("max_chunk_size", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_max_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 273, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size)) {
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_max_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size)) {
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 392, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_r = __pyx_t_5;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":393
+ * 
+ *     cpdef int max_chunk_size(self):
+ *         return self._max_chunk_size             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef clear(self):
+ */
+  __pyx_r = __pyx_v_self->_max_chunk_size;
+  goto __pyx_L0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":392
+ *         self._after_segment = False
+ * 
+ *     cpdef int max_chunk_size(self):             # <<<<<<<<<<<<<<
+ *         return self._max_chunk_size
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_WriteUnraisable("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.max_chunk_size", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("max_chunk_size (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("max_chunk_size", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 392, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.max_chunk_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":395
+ *         return self._max_chunk_size
+ * 
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         self._header = 0
+ *         self._start = 2
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_clear(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_clear); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 395, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_5clear)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 395, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 273, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 273, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 273, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_r = __pyx_t_5;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":274
- * 
- *     cpdef int max_chunk_size(self):
- *         return self._max_chunk_size             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":396
  * 
  *     cpdef clear(self):
+ *         self._header = 0             # <<<<<<<<<<<<<<
+ *         self._start = 2
+ *         self._end = 2
  */
-  __pyx_r = __pyx_v_self->_max_chunk_size;
-  goto __pyx_L0;
+  __pyx_v_self->_header = 0;
 
-  /* "neobolt/bolt/_io.pyx":273
- *         self._data = bytearray(capacity)
+  /* "neobolt/impl/python/bolt/_io.pyx":397
+ *     cpdef clear(self):
+ *         self._header = 0
+ *         self._start = 2             # <<<<<<<<<<<<<<
+ *         self._end = 2
+ *         self._data[0:2] = b"\x00\x00"
+ */
+  __pyx_v_self->_start = 2;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":398
+ *         self._header = 0
+ *         self._start = 2
+ *         self._end = 2             # <<<<<<<<<<<<<<
+ *         self._data[0:2] = b"\x00\x00"
+ *         self._segments = []
+ */
+  __pyx_v_self->_end = 2;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":399
+ *         self._start = 2
+ *         self._end = 2
+ *         self._data[0:2] = b"\x00\x00"             # <<<<<<<<<<<<<<
+ *         self._segments = []
+ *         self._after_segment = False
+ */
+  if (unlikely(__pyx_v_self->_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 399, __pyx_L1_error)
+  }
+  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_kp_b__6, 0, 2, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 399, __pyx_L1_error)
+
+  /* "neobolt/impl/python/bolt/_io.pyx":400
+ *         self._end = 2
+ *         self._data[0:2] = b"\x00\x00"
+ *         self._segments = []             # <<<<<<<<<<<<<<
+ *         self._after_segment = False
  * 
- *     cpdef int max_chunk_size(self):             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->_segments);
+  __Pyx_DECREF(__pyx_v_self->_segments);
+  __pyx_v_self->_segments = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":401
+ *         self._data[0:2] = b"\x00\x00"
+ *         self._segments = []
+ *         self._after_segment = False             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef write(self, bytes b):
+ */
+  __pyx_v_self->_after_segment = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":395
  *         return self._max_chunk_size
  * 
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         self._header = 0
+ *         self._start = 2
  */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_WriteUnraisable("neobolt.bolt._io.ChunkedOutputBuffer.max_chunk_size", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("max_chunk_size (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("clear (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_4clear(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_size(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_4clear(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("max_chunk_size", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 273, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_clear(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 395, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5949,7 +8083,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_s
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.max_chunk_size", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -5957,104 +8091,398 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_2max_chunk_s
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":276
- *         return self._max_chunk_size
+/* "neobolt/impl/python/bolt/_io.pyx":403
+ *         self._after_segment = False
  * 
- *     cpdef clear(self):             # <<<<<<<<<<<<<<
- *         self._header = 0
- *         self._start = 2
+ *     cpdef write(self, bytes b):             # <<<<<<<<<<<<<<
+ *         cdef bytearray data
+ *         cdef int new_data_size
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_clear(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_data = 0;
+  int __pyx_v_new_data_size;
+  int __pyx_v_chunk_size;
+  int __pyx_v_chunk_remaining;
+  int __pyx_v_new_end;
+  int __pyx_v_new_chunk_size;
+  PyObject *__pyx_v_max_chunk_size = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  __Pyx_RefNannySetupContext("clear", 0);
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_clear); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 276, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_5clear)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_7write)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_b) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_b);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 403, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 276, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 276, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":411
+ *         cdef int new_chunk_size
+ * 
+ *         data = self._data             # <<<<<<<<<<<<<<
+ *         new_data_size = len(b)
+ *         if new_data_size:
+ */
+  __pyx_t_1 = __pyx_v_self->_data;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_data = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":412
+ * 
+ *         data = self._data
+ *         new_data_size = len(b)             # <<<<<<<<<<<<<<
+ *         if new_data_size:
+ *             self._after_segment = False
+ */
+  if (unlikely(__pyx_v_b == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 412, __pyx_L1_error)
+  }
+  __pyx_t_5 = PyBytes_GET_SIZE(__pyx_v_b); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 412, __pyx_L1_error)
+  __pyx_v_new_data_size = __pyx_t_5;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":413
+ *         data = self._data
+ *         new_data_size = len(b)
+ *         if new_data_size:             # <<<<<<<<<<<<<<
+ *             self._after_segment = False
+ *         chunk_size = self._end - self._start
+ */
+  __pyx_t_6 = (__pyx_v_new_data_size != 0);
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":414
+ *         new_data_size = len(b)
+ *         if new_data_size:
+ *             self._after_segment = False             # <<<<<<<<<<<<<<
+ *         chunk_size = self._end - self._start
+ *         max_chunk_size = self._max_chunk_size
+ */
+    __pyx_v_self->_after_segment = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":413
+ *         data = self._data
+ *         new_data_size = len(b)
+ *         if new_data_size:             # <<<<<<<<<<<<<<
+ *             self._after_segment = False
+ *         chunk_size = self._end - self._start
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":415
+ *         if new_data_size:
+ *             self._after_segment = False
+ *         chunk_size = self._end - self._start             # <<<<<<<<<<<<<<
+ *         max_chunk_size = self._max_chunk_size
+ *         chunk_remaining = max_chunk_size - chunk_size
+ */
+  __pyx_v_chunk_size = (__pyx_v_self->_end - __pyx_v_self->_start);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":416
+ *             self._after_segment = False
+ *         chunk_size = self._end - self._start
+ *         max_chunk_size = self._max_chunk_size             # <<<<<<<<<<<<<<
+ *         chunk_remaining = max_chunk_size - chunk_size
+ *         if new_data_size > max_chunk_size:
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_max_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 416, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_max_chunk_size = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":417
+ *         chunk_size = self._end - self._start
+ *         max_chunk_size = self._max_chunk_size
+ *         chunk_remaining = max_chunk_size - chunk_size             # <<<<<<<<<<<<<<
+ *         if new_data_size > max_chunk_size:
+ *             self.write(b[:chunk_remaining])
+ */
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyNumber_Subtract(__pyx_v_max_chunk_size, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 417, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_chunk_remaining = __pyx_t_7;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":418
+ *         max_chunk_size = self._max_chunk_size
+ *         chunk_remaining = max_chunk_size - chunk_size
+ *         if new_data_size > max_chunk_size:             # <<<<<<<<<<<<<<
+ *             self.write(b[:chunk_remaining])
+ *             self.chunk()
+ */
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_new_data_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyObject_RichCompare(__pyx_t_2, __pyx_v_max_chunk_size, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(0, 418, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":419
+ *         chunk_remaining = max_chunk_size - chunk_size
+ *         if new_data_size > max_chunk_size:
+ *             self.write(b[:chunk_remaining])             # <<<<<<<<<<<<<<
+ *             self.chunk()
+ *             self.write(b[chunk_remaining:])
+ */
+    if (unlikely(__pyx_v_b == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 419, __pyx_L1_error)
+    }
+    __pyx_t_1 = PySequence_GetSlice(__pyx_v_b, 0, __pyx_v_chunk_remaining); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((PyObject*)__pyx_t_1), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 419, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":420
+ *         if new_data_size > max_chunk_size:
+ *             self.write(b[:chunk_remaining])
+ *             self.chunk()             # <<<<<<<<<<<<<<
+ *             self.write(b[chunk_remaining:])
+ *             return
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->chunk(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 420, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":421
+ *             self.write(b[:chunk_remaining])
+ *             self.chunk()
+ *             self.write(b[chunk_remaining:])             # <<<<<<<<<<<<<<
+ *             return
+ *         if new_data_size > chunk_remaining:
+ */
+    if (unlikely(__pyx_v_b == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 421, __pyx_L1_error)
     }
+    __pyx_t_2 = PySequence_GetSlice(__pyx_v_b, __pyx_v_chunk_remaining, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 421, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((PyObject*)__pyx_t_2), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 421, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":422
+ *             self.chunk()
+ *             self.write(b[chunk_remaining:])
+ *             return             # <<<<<<<<<<<<<<
+ *         if new_data_size > chunk_remaining:
+ *             self.chunk()
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":418
+ *         max_chunk_size = self._max_chunk_size
+ *         chunk_remaining = max_chunk_size - chunk_size
+ *         if new_data_size > max_chunk_size:             # <<<<<<<<<<<<<<
+ *             self.write(b[:chunk_remaining])
+ *             self.chunk()
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":423
+ *             self.write(b[chunk_remaining:])
+ *             return
+ *         if new_data_size > chunk_remaining:             # <<<<<<<<<<<<<<
+ *             self.chunk()
+ *         new_end = self._end + new_data_size
+ */
+  __pyx_t_6 = ((__pyx_v_new_data_size > __pyx_v_chunk_remaining) != 0);
+  if (__pyx_t_6) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":424
+ *             return
+ *         if new_data_size > chunk_remaining:
+ *             self.chunk()             # <<<<<<<<<<<<<<
+ *         new_end = self._end + new_data_size
+ *         new_chunk_size = new_end - self._start
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->chunk(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":423
+ *             self.write(b[chunk_remaining:])
+ *             return
+ *         if new_data_size > chunk_remaining:             # <<<<<<<<<<<<<<
+ *             self.chunk()
+ *         new_end = self._end + new_data_size
+ */
   }
 
-  /* "neobolt/bolt/_io.pyx":277
- * 
- *     cpdef clear(self):
- *         self._header = 0             # <<<<<<<<<<<<<<
- *         self._start = 2
- *         self._end = 2
+  /* "neobolt/impl/python/bolt/_io.pyx":425
+ *         if new_data_size > chunk_remaining:
+ *             self.chunk()
+ *         new_end = self._end + new_data_size             # <<<<<<<<<<<<<<
+ *         new_chunk_size = new_end - self._start
+ *         data[self._end:new_end] = b
  */
-  __pyx_v_self->_header = 0;
+  __pyx_v_new_end = (__pyx_v_self->_end + __pyx_v_new_data_size);
 
-  /* "neobolt/bolt/_io.pyx":278
- *     cpdef clear(self):
- *         self._header = 0
- *         self._start = 2             # <<<<<<<<<<<<<<
- *         self._end = 2
- *         self._data[0:2] = b"\x00\x00"
+  /* "neobolt/impl/python/bolt/_io.pyx":426
+ *             self.chunk()
+ *         new_end = self._end + new_data_size
+ *         new_chunk_size = new_end - self._start             # <<<<<<<<<<<<<<
+ *         data[self._end:new_end] = b
+ *         self._end = new_end
  */
-  __pyx_v_self->_start = 2;
+  __pyx_v_new_chunk_size = (__pyx_v_new_end - __pyx_v_self->_start);
 
-  /* "neobolt/bolt/_io.pyx":279
- *         self._header = 0
- *         self._start = 2
- *         self._end = 2             # <<<<<<<<<<<<<<
- *         self._data[0:2] = b"\x00\x00"
+  /* "neobolt/impl/python/bolt/_io.pyx":427
+ *         new_end = self._end + new_data_size
+ *         new_chunk_size = new_end - self._start
+ *         data[self._end:new_end] = b             # <<<<<<<<<<<<<<
+ *         self._end = new_end
+ *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+ */
+  if (unlikely(__pyx_v_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 427, __pyx_L1_error)
+  }
+  if (__Pyx_PyObject_SetSlice(__pyx_v_data, __pyx_v_b, __pyx_v_self->_end, __pyx_v_new_end, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 427, __pyx_L1_error)
+
+  /* "neobolt/impl/python/bolt/_io.pyx":428
+ *         new_chunk_size = new_end - self._start
+ *         data[self._end:new_end] = b
+ *         self._end = new_end             # <<<<<<<<<<<<<<
+ *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
  * 
  */
-  __pyx_v_self->_end = 2;
+  __pyx_v_self->_end = __pyx_v_new_end;
 
-  /* "neobolt/bolt/_io.pyx":280
- *         self._start = 2
- *         self._end = 2
- *         self._data[0:2] = b"\x00\x00"             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":429
+ *         data[self._end:new_end] = b
+ *         self._end = new_end
+ *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)             # <<<<<<<<<<<<<<
  * 
- *     cpdef write(self, bytes b):
+ *     cpdef write_segment(self, b):
  */
-  if (unlikely(__pyx_v_self->_data == Py_None)) {
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_new_chunk_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  __pyx_t_7 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_7 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_H, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_H, __pyx_t_3};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    if (__pyx_t_4) {
+      __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+    }
+    __Pyx_INCREF(__pyx_kp_s_H);
+    __Pyx_GIVEREF(__pyx_kp_s_H);
+    PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_H);
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_3);
+    __pyx_t_3 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 429, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_data == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 280, __pyx_L1_error)
+    __PYX_ERR(0, 429, __pyx_L1_error)
   }
-  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_kp_b__5, 0, 2, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 280, __pyx_L1_error)
+  if (__Pyx_PyObject_SetSlice(__pyx_v_data, __pyx_t_1, __pyx_v_self->_header, (__pyx_v_self->_header + 2), NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 429, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":276
- *         return self._max_chunk_size
+  /* "neobolt/impl/python/bolt/_io.pyx":403
+ *         self._after_segment = False
  * 
- *     cpdef clear(self):             # <<<<<<<<<<<<<<
- *         self._header = 0
- *         self._start = 2
+ *     cpdef write(self, bytes b):             # <<<<<<<<<<<<<<
+ *         cdef bytearray data
+ *         cdef int new_data_size
  */
 
   /* function exit code */
@@ -6065,34 +8493,48 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_clear(struct
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_max_chunk_size);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_5clear(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("clear (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_4clear(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("write (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_b), (&PyBytes_Type), 1, "b", 1))) __PYX_ERR(0, 403, __pyx_L1_error)
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_6write(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), ((PyObject*)__pyx_v_b));
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_4clear(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_6write(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("clear", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_clear(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 276, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write(__pyx_v_self, __pyx_v_b, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 403, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6101,7 +8543,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_4clear(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6109,380 +8551,457 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_4clear(struc
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":282
- *         self._data[0:2] = b"\x00\x00"
+/* "neobolt/impl/python/bolt/_io.pyx":431
+ *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+ * 
+ *     cpdef write_segment(self, b):             # <<<<<<<<<<<<<<
+ *         """ Append data by reference instead of copying it into the buffer.
  * 
- *     cpdef write(self, bytes b):             # <<<<<<<<<<<<<<
- *         cdef bytearray data
- *         cdef int new_data_size
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_write(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch) {
-  PyObject *__pyx_v_data = 0;
-  int __pyx_v_new_data_size;
-  int __pyx_v_chunk_size;
-  int __pyx_v_chunk_remaining;
-  int __pyx_v_new_end;
-  int __pyx_v_new_chunk_size;
-  PyObject *__pyx_v_max_chunk_size = NULL;
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_9write_segment(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write_segment(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b, int __pyx_skip_dispatch) {
+  int __pyx_v_size;
+  int __pyx_v_offset;
+  int __pyx_v_max_chunk_size;
+  int __pyx_v_p;
+  int __pyx_v_q;
+  PyObject *__pyx_v_views = 0;
+  PyObject *__pyx_v_view = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_t_6;
   int __pyx_t_7;
-  int __pyx_t_8;
-  __Pyx_RefNannySetupContext("write", 0);
+  PyObject *(*__pyx_t_8)(PyObject *);
+  int __pyx_t_9;
+  int __pyx_t_10;
+  PyObject *__pyx_t_11 = NULL;
+  PyObject *__pyx_t_12 = NULL;
+  int __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_segment", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 282, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_7write)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_write_segment); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 431, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_9write_segment)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_b); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 282, __pyx_L1_error)
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_b) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_b);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 431, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_b};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 282, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_b};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 282, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        {
-          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 282, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-          __Pyx_INCREF(__pyx_v_b);
-          __Pyx_GIVEREF(__pyx_v_b);
-          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_b);
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 282, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        }
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":290
- *         cdef int new_chunk_size
- * 
- *         data = self._data             # <<<<<<<<<<<<<<
- *         new_data_size = len(b)
- *         chunk_size = self._end - self._start
- */
-  __pyx_t_1 = __pyx_v_self->_data;
-  __Pyx_INCREF(__pyx_t_1);
-  __pyx_v_data = ((PyObject*)__pyx_t_1);
-  __pyx_t_1 = 0;
-
-  /* "neobolt/bolt/_io.pyx":291
+  /* "neobolt/impl/python/bolt/_io.pyx":445
+ *         cdef list views
  * 
- *         data = self._data
- *         new_data_size = len(b)             # <<<<<<<<<<<<<<
- *         chunk_size = self._end - self._start
- *         max_chunk_size = self._max_chunk_size
- */
-  if (unlikely(__pyx_v_b == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(1, 291, __pyx_L1_error)
-  }
-  __pyx_t_6 = PyBytes_GET_SIZE(__pyx_v_b); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(1, 291, __pyx_L1_error)
-  __pyx_v_new_data_size = __pyx_t_6;
-
-  /* "neobolt/bolt/_io.pyx":292
- *         data = self._data
- *         new_data_size = len(b)
- *         chunk_size = self._end - self._start             # <<<<<<<<<<<<<<
- *         max_chunk_size = self._max_chunk_size
- *         chunk_remaining = max_chunk_size - chunk_size
- */
-  __pyx_v_chunk_size = (__pyx_v_self->_end - __pyx_v_self->_start);
-
-  /* "neobolt/bolt/_io.pyx":293
- *         new_data_size = len(b)
- *         chunk_size = self._end - self._start
- *         max_chunk_size = self._max_chunk_size             # <<<<<<<<<<<<<<
- *         chunk_remaining = max_chunk_size - chunk_size
- *         if new_data_size > max_chunk_size:
+ *         view = memoryview(b)             # <<<<<<<<<<<<<<
+ *         size = len(view)
+ *         if size == 0:
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_self->_max_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 293, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_v_max_chunk_size = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "neobolt/bolt/_io.pyx":294
- *         chunk_size = self._end - self._start
- *         max_chunk_size = self._max_chunk_size
- *         chunk_remaining = max_chunk_size - chunk_size             # <<<<<<<<<<<<<<
- *         if new_data_size > max_chunk_size:
- *             self.write(b[:chunk_remaining])
- */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 294, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyNumber_Subtract(__pyx_v_max_chunk_size, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 294, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 294, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_chunk_remaining = __pyx_t_7;
-
-  /* "neobolt/bolt/_io.pyx":295
- *         max_chunk_size = self._max_chunk_size
- *         chunk_remaining = max_chunk_size - chunk_size
- *         if new_data_size > max_chunk_size:             # <<<<<<<<<<<<<<
- *             self.write(b[:chunk_remaining])
- *             self.chunk()
- */
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_new_data_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 295, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_v_b); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 445, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyObject_RichCompare(__pyx_t_2, __pyx_v_max_chunk_size, Py_GT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 295, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_8 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_8 < 0)) __PYX_ERR(1, 295, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (__pyx_t_8) {
-
-    /* "neobolt/bolt/_io.pyx":296
- *         chunk_remaining = max_chunk_size - chunk_size
- *         if new_data_size > max_chunk_size:
- *             self.write(b[:chunk_remaining])             # <<<<<<<<<<<<<<
- *             self.chunk()
- *             self.write(b[chunk_remaining:])
- */
-    if (unlikely(__pyx_v_b == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 296, __pyx_L1_error)
-    }
-    __pyx_t_1 = PySequence_GetSlice(__pyx_v_b, 0, __pyx_v_chunk_remaining); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 296, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((PyObject*)__pyx_t_1), 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 296, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_view = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-    /* "neobolt/bolt/_io.pyx":297
- *         if new_data_size > max_chunk_size:
- *             self.write(b[:chunk_remaining])
- *             self.chunk()             # <<<<<<<<<<<<<<
- *             self.write(b[chunk_remaining:])
+  /* "neobolt/impl/python/bolt/_io.pyx":446
+ * 
+ *         view = memoryview(b)
+ *         size = len(view)             # <<<<<<<<<<<<<<
+ *         if size == 0:
  *             return
  */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->chunk(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 297, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_5 = PyObject_Length(__pyx_v_view); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 446, __pyx_L1_error)
+  __pyx_v_size = __pyx_t_5;
 
-    /* "neobolt/bolt/_io.pyx":298
- *             self.write(b[:chunk_remaining])
- *             self.chunk()
- *             self.write(b[chunk_remaining:])             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":447
+ *         view = memoryview(b)
+ *         size = len(view)
+ *         if size == 0:             # <<<<<<<<<<<<<<
  *             return
- *         if new_data_size > chunk_remaining:
+ *         if self._end == self._start:
  */
-    if (unlikely(__pyx_v_b == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 298, __pyx_L1_error)
-    }
-    __pyx_t_2 = PySequence_GetSlice(__pyx_v_b, __pyx_v_chunk_remaining, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 298, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->write(__pyx_v_self, ((PyObject*)__pyx_t_2), 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 298, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_6 = ((__pyx_v_size == 0) != 0);
+  if (__pyx_t_6) {
 
-    /* "neobolt/bolt/_io.pyx":299
- *             self.chunk()
- *             self.write(b[chunk_remaining:])
+    /* "neobolt/impl/python/bolt/_io.pyx":448
+ *         size = len(view)
+ *         if size == 0:
  *             return             # <<<<<<<<<<<<<<
- *         if new_data_size > chunk_remaining:
- *             self.chunk()
+ *         if self._end == self._start:
+ *             # Drop the empty chunk that is currently open
  */
     __Pyx_XDECREF(__pyx_r);
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "neobolt/bolt/_io.pyx":295
- *         max_chunk_size = self._max_chunk_size
- *         chunk_remaining = max_chunk_size - chunk_size
- *         if new_data_size > max_chunk_size:             # <<<<<<<<<<<<<<
- *             self.write(b[:chunk_remaining])
- *             self.chunk()
+    /* "neobolt/impl/python/bolt/_io.pyx":447
+ *         view = memoryview(b)
+ *         size = len(view)
+ *         if size == 0:             # <<<<<<<<<<<<<<
+ *             return
+ *         if self._end == self._start:
  */
   }
 
-  /* "neobolt/bolt/_io.pyx":300
- *             self.write(b[chunk_remaining:])
+  /* "neobolt/impl/python/bolt/_io.pyx":449
+ *         if size == 0:
  *             return
- *         if new_data_size > chunk_remaining:             # <<<<<<<<<<<<<<
- *             self.chunk()
- *         new_end = self._end + new_data_size
+ *         if self._end == self._start:             # <<<<<<<<<<<<<<
+ *             # Drop the empty chunk that is currently open
+ *             offset = self._header
  */
-  __pyx_t_8 = ((__pyx_v_new_data_size > __pyx_v_chunk_remaining) != 0);
-  if (__pyx_t_8) {
+  __pyx_t_6 = ((__pyx_v_self->_end == __pyx_v_self->_start) != 0);
+  if (__pyx_t_6) {
 
-    /* "neobolt/bolt/_io.pyx":301
- *             return
- *         if new_data_size > chunk_remaining:
- *             self.chunk()             # <<<<<<<<<<<<<<
- *         new_end = self._end + new_data_size
- *         new_chunk_size = new_end - self._start
+    /* "neobolt/impl/python/bolt/_io.pyx":451
+ *         if self._end == self._start:
+ *             # Drop the empty chunk that is currently open
+ *             offset = self._header             # <<<<<<<<<<<<<<
+ *         else:
+ *             offset = self._end
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->chunk(__pyx_v_self, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 301, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_7 = __pyx_v_self->_header;
+    __pyx_v_offset = __pyx_t_7;
 
-    /* "neobolt/bolt/_io.pyx":300
- *             self.write(b[chunk_remaining:])
+    /* "neobolt/impl/python/bolt/_io.pyx":449
+ *         if size == 0:
  *             return
- *         if new_data_size > chunk_remaining:             # <<<<<<<<<<<<<<
- *             self.chunk()
- *         new_end = self._end + new_data_size
+ *         if self._end == self._start:             # <<<<<<<<<<<<<<
+ *             # Drop the empty chunk that is currently open
+ *             offset = self._header
  */
+    goto __pyx_L4;
   }
 
-  /* "neobolt/bolt/_io.pyx":302
- *         if new_data_size > chunk_remaining:
- *             self.chunk()
- *         new_end = self._end + new_data_size             # <<<<<<<<<<<<<<
- *         new_chunk_size = new_end - self._start
- *         data[self._end:new_end] = b
- */
-  __pyx_v_new_end = (__pyx_v_self->_end + __pyx_v_new_data_size);
-
-  /* "neobolt/bolt/_io.pyx":303
- *             self.chunk()
- *         new_end = self._end + new_data_size
- *         new_chunk_size = new_end - self._start             # <<<<<<<<<<<<<<
- *         data[self._end:new_end] = b
- *         self._end = new_end
+  /* "neobolt/impl/python/bolt/_io.pyx":453
+ *             offset = self._header
+ *         else:
+ *             offset = self._end             # <<<<<<<<<<<<<<
+ *         max_chunk_size = self._max_chunk_size
+ *         views = []
  */
-  __pyx_v_new_chunk_size = (__pyx_v_new_end - __pyx_v_self->_start);
+  /*else*/ {
+    __pyx_t_7 = __pyx_v_self->_end;
+    __pyx_v_offset = __pyx_t_7;
+  }
+  __pyx_L4:;
 
-  /* "neobolt/bolt/_io.pyx":304
- *         new_end = self._end + new_data_size
- *         new_chunk_size = new_end - self._start
- *         data[self._end:new_end] = b             # <<<<<<<<<<<<<<
- *         self._end = new_end
- *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+  /* "neobolt/impl/python/bolt/_io.pyx":454
+ *         else:
+ *             offset = self._end
+ *         max_chunk_size = self._max_chunk_size             # <<<<<<<<<<<<<<
+ *         views = []
+ *         for p in range(0, size, max_chunk_size):
  */
-  if (unlikely(__pyx_v_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 304, __pyx_L1_error)
-  }
-  if (__Pyx_PyObject_SetSlice(__pyx_v_data, __pyx_v_b, __pyx_v_self->_end, __pyx_v_new_end, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 304, __pyx_L1_error)
+  __pyx_t_7 = __pyx_v_self->_max_chunk_size;
+  __pyx_v_max_chunk_size = __pyx_t_7;
 
-  /* "neobolt/bolt/_io.pyx":305
- *         new_chunk_size = new_end - self._start
- *         data[self._end:new_end] = b
- *         self._end = new_end             # <<<<<<<<<<<<<<
- *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
- * 
+  /* "neobolt/impl/python/bolt/_io.pyx":455
+ *             offset = self._end
+ *         max_chunk_size = self._max_chunk_size
+ *         views = []             # <<<<<<<<<<<<<<
+ *         for p in range(0, size, max_chunk_size):
+ *             q = min(p + max_chunk_size, size)
  */
-  __pyx_v_self->_end = __pyx_v_new_end;
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_views = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-  /* "neobolt/bolt/_io.pyx":306
- *         data[self._end:new_end] = b
- *         self._end = new_end
- *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)             # <<<<<<<<<<<<<<
- * 
- *     cpdef chunk(self):
+  /* "neobolt/impl/python/bolt/_io.pyx":456
+ *         max_chunk_size = self._max_chunk_size
+ *         views = []
+ *         for p in range(0, size, max_chunk_size):             # <<<<<<<<<<<<<<
+ *             q = min(p + max_chunk_size, size)
+ *             views.append(struct_pack(">H", q - p))
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 456, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_new_chunk_size); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_max_chunk_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 456, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_5 = NULL;
-  __pyx_t_7 = 0;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-      __pyx_t_7 = 1;
-    }
+  __Pyx_INCREF(__pyx_int_0);
+  __Pyx_GIVEREF(__pyx_int_0);
+  PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_int_0);
+  __Pyx_GIVEREF(__pyx_t_2);
+  PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_1);
+  PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_1);
+  __pyx_t_2 = 0;
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+    __pyx_t_3 = __pyx_t_1; __Pyx_INCREF(__pyx_t_3); __pyx_t_5 = 0;
+    __pyx_t_8 = NULL;
+  } else {
+    __pyx_t_5 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_8 = Py_TYPE(__pyx_t_3)->tp_iternext; if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 456, __pyx_L1_error)
   }
-  #if CYTHON_FAST_PYCALL
-  if (PyFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_H, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 306, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  } else
-  #endif
-  #if CYTHON_FAST_PYCCALL
-  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_u_H, __pyx_t_3};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 306, __pyx_L1_error)
-    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  } else
-  #endif
-  {
-    __pyx_t_4 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  for (;;) {
+    if (likely(!__pyx_t_8)) {
+      if (likely(PyList_CheckExact(__pyx_t_3))) {
+        if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 456, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      } else {
+        if (__pyx_t_5 >= PyTuple_GET_SIZE(__pyx_t_3)) break;
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_5); __Pyx_INCREF(__pyx_t_1); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 456, __pyx_L1_error)
+        #else
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_3, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 456, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        #endif
+      }
+    } else {
+      __pyx_t_1 = __pyx_t_8(__pyx_t_3);
+      if (unlikely(!__pyx_t_1)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+          else __PYX_ERR(0, 456, __pyx_L1_error)
+        }
+        break;
+      }
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __pyx_t_7 = __Pyx_PyInt_As_int(__pyx_t_1); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 456, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_p = __pyx_t_7;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":457
+ *         views = []
+ *         for p in range(0, size, max_chunk_size):
+ *             q = min(p + max_chunk_size, size)             # <<<<<<<<<<<<<<
+ *             views.append(struct_pack(">H", q - p))
+ *             views.append(view[p:q])
+ */
+    __pyx_t_7 = __pyx_v_size;
+    __pyx_t_9 = (__pyx_v_p + __pyx_v_max_chunk_size);
+    if (((__pyx_t_7 < __pyx_t_9) != 0)) {
+      __pyx_t_10 = __pyx_t_7;
+    } else {
+      __pyx_t_10 = __pyx_t_9;
+    }
+    __pyx_v_q = __pyx_t_10;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":458
+ *         for p in range(0, size, max_chunk_size):
+ *             q = min(p + max_chunk_size, size)
+ *             views.append(struct_pack(">H", q - p))             # <<<<<<<<<<<<<<
+ *             views.append(view[p:q])
+ *         self._segments.append((offset, views))
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_q - __pyx_v_p)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 458, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    if (__pyx_t_5) {
-      __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_5); __pyx_t_5 = NULL;
+    __pyx_t_11 = NULL;
+    __pyx_t_10 = 0;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_11)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_11);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+        __pyx_t_10 = 1;
+      }
     }
-    __Pyx_INCREF(__pyx_kp_u_H);
-    __Pyx_GIVEREF(__pyx_kp_u_H);
-    PyTuple_SET_ITEM(__pyx_t_4, 0+__pyx_t_7, __pyx_kp_u_H);
-    __Pyx_GIVEREF(__pyx_t_3);
-    PyTuple_SET_ITEM(__pyx_t_4, 1+__pyx_t_7, __pyx_t_3);
-    __pyx_t_3 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 306, __pyx_L1_error)
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_kp_s_H, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_11, __pyx_kp_s_H, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_10, 2+__pyx_t_10); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    } else
+    #endif
+    {
+      __pyx_t_12 = PyTuple_New(2+__pyx_t_10); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 458, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_12);
+      if (__pyx_t_11) {
+        __Pyx_GIVEREF(__pyx_t_11); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_11); __pyx_t_11 = NULL;
+      }
+      __Pyx_INCREF(__pyx_kp_s_H);
+      __Pyx_GIVEREF(__pyx_kp_s_H);
+      PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_10, __pyx_kp_s_H);
+      __Pyx_GIVEREF(__pyx_t_4);
+      PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_10, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 458, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_13 = __Pyx_PyList_Append(__pyx_v_views, __pyx_t_1); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 458, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":459
+ *             q = min(p + max_chunk_size, size)
+ *             views.append(struct_pack(">H", q - p))
+ *             views.append(view[p:q])             # <<<<<<<<<<<<<<
+ *         self._segments.append((offset, views))
+ *         self._header = offset
+ */
+    __pyx_t_1 = __Pyx_PyObject_GetSlice(__pyx_v_view, __pyx_v_p, __pyx_v_q, NULL, NULL, NULL, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 459, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_13 = __Pyx_PyList_Append(__pyx_v_views, __pyx_t_1); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 459, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":456
+ *         max_chunk_size = self._max_chunk_size
+ *         views = []
+ *         for p in range(0, size, max_chunk_size):             # <<<<<<<<<<<<<<
+ *             q = min(p + max_chunk_size, size)
+ *             views.append(struct_pack(">H", q - p))
+ */
   }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_v_data == Py_None)) {
-    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 306, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":460
+ *             views.append(struct_pack(">H", q - p))
+ *             views.append(view[p:q])
+ *         self._segments.append((offset, views))             # <<<<<<<<<<<<<<
+ *         self._header = offset
+ *         self._start = offset + 2
+ */
+  if (unlikely(__pyx_v_self->_segments == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+    __PYX_ERR(0, 460, __pyx_L1_error)
   }
-  if (__Pyx_PyObject_SetSlice(__pyx_v_data, __pyx_t_1, __pyx_v_self->_header, (__pyx_v_self->_header + 2), NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 306, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_offset); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_3);
+  PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
+  __Pyx_INCREF(__pyx_v_views);
+  __Pyx_GIVEREF(__pyx_v_views);
+  PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_v_views);
+  __pyx_t_3 = 0;
+  __pyx_t_13 = __Pyx_PyList_Append(__pyx_v_self->_segments, __pyx_t_1); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 460, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":282
- *         self._data[0:2] = b"\x00\x00"
+  /* "neobolt/impl/python/bolt/_io.pyx":461
+ *             views.append(view[p:q])
+ *         self._segments.append((offset, views))
+ *         self._header = offset             # <<<<<<<<<<<<<<
+ *         self._start = offset + 2
+ *         self._end = self._start
+ */
+  __pyx_v_self->_header = __pyx_v_offset;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":462
+ *         self._segments.append((offset, views))
+ *         self._header = offset
+ *         self._start = offset + 2             # <<<<<<<<<<<<<<
+ *         self._end = self._start
+ *         self._data[self._header:self._start] = b"\x00\x00"
+ */
+  __pyx_v_self->_start = (__pyx_v_offset + 2);
+
+  /* "neobolt/impl/python/bolt/_io.pyx":463
+ *         self._header = offset
+ *         self._start = offset + 2
+ *         self._end = self._start             # <<<<<<<<<<<<<<
+ *         self._data[self._header:self._start] = b"\x00\x00"
+ *         self._after_segment = True
+ */
+  __pyx_t_10 = __pyx_v_self->_start;
+  __pyx_v_self->_end = __pyx_t_10;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":464
+ *         self._start = offset + 2
+ *         self._end = self._start
+ *         self._data[self._header:self._start] = b"\x00\x00"             # <<<<<<<<<<<<<<
+ *         self._after_segment = True
+ * 
+ */
+  if (unlikely(__pyx_v_self->_data == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 464, __pyx_L1_error)
+  }
+  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_kp_b__6, __pyx_v_self->_header, __pyx_v_self->_start, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 464, __pyx_L1_error)
+
+  /* "neobolt/impl/python/bolt/_io.pyx":465
+ *         self._end = self._start
+ *         self._data[self._header:self._start] = b"\x00\x00"
+ *         self._after_segment = True             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef chunk(self):
+ */
+  __pyx_v_self->_after_segment = 1;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":431
+ *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+ * 
+ *     cpdef write_segment(self, b):             # <<<<<<<<<<<<<<
+ *         """ Append data by reference instead of copying it into the buffer.
  * 
- *     cpdef write(self, bytes b):             # <<<<<<<<<<<<<<
- *         cdef bytearray data
- *         cdef int new_data_size
  */
 
   /* function exit code */
@@ -6493,42 +9012,42 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_write(struct
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_11);
+  __Pyx_XDECREF(__pyx_t_12);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.write_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_data);
-  __Pyx_XDECREF(__pyx_v_max_chunk_size);
+  __Pyx_XDECREF(__pyx_v_views);
+  __Pyx_XDECREF(__pyx_v_view);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_7write(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_9write_segment(PyObject *__pyx_v_self, PyObject *__pyx_v_b); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_8write_segment[] = " Append data by reference instead of copying it into the buffer.\n\n        The data is framed into chunks of its own, for which only the\n        chunk headers are held locally, and must not be modified until\n        the buffer has been cleared.\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_9write_segment(PyObject *__pyx_v_self, PyObject *__pyx_v_b) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("write (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_b), (&PyBytes_Type), 1, "b", 1))) __PYX_ERR(1, 282, __pyx_L1_error)
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_6write(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), ((PyObject*)__pyx_v_b));
+  __Pyx_RefNannySetupContext("write_segment (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_8write_segment(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v_b));
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_6write(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_8write_segment(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, PyObject *__pyx_v_b) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("write", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("write_segment", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_write(__pyx_v_self, __pyx_v_b, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 282, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write_segment(__pyx_v_self, __pyx_v_b, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 431, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6537,7 +9056,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_6write(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.write_segment", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6545,16 +9064,16 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_6write(struc
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":308
- *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+/* "neobolt/impl/python/bolt/_io.pyx":467
+ *         self._after_segment = True
  * 
  *     cpdef chunk(self):             # <<<<<<<<<<<<<<
- *         self._header = self._end
- *         self._start = self._header + 2
+ *         if self._after_segment:
+ *             # The last segment chunk has already been closed
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_9chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_11chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -6562,54 +9081,109 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("chunk", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_chunk); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 308, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_9chunk)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_chunk); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 467, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_11chunk)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 467, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 308, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 308, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":309
+  /* "neobolt/impl/python/bolt/_io.pyx":468
+ * 
+ *     cpdef chunk(self):
+ *         if self._after_segment:             # <<<<<<<<<<<<<<
+ *             # The last segment chunk has already been closed
+ *             # and a new local chunk opened in its place
+ */
+  __pyx_t_5 = (__pyx_v_self->_after_segment != 0);
+  if (__pyx_t_5) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":471
+ *             # The last segment chunk has already been closed
+ *             # and a new local chunk opened in its place
+ *             self._after_segment = False             # <<<<<<<<<<<<<<
+ *             return
+ *         self._header = self._end
+ */
+    __pyx_v_self->_after_segment = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":472
+ *             # and a new local chunk opened in its place
+ *             self._after_segment = False
+ *             return             # <<<<<<<<<<<<<<
+ *         self._header = self._end
+ *         self._start = self._header + 2
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":468
  * 
  *     cpdef chunk(self):
+ *         if self._after_segment:             # <<<<<<<<<<<<<<
+ *             # The last segment chunk has already been closed
+ *             # and a new local chunk opened in its place
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":473
+ *             self._after_segment = False
+ *             return
  *         self._header = self._end             # <<<<<<<<<<<<<<
  *         self._start = self._header + 2
  *         self._end = self._start
  */
-  __pyx_t_5 = __pyx_v_self->_end;
-  __pyx_v_self->_header = __pyx_t_5;
+  __pyx_t_6 = __pyx_v_self->_end;
+  __pyx_v_self->_header = __pyx_t_6;
 
-  /* "neobolt/bolt/_io.pyx":310
- *     cpdef chunk(self):
+  /* "neobolt/impl/python/bolt/_io.pyx":474
+ *             return
  *         self._header = self._end
  *         self._start = self._header + 2             # <<<<<<<<<<<<<<
  *         self._end = self._start
@@ -6617,17 +9191,17 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct
  */
   __pyx_v_self->_start = (__pyx_v_self->_header + 2);
 
-  /* "neobolt/bolt/_io.pyx":311
+  /* "neobolt/impl/python/bolt/_io.pyx":475
  *         self._header = self._end
  *         self._start = self._header + 2
  *         self._end = self._start             # <<<<<<<<<<<<<<
  *         self._data[self._header:self._start] = b"\x00\x00"
  * 
  */
-  __pyx_t_5 = __pyx_v_self->_start;
-  __pyx_v_self->_end = __pyx_t_5;
+  __pyx_t_6 = __pyx_v_self->_start;
+  __pyx_v_self->_end = __pyx_t_6;
 
-  /* "neobolt/bolt/_io.pyx":312
+  /* "neobolt/impl/python/bolt/_io.pyx":476
  *         self._start = self._header + 2
  *         self._end = self._start
  *         self._data[self._header:self._start] = b"\x00\x00"             # <<<<<<<<<<<<<<
@@ -6636,16 +9210,16 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct
  */
   if (unlikely(__pyx_v_self->_data == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(1, 312, __pyx_L1_error)
+    __PYX_ERR(0, 476, __pyx_L1_error)
   }
-  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_kp_b__5, __pyx_v_self->_header, __pyx_v_self->_start, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(1, 312, __pyx_L1_error)
+  if (__Pyx_PyObject_SetSlice(__pyx_v_self->_data, __pyx_kp_b__6, __pyx_v_self->_header, __pyx_v_self->_start, NULL, NULL, NULL, 1, 1, 1) < 0) __PYX_ERR(0, 476, __pyx_L1_error)
 
-  /* "neobolt/bolt/_io.pyx":308
- *         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
+  /* "neobolt/impl/python/bolt/_io.pyx":467
+ *         self._after_segment = True
  * 
  *     cpdef chunk(self):             # <<<<<<<<<<<<<<
- *         self._header = self._end
- *         self._start = self._header + 2
+ *         if self._after_segment:
+ *             # The last segment chunk has already been closed
  */
 
   /* function exit code */
@@ -6656,7 +9230,7 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.chunk", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.chunk", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6665,25 +9239,28 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(struct
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_9chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_9chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_11chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_11chunk(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("chunk (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_10chunk(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_10chunk(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("chunk", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 308, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_chunk(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 467, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6692,7 +9269,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.chunk", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.chunk", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6700,7 +9277,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(struc
   return __pyx_r;
 }
 
-/* "neobolt/bolt/_io.pyx":314
+/* "neobolt/impl/python/bolt/_io.pyx":478
  *         self._data[self._header:self._start] = b"\x00\x00"
  * 
  *     cpdef view(self):             # <<<<<<<<<<<<<<
@@ -6708,8 +9285,8 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_8chunk(struc
  *         cdef int chunk_size
  */
 
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_11view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_13view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
   int __pyx_v_end;
   int __pyx_v_chunk_size;
   PyObject *__pyx_r = NULL;
@@ -6720,54 +9297,111 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct _
   PyObject *__pyx_t_4 = NULL;
   int __pyx_t_5;
   int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("view", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 314, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_11view)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_view); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 478, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_13view)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 478, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 314, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 314, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/bolt/_io.pyx":318
+  /* "neobolt/impl/python/bolt/_io.pyx":482
+ *         cdef int chunk_size
+ * 
+ *         if self._segments:             # <<<<<<<<<<<<<<
+ *             return memoryview(b"".join(self.views()))
+ *         end = self._end
+ */
+  __pyx_t_5 = (__pyx_v_self->_segments != Py_None)&&(PyList_GET_SIZE(__pyx_v_self->_segments) != 0);
+  if (__pyx_t_5) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":483
+ * 
+ *         if self._segments:
+ *             return memoryview(b"".join(self.views()))             # <<<<<<<<<<<<<<
+ *         end = self._end
+ *         chunk_size = end - self._start
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 483, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self->__pyx_vtab)->views(__pyx_v_self, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = __Pyx_PyBytes_Join(__pyx_kp_b__7, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 483, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":482
  *         cdef int chunk_size
  * 
+ *         if self._segments:             # <<<<<<<<<<<<<<
+ *             return memoryview(b"".join(self.views()))
+ *         end = self._end
+ */
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":484
+ *         if self._segments:
+ *             return memoryview(b"".join(self.views()))
  *         end = self._end             # <<<<<<<<<<<<<<
  *         chunk_size = end - self._start
  *         if chunk_size == 0:
  */
-  __pyx_t_5 = __pyx_v_self->_end;
-  __pyx_v_end = __pyx_t_5;
+  __pyx_t_6 = __pyx_v_self->_end;
+  __pyx_v_end = __pyx_t_6;
 
-  /* "neobolt/bolt/_io.pyx":319
- * 
+  /* "neobolt/impl/python/bolt/_io.pyx":485
+ *             return memoryview(b"".join(self.views()))
  *         end = self._end
  *         chunk_size = end - self._start             # <<<<<<<<<<<<<<
  *         if chunk_size == 0:
@@ -6775,17 +9409,17 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct _
  */
   __pyx_v_chunk_size = (__pyx_v_end - __pyx_v_self->_start);
 
-  /* "neobolt/bolt/_io.pyx":320
+  /* "neobolt/impl/python/bolt/_io.pyx":486
  *         end = self._end
  *         chunk_size = end - self._start
  *         if chunk_size == 0:             # <<<<<<<<<<<<<<
  *             return memoryview(self._data[:self._header])
  *         else:
  */
-  __pyx_t_6 = ((__pyx_v_chunk_size == 0) != 0);
-  if (__pyx_t_6) {
+  __pyx_t_5 = ((__pyx_v_chunk_size == 0) != 0);
+  if (__pyx_t_5) {
 
-    /* "neobolt/bolt/_io.pyx":321
+    /* "neobolt/impl/python/bolt/_io.pyx":487
  *         chunk_size = end - self._start
  *         if chunk_size == 0:
  *             return memoryview(self._data[:self._header])             # <<<<<<<<<<<<<<
@@ -6793,23 +9427,23 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct _
  *             return memoryview(self._data[:end])
  */
     __Pyx_XDECREF(__pyx_r);
-    __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 321, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     if (unlikely(__pyx_v_self->_data == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 321, __pyx_L1_error)
+      __PYX_ERR(0, 487, __pyx_L1_error)
     }
-    __pyx_t_2 = PySequence_GetSlice(__pyx_v_self->_data, 0, __pyx_v_self->_header); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 321, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 321, __pyx_L1_error)
+    __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->_data, 0, __pyx_v_self->_header); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 487, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 487, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_r = __pyx_t_3;
-    __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
     goto __pyx_L0;
 
-    /* "neobolt/bolt/_io.pyx":320
+    /* "neobolt/impl/python/bolt/_io.pyx":486
  *         end = self._end
  *         chunk_size = end - self._start
  *         if chunk_size == 0:             # <<<<<<<<<<<<<<
@@ -6818,36 +9452,446 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct _
  */
   }
 
-  /* "neobolt/bolt/_io.pyx":323
+  /* "neobolt/impl/python/bolt/_io.pyx":489
  *             return memoryview(self._data[:self._header])
  *         else:
- *             return memoryview(self._data[:end])             # <<<<<<<<<<<<<<
+ *             return memoryview(self._data[:end])             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef list views(self):
+ */
+  /*else*/ {
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 489, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(__pyx_v_self->_data == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 489, __pyx_L1_error)
+    }
+    __pyx_t_3 = PySequence_GetSlice(__pyx_v_self->_data, 0, __pyx_v_end); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 489, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 489, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":478
+ *         self._data[self._header:self._start] = b"\x00\x00"
+ * 
+ *     cpdef view(self):             # <<<<<<<<<<<<<<
+ *         cdef int end
+ *         cdef int chunk_size
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_13view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_13view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("view (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_12view(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_12view(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("view", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_view(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 478, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "neobolt/impl/python/bolt/_io.pyx":491
+ *             return memoryview(self._data[:end])
+ * 
+ *     cpdef list views(self):             # <<<<<<<<<<<<<<
+ *         """ Return the buffered data as a list of views, suitable
+ *         for scatter-gather output with `socket.sendmsg`.
+ */
+
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_15views(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_views(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_data = 0;
+  PyObject *__pyx_v_views = 0;
+  int __pyx_v_p;
+  int __pyx_v_offset;
+  int __pyx_v_end;
+  PyObject *__pyx_v_segment_views = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  Py_ssize_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("views", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_views); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_15views)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
+        }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 491, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (!(likely(PyList_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "list", Py_TYPE(__pyx_t_2)->tp_name), 0))) __PYX_ERR(0, 491, __pyx_L1_error)
+        __pyx_r = ((PyObject*)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":501
+ *         cdef int end
+ * 
+ *         data = self._data             # <<<<<<<<<<<<<<
+ *         views = []
+ *         p = 0
+ */
+  __pyx_t_1 = __pyx_v_self->_data;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_data = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":502
+ * 
+ *         data = self._data
+ *         views = []             # <<<<<<<<<<<<<<
+ *         p = 0
+ *         for offset, segment_views in self._segments:
+ */
+  __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 502, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_views = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":503
+ *         data = self._data
+ *         views = []
+ *         p = 0             # <<<<<<<<<<<<<<
+ *         for offset, segment_views in self._segments:
+ *             if offset > p:
+ */
+  __pyx_v_p = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":504
+ *         views = []
+ *         p = 0
+ *         for offset, segment_views in self._segments:             # <<<<<<<<<<<<<<
+ *             if offset > p:
+ *                 views.append(memoryview(data[p:offset]))
+ */
+  if (unlikely(__pyx_v_self->_segments == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+    __PYX_ERR(0, 504, __pyx_L1_error)
+  }
+  __pyx_t_1 = __pyx_v_self->_segments; __Pyx_INCREF(__pyx_t_1); __pyx_t_5 = 0;
+  for (;;) {
+    if (__pyx_t_5 >= PyList_GET_SIZE(__pyx_t_1)) break;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_5); __Pyx_INCREF(__pyx_t_2); __pyx_t_5++; if (unlikely(0 < 0)) __PYX_ERR(0, 504, __pyx_L1_error)
+    #else
+    __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_5); __pyx_t_5++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 504, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    #endif
+    if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
+      PyObject* sequence = __pyx_t_2;
+      Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+      if (unlikely(size != 2)) {
+        if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+        else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+        __PYX_ERR(0, 504, __pyx_L1_error)
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      if (likely(PyTuple_CheckExact(sequence))) {
+        __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
+      } else {
+        __pyx_t_3 = PyList_GET_ITEM(sequence, 0); 
+        __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
+      }
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_4);
+      #else
+      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 504, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 504, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      #endif
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    } else {
+      Py_ssize_t index = -1;
+      __pyx_t_6 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 504, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
+      index = 0; __pyx_t_3 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_3)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_3);
+      index = 1; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L5_unpacking_failed;
+      __Pyx_GOTREF(__pyx_t_4);
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 504, __pyx_L1_error)
+      __pyx_t_7 = NULL;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      goto __pyx_L6_unpacking_done;
+      __pyx_L5_unpacking_failed:;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_7 = NULL;
+      if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+      __PYX_ERR(0, 504, __pyx_L1_error)
+      __pyx_L6_unpacking_done:;
+    }
+    __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 504, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __pyx_v_offset = __pyx_t_8;
+    __Pyx_XDECREF_SET(__pyx_v_segment_views, __pyx_t_4);
+    __pyx_t_4 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":505
+ *         p = 0
+ *         for offset, segment_views in self._segments:
+ *             if offset > p:             # <<<<<<<<<<<<<<
+ *                 views.append(memoryview(data[p:offset]))
+ *             views.extend(segment_views)
+ */
+    __pyx_t_9 = ((__pyx_v_offset > __pyx_v_p) != 0);
+    if (__pyx_t_9) {
+
+      /* "neobolt/impl/python/bolt/_io.pyx":506
+ *         for offset, segment_views in self._segments:
+ *             if offset > p:
+ *                 views.append(memoryview(data[p:offset]))             # <<<<<<<<<<<<<<
+ *             views.extend(segment_views)
+ *             p = offset
+ */
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 506, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      if (unlikely(__pyx_v_data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 506, __pyx_L1_error)
+      }
+      __pyx_t_4 = PySequence_GetSlice(__pyx_v_data, __pyx_v_p, __pyx_v_offset); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 506, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 506, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_views, __pyx_t_3); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 506, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "neobolt/impl/python/bolt/_io.pyx":505
+ *         p = 0
+ *         for offset, segment_views in self._segments:
+ *             if offset > p:             # <<<<<<<<<<<<<<
+ *                 views.append(memoryview(data[p:offset]))
+ *             views.extend(segment_views)
+ */
+    }
+
+    /* "neobolt/impl/python/bolt/_io.pyx":507
+ *             if offset > p:
+ *                 views.append(memoryview(data[p:offset]))
+ *             views.extend(segment_views)             # <<<<<<<<<<<<<<
+ *             p = offset
+ *         if self._end == self._start:
+ */
+    __pyx_t_10 = __Pyx_PyList_Extend(__pyx_v_views, __pyx_v_segment_views); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 507, __pyx_L1_error)
+
+    /* "neobolt/impl/python/bolt/_io.pyx":508
+ *                 views.append(memoryview(data[p:offset]))
+ *             views.extend(segment_views)
+ *             p = offset             # <<<<<<<<<<<<<<
+ *         if self._end == self._start:
+ *             end = self._header
+ */
+    __pyx_v_p = __pyx_v_offset;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":504
+ *         views = []
+ *         p = 0
+ *         for offset, segment_views in self._segments:             # <<<<<<<<<<<<<<
+ *             if offset > p:
+ *                 views.append(memoryview(data[p:offset]))
+ */
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":509
+ *             views.extend(segment_views)
+ *             p = offset
+ *         if self._end == self._start:             # <<<<<<<<<<<<<<
+ *             end = self._header
+ *         else:
+ */
+  __pyx_t_9 = ((__pyx_v_self->_end == __pyx_v_self->_start) != 0);
+  if (__pyx_t_9) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":510
+ *             p = offset
+ *         if self._end == self._start:
+ *             end = self._header             # <<<<<<<<<<<<<<
+ *         else:
+ *             end = self._end
+ */
+    __pyx_t_8 = __pyx_v_self->_header;
+    __pyx_v_end = __pyx_t_8;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":509
+ *             views.extend(segment_views)
+ *             p = offset
+ *         if self._end == self._start:             # <<<<<<<<<<<<<<
+ *             end = self._header
+ *         else:
+ */
+    goto __pyx_L8;
+  }
+
+  /* "neobolt/impl/python/bolt/_io.pyx":512
+ *             end = self._header
+ *         else:
+ *             end = self._end             # <<<<<<<<<<<<<<
+ *         if end > p:
+ *             views.append(memoryview(data[p:end]))
+ */
+  /*else*/ {
+    __pyx_t_8 = __pyx_v_self->_end;
+    __pyx_v_end = __pyx_t_8;
+  }
+  __pyx_L8:;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":513
+ *         else:
+ *             end = self._end
+ *         if end > p:             # <<<<<<<<<<<<<<
+ *             views.append(memoryview(data[p:end]))
+ *         return views
  */
-  /*else*/ {
-    __Pyx_XDECREF(__pyx_r);
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 323, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    if (unlikely(__pyx_v_self->_data == Py_None)) {
+  __pyx_t_9 = ((__pyx_v_end > __pyx_v_p) != 0);
+  if (__pyx_t_9) {
+
+    /* "neobolt/impl/python/bolt/_io.pyx":514
+ *             end = self._end
+ *         if end > p:
+ *             views.append(memoryview(data[p:end]))             # <<<<<<<<<<<<<<
+ *         return views
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(__pyx_v_data == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 323, __pyx_L1_error)
+      __PYX_ERR(0, 514, __pyx_L1_error)
     }
-    __pyx_t_2 = PySequence_GetSlice(__pyx_v_self->_data, 0, __pyx_v_end); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 323, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 323, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = PySequence_GetSlice(__pyx_v_data, __pyx_v_p, __pyx_v_end); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
+    __pyx_t_10 = __Pyx_PyList_Append(__pyx_v_views, __pyx_t_4); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 514, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+    /* "neobolt/impl/python/bolt/_io.pyx":513
+ *         else:
+ *             end = self._end
+ *         if end > p:             # <<<<<<<<<<<<<<
+ *             views.append(memoryview(data[p:end]))
+ *         return views
+ */
   }
 
-  /* "neobolt/bolt/_io.pyx":314
- *         self._data[self._header:self._start] = b"\x00\x00"
+  /* "neobolt/impl/python/bolt/_io.pyx":515
+ *         if end > p:
+ *             views.append(memoryview(data[p:end]))
+ *         return views             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_views);
+  __pyx_r = __pyx_v_views;
+  goto __pyx_L0;
+
+  /* "neobolt/impl/python/bolt/_io.pyx":491
+ *             return memoryview(self._data[:end])
  * 
- *     cpdef view(self):             # <<<<<<<<<<<<<<
- *         cdef int end
- *         cdef int chunk_size
+ *     cpdef list views(self):             # <<<<<<<<<<<<<<
+ *         """ Return the buffered data as a list of views, suitable
+ *         for scatter-gather output with `socket.sendmsg`.
  */
 
   /* function exit code */
@@ -6856,34 +9900,42 @@ static PyObject *__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(struct _
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.views", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_data);
+  __Pyx_XDECREF(__pyx_v_views);
+  __Pyx_XDECREF(__pyx_v_segment_views);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_11view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_11view(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_15views(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_14views[] = " Return the buffered data as a list of views, suitable\n        for scatter-gather output with `socket.sendmsg`.\n        ";
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_15views(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("view (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_10view(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("views (wrapper)", 0);
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_14views(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_10view(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_14views(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  __Pyx_RefNannySetupContext("view", 0);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("views", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 314, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_views(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 491, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6892,7 +9944,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_10view(struc
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.view", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.views", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -6907,22 +9959,25 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_10view(struc
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_13__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_17__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_16__reduce_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_16__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -6931,11 +9986,11 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_c
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 2, __pyx_L1_error)
+  __PYX_ERR(1, 2, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
@@ -6946,7 +10001,7 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_c
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
@@ -6961,22 +10016,25 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_12__reduce_c
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static PyObject *__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_15__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static PyObject *__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_19__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_14__setstate_cython__(((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __pyx_r = __pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_18__setstate_cython__(((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_14__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_18__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -6984,11 +10042,11 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_14__setstate
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 4, __pyx_L1_error)
+  __PYX_ERR(1, 4, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -7000,16 +10058,16 @@ static PyObject *__pyx_pf_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_14__setstate
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("neobolt.bolt._io.ChunkedOutputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("neobolt.impl.python.bolt._io.ChunkedOutputBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_MessageFrame __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_MessageFrame __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
 
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_MessageFrame(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *p;
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_MessageFrame(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *p;
   PyObject *o;
   if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
     o = (*t->tp_alloc)(t, 0);
@@ -7017,71 +10075,78 @@ static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_MessageFrame(PyTypeObject *t,
     o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
   }
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4bolt_3_io_MessageFrame;
+  p = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
   p->_view = Py_None; Py_INCREF(Py_None);
-  p->_panes = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  if (unlikely(__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_1__cinit__(o, a, k) < 0)) goto bad;
+  if (unlikely(__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_1__cinit__(o, a, k) < 0)) goto bad;
   return o;
   bad:
   Py_DECREF(o); o = 0;
   return NULL;
 }
 
-static void __pyx_tp_dealloc_7neobolt_4bolt_3_io_MessageFrame(PyObject *o) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)o;
+static void __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_MessageFrame(PyObject *o) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
   PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
   Py_CLEAR(p->_view);
-  Py_CLEAR(p->_panes);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
-static int __pyx_tp_traverse_7neobolt_4bolt_3_io_MessageFrame(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_MessageFrame(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)o;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)o;
   if (p->_view) {
     e = (*v)(p->_view, a); if (e) return e;
   }
-  if (p->_panes) {
-    e = (*v)(p->_panes, a); if (e) return e;
-  }
   return 0;
 }
 
-static int __pyx_tp_clear_7neobolt_4bolt_3_io_MessageFrame(PyObject *o) {
+static int __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_MessageFrame(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)o;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)o;
   tmp = ((PyObject*)p->_view);
   p->_view = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->_panes);
-  p->_panes = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
   return 0;
 }
 
-static PyMethodDef __pyx_methods_7neobolt_4bolt_3_io_MessageFrame[] = {
-  {"panes", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_3panes, METH_NOARGS, 0},
-  {"read_int", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_5read_int, METH_NOARGS, 0},
-  {"read", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_7read, METH_O, 0},
-  {"close", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_9close, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_11__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_12MessageFrame_13__setstate_cython__, METH_O, 0},
+static PyMethodDef __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_MessageFrame[] = {
+  {"reset", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_5reset, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_4reset},
+  {"panes", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_7panes, METH_NOARGS, 0},
+  {"view", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_9view, METH_NOARGS, 0},
+  {"read_int", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_11read_int, METH_NOARGS, 0},
+  {"read", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_13read, METH_O, 0},
+  {"close", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_15close, METH_NOARGS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_17__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_19__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_MessageFrame = {
+static PyTypeObject __pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame = {
   PyVarObject_HEAD_INIT(0, 0)
-  "neobolt.bolt._io.MessageFrame", /*tp_name*/
-  sizeof(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame), /*tp_basicsize*/
+  "neobolt.impl.python.bolt._io.MessageFrame", /*tp_name*/
+  sizeof(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7neobolt_4bolt_3_io_MessageFrame, /*tp_dealloc*/
+  __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_MessageFrame, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -7101,14 +10166,14 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_MessageFrame = {
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_7neobolt_4bolt_3_io_MessageFrame, /*tp_traverse*/
-  __pyx_tp_clear_7neobolt_4bolt_3_io_MessageFrame, /*tp_clear*/
+  " Read cursor over a message held in one or more panes of a\n    buffer. Pane positions are stored in an array that is kept\n    between calls to :meth:`.reset`, so a single frame can be reused\n    for every message read from a :class:`.ChunkedInputBuffer`.\n    ", /*tp_doc*/
+  __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_MessageFrame, /*tp_traverse*/
+  __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_MessageFrame, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_7neobolt_4bolt_3_io_MessageFrame, /*tp_methods*/
+  __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_MessageFrame, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -7118,7 +10183,7 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_MessageFrame = {
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7neobolt_4bolt_3_io_MessageFrame, /*tp_new*/
+  __pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_MessageFrame, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -7131,11 +10196,20 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_MessageFrame = {
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedInputBuffer __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
 
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *p;
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *p;
   PyObject *o;
   if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
     o = (*t->tp_alloc)(t, 0);
@@ -7143,22 +10217,23 @@ static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyTypeObjec
     o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
   }
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedInputBuffer;
+  p = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
   p->_data = ((PyObject*)Py_None); Py_INCREF(Py_None);
   p->_view = Py_None; Py_INCREF(Py_None);
-  p->_frame = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
-  if (unlikely(__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(o, a, k) < 0)) goto bad;
+  p->_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
+  p->_message_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_1__cinit__(o, a, k) < 0)) goto bad;
   return o;
   bad:
   Py_DECREF(o); o = 0;
   return NULL;
 }
 
-static void __pyx_tp_dealloc_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyObject *o) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)o;
+static void __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer(PyObject *o) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -7166,54 +10241,68 @@ static void __pyx_tp_dealloc_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyObject *o)
   Py_CLEAR(p->_data);
   Py_CLEAR(p->_view);
   Py_CLEAR(p->_frame);
+  Py_CLEAR(p->_message_frame);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
-static int __pyx_tp_traverse_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)o;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)o;
   if (p->_view) {
     e = (*v)(p->_view, a); if (e) return e;
   }
   if (p->_frame) {
     e = (*v)(((PyObject *)p->_frame), a); if (e) return e;
   }
+  if (p->_message_frame) {
+    e = (*v)(((PyObject *)p->_message_frame), a); if (e) return e;
+  }
   return 0;
 }
 
-static int __pyx_tp_clear_7neobolt_4bolt_3_io_ChunkedInputBuffer(PyObject *o) {
+static int __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *)o;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *)o;
   tmp = ((PyObject*)p->_view);
   p->_view = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   tmp = ((PyObject*)p->_frame);
-  p->_frame = ((struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
+  p->_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_message_frame);
+  p->_message_frame = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyMethodDef __pyx_methods_7neobolt_4bolt_3_io_ChunkedInputBuffer[] = {
-  {"capacity", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_5capacity, METH_NOARGS, 0},
-  {"view", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_7view, METH_NOARGS, 0},
-  {"load", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_9load, METH_O, __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_8load},
-  {"receive", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_11receive, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_10receive},
-  {"receive_message", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_13receive_message, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_12receive_message},
-  {"frame", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_15frame, METH_NOARGS, 0},
-  {"frame_message", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_17frame_message, METH_NOARGS, __pyx_doc_7neobolt_4bolt_3_io_18ChunkedInputBuffer_16frame_message},
-  {"discard_message", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_19discard_message, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_21__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_23__setstate_cython__, METH_O, 0},
+static PyMethodDef __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer[] = {
+  {"capacity", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_5capacity, METH_NOARGS, 0},
+  {"view", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_7view, METH_NOARGS, 0},
+  {"load", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_9load, METH_O, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_8load},
+  {"receive", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_11receive, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_10receive},
+  {"reserve", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_13reserve, METH_O, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_12reserve},
+  {"advance", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_15advance, METH_O, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_14advance},
+  {"receive_message", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_17receive_message, METH_VARARGS|METH_KEYWORDS, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_16receive_message},
+  {"frame", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_19frame, METH_NOARGS, 0},
+  {"frame_message", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_21frame_message, METH_NOARGS, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_20frame_message},
+  {"discard_message", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_23discard_message, METH_NOARGS, 0},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_25__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_27__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer = {
+static PyTypeObject __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer = {
   PyVarObject_HEAD_INIT(0, 0)
-  "neobolt.bolt._io.ChunkedInputBuffer", /*tp_name*/
-  sizeof(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer), /*tp_basicsize*/
+  "neobolt.impl.python.bolt._io.ChunkedInputBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7neobolt_4bolt_3_io_ChunkedInputBuffer, /*tp_dealloc*/
+  __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -7222,7 +10311,7 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer = {
   #if PY_MAJOR_VERSION >= 3
   0, /*tp_as_async*/
   #endif
-  __pyx_pw_7neobolt_4bolt_3_io_18ChunkedInputBuffer_3__repr__, /*tp_repr*/
+  __pyx_pw_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_3__repr__, /*tp_repr*/
   0, /*tp_as_number*/
   0, /*tp_as_sequence*/
   0, /*tp_as_mapping*/
@@ -7234,13 +10323,13 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer = {
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_7neobolt_4bolt_3_io_ChunkedInputBuffer, /*tp_traverse*/
-  __pyx_tp_clear_7neobolt_4bolt_3_io_ChunkedInputBuffer, /*tp_clear*/
+  __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer, /*tp_traverse*/
+  __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_7neobolt_4bolt_3_io_ChunkedInputBuffer, /*tp_methods*/
+  __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -7250,7 +10339,7 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer = {
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7neobolt_4bolt_3_io_ChunkedInputBuffer, /*tp_new*/
+  __pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -7263,11 +10352,20 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer = {
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
-static struct __pyx_vtabstruct_7neobolt_4bolt_3_io_ChunkedOutputBuffer __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
+static struct __pyx_vtabstruct_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
 
-static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedOutputBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *p;
+static PyObject *__pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *p;
   PyObject *o;
   if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
     o = (*t->tp_alloc)(t, 0);
@@ -7275,45 +10373,73 @@ static PyObject *__pyx_tp_new_7neobolt_4bolt_3_io_ChunkedOutputBuffer(PyTypeObje
     o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
   }
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)o);
-  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
+  p = ((struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
   p->_data = ((PyObject*)Py_None); Py_INCREF(Py_None);
-  if (unlikely(__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(o, a, k) < 0)) goto bad;
+  p->_segments = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_1__cinit__(o, a, k) < 0)) goto bad;
   return o;
   bad:
   Py_DECREF(o); o = 0;
   return NULL;
 }
 
-static void __pyx_tp_dealloc_7neobolt_4bolt_3_io_ChunkedOutputBuffer(PyObject *o) {
-  struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *p = (struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *)o;
+static void __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer(PyObject *o) {
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !_PyGC_FINALIZED(o))) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
+  PyObject_GC_UnTrack(o);
   Py_CLEAR(p->_data);
+  Py_CLEAR(p->_segments);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
-static PyMethodDef __pyx_methods_7neobolt_4bolt_3_io_ChunkedOutputBuffer[] = {
-  {"max_chunk_size", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size, METH_NOARGS, 0},
-  {"clear", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_5clear, METH_NOARGS, 0},
-  {"write", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_7write, METH_O, 0},
-  {"chunk", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_9chunk, METH_NOARGS, 0},
-  {"view", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_11view, METH_NOARGS, 0},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_13__reduce_cython__, METH_NOARGS, 0},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_15__setstate_cython__, METH_O, 0},
+static int __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)o;
+  if (p->_segments) {
+    e = (*v)(p->_segments, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *p = (struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *)o;
+  tmp = ((PyObject*)p->_segments);
+  p->_segments = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer[] = {
+  {"max_chunk_size", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_3max_chunk_size, METH_NOARGS, 0},
+  {"clear", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_5clear, METH_NOARGS, 0},
+  {"write", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_7write, METH_O, 0},
+  {"write_segment", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_9write_segment, METH_O, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_8write_segment},
+  {"chunk", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_11chunk, METH_NOARGS, 0},
+  {"view", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_13view, METH_NOARGS, 0},
+  {"views", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_15views, METH_NOARGS, __pyx_doc_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_14views},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_17__reduce_cython__, METH_NOARGS, 0},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_19__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
-static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer = {
+static PyTypeObject __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer = {
   PyVarObject_HEAD_INIT(0, 0)
-  "neobolt.bolt._io.ChunkedOutputBuffer", /*tp_name*/
-  sizeof(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer), /*tp_basicsize*/
+  "neobolt.impl.python.bolt._io.ChunkedOutputBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_7neobolt_4bolt_3_io_ChunkedOutputBuffer, /*tp_dealloc*/
+  __pyx_tp_dealloc_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -7332,15 +10458,15 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
   0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  __pyx_tp_traverse_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer, /*tp_traverse*/
+  __pyx_tp_clear_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_7neobolt_4bolt_3_io_ChunkedOutputBuffer, /*tp_methods*/
+  __pyx_methods_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -7350,7 +10476,7 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer = {
   0, /*tp_dictoffset*/
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_7neobolt_4bolt_3_io_ChunkedOutputBuffer, /*tp_new*/
+  __pyx_tp_new_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -7363,6 +10489,15 @@ static PyTypeObject __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer = {
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -7400,24 +10535,41 @@ static struct PyModuleDef __pyx_moduledef = {
     NULL /* m_free */
 };
 #endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_u_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 1, 0, 0},
+  {&__pyx_n_s_ChunkedInputBuffer, __pyx_k_ChunkedInputBuffer, sizeof(__pyx_k_ChunkedInputBuffer), 0, 0, 1, 1},
+  {&__pyx_n_s_ChunkedOutputBuffer, __pyx_k_ChunkedOutputBuffer, sizeof(__pyx_k_ChunkedOutputBuffer), 0, 0, 1, 1},
+  {&__pyx_kp_s_H, __pyx_k_H, sizeof(__pyx_k_H), 0, 0, 1, 0},
   {&__pyx_n_s_KeyboardInterrupt, __pyx_k_KeyboardInterrupt, sizeof(__pyx_k_KeyboardInterrupt), 0, 0, 1, 1},
+  {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+  {&__pyx_n_s_MessageFrame, __pyx_k_MessageFrame, sizeof(__pyx_k_MessageFrame), 0, 0, 1, 1},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
-  {&__pyx_kp_b__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 0, 0},
-  {&__pyx_kp_b__8, __pyx_k__8, sizeof(__pyx_k__8), 0, 0, 0, 0},
+  {&__pyx_kp_b__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 0, 0, 0},
+  {&__pyx_kp_b__7, __pyx_k__7, sizeof(__pyx_k__7), 0, 0, 0, 0},
+  {&__pyx_n_s_advance, __pyx_k_advance, sizeof(__pyx_k_advance), 0, 0, 1, 1},
+  {&__pyx_n_s_base, __pyx_k_base, sizeof(__pyx_k_base), 0, 0, 1, 1},
   {&__pyx_n_s_capacity, __pyx_k_capacity, sizeof(__pyx_k_capacity), 0, 0, 1, 1},
   {&__pyx_n_s_chunk, __pyx_k_chunk, sizeof(__pyx_k_chunk), 0, 0, 1, 1},
   {&__pyx_n_s_clear, __pyx_k_clear, sizeof(__pyx_k_clear), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
   {&__pyx_n_s_discard_message, __pyx_k_discard_message, sizeof(__pyx_k_discard_message), 0, 0, 1, 1},
+  {&__pyx_n_s_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 0, 1, 1},
   {&__pyx_n_s_extend, __pyx_k_extend, sizeof(__pyx_k_extend), 0, 0, 1, 1},
   {&__pyx_n_s_frame, __pyx_k_frame, sizeof(__pyx_k_frame), 0, 0, 1, 1},
   {&__pyx_n_s_frame_message, __pyx_k_frame_message, sizeof(__pyx_k_frame_message), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_join, __pyx_k_join, sizeof(__pyx_k_join), 0, 0, 1, 1},
   {&__pyx_n_s_load, __pyx_k_load, sizeof(__pyx_k_load), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
   {&__pyx_n_s_max_chunk_size, __pyx_k_max_chunk_size, sizeof(__pyx_k_max_chunk_size), 0, 0, 1, 1},
@@ -7428,6 +10580,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
   {&__pyx_n_s_panes, __pyx_k_panes, sizeof(__pyx_k_panes), 0, 0, 1, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+  {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
   {&__pyx_n_s_read, __pyx_k_read, sizeof(__pyx_k_read), 0, 0, 1, 1},
   {&__pyx_n_s_read_int, __pyx_k_read_int, sizeof(__pyx_k_read_int), 0, 0, 1, 1},
   {&__pyx_n_s_receive, __pyx_k_receive, sizeof(__pyx_k_receive), 0, 0, 1, 1},
@@ -7437,28 +10590,33 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+  {&__pyx_n_s_reserve, __pyx_k_reserve, sizeof(__pyx_k_reserve), 0, 0, 1, 1},
+  {&__pyx_n_s_reset, __pyx_k_reset, sizeof(__pyx_k_reset), 0, 0, 1, 1},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
   {&__pyx_n_s_socket, __pyx_k_socket, sizeof(__pyx_k_socket), 0, 0, 1, 1},
+  {&__pyx_n_s_start, __pyx_k_start, sizeof(__pyx_k_start), 0, 0, 1, 1},
   {&__pyx_n_s_struct, __pyx_k_struct, sizeof(__pyx_k_struct), 0, 0, 1, 1},
   {&__pyx_n_s_struct_pack, __pyx_k_struct_pack, sizeof(__pyx_k_struct_pack), 0, 0, 1, 1},
-  {&__pyx_n_s_struct_unpack, __pyx_k_struct_unpack, sizeof(__pyx_k_struct_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_tobytes, __pyx_k_tobytes, sizeof(__pyx_k_tobytes), 0, 0, 1, 1},
-  {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
   {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
+  {&__pyx_n_s_views, __pyx_k_views, sizeof(__pyx_k_views), 0, 0, 1, 1},
   {&__pyx_n_s_write, __pyx_k_write, sizeof(__pyx_k_write), 0, 0, 1, 1},
+  {&__pyx_n_s_write_segment, __pyx_k_write_segment, sizeof(__pyx_k_write_segment), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
-  __pyx_builtin_KeyboardInterrupt = __Pyx_GetBuiltinName(__pyx_n_s_KeyboardInterrupt); if (!__pyx_builtin_KeyboardInterrupt) __PYX_ERR(1, 178, __pyx_L1_error)
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 75, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 111, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_KeyboardInterrupt = __Pyx_GetBuiltinName(__pyx_n_s_KeyboardInterrupt); if (!__pyx_builtin_KeyboardInterrupt) __PYX_ERR(0, 236, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_InitCachedConstants(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
@@ -7468,7 +10626,7 @@ static int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
@@ -7477,28 +10635,39 @@ static int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
+  /* "neobolt/impl/python/bolt/_io.pyx":179
+ *         self._limit = -1    # end position of current frame
+ *         self._frame = None  # frame object
+ *         self._message_frame = MessageFrame(None, ())             # <<<<<<<<<<<<<<
+ * 
+ *     def __repr__(self):
+ */
+  __pyx_tuple__3 = PyTuple_Pack(2, Py_None, __pyx_empty_tuple); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -7506,29 +10675,29 @@ static int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "neobolt/bolt/_io.pyx":25
+  /* "neobolt/impl/python/bolt/_io.pyx":27
  * 
  * 
  * cdef _empty_view = memoryview(b"")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_b__8); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 25, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_b__7); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7536,30 +10705,30 @@ static int __Pyx_InitCachedConstants(void) {
   return -1;
 }
 
-static int __Pyx_InitGlobals(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   __pyx_umethod_PyByteArray_Type_extend.type = (PyObject*)&PyByteArray_Type;
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_int_524288 = PyInt_FromLong(524288L); if (unlikely(!__pyx_int_524288)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_524288 = PyInt_FromLong(524288L); if (unlikely(!__pyx_int_524288)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_modinit_global_init_code(void); /*proto*/
-static int __Pyx_modinit_variable_export_code(void); /*proto*/
-static int __Pyx_modinit_function_export_code(void); /*proto*/
-static int __Pyx_modinit_type_init_code(void); /*proto*/
-static int __Pyx_modinit_type_import_code(void); /*proto*/
-static int __Pyx_modinit_variable_import_code(void); /*proto*/
-static int __Pyx_modinit_function_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
 
 static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
-  __pyx_v_7neobolt_4bolt_3_io__empty_view = Py_None; Py_INCREF(Py_None);
+  __pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view = Py_None; Py_INCREF(Py_None);
   __Pyx_RefNannyFinishContext();
   return 0;
 }
@@ -7582,57 +10751,75 @@ static int __Pyx_modinit_function_export_code(void) {
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  __pyx_vtabptr_7neobolt_4bolt_3_io_MessageFrame = &__pyx_vtable_7neobolt_4bolt_3_io_MessageFrame;
-  __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame._next_pane = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *))__pyx_f_7neobolt_4bolt_3_io_12MessageFrame__next_pane;
-  __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame.panes = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_panes;
-  __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame.read_int = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read_int;
-  __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame.read = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_read;
-  __pyx_vtable_7neobolt_4bolt_3_io_MessageFrame.close = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_12MessageFrame_close;
-  if (PyType_Ready(&__pyx_type_7neobolt_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(1, 28, __pyx_L1_error)
-  __pyx_type_7neobolt_4bolt_3_io_MessageFrame.tp_print = 0;
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4bolt_3_io_MessageFrame.tp_dictoffset && __pyx_type_7neobolt_4bolt_3_io_MessageFrame.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7neobolt_4bolt_3_io_MessageFrame.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_MessageFrame = &__pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame._reserve = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__reserve;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.reset = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, PyObject *, int, int, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_reset;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame._first_pane = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__first_pane;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame._next_pane = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame__next_pane;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.panes = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_panes;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.view = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_view;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.read_int = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read_int;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.read = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_read;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.close = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_MessageFrame *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_12MessageFrame_close;
+  if (PyType_Ready(&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.tp_dictoffset && __pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7neobolt_4bolt_3_io_MessageFrame.tp_dict, __pyx_vtabptr_7neobolt_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(1, 28, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "MessageFrame", (PyObject *)&__pyx_type_7neobolt_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(1, 28, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(1, 28, __pyx_L1_error)
-  __pyx_ptype_7neobolt_4bolt_3_io_MessageFrame = &__pyx_type_7neobolt_4bolt_3_io_MessageFrame;
-  __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedInputBuffer = &__pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.capacity = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_capacity;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.view = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_view;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.load = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_load;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.receive = (int (*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.receive_message = (int (*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_receive_message;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer._recycle = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer__recycle;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.frame = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.frame_message = (int (*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_frame_message;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedInputBuffer.discard_message = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_18ChunkedInputBuffer_discard_message;
-  if (PyType_Ready(&__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(1, 106, __pyx_L1_error)
-  __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer.tp_print = 0;
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer.tp_dictoffset && __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  if (__Pyx_SetVtable(__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame.tp_dict, __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_MessageFrame, (PyObject *)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame) < 0) __PYX_ERR(0, 30, __pyx_L1_error)
+  __pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_MessageFrame = &__pyx_type_7neobolt_4impl_6python_4bolt_3_io_MessageFrame;
+  __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer = &__pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.capacity = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_capacity;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.view = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_view;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.load = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_load;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.receive = (int (*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.reserve = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_reserve;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.advance = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_advance;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.receive_message = (int (*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, PyObject *, int, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_receive_message;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer._recycle = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__recycle;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.frame = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.frame_message = (int (*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_frame_message;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer._coalesce = (int (*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer__coalesce;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.discard_message = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_18ChunkedInputBuffer_discard_message;
+  if (PyType_Ready(&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.tp_dictoffset && __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer.tp_dict, __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(1, 106, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "ChunkedInputBuffer", (PyObject *)&__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(1, 106, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(1, 106, __pyx_L1_error)
-  __pyx_ptype_7neobolt_4bolt_3_io_ChunkedInputBuffer = &__pyx_type_7neobolt_4bolt_3_io_ChunkedInputBuffer;
-  __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedOutputBuffer = &__pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer.max_chunk_size = (int (*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer.clear = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_clear;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer.write = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_write;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer.chunk = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_chunk;
-  __pyx_vtable_7neobolt_4bolt_3_io_ChunkedOutputBuffer.view = (PyObject *(*)(struct __pyx_obj_7neobolt_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4bolt_3_io_19ChunkedOutputBuffer_view;
-  if (PyType_Ready(&__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(1, 258, __pyx_L1_error)
-  __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer.tp_print = 0;
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer.tp_dictoffset && __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  if (__Pyx_SetVtable(__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer.tp_dict, __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ChunkedInputBuffer, (PyObject *)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer) < 0) __PYX_ERR(0, 162, __pyx_L1_error)
+  __pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer = &__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedInputBuffer;
+  __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer = &__pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.max_chunk_size = (int (*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_max_chunk_size;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.clear = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_clear;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.write = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.write_segment = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_write_segment;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.chunk = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_chunk;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.view = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_view;
+  __pyx_vtable_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.views = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_4bolt_3_io_19ChunkedOutputBuffer_views;
+  if (PyType_Ready(&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.tp_dictoffset && __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer.tp_dict, __pyx_vtabptr_7neobolt_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(1, 258, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "ChunkedOutputBuffer", (PyObject *)&__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(1, 258, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(1, 258, __pyx_L1_error)
-  __pyx_ptype_7neobolt_4bolt_3_io_ChunkedOutputBuffer = &__pyx_type_7neobolt_4bolt_3_io_ChunkedOutputBuffer;
+  if (__Pyx_SetVtable(__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer.tp_dict, __pyx_vtabptr_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ChunkedOutputBuffer, (PyObject *)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
+  __pyx_ptype_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer = &__pyx_type_7neobolt_4impl_6python_4bolt_3_io_ChunkedOutputBuffer;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -7665,26 +10852,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
-#else
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyObject *
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
 #else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
+#define __Pyx_PyMODINIT_FUNC void
 #endif
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (!(defined(__cplusplus)) || (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ > 4)))
-    #define CYTHON_SMALL_CODE __attribute__((optimize("Os")))
 #else
-    #define CYTHON_SMALL_CODE
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
 #endif
 #endif
 
@@ -7699,11 +10879,36 @@ __Pyx_PyMODINIT_FUNC PyInit__io(void)
 {
   return PyModuleDef_Init(&__pyx_moduledef);
 }
-static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name) {
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
     PyObject *value = PyObject_GetAttrString(spec, from_name);
     int result = 0;
     if (likely(value)) {
-        result = PyDict_SetItemString(moddict, to_name, value);
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
         Py_DECREF(value);
     } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Clear();
@@ -7712,8 +10917,10 @@ static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const ch
     }
     return result;
 }
-static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
     PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
     if (__pyx_m)
         return __Pyx_NewRef(__pyx_m);
     modname = PyObject_GetAttrString(spec, "name");
@@ -7723,10 +10930,10 @@ static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *d
     if (unlikely(!module)) goto bad;
     moddict = PyModule_GetDict(module);
     if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
     return module;
 bad:
     Py_XDECREF(module);
@@ -7734,15 +10941,22 @@ bad:
 }
 
 
-static int __pyx_pymod_exec__io(PyObject *__pyx_pyinit_module)
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__io(PyObject *__pyx_pyinit_module)
 #endif
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_io' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
   #elif PY_MAJOR_VERSION >= 3
   if (__pyx_m) return __Pyx_NewRef(__pyx_m);
   #endif
@@ -7756,35 +10970,36 @@ if (!__Pyx_RefNanny) {
 }
 #endif
   __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__io(void)", 0);
-  if (__Pyx_check_binary_version() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
   #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -7795,102 +11010,94 @@ if (!__Pyx_RefNanny) {
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
-  if (unlikely(!__pyx_m)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(1, 1, __pyx_L1_error)
-  #if CYTHON_COMPILING_IN_PYPY
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  if (__pyx_module_is_main_neobolt__bolt___io) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_neobolt__impl__python__bolt___io) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(1, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "neobolt.bolt._io")) {
-      if (unlikely(PyDict_SetItemString(modules, "neobolt.bolt._io", __pyx_m) < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "neobolt.impl.python.bolt._io")) {
+      if (unlikely(PyDict_SetItemString(modules, "neobolt.impl.python.bolt._io", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #endif
   /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Global type/function init code ---*/
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
   /*--- Execution code ---*/
   #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "neobolt/bolt/_io.pyx":22
- * 
- * 
- * from struct import pack as struct_pack, unpack as struct_unpack             # <<<<<<<<<<<<<<
+  /* "neobolt/impl/python/bolt/_io.pyx":24
+ * from cpython.mem cimport PyMem_Free, PyMem_Realloc
+ * from libc.string cimport memmove
+ * from struct import pack as struct_pack             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_pack);
   __Pyx_GIVEREF(__pyx_n_s_pack);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_pack);
-  __Pyx_INCREF(__pyx_n_s_unpack);
-  __Pyx_GIVEREF(__pyx_n_s_unpack);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_unpack);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_struct, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 22, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_struct, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_struct_pack, __pyx_t_1) < 0) __PYX_ERR(1, 22, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_unpack); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_struct_unpack, __pyx_t_1) < 0) __PYX_ERR(1, 22, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_struct_pack, __pyx_t_1) < 0) __PYX_ERR(0, 24, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "neobolt/bolt/_io.pyx":25
+  /* "neobolt/impl/python/bolt/_io.pyx":27
  * 
  * 
  * cdef _empty_view = memoryview(b"")             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 25, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_memoryview); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 25, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_XGOTREF(__pyx_v_7neobolt_4bolt_3_io__empty_view);
-  __Pyx_DECREF_SET(__pyx_v_7neobolt_4bolt_3_io__empty_view, __pyx_t_1);
+  __Pyx_XGOTREF(__pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view);
+  __Pyx_DECREF_SET(__pyx_v_7neobolt_4impl_6python_4bolt_3_io__empty_view, __pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "neobolt/bolt/_io.pyx":1
+  /* "neobolt/impl/python/bolt/_io.pyx":1
  * #!/usr/bin/env python             # <<<<<<<<<<<<<<
  * # -*- encoding: utf-8 -*-
  * 
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /*--- Wrapped vars code ---*/
@@ -7901,11 +11108,11 @@ if (!__Pyx_RefNanny) {
   __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init neobolt.bolt._io", 0, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init neobolt.impl.python.bolt._io", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
+    Py_CLEAR(__pyx_m);
   } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init neobolt.bolt._io");
+    PyErr_SetString(PyExc_ImportError, "init neobolt.impl.python.bolt._io");
   }
   __pyx_L0:;
   __Pyx_RefNannyFinishContext();
@@ -7924,9 +11131,9 @@ if (!__Pyx_RefNanny) {
 static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
     PyObject *m = NULL, *p = NULL;
     void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
+    m = PyImport_ImportModule(modname);
     if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
     if (!p) goto end;
     r = PyLong_AsVoidPtr(p);
 end:
@@ -8026,7 +11233,7 @@ static int __Pyx_ParseOptionalKeywords(
         }
         name = first_kw_arg;
         #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+        if (likely(PyString_Check(key))) {
             while (*name) {
                 if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
                         && _PyString_Eq(**name, key)) {
@@ -8053,7 +11260,7 @@ static int __Pyx_ParseOptionalKeywords(
             while (*name) {
                 int cmp = (**name == key) ? 0 :
                 #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                 #endif
                     PyUnicode_Compare(**name, key);
                 if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -8069,7 +11276,7 @@ static int __Pyx_ParseOptionalKeywords(
                 while (argname != first_kw_arg) {
                     int cmp = (**argname == key) ? 0 :
                     #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                     #endif
                         PyUnicode_Compare(**argname, key);
                     if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -8106,53 +11313,92 @@ bad:
     return -1;
 }
 
-/* ArgTypeTest */
-static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
-{
-    if (unlikely(!type)) {
-        PyErr_SetString(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    else if (exact) {
-        #if PY_MAJOR_VERSION == 2
-        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
-        #endif
+/* RaiseTooManyValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+    PyErr_Format(PyExc_ValueError,
+                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
+}
+
+/* RaiseNeedMoreValuesToUnpack */
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+    PyErr_Format(PyExc_ValueError,
+                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
+                 index, (index == 1) ? "" : "s");
+}
+
+/* IterFinish */
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
+#if CYTHON_FAST_THREAD_STATE
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject* exc_type = tstate->curexc_type;
+    if (unlikely(exc_type)) {
+        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
+            PyObject *exc_value, *exc_tb;
+            exc_value = tstate->curexc_value;
+            exc_tb = tstate->curexc_traceback;
+            tstate->curexc_type = 0;
+            tstate->curexc_value = 0;
+            tstate->curexc_traceback = 0;
+            Py_DECREF(exc_type);
+            Py_XDECREF(exc_value);
+            Py_XDECREF(exc_tb);
+            return 0;
+        } else {
+            return -1;
+        }
     }
-    else {
-        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    return 0;
+#else
+    if (unlikely(PyErr_Occurred())) {
+        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
+            PyErr_Clear();
+            return 0;
+        } else {
+            return -1;
+        }
     }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
     return 0;
+#endif
 }
 
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
+/* UnpackItemEndCheck */
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+    if (unlikely(retval)) {
+        Py_DECREF(retval);
+        __Pyx_RaiseTooManyValuesError(expected);
+        return -1;
+    }
+    return __Pyx_IterFinish();
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
     }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
 }
 #endif
 
 /* PyFunctionFastCall */
 #if CYTHON_FAST_PYCALL
-#include "frameobject.h"
 static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
                                                PyObject *globals) {
     PyFrameObject *f;
@@ -8170,7 +11416,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     if (f == NULL) {
         return NULL;
     }
-    fastlocals = f->f_localsplus;
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
     for (i = 0; i < na; i++) {
         Py_INCREF(*args);
         fastlocals[i] = *args++;
@@ -8182,7 +11428,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     return result;
 }
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
     PyObject *globals = PyFunction_GET_GLOBALS(func);
     PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
@@ -8253,12 +11499,12 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
     }
 #if PY_MAJOR_VERSION >= 3
     result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, kwdefs, closure);
 #else
     result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, closure);
 #endif
@@ -8270,11 +11516,34 @@ done:
 #endif
 #endif
 
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
 /* PyObjectCall */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -8306,7 +11575,29 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
             PyExc_SystemError,
             "NULL result without error in PyObject_Call");
     }
-    return result;
+    return result;
+}
+#endif
+
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
 }
 #endif
 
@@ -8332,7 +11623,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
         if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
             return __Pyx_PyObject_CallMethO(func, arg);
 #if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
             return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
         }
@@ -8350,203 +11641,8 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
-/* PyObjectCallNoArg */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, NULL, 0);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_TypeCheck(func, __pyx_CyFunctionType))) {
-#else
-    if (likely(PyCFunction_Check(func))) {
-#endif
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
-/* GetItemInt */
-  static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
-    PyObject *r;
-    if (!j) return NULL;
-    r = PyObject_GetItem(o, j);
-    Py_DECREF(j);
-    return r;
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyList_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyList_GET_SIZE(o)))) {
-        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
-                                                              CYTHON_NCP_UNUSED int wraparound,
-                                                              CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    Py_ssize_t wrapped_i = i;
-    if (wraparound & unlikely(i < 0)) {
-        wrapped_i += PyTuple_GET_SIZE(o);
-    }
-    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyTuple_GET_SIZE(o)))) {
-        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
-        Py_INCREF(r);
-        return r;
-    }
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-#else
-    return PySequence_GetItem(o, i);
-#endif
-}
-static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
-                                                     CYTHON_NCP_UNUSED int wraparound,
-                                                     CYTHON_NCP_UNUSED int boundscheck) {
-#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
-    if (is_list || PyList_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
-            PyObject *r = PyList_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    }
-    else if (PyTuple_CheckExact(o)) {
-        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
-            PyObject *r = PyTuple_GET_ITEM(o, n);
-            Py_INCREF(r);
-            return r;
-        }
-    } else {
-        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
-        if (likely(m && m->sq_item)) {
-            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
-                Py_ssize_t l = m->sq_length(o);
-                if (likely(l >= 0)) {
-                    i += l;
-                } else {
-                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
-                        return NULL;
-                    PyErr_Clear();
-                }
-            }
-            return m->sq_item(o, i);
-        }
-    }
-#else
-    if (is_list || PySequence_Check(o)) {
-        return PySequence_GetItem(o, i);
-    }
-#endif
-    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
-}
-
-/* RaiseTooManyValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
-    PyErr_Format(PyExc_ValueError,
-                 "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
-}
-
-/* RaiseNeedMoreValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
-    PyErr_Format(PyExc_ValueError,
-                 "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
-                 index, (index == 1) ? "" : "s");
-}
-
-/* IterFinish */
-  static CYTHON_INLINE int __Pyx_IterFinish(void) {
-#if CYTHON_FAST_THREAD_STATE
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject* exc_type = tstate->curexc_type;
-    if (unlikely(exc_type)) {
-        if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) {
-            PyObject *exc_value, *exc_tb;
-            exc_value = tstate->curexc_value;
-            exc_tb = tstate->curexc_traceback;
-            tstate->curexc_type = 0;
-            tstate->curexc_value = 0;
-            tstate->curexc_traceback = 0;
-            Py_DECREF(exc_type);
-            Py_XDECREF(exc_value);
-            Py_XDECREF(exc_tb);
-            return 0;
-        } else {
-            return -1;
-        }
-    }
-    return 0;
-#else
-    if (unlikely(PyErr_Occurred())) {
-        if (likely(PyErr_ExceptionMatches(PyExc_StopIteration))) {
-            PyErr_Clear();
-            return 0;
-        } else {
-            return -1;
-        }
-    }
-    return 0;
-#endif
-}
-
-/* UnpackItemEndCheck */
-  static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
-    if (unlikely(retval)) {
-        Py_DECREF(retval);
-        __Pyx_RaiseTooManyValuesError(expected);
-        return -1;
-    } else {
-        return __Pyx_IterFinish();
-    }
-    return 0;
-}
-
-/* GetModuleGlobalName */
-  static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    if (likely(result)) {
-        Py_INCREF(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        result = NULL;
-    } else {
-#else
-    result = PyDict_GetItem(__pyx_d, name);
-    if (likely(result)) {
-        Py_INCREF(result);
-    } else {
-#endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
-#endif
-        result = __Pyx_GetBuiltinName(name);
-    }
-    return result;
-}
-
 /* SliceObject */
-      static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
         Py_ssize_t cstart, Py_ssize_t cstop,
         PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
         int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
@@ -8621,29 +11717,145 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
                 } else
                     py_stop = Py_None;
             }
-            py_slice = PySlice_New(py_start, py_stop, Py_None);
-            Py_XDECREF(owned_start);
-            Py_XDECREF(owned_stop);
-            if (unlikely(!py_slice)) goto bad;
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
+bad:
+    return NULL;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (!j) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PySequenceMethods *m = Py_TYPE(o)->tp_as_sequence;
+        if (likely(m && m->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(m->sq_length)) {
+                Py_ssize_t l = m->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return m->sq_item(o, i);
         }
-#if CYTHON_USE_TYPE_SLOTS
-        result = mp->mp_subscript(obj, py_slice);
+    }
 #else
-        result = PyObject_GetItem(obj, py_slice);
+    if (is_list || PySequence_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
 #endif
-        if (!_py_slice) {
-            Py_DECREF(py_slice);
-        }
-        return result;
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
     }
-    PyErr_Format(PyExc_TypeError,
-        "'%.200s' object is unsliceable", Py_TYPE(obj)->tp_name);
-bad:
-    return NULL;
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
 }
 
 /* UnpackUnboundCMethod */
-      static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
     PyObject *method;
     method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
     if (unlikely(!method))
@@ -8656,27 +11868,27 @@ bad:
     {
         PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
         target->func = descr->d_method->ml_meth;
-        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST);
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
     }
 #endif
     return 0;
 }
 
 /* CallUnboundCMethod1 */
-      #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg) {
     if (likely(cfunc->func)) {
         int flag = cfunc->flag;
         if (flag == METH_O) {
             return (*(cfunc->func))(self, arg);
         } else if (PY_VERSION_HEX >= 0x030600B1 && flag == METH_FASTCALL) {
-            if (PY_VERSION_HEX >= 0x030700A0) {
-                return (*(__Pyx_PyCFunctionFast)cfunc->func)(self, &arg, 1);
-            } else {
-                return (*(__Pyx_PyCFunctionFastWithKeywords)cfunc->func)(self, &arg, 1, NULL);
-            }
+            #if PY_VERSION_HEX >= 0x030700A0
+                return (*(__Pyx_PyCFunctionFast)(void*)(PyCFunction)cfunc->func)(self, &arg, 1);
+            #else
+                return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
+            #endif
         } else if (PY_VERSION_HEX >= 0x030700A0 && flag == (METH_FASTCALL | METH_KEYWORDS)) {
-            return (*(__Pyx_PyCFunctionFastWithKeywords)cfunc->func)(self, &arg, 1, NULL);
+            return (*(__Pyx_PyCFunctionFastWithKeywords)(void*)(PyCFunction)cfunc->func)(self, &arg, 1, NULL);
         }
     }
     return __Pyx__CallUnboundCMethod1(cfunc, self, arg);
@@ -8692,7 +11904,7 @@ static PyObject* __Pyx__CallUnboundCMethod1(__Pyx_CachedCFunction* cfunc, PyObje
         Py_INCREF(arg);
         PyTuple_SET_ITEM(args, 0, arg);
         if (cfunc->flag & METH_KEYWORDS)
-            result = (*(PyCFunctionWithKeywords)cfunc->func)(self, args, NULL);
+            result = (*(PyCFunctionWithKeywords)(void*)(PyCFunction)cfunc->func)(self, args, NULL);
         else
             result = (*cfunc->func)(self, args);
     } else {
@@ -8714,8 +11926,43 @@ bad:
     return result;
 }
 
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
 /* PyErrFetchRestore */
-      #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
     tmp_type = tstate->curexc_type;
@@ -8739,7 +11986,7 @@ static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject
 #endif
 
 /* RaiseException */
-      #if PY_MAJOR_VERSION < 3
+#if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -8875,13 +12122,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -8889,6 +12130,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -8898,7 +12145,7 @@ bad:
 #endif
 
 /* SliceObject */
-      static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
         Py_ssize_t cstart, Py_ssize_t cstop,
         PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
         int has_cstart, int has_cstop, CYTHON_UNUSED int wraparound) {
@@ -8995,13 +12242,29 @@ bad:
     return -1;
 }
 
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
 /* SaveResetException */
-      #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    #if PY_VERSION_HEX >= 0x030700A3
-    *type = tstate->exc_state.exc_type;
-    *value = tstate->exc_state.exc_value;
-    *tb = tstate->exc_state.exc_traceback;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
     #else
     *type = tstate->exc_type;
     *value = tstate->exc_value;
@@ -9013,13 +12276,14 @@ static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject *
 }
 static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
-    #if PY_VERSION_HEX >= 0x030700A3
-    tmp_type = tstate->exc_state.exc_type;
-    tmp_value = tstate->exc_state.exc_value;
-    tmp_tb = tstate->exc_state.exc_traceback;
-    tstate->exc_state.exc_type = type;
-    tstate->exc_state.exc_value = value;
-    tstate->exc_state.exc_traceback = tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
     #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
@@ -9035,7 +12299,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyErrExceptionMatches */
-      #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
     Py_ssize_t i, n;
     n = PyTuple_GET_SIZE(tuple);
@@ -9060,11 +12324,12 @@ static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tsta
 #endif
 
 /* GetException */
-      #if CYTHON_FAST_THREAD_STATE
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
 #else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
 #endif
+{
     PyObject *local_type, *local_value, *local_tb;
 #if CYTHON_FAST_THREAD_STATE
     PyObject *tmp_type, *tmp_value, *tmp_tb;
@@ -9097,13 +12362,16 @@ static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
     *value = local_value;
     *tb = local_tb;
 #if CYTHON_FAST_THREAD_STATE
-    #if PY_VERSION_HEX >= 0x030700A3
-    tmp_type = tstate->exc_state.exc_type;
-    tmp_value = tstate->exc_state.exc_value;
-    tmp_tb = tstate->exc_state.exc_traceback;
-    tstate->exc_state.exc_type = local_type;
-    tstate->exc_state.exc_value = local_value;
-    tstate->exc_state.exc_traceback = local_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
     #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
@@ -9130,7 +12398,7 @@ bad:
 }
 
 /* WriteUnraisableException */
-        static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
+static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
                                   CYTHON_UNUSED int lineno, CYTHON_UNUSED const char *filename,
                                   int full_traceback, CYTHON_UNUSED int nogil) {
     PyObject *old_exc, *old_val, *old_tb;
@@ -9140,9 +12408,7 @@ bad:
     PyGILState_STATE state;
     if (nogil)
         state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
-#endif
+    else state = (PyGILState_STATE)0;
 #endif
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
@@ -9171,8 +12437,36 @@ bad:
 #endif
 }
 
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected %.200s, got %.200s)",
+        name, type->tp_name, Py_TYPE(obj)->tp_name);
+    return 0;
+}
+
+/* StringJoin */
+#if !CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyBytes_Join(PyObject* sep, PyObject* values) {
+    return PyObject_CallMethodObjArgs(sep, __pyx_n_s_join, values, NULL);
+}
+#endif
+
 /* PyObject_GenericGetAttrNoDict */
-        #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
     PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
@@ -9212,7 +12506,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 #endif
 
 /* PyObject_GenericGetAttr */
-        #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
     if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
         return PyObject_GenericGetAttr(obj, attr_name);
@@ -9222,7 +12516,7 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #endif
 
 /* SetVTable */
-        static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
 #if PY_VERSION_HEX >= 0x02070000
     PyObject *ob = PyCapsule_New(vtable, 0, 0);
 #else
@@ -9239,8 +12533,30 @@ bad:
     return -1;
 }
 
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
 /* SetupReduce */
-        static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
   PyObject *name_attr;
   name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
@@ -9259,53 +12575,81 @@ bad:
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
     if (reduce_ex == object_reduce_ex) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
         if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
-            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
             setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
             if (!setstate) PyErr_Clear();
             if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
             }
             PyType_Modified((PyTypeObject*)type_obj);
         }
     }
-    goto GOOD;
-BAD:
+    goto __PYX_GOOD;
+__PYX_BAD:
     if (!PyErr_Occurred())
         PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
     ret = -1;
-GOOD:
+__PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -9316,7 +12660,7 @@ GOOD:
 }
 
 /* Import */
-        static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -9345,7 +12689,7 @@ GOOD:
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
                 module = PyImport_ImportModuleLevelObject(
                     name, global_dict, empty_dict, list, 1);
                 if (!module) {
@@ -9363,7 +12707,7 @@ GOOD:
             if (!py_level)
                 goto bad;
             module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
             Py_DECREF(py_level);
             #else
             module = PyImport_ImportModuleLevelObject(
@@ -9381,7 +12725,7 @@ bad:
 }
 
 /* ImportFrom */
-        static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -9395,7 +12739,7 @@ bad:
 }
 
 /* CLineInTraceback */
-        #ifndef CYTHON_CLINE_IN_TRACEBACK
+#ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -9409,7 +12753,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #if CYTHON_COMPILING_IN_CPYTHON
     cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
     if (likely(cython_runtime_dict)) {
-      use_cline = __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback);
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
     } else
 #endif
     {
@@ -9424,9 +12770,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
-    else if (PyObject_Not(use_cline) != 0) {
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
     }
     __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
@@ -9435,7 +12781,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-        static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -9498,7 +12844,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -9515,36 +12861,43 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-        #include "compile.h"
+#include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -9563,11 +12916,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -9575,14 +12933,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -9600,7 +12968,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-        #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -9621,40 +12989,16 @@ bad:
         return (target_type) value;\
     }
 
-/* CIntToPy */
-        static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
-}
-
 /* CIntFromPy */
-        static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -9705,7 +13049,7 @@ bad:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -9842,8 +13186,53 @@ raise_neg_overflow:
 }
 
 /* CIntToPy */
-        static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -9873,8 +13262,15 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-        static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -9925,7 +13321,7 @@ raise_neg_overflow:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -10062,7 +13458,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-        #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -10162,12 +13558,34 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-        static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -10178,7 +13596,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* InitStrings */
-        static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -10287,6 +13705,13 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
    else return PyObject_IsTrue(x);
 }
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
 static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
 #if PY_MAJOR_VERSION >= 3
     if (PyLong_Check(result)) {
@@ -10364,7 +13789,7 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
     if (sizeof(Py_ssize_t) >= sizeof(long))
         return PyInt_AS_LONG(b);
     else
-        return PyInt_AsSsize_t(x);
+        return PyInt_AsSsize_t(b);
   }
 #endif
   if (likely(PyLong_CheckExact(b))) {
@@ -10418,6 +13843,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -19,53 +19,108 @@
 # limitations under the License.
 
 
-from struct import pack as struct_pack, unpack as struct_unpack
+from cpython.mem cimport PyMem_Free, PyMem_Realloc
+from libc.string cimport memmove
+from struct import pack as struct_pack
 
 
 cdef _empty_view = memoryview(b"")
 
 
 cdef class MessageFrame(object):
+    """ Read cursor over a message held in one or more panes of a
+    buffer. Pane positions are stored in an array that is kept
+    between calls to :meth:`.reset`, so a single frame can be reused
+    for every message read from a :class:`.ChunkedInputBuffer`.
+    """
 
     cdef _view
-    cdef list _panes
+    cdef int _base
+    cdef int* _bounds
+    cdef int _bounds_capacity
+    cdef int _pane_count
     cdef int _current_pane
     cdef int _current_offset
+    cdef int _pane_start
+    cdef int _pane_end
+
+    def __cinit__(self, view, panes):
+        cdef int i
+        cdef int p
+        cdef int q
 
-    def __cinit__(self, view, list panes):
         self._view = view
-        self._panes = panes
-        if panes:
-            self._current_pane = 0
-            self._current_offset = 0
+        self._base = 0
+        self._bounds = NULL
+        self._bounds_capacity = 0
+        self._pane_count = 0
+        self._reserve(max(len(panes), 1))
+        i = 0
+        for p, q in panes:
+            self._bounds[i] = p
+            self._bounds[i + 1] = q
+            i += 2
+        self._pane_count = len(panes)
+        self._first_pane()
+
+    def __dealloc__(self):
+        PyMem_Free(self._bounds)
+
+    cdef _reserve(self, int pane_count):
+        cdef int* bounds
+
+        if 2 * pane_count > self._bounds_capacity:
+            bounds = <int*>PyMem_Realloc(self._bounds, 2 * pane_count * sizeof(int))
+            if bounds == NULL:
+                raise MemoryError()
+            self._bounds = bounds
+            self._bounds_capacity = 2 * pane_count
+
+    cpdef reset(self, view, int base, int start, int end):
+        """ Reframe around a message held in a single pane, spanning
+        `start` to `end` of `view` and reported relative to `base`.
+        """
+        self._view = view
+        self._base = base
+        if end > start:
+            self._bounds[0] = start
+            self._bounds[1] = end
+            self._pane_count = 1
         else:
-            self._current_pane = -1
-            self._current_offset = -1
+            self._pane_count = 0
+        self._first_pane()
+
+    cdef _first_pane(self):
+        self._current_pane = -1
+        self._next_pane()
 
     cdef _next_pane(self):
         self._current_pane += 1
-        if self._current_pane < len(self._panes):
+        if self._current_pane < self._pane_count:
+            self._pane_start = self._bounds[2 * self._current_pane]
+            self._pane_end = self._bounds[2 * self._current_pane + 1]
             self._current_offset = 0
         else:
             self._current_pane = -1
             self._current_offset = -1
 
     cpdef panes(self):
-        return self._panes
+        cdef int i
+
+        return [(self._bounds[i] - self._base, self._bounds[i + 1] - self._base)
+                for i in range(0, 2 * self._pane_count, 2)]
+
+    cpdef view(self):
+        return self._view[self._base:]
 
     cpdef read_int(self):
-        cdef int p
-        cdef int q
-        cdef int size
         cdef int value
 
         if self._current_pane == -1:
             return -1
-        p, q = self._panes[self._current_pane]
-        size = q - p
-        value = self._view[p + self._current_offset]
+        value = self._view[self._pane_start + self._current_offset]
         self._current_offset += 1
-        if self._current_offset == size:
+        if self._current_offset == self._pane_end - self._pane_start:
             self._next_pane()
         return value
 
@@ -80,7 +135,8 @@ cdef class MessageFrame(object):
 
         if n == 0 or self._current_pane == -1:
             return _empty_view
-        p, q = self._panes[self._current_pane]
+        p = self._pane_start
+        q = self._pane_end
         size = q - p
         remaining = size - self._current_offset
         if n <= remaining:
@@ -90,7 +146,7 @@ cdef class MessageFrame(object):
                 self._current_offset += n
             else:
                 self._next_pane()
-            return memoryview(self._view[start:end])
+            return self._view[start:end]
         start = p + self._current_offset
         end = q
         value = bytearray(self._view[start:end])
@@ -111,6 +167,7 @@ cdef class ChunkedInputBuffer(object):
     cdef int _origin
     cdef int _limit
     cdef MessageFrame _frame
+    cdef MessageFrame _message_frame
 
     def __cinit__(self, capacity=524288):
         self._data = bytearray(capacity)
@@ -119,6 +176,7 @@ cdef class ChunkedInputBuffer(object):
         self._origin = 0    # start position of current frame
         self._limit = -1    # end position of current frame
         self._frame = None  # frame object
+        self._message_frame = MessageFrame(None, ())
 
     def __repr__(self):
         return repr(self.view().tobytes())
@@ -148,7 +206,7 @@ cdef class ChunkedInputBuffer(object):
             self._view[self._extent:new_extent] = b
         self._extent = new_extent
 
-    cpdef int receive(self, socket, int n):
+    cpdef int receive(self, socket, int n) except? -2:
         """
 
         Note: may modify buffer size, should error if frame exists
@@ -178,7 +236,33 @@ cdef class ChunkedInputBuffer(object):
         except KeyboardInterrupt:
             return -1
 
-    cpdef int receive_message(self, socket, int n):
+    cpdef reserve(self, int n):
+        """ Return a writable view of at least `n` bytes of free space
+        following the loaded data, into which data can be received
+        directly. Any data written is loaded by a subsequent call to
+        :meth:`.advance`. The current frame, if any, is discarded.
+
+        Note: may modify buffer size
+        """
+        cdef int shortfall
+
+        self.discard_message()
+        if self._extent + n > len(self._data):
+            self._recycle()
+            shortfall = self._extent + n - len(self._data)
+            if shortfall > 0:
+                self._view = None
+                self._data.extend(bytes(max(shortfall, len(self._data))))
+                self._view = memoryview(self._data)
+        return self._view[self._extent:]
+
+    cpdef advance(self, int n):
+        """ Load `n` bytes written into the view returned by
+        :meth:`.reserve`.
+        """
+        self._extent += n
+
+    cpdef int receive_message(self, socket, int n) except? -2:
         """
 
         :param socket:
@@ -219,34 +303,65 @@ cdef class ChunkedInputBuffer(object):
     cpdef bint frame_message(self):
         """ Construct a frame around the first complete message in the buffer.
         """
-        cdef list panes
+        cdef unsigned char* data
         cdef int origin
         cdef int p
         cdef int extent
-        cdef int available
         cdef int chunk_size
-        cdef int q
+        cdef int chunk_count
+        cdef int start
+        cdef int end
 
         if self._frame is not None:
             self.discard_message()
-        panes = []
+        data = self._data
         p = origin = self._origin
         extent = self._extent
-        while p < extent:
-            available = extent - p
-            if available < 2:
-                break
-            chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
+        chunk_count = 0
+        while p + 2 <= extent:
+            chunk_size = data[p] << 8 | data[p + 1]
             p += 2
             if chunk_size == 0:
                 self._limit = p
-                self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
+                start = origin + 2
+                if chunk_count == 0:
+                    end = start
+                elif chunk_count == 1:
+                    end = p - 2
+                else:
+                    end = self._coalesce(origin)
+                self._frame = self._message_frame
+                self._frame.reset(self._view, origin, start, end)
                 return True
-            q = p + chunk_size
-            panes.append((p - origin, q - origin))
-            p = q
+            chunk_count += 1
+            p += chunk_size
         return False
 
+    cdef int _coalesce(self, int origin):
+        """ Move the data from all chunks of the complete message at
+        `origin` into one contiguous region, overwriting the chunk
+        headers in between, and return the end position of that region.
+
+        Note: modifies buffer content before the frame limit
+        """
+        cdef unsigned char* data
+        cdef int chunk_size
+        cdef int end
+        cdef int p
+
+        data = self._data
+        chunk_size = data[origin] << 8 | data[origin + 1]
+        end = origin + 2 + chunk_size
+        p = end
+        while True:
+            chunk_size = data[p] << 8 | data[p + 1]
+            if chunk_size == 0:
+                return end
+            p += 2
+            memmove(data + end, data + p, chunk_size)
+            end += chunk_size
+            p += chunk_size
+
     cpdef discard_message(self):
         if self._frame is not None:
             self._frame.close()
@@ -262,6 +377,8 @@ cdef class ChunkedOutputBuffer(object):
     cdef int _header
     cdef int _start
     cdef int _end
+    cdef list _segments
+    cdef bint _after_segment
 
     def __cinit__(self, int capacity=1048576, int max_chunk_size=16384):
         self._max_chunk_size = max_chunk_size
@@ -269,6 +386,8 @@ cdef class ChunkedOutputBuffer(object):
         self._start = 2
         self._end = 2
         self._data = bytearray(capacity)
+        self._segments = []         # (offset, views) for externally held data
+        self._after_segment = False
 
     cpdef int max_chunk_size(self):
         return self._max_chunk_size
@@ -278,6 +397,8 @@ cdef class ChunkedOutputBuffer(object):
         self._start = 2
         self._end = 2
         self._data[0:2] = b"\x00\x00"
+        self._segments = []
+        self._after_segment = False
 
     cpdef write(self, bytes b):
         cdef bytearray data
@@ -289,6 +410,8 @@ cdef class ChunkedOutputBuffer(object):
 
         data = self._data
         new_data_size = len(b)
+        if new_data_size:
+            self._after_segment = False
         chunk_size = self._end - self._start
         max_chunk_size = self._max_chunk_size
         chunk_remaining = max_chunk_size - chunk_size
@@ -305,7 +428,48 @@ cdef class ChunkedOutputBuffer(object):
         self._end = new_end
         data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
 
+    cpdef write_segment(self, b):
+        """ Append data by reference instead of copying it into the buffer.
+
+        The data is framed into chunks of its own, for which only the
+        chunk headers are held locally, and must not be modified until
+        the buffer has been cleared.
+        """
+        cdef int size
+        cdef int offset
+        cdef int max_chunk_size
+        cdef int p
+        cdef int q
+        cdef list views
+
+        view = memoryview(b)
+        size = len(view)
+        if size == 0:
+            return
+        if self._end == self._start:
+            # Drop the empty chunk that is currently open
+            offset = self._header
+        else:
+            offset = self._end
+        max_chunk_size = self._max_chunk_size
+        views = []
+        for p in range(0, size, max_chunk_size):
+            q = min(p + max_chunk_size, size)
+            views.append(struct_pack(">H", q - p))
+            views.append(view[p:q])
+        self._segments.append((offset, views))
+        self._header = offset
+        self._start = offset + 2
+        self._end = self._start
+        self._data[self._header:self._start] = b"\x00\x00"
+        self._after_segment = True
+
     cpdef chunk(self):
+        if self._after_segment:
+            # The last segment chunk has already been closed
+            # and a new local chunk opened in its place
+            self._after_segment = False
+            return
         self._header = self._end
         self._start = self._header + 2
         self._end = self._start
@@ -315,9 +479,37 @@ cdef class ChunkedOutputBuffer(object):
         cdef int end
         cdef int chunk_size
 
+        if self._segments:
+            return memoryview(b"".join(self.views()))
         end = self._end
         chunk_size = end - self._start
         if chunk_size == 0:
             return memoryview(self._data[:self._header])
         else:
-            return memoryview(self._data[:end])
\ No newline at end of file
+            return memoryview(self._data[:end])
+
+    cpdef list views(self):
+        """ Return the buffered data as a list of views, suitable
+        for scatter-gather output with `socket.sendmsg`.
+        """
+        cdef bytearray data
+        cdef list views
+        cdef int p
+        cdef int offset
+        cdef int end
+
+        data = self._data
+        views = []
+        p = 0
+        for offset, segment_views in self._segments:
+            if offset > p:
+                views.append(memoryview(data[p:offset]))
+            views.extend(segment_views)
+            p = offset
+        if self._end == self._start:
+            end = self._header
+        else:
+            end = self._end
+        if end > p:
+            views.append(memoryview(data[p:end]))
+        return views
@@ -19,46 +19,84 @@
 # limitations under the License.
 
 
-from struct import pack as struct_pack, unpack as struct_unpack
+from struct import pack as struct_pack
 
 
 _empty_view = memoryview(b"")
 
 
 class MessageFrame(object):
+    """ Read cursor over a message held in one or more panes of a
+    buffer. Pane positions are stored in a flat list that is kept
+    between calls to :meth:`.reset`, so a single frame can be reused
+    for every message read from a :class:`.ChunkedInputBuffer`.
+    """
 
     _current_pane = -1
     _current_offset = -1
+    _pane_start = 0
+    _pane_end = 0
 
     def __init__(self, view, panes):
         self._view = view
-        self._panes = panes
-        if panes:
-            self._current_pane = 0
-            self._current_offset = 0
+        self._base = 0          # position from which pane positions are reported
+        self._bounds = []       # start and end positions of each pane
+        self._pane_count = 0
+        for p, q in panes:
+            self._bounds.extend((p, q))
+        self._pane_count = len(panes)
+        self._first_pane()
+
+    def reset(self, view, base, start, end):
+        """ Reframe around a message held in a single pane, spanning
+        `start` to `end` of `view` and reported relative to `base`.
+        """
+        self._view = view
+        self._base = base
+        if end > start:
+            bounds = self._bounds
+            if bounds:
+                bounds[0] = start
+                bounds[1] = end
+            else:
+                bounds.extend((start, end))
+            self._pane_count = 1
+        else:
+            self._pane_count = 0
+        self._first_pane()
 
     def close(self):
          self._view = None
 
+    def _first_pane(self):
+        self._current_pane = -1
+        self._next_pane()
+
     def _next_pane(self):
         self._current_pane += 1
-        if self._current_pane < len(self._panes):
+        if self._current_pane < self._pane_count:
+            i = 2 * self._current_pane
+            self._pane_start = self._bounds[i]
+            self._pane_end = self._bounds[i + 1]
             self._current_offset = 0
         else:
             self._current_pane = -1
             self._current_offset = -1
 
     def panes(self):
-        return self._panes
+        base = self._base
+        bounds = self._bounds
+        return [(bounds[i] - base, bounds[i + 1] - base) for i in range(0, 2 * self._pane_count, 2)]
+
+    def view(self):
+        return self._view[self._base:]
 
     def read_int(self):
         if self._current_pane == -1:
             return -1
-        p, q = self._panes[self._current_pane]
-        size = q - p
-        value = self._view[p + self._current_offset]
+        value = self._view[self._pane_start + self._current_offset]
         self._current_offset += 1
-        if self._current_offset == size:
+        if self._current_offset == self._pane_end - self._pane_start:
             self._next_pane()
         return value
 
@@ -71,7 +109,8 @@ class MessageFrame(object):
 
         to_read = n
         while to_read > 0 and self._current_pane >= 0:
-            p, q = self._panes[self._current_pane]
+            p = self._pane_start
+            q = self._pane_end
             size = q - p
             remaining = size - self._current_offset
             start = p + self._current_offset
@@ -94,10 +133,12 @@ class MessageFrame(object):
                     is_memoryview = False
                 value[offset:offset+read] = self._view[start:end]
             else:
-                value = memoryview(self._view[start:end])
+                value = self._view[start:end]
                 is_memoryview = True
             offset += read
             to_read -= read
+        if is_memoryview:
+            return value
         return memoryview(value)
 
 
@@ -110,6 +151,7 @@ class ChunkedInputBuffer(object):
         self._origin = 0    # start position of current frame
         self._limit = -1    # end position of current frame
         self._frame = None  # frame object
+        self._message_frame = MessageFrame(None, ())
 
     def __repr__(self):
         return repr(self.view().tobytes())
@@ -164,6 +206,30 @@ class ChunkedInputBuffer(object):
         except KeyboardInterrupt:
             return -1
 
+    def reserve(self, n):
+        """ Return a writable view of at least `n` bytes of free space
+        following the loaded data, into which data can be received
+        directly. Any data written is loaded by a subsequent call to
+        :meth:`.advance`. The current frame, if any, is discarded.
+
+        Note: may modify buffer size
+        """
+        self.discard_message()
+        if self._extent + n > len(self._data):
+            self._recycle()
+            shortfall = self._extent + n - len(self._data)
+            if shortfall > 0:
+                self._view = None
+                self._data.extend(bytes(max(shortfall, len(self._data))))
+                self._view = memoryview(self._data)
+        return self._view[self._extent:]
+
+    def advance(self, n):
+        """ Load `n` bytes written into the view returned by
+        :meth:`.reserve`.
+        """
+        self._extent += n
+
     def receive_message(self, socket, n):
         """
 
@@ -200,24 +266,50 @@ class ChunkedInputBuffer(object):
         """
         if self._frame is not None:
             self.discard_message()
-        panes = []
+        data = self._data
         p = origin = self._origin
         extent = self._extent
-        while p < extent:
-            available = extent - p
-            if available < 2:
-                break
-            chunk_size, = struct_unpack(">H", self._view[p:(p + 2)])
+        chunk_count = 0
+        while p + 2 <= extent:
+            chunk_size = data[p] << 8 | data[p + 1]
             p += 2
             if chunk_size == 0:
                 self._limit = p
-                self._frame = MessageFrame(memoryview(self._view[origin:self._limit]), panes)
+                start = origin + 2
+                if chunk_count == 0:
+                    end = start
+                elif chunk_count == 1:
+                    end = p - 2
+                else:
+                    end = self._coalesce(origin)
+                self._frame = self._message_frame
+                self._frame.reset(self._view, origin, start, end)
                 return True
-            q = p + chunk_size
-            panes.append((p - origin, q - origin))
-            p = q
+            chunk_count += 1
+            p += chunk_size
         return False
 
+    def _coalesce(self, origin):
+        """ Move the data from all chunks of the complete message at
+        `origin` into one contiguous region, overwriting the chunk
+        headers in between, and return the end position of that region.
+
+        Note: modifies buffer content before the frame limit
+        """
+        data = self._data
+        view = self._view
+        chunk_size = data[origin] << 8 | data[origin + 1]
+        end = origin + 2 + chunk_size
+        p = end
+        while True:
+            chunk_size = data[p] << 8 | data[p + 1]
+            if chunk_size == 0:
+                return end
+            p += 2
+            view[end:(end + chunk_size)] = view[p:(p + chunk_size)]
+            end += chunk_size
+            p += chunk_size
+
     def discard_message(self):
         if self._frame is not None:
             self._frame.close()
@@ -234,6 +326,8 @@ class ChunkedOutputBuffer(object):
         self._start = 2
         self._end = 2
         self._data = bytearray(capacity)
+        self._segments = []         # (offset, views) for externally held data
+        self._after_segment = False
 
     def max_chunk_size(self):
         return self._max_chunk_size
@@ -243,11 +337,15 @@ class ChunkedOutputBuffer(object):
         self._start = 2
         self._end = 2
         self._data[0:2] = b"\x00\x00"
+        self._segments = []
+        self._after_segment = False
 
     def write(self, b):
         to_write = len(b)
         max_chunk_size = self._max_chunk_size
         pos = 0
+        if to_write:
+            self._after_segment = False
         while to_write > 0:
             chunk_size = self._end - self._start
             remaining = max_chunk_size - chunk_size
@@ -263,16 +361,72 @@ class ChunkedOutputBuffer(object):
                 self._data[self._header:(self._header + 2)] = struct_pack(">H", new_chunk_size)
                 to_write -= wrote
 
+    def write_segment(self, b):
+        """ Append data by reference instead of copying it into the buffer.
+
+        The data is framed into chunks of its own, for which only the
+        chunk headers are held locally, and must not be modified until
+        the buffer has been cleared.
+        """
+        view = memoryview(b)
+        size = len(view)
+        if size == 0:
+            return
+        if self._end == self._start:
+            # Drop the empty chunk that is currently open
+            offset = self._header
+        else:
+            offset = self._end
+        max_chunk_size = self._max_chunk_size
+        views = []
+        for p in range(0, size, max_chunk_size):
+            q = min(p + max_chunk_size, size)
+            views.append(struct_pack(">H", q - p))
+            views.append(view[p:q])
+        self._segments.append((offset, views))
+        self._header = offset
+        self._start = offset + 2
+        self._end = self._start
+        self._data[self._header:self._start] = b"\x00\x00"
+        self._after_segment = True
+
     def chunk(self):
+        if self._after_segment:
+            # The last segment chunk has already been closed
+            # and a new local chunk opened in its place
+            self._after_segment = False
+            return
         self._header = self._end
         self._start = self._header + 2
         self._end = self._start
         self._data[self._header:self._start] = b"\x00\x00"
 
     def view(self):
+        if self._segments:
+            return memoryview(b"".join(self.views()))
         end = self._end
         chunk_size = end - self._start
         if chunk_size == 0:
             return memoryview(self._data[:self._header])
         else:
             return memoryview(self._data[:end])
+
+    def views(self):
+        """ Return the buffered data as a list of views, suitable
+        for scatter-gather output with `socket.sendmsg`.
+        """
+        data = self._data
+        views = []
+        p = 0
+        for offset, segment_views in self._segments:
+            if offset > p:
+                views.append(memoryview(data[p:offset]))
+            views.extend(segment_views)
+            p = offset
+        if self._end == self._start:
+            end = self._header
+        else:
+            end = self._end
+        if end > p:
+            views.append(memoryview(data[p:end]))
+        return views
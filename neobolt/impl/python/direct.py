@@ -32,36 +32,87 @@ __all__ = [
     "AbstractConnectionPool",
     "Connection",
     "ConnectionPool",
+    "RecordStream",
     "connect",
 ]
 
 
 from collections import deque
-from logging import getLogger
+from errno import EAGAIN, EINPROGRESS, EWOULDBLOCK
+from logging import getLogger, DEBUG
 from select import select
-from socket import socket, SOL_SOCKET, SO_KEEPALIVE, SHUT_RDWR, error as SocketError, timeout as SocketTimeout, AF_INET, AF_INET6
+from socket import socket, SOL_SOCKET, SO_KEEPALIVE, SO_RCVBUF, SO_SNDBUF, IPPROTO_TCP, TCP_NODELAY, SHUT_RDWR, \
+    SO_ERROR, error as SocketError, timeout as SocketTimeout, AF_INET, AF_INET6
+from os import strerror
 from ssl import HAS_SNI, SSLSocket, SSLError
 from struct import pack as struct_pack, unpack as struct_unpack
-from threading import RLock, Condition
+from threading import RLock, Condition, Thread
 from time import perf_counter
 
 from neobolt.addressing import SocketAddress, Resolver
-from neobolt.direct import DEFAULT_CONNECTION_TIMEOUT, DEFAULT_MAX_CONNECTION_LIFETIME, \
-    DEFAULT_MAX_CONNECTION_POOL_SIZE, DEFAULT_CONNECTION_ACQUISITION_TIMEOUT, DEFAULT_KEEP_ALIVE, \
-    AuthToken, ServerInfo
-from neobolt.exceptions import ClientError, ProtocolError, SecurityError, ServiceUnavailable, AuthError, CypherError
+from neobolt.direct import DEFAULT_CONNECTION_TIMEOUT, DEFAULT_MAX_CONNECTION_LIFETIME, DEFAULT_LIVENESS_CHECK_TIMEOUT, \
+    DEFAULT_LIVENESS_PROBE_TIMEOUT, DEFAULT_CONNECTION_ATTEMPT_DELAY, DEFAULT_MIN_IDLE_CONNECTIONS, DEFAULT_MAX_CONNECTION_POOL_SIZE, \
+    DEFAULT_CONNECTION_ACQUISITION_TIMEOUT, DEFAULT_KEEP_ALIVE, DEFAULT_MAX_CHUNK_SIZE, MAX_CHUNK_SIZE, \
+    DEFAULT_MAX_IN_FLIGHT, DEFAULT_FETCH_SIZE, DEFAULT_READ_TIMEOUT, DEFAULT_DNS_CACHE_TTL, \
+    DEFAULT_DNS_NEGATIVE_CACHE_TTL, DEFAULT_DNS_STALE_TTL, SOCKET_PROFILES, AuthToken, ServerInfo
+from neobolt.exceptions import ClientError, ProtocolError, SecurityError, ServiceUnavailable, AuthError, \
+    CypherError, ConnectionTimedOut
 from neobolt.meta import get_user_agent, import_best
 
+from .addressing import DNSRefresher, is_ip_address
 from .packstream import Packer, Unpacker
 from .security import make_ssl_context
 
 
+# Socket options that are not available on every platform
+try:
+    from socket import TCP_KEEPIDLE, TCP_KEEPINTVL, TCP_KEEPCNT
+except ImportError:
+    TCP_KEEPIDLE = TCP_KEEPINTVL = TCP_KEEPCNT = None
+try:
+    from socket import TCP_QUICKACK
+except ImportError:
+    TCP_QUICKACK = None
+
 ChunkedInputBuffer = import_best("neobolt.impl.python.bolt._io", "neobolt.impl.python.bolt.io").ChunkedInputBuffer
 ChunkedOutputBuffer = import_best("neobolt.impl.python.bolt._io", "neobolt.impl.python.bolt.io").ChunkedOutputBuffer
 
 
 MAGIC_PREAMBLE = 0x6060B017
 
+# Maximum number of buffers passed to a single sendmsg call
+IOV_MAX = 1024
+
+# Connection settings that a pool passes on to its connector
+# whenever they are included in the pool configuration
+POOLED_CONNECTION_CONFIG_KEYS = (
+    "max_chunk_size",
+    "fetch_size",
+    "read_timeout",
+    "socket_profile",
+    "tcp_nodelay",
+    "tcp_quickack",
+    "receive_buffer_size",
+    "send_buffer_size",
+    "keep_alive_idle",
+    "keep_alive_interval",
+    "keep_alive_count",
+    "dns_cache_ttl",
+    "dns_negative_cache_ttl",
+    "dns_stale_ttl",
+)
+
+# Individual socket options, which may also be set by a socket profile
+SOCKET_OPTION_KEYS = (
+    "tcp_nodelay",
+    "tcp_quickack",
+    "receive_buffer_size",
+    "send_buffer_size",
+    "keep_alive_idle",
+    "keep_alive_interval",
+    "keep_alive_count",
+)
+
 
 # Set up logger
 log = getLogger("neobolt")
@@ -78,39 +129,93 @@ class Connection(object):
     .. note:: logs at INFO level
     """
 
-    #: The protocol version in use on this connection
-    protocol_version = 0
-
-    #: Server details for this connection
-    server = None
-
-    in_use = False
-
-    _closed = False
-
-    _defunct = False
-
-    #: The pool of which this connection is a member
-    pool = None
-
-    #: Error class used for raising connection errors
-    Error = ServiceUnavailable
-
-    _last_run_statement = None
+    __slots__ = [
+        "protocol_version",
+        "address",
+        "socket",
+        "local_port",
+        "server",
+        "in_use",
+        "idle_since",
+        "pool",
+        "Error",
+        "input_buffer",
+        "output_buffer",
+        "fetch_size",
+        "read_timeout",
+        "packer",
+        "unpacker",
+        "responses",
+        "user_agent",
+        "auth_dict",
+        "der_encoded_server_certificate",
+        "_closed",
+        "_defunct",
+        "_max_connection_lifetime",
+        "_creation_timestamp",
+        "_last_run_statement",
+        "_last_qid",
+        "_deferred_pulls",
+        "_reset_pending",
+        "_deadline",
+        "_quickack",
+        "__weakref__",
+    ]
 
     def __init__(self, protocol_version, address, sock, **config):
+        self._closed = False
+        self._defunct = False
+        self._last_run_statement = None
+        self._last_qid = -1
+        self._deferred_pulls = deque()
+        self._reset_pending = False
+        self._deadline = None
+        self._quickack = bool(TCP_QUICKACK and _socket_options(config).get("tcp_quickack"))
+        self.in_use = False
+
+        #: The pool of which this connection is a member
+        self.pool = None
+
+        #: Error class used for raising connection errors
+        self.Error = ServiceUnavailable
+
+        #: The protocol version in use on this connection
         self.protocol_version = protocol_version
         self.address = address
         self.socket = sock
+        try:
+            self.local_port = sock.getsockname()[1]
+        except IOError:
+            self.local_port = 0
+
+        #: Server details for this connection
         self.server = ServerInfo(SocketAddress.from_socket(sock), protocol_version)
         self.input_buffer = ChunkedInputBuffer()
-        self.output_buffer = ChunkedOutputBuffer()
+        max_chunk_size = config.get("max_chunk_size", DEFAULT_MAX_CHUNK_SIZE)
+        if max_chunk_size is None:
+            max_chunk_size = MAX_CHUNK_SIZE
+        elif not 0 < max_chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError("Maximum chunk size must be between 1 and %d bytes" % MAX_CHUNK_SIZE)
+        self.output_buffer = ChunkedOutputBuffer(max_chunk_size=max_chunk_size)
+        fetch_size = config.get("fetch_size", DEFAULT_FETCH_SIZE)
+        if fetch_size != -1 and not fetch_size > 0:
+            raise ValueError("Fetch size must be a positive number of records, or -1 for all records")
+        self.fetch_size = fetch_size
+        read_timeout = config.get("read_timeout", DEFAULT_READ_TIMEOUT)
+        if read_timeout is not None:
+            if not read_timeout > 0:
+                raise ValueError("Read timeout must be a positive number of seconds, or None")
+            sock.settimeout(read_timeout)
+        self.read_timeout = read_timeout
         self.packer = Packer(self.output_buffer)
         self.unpacker = Unpacker()
         self.responses = deque()
         self._max_connection_lifetime = config.get("max_connection_lifetime", DEFAULT_MAX_CONNECTION_LIFETIME)
         self._creation_timestamp = perf_counter()
 
+        #: Time at which the connection was last released to its pool
+        self.idle_since = self._creation_timestamp
+
         # Determine the user agent and ensure it is a Unicode value
         user_agent = config.get("user_agent", get_user_agent())
         if isinstance(user_agent, bytes):
@@ -118,25 +223,7 @@ class Connection(object):
         self.user_agent = user_agent
 
         # Determine auth details
-        auth = config.get("auth")
-        if not auth:
-            self.auth_dict = {}
-        elif isinstance(auth, tuple) and 2 <= len(auth) <= 3:
-            self.auth_dict = vars(AuthToken("basic", *auth))
-        else:
-            try:
-                self.auth_dict = vars(auth)
-            except (KeyError, TypeError):
-                raise AuthError("Cannot determine auth details from %r" % auth)
-
-        # Check for missing password
-        try:
-            credentials = self.auth_dict["credentials"]
-        except KeyError:
-            pass
-        else:
-            if credentials is None:
-                raise AuthError("Password cannot be None")
+        self.auth_dict = _auth_dict(config.get("auth"))
 
         # Pick up the server certificate, if any
         self.der_encoded_server_certificate = config.get("der_encoded_server_certificate")
@@ -145,19 +232,12 @@ class Connection(object):
     def secure(self):
         return isinstance(self.socket, SSLSocket)
 
-    @property
-    def local_port(self):
-        try:
-            return self.socket.getsockname()[1]
-        except IOError:
-            return 0
-
     def init(self):
         log_debug("[#%04X]  C: INIT %r {...}", self.local_port, self.user_agent)
         self._append(b"\x01", (self.user_agent, self.auth_dict),
-                     response=InitResponse(self, on_success=self.server.metadata.update))
+                     response=InitResponse(self, on_success=self.server.update))
         self.sync()
-        self.packer.supports_bytes = self.server.supports("bytes")
+        self.packer.supports_bytes = self.server.capabilities.bytes
 
     def hello(self):
         headers = {"user_agent": self.user_agent}
@@ -167,9 +247,9 @@ class Connection(object):
             logged_headers["credentials"] = "*******"
         log_debug("[#%04X]  C: HELLO %r", self.local_port, logged_headers)
         self._append(b"\x01", (headers,),
-                     response=InitResponse(self, on_success=self.server.metadata.update))
+                     response=InitResponse(self, on_success=self.server.update))
         self.sync()
-        self.packer.supports_bytes = self.server.supports("bytes")
+        self.packer.supports_bytes = self.server.capabilities.bytes
 
     def __del__(self):
         try:
@@ -184,7 +264,7 @@ class Connection(object):
         self.close()
 
     def run(self, statement, parameters=None, bookmarks=None, metadata=None, timeout=None, **handlers):
-        if self.server.supports("statement_reuse"):
+        if self.server.capabilities.statement_reuse:
             if statement.upper() not in (u"BEGIN", u"COMMIT", u"ROLLBACK"):
                 if statement == self._last_run_statement:
                     statement = ""
@@ -193,22 +273,7 @@ class Connection(object):
         if not parameters:
             parameters = {}
         if self.protocol_version >= 3:
-            extra = {}
-            if bookmarks:
-                try:
-                    extra["bookmarks"] = list(bookmarks)
-                except TypeError:
-                    raise TypeError("Bookmarks must be provided within an iterable")
-            if metadata:
-                try:
-                    extra["tx_metadata"] = dict(metadata)
-                except TypeError:
-                    raise TypeError("Metadata must be coercible to a dict")
-            if timeout:
-                try:
-                    extra["tx_timeout"] = int(1000 * timeout)
-                except TypeError:
-                    raise TypeError("Timeout must be specified as a number of seconds")
+            extra = _transaction_extra(bookmarks, metadata, timeout)
             fields = (statement, parameters, extra)
         else:
             if metadata:
@@ -216,35 +281,232 @@ class Connection(object):
             if timeout:
                 raise NotImplementedError("Transaction timeouts are not supported in Bolt v%d" % self.protocol_version)
             fields = (statement, parameters)
-        log_debug("[#%04X]  C: RUN %s", self.local_port, " ".join(map(repr, fields)))
-        self._append(b"\x10", fields, Response(self, **handlers))
+        if log.isEnabledFor(DEBUG):
+            log_debug("[#%04X]  C: RUN %s", self.local_port, " ".join(map(repr, fields)))
+        if self.protocol_version >= 4:
+            self._append(b"\x10", fields, RunResponse(self, **handlers))
+        else:
+            self._append(b"\x10", fields, Response(self, **handlers))
+
+    def run_many(self, statement, parameter_iterable, bookmarks=None, metadata=None, timeout=None,
+                 discard=False, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        """ Run a statement once for each set of parameters, pipelining
+        the RUN and PULL_ALL (or DISCARD_ALL) messages so that many
+        statements are sent with each network write.
+
+        No more than `max_in_flight` statements are outstanding at any
+        time. Once half of these have completed, the pipeline is topped
+        up and all newly queued messages are sent together.
+
+        If any statement fails, the server ignores all those sent after
+        it. Their IGNORED replies are received before the error is
+        raised from the iterator, and no further statements are run.
+        The RESET needed to clear the failure is deferred until the
+        next message, as for :meth:`.sync`.
+
+        :param statement: Cypher statement to run
+        :param parameter_iterable: iterable of parameter dictionaries
+        :param bookmarks: bookmarks to pass with each RUN (v3 only)
+        :param metadata: transaction metadata to pass with each RUN (v3 only)
+        :param timeout: transaction timeout to pass with each RUN (v3 only)
+        :param discard: if true, discard results instead of pulling them
+        :param max_in_flight: maximum number of outstanding statements
+        :return: iterator of (records, metadata) pairs, one for each set of
+                 parameters and in the same order; records are omitted
+                 (empty) if discarding and metadata combines the summaries
+                 of both responses
+        """
+        if max_in_flight < 1:
+            raise ValueError("At least one statement must be allowed in flight")
+        return self._run_many(statement, iter(parameter_iterable), bookmarks, metadata, timeout,
+                              discard, max_in_flight)
+
+    def _run_many(self, statement, parameter_iterator, bookmarks, metadata, timeout, discard, max_in_flight):
+        low_water_mark = max_in_flight // 2
+        in_flight = deque()
+        exhausted = False
+        while True:
+            if not exhausted and len(in_flight) <= low_water_mark:
+                while len(in_flight) < max_in_flight:
+                    try:
+                        parameters = next(parameter_iterator)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    records = []
+                    summary_metadata = {}
+                    self.run(statement, parameters, bookmarks=bookmarks, metadata=metadata, timeout=timeout,
+                             on_success=summary_metadata.update)
+                    if discard:
+                        self.discard_all(on_success=summary_metadata.update)
+                    else:
+                        self.pull_all(on_success=summary_metadata.update, on_records=records.extend)
+                    in_flight.append((self.responses[-1], records, summary_metadata))
+                self.send()
+            if not in_flight:
+                return
+            response, records, summary_metadata = in_flight.popleft()
+            try:
+                while not response.complete:
+                    self.fetch()
+            except CypherError:
+                while self.responses:
+                    self.fetch()
+                raise
+            yield records, summary_metadata
+
+    def run_in_transaction(self, statement, parameters=None, bookmarks=None, metadata=None, timeout=None):
+        """ Run a single statement within an explicit transaction,
+        sending BEGIN, RUN, PULL_ALL and COMMIT together and receiving
+        all of the responses in a single round trip.
+
+        If any part of the transaction fails, the server responds to the
+        remainder with IGNORED. The FAILURE is raised as an error once
+        the connection has been reset, and the transaction is not
+        committed.
+
+        :param statement: Cypher statement to run
+        :param parameters: dictionary of parameters
+        :param bookmarks: bookmarks to pass with BEGIN
+        :param metadata: transaction metadata to pass with BEGIN (v3 only)
+        :param timeout: transaction timeout to pass with BEGIN (v3 only)
+        :return: 2-tuple of records and metadata, where metadata combines
+                 the summaries of all responses (including the bookmark
+                 returned on commit)
+        :raise CypherError: if the transaction failed
+        """
+        records = []
+        summary_metadata = {}
+        ignored = []
+        self.begin(bookmarks=bookmarks, metadata=metadata, timeout=timeout, on_ignored=ignored.append)
+        self.run(statement, parameters, on_success=summary_metadata.update, on_ignored=ignored.append)
+        self.pull_all(on_success=summary_metadata.update, on_records=records.extend, on_ignored=ignored.append)
+        self.commit(on_success=summary_metadata.update, on_ignored=ignored.append)
+        self.sync()
+        if ignored:
+            # A FAILURE would already have been raised, so this can
+            # only happen if the connection was in a failed state
+            raise ProtocolError("Transaction was ignored by the server and not committed")
+        return records, summary_metadata
+
+    def stream(self, statement, parameters=None, bookmarks=None, metadata=None, timeout=None):
+        """ Run a statement and return a :class:`.RecordStream` over
+        its result.
+
+        Records are received from the network only as the stream is
+        consumed, so memory usage is bounded by the amount of data
+        held in the input buffer rather than by the size of the
+        result. The stream must be exhausted or closed before any
+        later responses on this connection can be received.
+
+        :param statement: Cypher statement to run
+        :param parameters: dictionary of parameters
+        :param bookmarks: bookmarks to pass with RUN (v3 only)
+        :param metadata: transaction metadata to pass with RUN (v3 only)
+        :param timeout: transaction timeout to pass with RUN (v3 only)
+        :return: :class:`.RecordStream` instance
+        """
+        stream = RecordStream(self)
+        self.run(statement, parameters, bookmarks=bookmarks, metadata=metadata, timeout=timeout,
+                 on_success=stream.metadata.update)
+        if self.protocol_version >= 4:
+            self.pull(on_success=stream.metadata.update, on_records=stream.records.extend)
+            self.responses[-1].deferred = True
+        else:
+            self.pull_all(on_success=stream.metadata.update, on_records=stream.records.extend)
+        stream.response = self.responses[-1]
+        self.send()
+        return stream
 
     def discard_all(self, **handlers):
-        log_debug("[#%04X]  C: DISCARD_ALL", self.local_port)
-        self._append(b"\x2F", (), Response(self, **handlers))
+        if self.protocol_version >= 4:
+            self.discard(-1, **handlers)
+        else:
+            log_debug("[#%04X]  C: DISCARD_ALL", self.local_port)
+            self._append(b"\x2F", (), Response(self, **handlers))
 
     def pull_all(self, **handlers):
-        log_debug("[#%04X]  C: PULL_ALL", self.local_port)
-        self._append(b"\x3F", (), Response(self, **handlers))
+        if self.protocol_version >= 4:
+            self.pull(-1, **handlers)
+        else:
+            log_debug("[#%04X]  C: PULL_ALL", self.local_port)
+            self._append(b"\x3F", (), Response(self, **handlers))
+
+    def discard(self, n=-1, **handlers):
+        """ Discard up to `n` records from the current result (v4 only).
+        If the server reports that more records remain, these are also
+        discarded once the response arrives, provided that no other
+        messages are queued behind it.
+
+        :param n: number of records to discard, or -1 for all records
+        """
+        if self.protocol_version < 4:
+            raise NotImplementedError("DISCARD n is not supported in Bolt v%d" % self.protocol_version)
+        log_debug("[#%04X]  C: DISCARD %r", self.local_port, n)
+        response = PullResponse(self, n, **handlers)
+        response.discarding = True
+        self._append(b"\x2F", ({"n": n},), response)
+
+    def pull(self, n=None, **handlers):
+        """ Request up to `n` records from the current result (v4 only).
+        If the server reports that more records remain, further records
+        are requested once the response arrives, provided that no other
+        messages are queued behind it. Records are therefore received
+        in batches of at most `n`, and the server sends each batch only
+        once the previous one has been read.
+
+        :param n: number of records per request, or -1 for all records;
+                  defaults to the `fetch_size` of the connection
+        """
+        if self.protocol_version < 4:
+            raise NotImplementedError("PULL n is not supported in Bolt v%d" % self.protocol_version)
+        if n is None:
+            n = self.fetch_size
+        log_debug("[#%04X]  C: PULL %r", self.local_port, n)
+        self._append(b"\x3F", ({"n": n},), PullResponse(self, n, **handlers))
+
+    def _pull_more(self, response):
+        """ Request further records for a :class:`.PullResponse` that
+        has completed a batch with `has_more` set.
+        """
+        response.complete = False
+        response.has_more = False
+        extra = {"n": -1 if response.discarding else response.n}
+        if response.qid != -1:
+            extra["qid"] = response.qid
+        if response.discarding:
+            log_debug("[#%04X]  C: DISCARD %r", self.local_port, extra)
+            self._append(b"\x2F", (extra,), response)
+        else:
+            log_debug("[#%04X]  C: PULL %r", self.local_port, extra)
+            self._append(b"\x3F", (extra,), response)
+        self.send()
+
+    def _resume_pulls(self):
+        """ Request further records for the first :class:`.PullResponse`
+        held back because other messages were queued behind it. If the
+        server has since reported a failure, the results are gone, so
+        the responses are abandoned instead.
+        """
+        if self._reset_pending:
+            self._abandon_pulls()
+        else:
+            self._pull_more(self._deferred_pulls.popleft())
+
+    def _abandon_pulls(self):
+        """ Complete any :class:`.PullResponse` objects held back by
+        :meth:`._resume_pulls` as ignored.
+        """
+        deferred_pulls = self._deferred_pulls
+        while deferred_pulls:
+            response = deferred_pulls.popleft()
+            response.complete = True
+            response.has_more = False
+            response.on_ignored({})
 
     def begin(self, bookmarks=None, metadata=None, timeout=None, **handlers):
         if self.protocol_version >= 3:
-            extra = {}
-            if bookmarks:
-                try:
-                    extra["bookmarks"] = list(bookmarks)
-                except TypeError:
-                    raise TypeError("Bookmarks must be provided within an iterable")
-            if metadata:
-                try:
-                    extra["tx_metadata"] = dict(metadata)
-                except TypeError:
-                    raise TypeError("Metadata must be coercible to a dict")
-            if timeout:
-                try:
-                    extra["tx_timeout"] = int(1000 * timeout)
-                except TypeError:
-                    raise TypeError("Timeout must be specified as a number of seconds")
+            extra = _transaction_extra(bookmarks, metadata, timeout)
             log_debug("[#%04X]  C: BEGIN %r", self.local_port, extra)
             self._append(b"\x11", (extra,), Response(self, **handlers))
         else:
@@ -287,6 +549,8 @@ class Connection(object):
         :arg fields: the fields of the message as a tuple
         :arg response: a response object to handle callbacks
         """
+        if self._reset_pending:
+            self._queue_reset()
         self.packer.pack_struct(signature, fields)
         self.output_buffer.chunk()
         self.output_buffer.chunk()
@@ -296,13 +560,29 @@ class Connection(object):
         """ Add a RESET message to the outgoing queue, send
         it and consume all remaining messages.
         """
+        self._queue_reset()
+        self.sync()
+
+    def _queue_reset(self):
 
         def fail(metadata):
             raise ProtocolError("RESET failed %r" % metadata)
 
+        self._reset_pending = False
+        # Open results do not survive the RESET
+        self._abandon_pulls()
         log_debug("[#%04X]  C: RESET", self.local_port)
         self._append(b"\x0F", response=Response(self, on_failure=fail))
-        self.sync()
+
+    def send_reset(self):
+        """ Send the RESET deferred after a failure, if there is one,
+        without waiting for the reply. This is carried out when the
+        connection is released, so that the server can process the
+        RESET while the connection is idle.
+        """
+        if self._reset_pending:
+            self._queue_reset()
+            self.send()
 
     def send(self):
         try:
@@ -315,14 +595,24 @@ class Connection(object):
     def _send(self):
         """ Send all queued messages to the server.
         """
-        data = self.output_buffer.view()
-        if not data:
+        views = self.output_buffer.views()
+        if not views:
             return
         if self.closed():
             raise self.Error("Failed to write to closed connection {!r}".format(self.server.address))
         if self.defunct():
             raise self.Error("Failed to write to defunct connection {!r}".format(self.server.address))
-        self.socket.sendall(data)
+        if self._deadline is not None:
+            self._apply_deadline()
+        try:
+            if len(views) == 1:
+                self.socket.sendall(views[0])
+            elif self.secure or not hasattr(self.socket, "sendmsg"):
+                self.socket.sendall(b"".join(views))
+            else:
+                _sendmsg_all(self.socket, views)
+        except SocketTimeout:
+            self._time_out()
         self.output_buffer.clear()
 
     def fetch(self):
@@ -346,38 +636,55 @@ class Connection(object):
             return 0, 0
 
         self._receive()
+        return self._process()
 
-        details, summary_signature, summary_metadata = self._unpack()
+    def _process(self):
+        """ Unpack the framed message, plus any further messages up to
+        and including the next summary, and pass them to the handlers
+        of the current response.
+
+        :return: 2-tuple of number of detail messages and number of summary messages processed
+        """
+        detail_count, details, summary_signature, summary_metadata = self._unpack()
 
+        if detail_count:
+            log_debug("[#%04X]  S: RECORD * %d", self.local_port, detail_count)  # TODO
         if details:
-            log_debug("[#%04X]  S: RECORD * %d", self.local_port, len(details))  # TODO
             self.responses[0].on_records(details)
 
         if summary_signature is None:
-            return len(details), 0
+            return detail_count, 0
 
         response = self.responses.popleft()
         response.complete = True
-        if summary_signature == b"\x70":
-            log_debug("[#%04X]  S: SUCCESS %r", self.local_port, summary_metadata)
-            response.on_success(summary_metadata or {})
-        elif summary_signature == b"\x7E":
-            self._last_run_statement = None
-            log_debug("[#%04X]  S: IGNORED", self.local_port)
-            response.on_ignored(summary_metadata or {})
-        elif summary_signature == b"\x7F":
-            self._last_run_statement = None
-            log_debug("[#%04X]  S: FAILURE %r", self.local_port, summary_metadata)
-            response.on_failure(summary_metadata or {})
-        else:
-            self._last_run_statement = None
-            raise ProtocolError("Unexpected response message with signature %02X" % summary_signature)
+        try:
+            if summary_signature == b"\x70":
+                log_debug("[#%04X]  S: SUCCESS %r", self.local_port, summary_metadata)
+                response.on_success(summary_metadata or {})
+            elif summary_signature == b"\x7E":
+                self._last_run_statement = None
+                log_debug("[#%04X]  S: IGNORED", self.local_port)
+                response.on_ignored(summary_metadata or {})
+            elif summary_signature == b"\x7F":
+                self._last_run_statement = None
+                log_debug("[#%04X]  S: FAILURE %r", self.local_port, summary_metadata)
+                response.on_failure(summary_metadata or {})
+            else:
+                self._last_run_statement = None
+                raise ProtocolError("Unexpected response message with signature %02X" % summary_signature)
+        finally:
+            if self._deferred_pulls and not self.responses:
+                self._resume_pulls()
 
-        return len(details), 1
+        return detail_count, 1
 
     def _receive(self):
+        if self._deadline is not None:
+            self._apply_deadline()
         try:
             received = self.input_buffer.receive_message(self.socket, 8192)
+        except SocketTimeout:
+            self._time_out()
         except SocketError:
             received = 0
         else:
@@ -387,53 +694,154 @@ class Connection(object):
             self._defunct = True
             self.close()
             raise self.Error("Failed to read from defunct connection {!r}".format(self.server.address))
+        if self._quickack:
+            # Linux drops back into delayed ACK mode of its own accord,
+            # so quick ACK mode needs to be requested after each read
+            self.socket.setsockopt(IPPROTO_TCP, TCP_QUICKACK, 1)
 
     def _unpack(self):
         unpacker = self.unpacker
         input_buffer = self.input_buffer
+        on_record_frame = self.responses[0].on_record_frame
 
+        detail_count = 0
         details = []
         summary_signature = None
         summary_metadata = None
         more = True
         while more:
-            unpacker.attach(input_buffer.frame())
+            frame = input_buffer.frame()
+            unpacker.attach(frame)
             size, signature = unpacker.unpack_structure_header()
             if size > 1:
                 raise ProtocolError("Expected one field")
             if signature == b"\x71":
-                data = unpacker.unpack_list()
-                details.append(data)
+                if on_record_frame is None:
+                    data = unpacker.unpack_list()
+                    details.append(data)
+                else:
+                    on_record_frame(frame)
+                detail_count += 1
                 more = input_buffer.frame_message()
             else:
                 summary_signature = signature
                 summary_metadata = unpacker.unpack_map()
                 more = False
-        return details, summary_signature, summary_metadata
+        return detail_count, details, summary_signature, summary_metadata
 
     def timedout(self):
         return 0 <= self._max_connection_lifetime <= perf_counter() - self._creation_timestamp
 
-    def sync(self):
+    def alive(self, timeout=None):
+        """ Check that the server end of an idle connection is still
+        open, without waiting for the network where possible.
+
+        Nothing should arrive on a connection with no outstanding
+        requests, so a socket that is readable at that point has either
+        been closed by the server (or something in between) or is out of
+        step with the protocol. If requests are outstanding, such as a
+        RESET sent on release, their responses are received instead,
+        for up to `timeout` seconds. A connection found to be dead is
+        marked as defunct. Errors are not passed to the pool, which
+        decides what to do with the connection itself.
+
+        :param timeout: maximum number of seconds to wait for replies
+        :return: :const:`True` if the connection can be reused
+        """
+        if self.closed() or self.defunct():
+            return False
+        if self.responses:
+            try:
+                self._within(timeout, self._drain)
+            except (ServiceUnavailable, SocketError, CypherError, ProtocolError):
+                return False
+            return True
+        try:
+            readable = self.secure and self.socket.pending() or select((self.socket,), (), (), 0)[0]
+        except (SocketError, ValueError):
+            readable = True
+        if readable:
+            self._defunct = True
+            return False
+        return True
+
+    def _apply_deadline(self):
+        """ Limit the next socket operation to the time remaining
+        before the deadline set by :meth:`.sync`, or to the read
+        timeout, if that is shorter.
+        """
+        remaining = self._deadline - perf_counter()
+        if remaining <= 0:
+            self._time_out()
+        if self.read_timeout is not None:
+            remaining = min(remaining, self.read_timeout)
+        self.socket.settimeout(remaining)
+
+    def _time_out(self):
+        self._defunct = True
+        self.close()
+        raise ConnectionTimedOut("Timed out waiting for server {!r}".format(self.server.address))
+
+    def sync(self, timeout=None):
         """ Send and fetch all outstanding messages.
 
+        If the exchange does not complete within `timeout` seconds,
+        the connection is marked defunct and :class:`.ConnectionTimedOut`
+        is raised. Each individual read is also limited by the
+        `read_timeout` of the connection, if any.
+
+        :param timeout: maximum number of seconds to spend in total
         :return: 2-tuple of number of detail messages and number of summary messages fetched
         """
+        return self._within(timeout, self._sync)
+
+    def _within(self, timeout, exchange):
+        """ Carry out an exchange with the server, such as :meth:`._sync`,
+        timing out if it does not complete within `timeout` seconds.
+        """
+        if timeout is None:
+            return exchange()
+        self._deadline = perf_counter() + timeout
+        try:
+            return exchange()
+        finally:
+            self._deadline = None
+            if not self._closed:
+                self.socket.settimeout(self.read_timeout)
+
+    def _drain(self):
+        """ Send all outstanding messages and receive their replies,
+        without involving the pool in any error.
+        """
+        self._send()
+        while self.responses:
+            self._fetch()
+
+    def _sync(self):
         self.send()
         detail_count = summary_count = 0
-        while self.responses:
-            response = self.responses[0]
-            while not response.complete:
-                detail_delta, summary_delta = self.fetch()
-                detail_count += detail_delta
-                summary_count += summary_delta
+        try:
+            while self.responses:
+                response = self.responses[0]
+                while not response.complete:
+                    detail_delta, summary_delta = self.fetch()
+                    detail_count += detail_delta
+                    summary_count += summary_delta
+        except CypherError:
+            # Everything sent after the failure will be ignored, and
+            # those replies are already on their way, so receive them
+            # now; the RESET itself is deferred until the next message
+            while self.responses:
+                self.fetch()
+            raise
         return detail_count, summary_count
 
     def close(self):
         """ Close the connection.
         """
         if not self._closed:
-            if self.protocol_version >= 3:
+            self._reset_pending = False
+            if self.protocol_version >= 3 and not self._defunct:
                 log_debug("[#%04X]  C: GOODBYE", self.local_port)
                 self._append(b"\x02", ())
                 try:
@@ -468,6 +876,20 @@ class AbstractConnectionPool(object):
         self.cond = Condition(self.lock)
         self._max_connection_pool_size = config.get("max_connection_pool_size", DEFAULT_MAX_CONNECTION_POOL_SIZE)
         self._connection_acquisition_timeout = config.get("connection_acquisition_timeout", DEFAULT_CONNECTION_ACQUISITION_TIMEOUT)
+        self._liveness_check_timeout = config.get("liveness_check_timeout", DEFAULT_LIVENESS_CHECK_TIMEOUT)
+        self._liveness_probe_timeout = config.get("liveness_probe_timeout", DEFAULT_LIVENESS_PROBE_TIMEOUT)
+        self._min_idle_connections = config.get("min_idle_connections", DEFAULT_MIN_IDLE_CONNECTIONS)
+        self._connection_config = {key: config[key] for key in POOLED_CONNECTION_CONFIG_KEYS if key in config}
+        self._warming = {}
+        self._tls_sessions = {}
+        self._resolver = config.get("resolver")
+        self._dns_cache_ttl = config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL)
+        self._dns_negative_cache_ttl = config.get("dns_negative_cache_ttl", DEFAULT_DNS_NEGATIVE_CACHE_TTL)
+        self._dns_refresher = None
+        #: Number of connections opened offering to resume a TLS session
+        self.tls_session_offers = 0
+        #: Number of TLS sessions offered that the server resumed
+        self.tls_session_hits = 0
 
     def __enter__(self):
         return self
@@ -493,20 +915,34 @@ class AbstractConnectionPool(object):
             connection_acquisition_start_timestamp = perf_counter()
             while True:
                 # try to find a free connection in pool
+                rescan = False
                 for connection in list(connections):
                     if connection.closed() or connection.defunct() or connection.timedout():
                         connections.remove(connection)
                         continue
                     if not connection.in_use:
                         connection.in_use = True
+                        if self._idle_too_long(connection) and not self._probe(connection):
+                            log_debug("[#%04X]  C: <DEAD> %s", connection.local_port, address)
+                            try:
+                                connections.remove(connection)
+                            except ValueError:
+                                pass
+                            connection.close()
+                            # The pool may have dropped other connections, or
+                            # the whole address, in the meantime
+                            connections = self.connections.setdefault(address, deque())
+                            rescan = True
+                            break
+                        if self._min_idle_connections:
+                            self.warm(address)
                         return connection
+                if rescan:
+                    continue
                 # all connections in pool are in-use
-                infinite_connection_pool = (self._max_connection_pool_size < 0 or
-                                            self._max_connection_pool_size == float("inf"))
-                can_create_new_connection = infinite_connection_pool or len(connections) < self._max_connection_pool_size
-                if can_create_new_connection:
+                if self._capacity(address) > 0:
                     try:
-                        connection = self.connector(address)
+                        connection = self._connect(address)
                     except ServiceUnavailable:
                         self.remove(address)
                         raise
@@ -514,6 +950,8 @@ class AbstractConnectionPool(object):
                         connection.pool = self
                         connection.in_use = True
                         connections.append(connection)
+                        if self._min_idle_connections:
+                            self.warm(address)
                         return connection
 
                 # failed to obtain a connection from pool because the pool is full and no free connection in the pool
@@ -528,6 +966,123 @@ class AbstractConnectionPool(object):
                 else:
                     raise ClientError("Failed to obtain a connection from pool within {!r}s".format(self._connection_acquisition_timeout))
 
+    def _connect(self, address):
+        """ Open a new connection to a given address, offering to resume
+        the TLS session of the last encrypted connection opened to that
+        address, and keeping the new session for next time.
+        """
+        self._keep_resolved(address)
+        session = self._tls_sessions.get(address)
+        if session is None:
+            connection = self.connector(address, **self._connection_config)
+        else:
+            connection = self.connector(address, tls_session=session, **self._connection_config)
+        s = connection.socket
+        if isinstance(s, SSLSocket):
+            with self.lock:
+                if session is not None:
+                    self.tls_session_offers += 1
+                    if s.session_reused:
+                        self.tls_session_hits += 1
+                self._tls_sessions[address] = s.session
+        return connection
+
+    def _keep_resolved(self, address):
+        """ Have the pool's DNS refresher keep the resolution of a host
+        name fresh, starting the refresher if this is the first.
+        """
+        if self._dns_cache_ttl <= 0 or is_ip_address(address[0]):
+            return
+        with self.lock:
+            if self._closed:
+                return
+            if self._dns_refresher is None:
+                self._dns_refresher = DNSRefresher(self._resolver, self._dns_cache_ttl, self._dns_negative_cache_ttl)
+                self._dns_refresher.start()
+            self._dns_refresher.watch(address)
+
+    def tls_session_hit_rate(self):
+        """ Return the proportion of TLS sessions offered on reconnection
+        that were resumed by the server, or :const:`None` if no session
+        has been offered yet.
+        """
+        with self.lock:
+            if self.tls_session_offers == 0:
+                return None
+            return self.tls_session_hits / self.tls_session_offers
+
+    def _capacity(self, address):
+        """ Return the number of further connections that may be opened
+        to a given address, counting those already being opened in the
+        background.
+        """
+        max_connection_pool_size = self._max_connection_pool_size
+        if max_connection_pool_size < 0 or max_connection_pool_size == float("inf"):
+            return float("inf")
+        return (max_connection_pool_size - len(self.connections.get(address, ())) -
+                self._warming.get(address, 0))
+
+    def warm(self, address):
+        """ Top up the idle connections to a given address to the
+        configured minimum, opening each missing connection in parallel
+        on a background thread.
+
+        This method is thread safe.
+        """
+        with self.lock:
+            if self._closed:
+                return
+            warming = self._warming.get(address, 0)
+            idle = sum(1 for connection in self.connections.get(address, ()) if not connection.in_use)
+            count = min(self._min_idle_connections - idle - warming, self._capacity(address))
+            if count <= 0:
+                return
+            self._warming[address] = warming + count
+        log_debug("[#0000]  C: <WARM> %s (%d)", address, count)
+        for _ in range(count):
+            Thread(target=self._open_idle, args=(address,), daemon=True).start()
+
+    def _open_idle(self, address):
+        """ Open a connection to a given address and add it to the pool
+        as an idle connection.
+        """
+        try:
+            connection = self._connect(address)
+        except Exception as error:
+            log_debug("[#0000]  C: <WARM> %s failed: %s", address, error)
+            connection = None
+        with self.lock:
+            self._warming[address] -= 1
+            if connection is not None:
+                if self._closed:
+                    connection.close()
+                else:
+                    connection.pool = self
+                    connection.in_use = False
+                    connection.idle_since = perf_counter()
+                    self.connections.setdefault(address, deque()).append(connection)
+            self.cond.notify_all()
+
+    def _probe(self, connection):
+        """ Check that a connection, already marked as in use, is alive.
+        The pool lock is released meanwhile, as the check may have to
+        wait for the server.
+        """
+        self.lock.release()
+        try:
+            return connection.alive(self._liveness_probe_timeout)
+        finally:
+            self.lock.acquire()
+
+    def _idle_too_long(self, connection):
+        """ Return :const:`True` if a connection has been idle for
+        long enough that it should be checked before being reused.
+        """
+        liveness_check_timeout = self._liveness_check_timeout
+        if liveness_check_timeout is None:
+            return False
+        return perf_counter() - connection.idle_since >= liveness_check_timeout
+
     def acquire(self, access_mode=None):
         """ Acquire a connection to a server that can satisfy a set of parameters.
 
@@ -535,11 +1090,17 @@ class AbstractConnectionPool(object):
         """
 
     def release(self, connection):
-        """ Release a connection back into the pool.
+        """ Release a connection back into the pool, first sending
+        any RESET deferred after a failure.
         This method is thread safe.
         """
+        try:
+            connection.send_reset()
+        except SocketError:
+            pass
         with self.lock:
             connection.in_use = False
+            connection.idle_since = perf_counter()
             self.cond.notify_all()
 
     def in_use_connection_count(self, address):
@@ -577,6 +1138,7 @@ class AbstractConnectionPool(object):
         all connections to that address.
         """
         with self.lock:
+            self._tls_sessions.pop(address, None)
             for connection in self.connections.pop(address, ()):
                 try:
                     connection.close()
@@ -593,6 +1155,8 @@ class AbstractConnectionPool(object):
             with self.lock:
                 if not self._closed:
                     self._closed = True
+                    if self._dns_refresher is not None:
+                        self._dns_refresher.stop()
                     for address in list(self.connections):
                         self.remove(address)
         except TypeError as e:
@@ -616,6 +1180,8 @@ class ConnectionPool(AbstractConnectionPool):
     def __init__(self, connector, address, **config):
         super(ConnectionPool, self).__init__(connector, **config)
         self.address = address
+        if self._min_idle_connections:
+            self.warm(address)
 
     def acquire(self, access_mode=None):
         return self.acquire_direct(self.address)
@@ -624,55 +1190,165 @@ class ConnectionPool(AbstractConnectionPool):
 class Response(object):
     """ Subscriber object for a full response (zero or
     more detail messages followed by one summary message).
+
+    Handlers are resolved once, on construction, and any that are not
+    callable are ignored. Handlers that this class does not use itself
+    are kept for the benefit of subclasses.
     """
 
-    def __init__(self, connection, **handlers):
+    __slots__ = [
+        "connection",
+        "_handlers",
+        "complete",
+        "on_record_frame",
+        "_on_records",
+        "_on_success",
+        "_on_failure",
+        "_on_ignored",
+        "_on_summary",
+        "__weakref__",
+    ]
+
+    def __init__(self, connection, on_records=None, on_success=None, on_failure=None,
+                 on_ignored=None, on_summary=None, on_record_frame=None, **handlers):
         self.connection = connection
-        self.handlers = handlers
         self.complete = False
 
+        #: Handler to which each RECORD message is passed as a
+        #: :class:`.MessageFrame`, undecoded, or :const:`None` if
+        #: records should be decoded and passed to `on_records`. The
+        #: frame is only valid for the duration of the call.
+        self.on_record_frame = on_record_frame if callable(on_record_frame) else None
+
+        self._on_records = on_records if callable(on_records) else None
+        self._on_success = on_success if callable(on_success) else None
+        self._on_failure = on_failure if callable(on_failure) else None
+        self._on_ignored = on_ignored if callable(on_ignored) else None
+        self._on_summary = on_summary if callable(on_summary) else None
+
+        # The dictionary is only kept if it holds anything, as one
+        # response is created for every message sent
+        self._handlers = handlers or None
+
+    @property
+    def handlers(self):
+        """ Dictionary of all handlers for this response, including
+        any that this class does not use itself.
+        """
+        handlers = dict(self._handlers or ())
+        for key in ("on_records", "on_success", "on_failure", "on_ignored", "on_summary"):
+            handler = getattr(self, "_" + key)
+            if handler is not None:
+                handlers[key] = handler
+        if self.on_record_frame is not None:
+            handlers["on_record_frame"] = self.on_record_frame
+        return handlers
+
     def on_records(self, records):
         """ Called when one or more RECORD messages have been received.
         """
-        handler = self.handlers.get("on_records")
-        if callable(handler):
+        handler = self._on_records
+        if handler is not None:
             handler(records)
 
     def on_success(self, metadata):
         """ Called when a SUCCESS message has been received.
         """
-        handler = self.handlers.get("on_success")
-        if callable(handler):
+        handler = self._on_success
+        if handler is not None:
             handler(metadata)
-        handler = self.handlers.get("on_summary")
-        if callable(handler):
+        handler = self._on_summary
+        if handler is not None:
             handler()
 
     def on_failure(self, metadata):
-        """ Called when a FAILURE message has been received.
+        """ Called when a FAILURE message has been received. The RESET
+        needed to clear the failure is not sent straight away, but
+        with the next message or when the connection is released.
         """
-        self.connection.reset()
-        handler = self.handlers.get("on_failure")
-        if callable(handler):
+        self.connection._reset_pending = True
+        handler = self._on_failure
+        if handler is not None:
             handler(metadata)
-        handler = self.handlers.get("on_summary")
-        if callable(handler):
+        handler = self._on_summary
+        if handler is not None:
             handler()
         raise CypherError.hydrate(**metadata)
 
     def on_ignored(self, metadata=None):
         """ Called when an IGNORED message has been received.
         """
-        handler = self.handlers.get("on_ignored")
-        if callable(handler):
+        handler = self._on_ignored
+        if handler is not None:
             handler(metadata)
-        handler = self.handlers.get("on_summary")
-        if callable(handler):
+        handler = self._on_summary
+        if handler is not None:
             handler()
 
 
+class RunResponse(Response):
+    """ Response to a Bolt v4 RUN, which notes the query ID returned by
+    the server so that the records can be pulled later on, even if
+    further statements have been run in the meantime.
+    """
+
+    __slots__ = []
+
+    def on_success(self, metadata):
+        self.connection._last_qid = metadata.get("qid", -1)
+        super(RunResponse, self).on_success(metadata)
+
+
+class PullResponse(Response):
+    """ Response to a Bolt v4 PULL or DISCARD, for which the server
+    may return records in several batches. Each batch ends with a
+    SUCCESS carrying `has_more`, after which the next is requested.
+    If other messages are queued behind it, the next batch is only
+    requested once their responses have been received.
+
+    If `deferred` is set, the next batch is not requested
+    automatically. Instead, the response completes with `has_more`
+    set, and the owner is responsible for requesting the remainder.
+    """
+
+    __slots__ = [
+        "n",
+        "qid",
+        "deferred",
+        "discarding",
+        "has_more",
+    ]
+
+    def __init__(self, connection, n, **handlers):
+        super(PullResponse, self).__init__(connection, **handlers)
+        self.n = n
+        self.qid = -1
+        self.deferred = False
+        self.discarding = False
+        self.has_more = False
+
+    def on_success(self, metadata):
+        if metadata.get("has_more"):
+            self.has_more = True
+            if self.deferred:
+                return
+            connection = self.connection
+            if connection.responses:
+                # The request is addressed to this result by ID, as the
+                # queued messages may include another RUN
+                self.qid = connection._last_qid
+                self.complete = False
+                connection._deferred_pulls.append(self)
+            else:
+                connection._pull_more(self)
+            return
+        super(PullResponse, self).on_success(metadata)
+
+
 class InitResponse(Response):
 
+    __slots__ = []
+
     def on_failure(self, metadata):
         code = metadata.get("code")
         message = metadata.get("message", "Connection initialisation failed")
@@ -682,6 +1358,129 @@ class InitResponse(Response):
             raise ServiceUnavailable(message)
 
 
+class RecordStream(object):
+    """ Iterator over the records of a single result, as returned by
+    :meth:`.Connection.stream`.
+
+    Records are decoded into a local buffer, which is only refilled
+    from the network once it has been emptied. Closing the stream
+    before all records have been consumed discards the remainder of
+    the result without decoding it. With Bolt v4, records are pulled
+    in batches of the connection `fetch_size` and any batches not
+    yet requested are discarded by the server instead.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.records = deque()
+        self.metadata = {}
+        self.response = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        records = self.records
+        while not records and self._receive():
+            pass
+        if records:
+            return records.popleft()
+        raise StopIteration
+
+    def keys(self):
+        """ Return the field names of the result, receiving the RUN
+        summary first if necessary.
+        """
+        while "fields" not in self.metadata and self._receive():
+            pass
+        return self.metadata.get("fields")
+
+    def close(self):
+        """ Discard any records not yet consumed, receiving the
+        remainder of the result from the network.
+        """
+        self.records.clear()
+        response = self.response
+        response.on_record_frame = _discard
+        if isinstance(response, PullResponse):
+            response.discarding = True
+        while self._receive():
+            pass
+
+    def _receive(self):
+        """ Receive more of the result, first requesting the next batch
+        if the previous one has been received in full.
+
+        :return: :const:`False` if the result is already complete
+        """
+        response = self.response
+        if response.complete:
+            if not getattr(response, "has_more", False):
+                return False
+            self.connection._pull_more(response)
+        self.connection.fetch()
+        return True
+
+
+def _discard(*_):
+    pass
+
+
+def _auth_dict(auth):
+    """ Return the auth details to pass with INIT or HELLO, given
+    either a tuple of basic auth values or an auth token object.
+    """
+    if not auth:
+        auth_dict = {}
+    elif isinstance(auth, tuple) and 2 <= len(auth) <= 3:
+        auth_dict = vars(AuthToken("basic", *auth))
+    else:
+        try:
+            auth_dict = vars(auth)
+        except (KeyError, TypeError):
+            raise AuthError("Cannot determine auth details from %r" % auth)
+
+    # Check for missing password
+    try:
+        credentials = auth_dict["credentials"]
+    except KeyError:
+        pass
+    else:
+        if credentials is None:
+            raise AuthError("Password cannot be None")
+
+    return auth_dict
+
+
+def _transaction_extra(bookmarks, metadata, timeout):
+    """ Return the extra transaction details to pass with RUN or
+    BEGIN from Bolt v3 onwards.
+    """
+    extra = {}
+    if bookmarks:
+        try:
+            extra["bookmarks"] = list(bookmarks)
+        except TypeError:
+            raise TypeError("Bookmarks must be provided within an iterable")
+    if metadata:
+        try:
+            extra["tx_metadata"] = dict(metadata)
+        except TypeError:
+            raise TypeError("Metadata must be coercible to a dict")
+    if timeout:
+        try:
+            extra["tx_timeout"] = int(1000 * timeout)
+        except TypeError:
+            raise TypeError("Timeout must be specified as a number of seconds")
+    return extra
+
+
 # TODO: remove in 2.0
 def _last_bookmark(b0, b1):
     """ Return the latest of two bookmarks by looking for the maximum
@@ -711,6 +1510,71 @@ def last_bookmark(bookmarks):
     return last
 
 
+def _sendmsg_all(s, views):
+    """ Send a list of buffers using scatter-gather output, carrying
+    on from wherever the last write stopped until all data is sent.
+
+    :param s: socket object
+    :param views: list of bytes-like objects
+    """
+    views = list(map(memoryview, views))
+    i = 0
+    n = len(views)
+    while i < n:
+        sent = s.sendmsg(views[i:(i + IOV_MAX)])
+        while sent > 0:
+            size = views[i].nbytes
+            if sent < size:
+                views[i] = views[i][sent:]
+                sent = 0
+            else:
+                sent -= size
+                i += 1
+
+
+def _socket_options(config):
+    """ Resolve the socket options for a connection from the named
+    socket profile, if any, and from any options given individually.
+
+    :return: dictionary of socket options
+    """
+    profile = config.get("socket_profile")
+    if profile is None:
+        options = {}
+    else:
+        try:
+            options = dict(SOCKET_PROFILES[profile])
+        except KeyError:
+            raise ValueError("Unknown socket profile {!r}".format(profile))
+    for key in SOCKET_OPTION_KEYS:
+        if key in config:
+            options[key] = config[key]
+    return options
+
+
+def _configure_socket(s, options):
+    """ Apply socket options, as resolved by :func:`._socket_options`.
+    Options that the platform does not support are skipped.
+    """
+    tcp_nodelay = options.get("tcp_nodelay")
+    if tcp_nodelay is not None:
+        s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1 if tcp_nodelay else 0)
+    if TCP_QUICKACK and options.get("tcp_quickack"):
+        s.setsockopt(IPPROTO_TCP, TCP_QUICKACK, 1)
+    receive_buffer_size = options.get("receive_buffer_size")
+    if receive_buffer_size:
+        s.setsockopt(SOL_SOCKET, SO_RCVBUF, receive_buffer_size)
+    send_buffer_size = options.get("send_buffer_size")
+    if send_buffer_size:
+        s.setsockopt(SOL_SOCKET, SO_SNDBUF, send_buffer_size)
+    for key, option in (("keep_alive_idle", TCP_KEEPIDLE),
+                        ("keep_alive_interval", TCP_KEEPINTVL),
+                        ("keep_alive_count", TCP_KEEPCNT)):
+        value = options.get(key)
+        if value and option:
+            s.setsockopt(IPPROTO_TCP, option, int(value))
+
+
 def _connect(resolved_address, **config):
     """
 
@@ -718,41 +1582,162 @@ def _connect(resolved_address, **config):
     :param config:
     :return: socket object
     """
-    s = None
-    try:
-        if len(resolved_address) == 2:
-            s = socket(AF_INET)
-        elif len(resolved_address) == 4:
-            s = socket(AF_INET6)
+    s, _ = _connect_any([resolved_address], **config)
+    return s
+
+
+def _interleave(resolved_addresses):
+    """ Reorder resolved addresses so that address families alternate,
+    starting with the family of the first address (RFC 8305, section 4).
+    """
+    first, second = [], []
+    for resolved_address in resolved_addresses:
+        if len(resolved_address) == len(resolved_addresses[0]):
+            first.append(resolved_address)
         else:
-            raise ValueError("Unsupported address {!r}".format(resolved_address))
-        t = s.gettimeout()
-        s.settimeout(config.get("connection_timeout", DEFAULT_CONNECTION_TIMEOUT))
+            second.append(resolved_address)
+    interleaved = []
+    for i in range(max(len(first), len(second))):
+        interleaved.extend(first[i:i + 1])
+        interleaved.extend(second[i:i + 1])
+    return interleaved
+
+
+def _connect_any(resolved_addresses, **config):
+    """ Open a TCP connection to the first of several resolved addresses
+    to accept one.
+
+    Attempts are started one after another, each `connection_attempt_delay`
+    seconds after the last or as soon as the last fails, and are left
+    running in parallel; the first to connect wins and the rest are
+    closed (RFC 8305). Each attempt has the full `connection_timeout`.
+
+    :param resolved_addresses:
+    :param config:
+    :return: 2-tuple of socket object and the address it is connected to
+    """
+    options = _socket_options(config)
+    connection_timeout = config.get("connection_timeout", DEFAULT_CONNECTION_TIMEOUT)
+    connection_attempt_delay = config.get("connection_attempt_delay", DEFAULT_CONNECTION_ATTEMPT_DELAY)
+    remaining = deque(_interleave(list(resolved_addresses)))
+    attempts = {}
+    last_error = None
+    next_attempt_time = perf_counter()
+    try:
+        while remaining or attempts:
+            now = perf_counter()
+            if remaining and (now >= next_attempt_time or not attempts):
+                resolved_address = remaining.popleft()
+                next_attempt_time = now + connection_attempt_delay
+                try:
+                    s = _start_connecting(resolved_address, options, config)
+                except (IOError, OSError) as error:  # TODO 2.0: remove IOError alias
+                    last_error = _connection_failed(resolved_address, error)
+                    next_attempt_time = now
+                else:
+                    attempts[s] = (resolved_address, now + connection_timeout)
+                continue
+            wake_time = min(deadline for _, deadline in attempts.values())
+            if remaining:
+                wake_time = min(wake_time, next_attempt_time)
+            _, connected, failed = select((), list(attempts), list(attempts), max(wake_time - now, 0))
+            for s in set(connected) | set(failed):
+                resolved_address, _ = attempts.pop(s)
+                error = s.getsockopt(SOL_SOCKET, SO_ERROR)
+                if error == 0:
+                    s.setblocking(True)
+                    return s, resolved_address
+                s.close()
+                last_error = _connection_failed(resolved_address, OSError(error, strerror(error)))
+                next_attempt_time = perf_counter()
+            now = perf_counter()
+            for s, (resolved_address, deadline) in list(attempts.items()):
+                if now >= deadline:
+                    del attempts[s]
+                    s.close()
+                    last_error = _connection_timed_out(resolved_address)
+                    next_attempt_time = now
+    finally:
+        for s, (resolved_address, _) in attempts.items():
+            log_debug("[#0000]  C: <CLOSE> %s", resolved_address)
+            s.close()
+    if last_error is None:
+        raise ServiceUnavailable("No addresses to connect to")
+    raise last_error
+
+
+def _start_connecting(resolved_address, options, config):
+    """ Create a non-blocking socket for a resolved address and start
+    connecting it.
+    """
+    s = _new_socket(resolved_address, options, config)
+    try:
         log_debug("[#0000]  C: <OPEN> %s", resolved_address)
-        s.connect(resolved_address)
-        s.settimeout(t)
-        s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, 1 if config.get("keep_alive", DEFAULT_KEEP_ALIVE) else 0)
-    except SocketTimeout:
-        log_debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
-        log_debug("[#0000]  C: <CLOSE> %s", resolved_address)
+        error = s.connect_ex(resolved_address)
+        if error not in (0, EINPROGRESS, EWOULDBLOCK, EAGAIN):
+            raise OSError(error, strerror(error))
+    except Exception:
         s.close()
-        raise ServiceUnavailable("Timed out trying to establish connection to {!r}".format(resolved_address))
-    except (IOError, OSError) as error:  # TODO 2.0: remove IOError alias
-        log_debug("[#0000]  C: <ERROR> %s %s", type(error).__name__, " ".join(map(repr, error.args)))
-        log_debug("[#0000]  C: <CLOSE> %s", resolved_address)
-        s.close()
-        raise ServiceUnavailable("Failed to establish connection to {!r} (reason {})".format(resolved_address, error))
+        raise
+    return s
+
+
+def _new_socket(resolved_address, options, config):
+    """ Create a non-blocking socket, ready to connect to a resolved
+    address, with the socket options given applied.
+    """
+    if len(resolved_address) == 2:
+        s = socket(AF_INET)
+    elif len(resolved_address) == 4:
+        s = socket(AF_INET6)
     else:
-        return s
+        raise ValueError("Unsupported address {!r}".format(resolved_address))
+    try:
+        # Buffer sizes must be set before connecting for the TCP
+        # window scale to take them into account
+        _configure_socket(s, options)
+        s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, 1 if config.get("keep_alive", DEFAULT_KEEP_ALIVE) else 0)
+        s.setblocking(False)
+    except Exception:
+        s.close()
+        raise
+    return s
+
+
+def _connection_failed(resolved_address, error):
+    log_debug("[#0000]  C: <ERROR> %s %s", type(error).__name__, " ".join(map(repr, error.args)))
+    log_debug("[#0000]  C: <CLOSE> %s", resolved_address)
+    return ServiceUnavailable("Failed to establish connection to {!r} (reason {})".format(resolved_address, error))
+
+
+def _connection_timed_out(resolved_address):
+    log_debug("[#0000]  C: <TIMEOUT> %s", resolved_address)
+    log_debug("[#0000]  C: <CLOSE> %s", resolved_address)
+    return ServiceUnavailable("Timed out trying to establish connection to {!r}".format(resolved_address))
+
+
+def _resolver(address, config):
+    """ Create a :class:`.Resolver` for an address, using the DNS
+    settings in `config`, and carry out any custom resolution. DNS
+    resolution is left to the caller.
+    """
+    resolver = Resolver(custom_resolver=config.get("resolver"),
+                        ttl=config.get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL),
+                        negative_ttl=config.get("dns_negative_cache_ttl", DEFAULT_DNS_NEGATIVE_CACHE_TTL),
+                        stale_ttl=config.get("dns_stale_ttl", DEFAULT_DNS_STALE_TTL))
+    resolver.addresses.append(address)
+    resolver.custom_resolve()
+    return resolver
 
 
-def _secure(s, host, ssl_context):
+def _secure(s, host, ssl_context, session=None):
     local_port = s.getsockname()[1]
-    # Secure the connection if an SSL context has been provided
+    # Secure the connection if an SSL context has been provided,
+    # offering to resume an earlier TLS session if one is given
     if ssl_context:
         log_debug("[#%04X]  C: <SECURE> %s", local_port, host)
         try:
-            s = ssl_context.wrap_socket(s, server_hostname=host if HAS_SNI and host else None)
+            s = ssl_context.wrap_socket(s, server_hostname=host if HAS_SNI and host else None, session=session)
         except SSLError as cause:
             s.close()
             error = SecurityError("Failed to establish secure connection to {!r}".format(cause.args[1]))
@@ -779,7 +1764,7 @@ def _handshake(s, resolved_address, der_encoded_server_certificate, **config):
     local_port = s.getsockname()[1]
 
     # Send details of the protocol versions supported
-    supported_versions = [3, 2, 1, 0]
+    supported_versions = [4, 3, 2, 1]
     handshake = [MAGIC_PREAMBLE] + supported_versions
     log_debug("[#%04X]  C: <MAGIC> 0x%08X", local_port, MAGIC_PREAMBLE)
     log_debug("[#%04X]  C: <HANDSHAKE> 0x%08X 0x%08X 0x%08X 0x%08X", local_port, *supported_versions)
@@ -819,7 +1804,7 @@ def _handshake(s, resolved_address, der_encoded_server_certificate, **config):
                                 **config)
         connection.init()
         return connection
-    elif agreed_version in (3,):
+    elif agreed_version in (3, 4):
         connection = Connection(agreed_version, resolved_address, s,
                                 der_encoded_server_certificate=der_encoded_server_certificate,
                                 **config)
@@ -846,14 +1831,19 @@ def connect(address, **config):
     # Catches refused connections see:
     # https://docs.python.org/2/library/errno.html
     log_debug("[#0000]  C: <RESOLVE> %s", address)
-    resolver = Resolver(custom_resolver=config.get("resolver"))
-    resolver.addresses.append(address)
-    resolver.custom_resolve()
+    resolver = _resolver(address, config)
     resolver.dns_resolve()
-    for resolved_address in resolver.addresses:
+    resolved_addresses = list(resolver.addresses)
+    while resolved_addresses:
+        try:
+            s, resolved_address = _connect_any(resolved_addresses, **config)
+        except ServiceUnavailable as error:
+            last_error = error
+            break
+        # Should the server fail the handshake, try the other addresses
+        resolved_addresses.remove(resolved_address)
         try:
-            s = _connect(resolved_address, **config)
-            s, der_encoded_server_certificate = _secure(s, address[0], ssl_context)
+            s, der_encoded_server_certificate = _secure(s, address[0], ssl_context, config.get("tls_session"))
             connection = _handshake(s, resolved_address, der_encoded_server_certificate, **config)
         except Exception as error:
             last_error = error
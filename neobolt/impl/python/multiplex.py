@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+This module provides a selector-based multiplexer, with which a single
+thread can drive many connections at once. Messages are queued on each
+connection as usual, and the multiplexer then sends them and receives
+the responses for whichever sockets are ready, passing each message to
+the handlers of its response.
+"""
+
+
+__all__ = [
+    "ConnectionMultiplexer",
+]
+
+
+from selectors import DefaultSelector, EVENT_READ, EVENT_WRITE
+from socket import error as SocketError
+from ssl import SSLWantReadError, SSLWantWriteError
+from time import perf_counter
+
+
+RECEIVE_SIZE = 8192
+
+
+class ConnectionMultiplexer(object):
+    """ Drives several connections from a single thread.
+
+    Each connection is used as it normally would be, except that
+    :meth:`.sync` is called on the multiplexer instead of on the
+    connection::
+
+        mux = ConnectionMultiplexer()
+        for cx in connections:
+            cx.run("RETURN $x", {"x": 1})
+            cx.pull_all(on_records=records.extend)
+            mux.add(cx)
+        mux.sync()
+
+    Queued messages are written as far as each socket will accept
+    without blocking, and responses are dispatched as each socket
+    becomes readable, so a slow server holds up only its own
+    connection. Sockets are only switched into non-blocking mode for
+    the duration of each read or write, so handlers can still use
+    their connection in the usual, blocking, way.
+
+    An error raised for one connection, either by the connection
+    itself or by one of its handlers, is raised from :meth:`.poll` or
+    :meth:`.sync`. A connection that becomes defunct is removed from
+    the multiplexer; any others remain in place, so that :meth:`.sync`
+    can be called again to complete them.
+    """
+
+    def __init__(self, connections=(), selector=None):
+        self.selector = selector or DefaultSelector()
+        self._pending = {}
+        for connection in connections:
+            self.add(connection)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, connection):
+        return connection in self._pending
+
+    def add(self, connection):
+        """ Add a connection to the multiplexer.
+        """
+        if connection in self._pending:
+            return
+        self.selector.register(connection.socket, EVENT_READ, connection)
+        self._pending[connection] = None
+
+    def remove(self, connection):
+        """ Remove a connection from the multiplexer, first sending any
+        data that could not be written without blocking.
+        """
+        try:
+            pending = self._pending.pop(connection)
+        except KeyError:
+            return
+        self.selector.unregister(connection.socket)
+        if pending and not connection.closed() and not connection.defunct():
+            connection.socket.sendall(pending)
+
+    def close(self):
+        """ Remove all connections from the multiplexer. The
+        connections themselves are left open.
+        """
+        for connection in list(self._pending):
+            self.remove(connection)
+        self.selector.close()
+
+    def outstanding(self):
+        """ Return `True` if any connection still has data to send or
+        responses to receive.
+        """
+        for connection, pending in self._pending.items():
+            if pending or connection.responses or connection.output_buffer.views():
+                return True
+        return False
+
+    def poll(self, timeout=None):
+        """ Send queued messages, then wait up to `timeout` seconds
+        for any socket to become ready and carry out whatever reads and
+        writes are possible without blocking.
+
+        :param timeout: maximum number of seconds to wait, or `None`
+                        to wait until at least one socket is ready
+        :return: 2-tuple of number of detail messages and number of summary messages processed
+        """
+        for connection in list(self._pending):
+            self._send(connection)
+        detail_count = summary_count = 0
+        for key, events in self.selector.select(timeout):
+            connection = key.data
+            if events & EVENT_WRITE:
+                self._send(connection)
+            if events & EVENT_READ and connection in self._pending:
+                detail_delta, summary_delta = self._fetch(connection)
+                detail_count += detail_delta
+                summary_count += summary_delta
+        return detail_count, summary_count
+
+    def sync(self, timeout=None):
+        """ Send all queued messages and process responses until every
+        connection has received a summary for each of its requests.
+
+        :param timeout: maximum number of seconds to wait in total, or
+                        `None` to wait indefinitely
+        :return: `True` if all responses were received, `False` if
+                 the timeout expired first
+        """
+        deadline = None if timeout is None else perf_counter() + timeout
+        while self.outstanding():
+            if deadline is None:
+                self.poll()
+            else:
+                remaining = deadline - perf_counter()
+                if remaining <= 0:
+                    return False
+                self.poll(remaining)
+        return True
+
+    def _send(self, connection):
+        """ Write as much queued data for a connection as the socket
+        will accept without blocking.
+        """
+        pending = self._pending[connection]
+        views = connection.output_buffer.views()
+        if views:
+            if connection.closed():
+                raise connection.Error("Failed to write to closed connection {!r}".format(connection.server.address))
+            if connection.defunct():
+                raise connection.Error("Failed to write to defunct connection {!r}".format(connection.server.address))
+            data = b"".join(views)
+            pending = memoryview(bytes(pending) + data if pending else data)
+            connection.output_buffer.clear()
+        if pending:
+            s = connection.socket
+            timeout = s.gettimeout()
+            s.setblocking(False)
+            try:
+                sent = s.send(pending)
+            except (BlockingIOError, SSLWantReadError, SSLWantWriteError):
+                sent = 0
+            except SocketError as error:
+                self._fail(connection, "Failed to write to defunct connection {!r}", error)
+            finally:
+                if s.fileno() != -1:
+                    s.settimeout(timeout)
+            pending = pending[sent:]
+        self._pending[connection] = pending
+        self.selector.modify(connection.socket, EVENT_READ | EVENT_WRITE if pending else EVENT_READ, connection)
+
+    def _fetch(self, connection):
+        """ Read whatever data is available for a connection and pass
+        each complete message received to the handlers of its response.
+        """
+        s = connection.socket
+        input_buffer = connection.input_buffer
+        input_buffer.discard_message()
+        timeout = s.gettimeout()
+        s.setblocking(False)
+        try:
+            received = input_buffer.receive(s, RECEIVE_SIZE)
+            # Decrypted data held by an SSL socket does not show up as
+            # readable on the underlying socket, so drain it here
+            pending = getattr(s, "pending", None)
+            while received and pending and pending():
+                received = input_buffer.receive(s, RECEIVE_SIZE)
+        except (BlockingIOError, SSLWantReadError, SSLWantWriteError):
+            return 0, 0
+        except SocketError as error:
+            self._fail(connection, "Failed to read from defunct connection {!r}", error)
+        finally:
+            if s.fileno() != -1:
+                s.settimeout(timeout)
+        if not received:
+            self._fail(connection, "Failed to read from defunct connection {!r}")
+        detail_count = summary_count = 0
+        try:
+            while connection.responses and input_buffer.frame_message():
+                detail_delta, summary_delta = connection._process()
+                detail_count += detail_delta
+                summary_count += summary_delta
+        except Exception as error:
+            if connection.pool:
+                connection.pool.handle(error, connection)
+            raise
+        return detail_count, summary_count
+
+    def _fail(self, connection, message, cause=None):
+        """ Mark a connection as defunct after a read or write failure,
+        remove it from the multiplexer and raise an error.
+        """
+        self._pending.pop(connection, None)
+        self.selector.unregister(connection.socket)
+        connection._defunct = True
+        connection.close()
+        error = connection.Error(message.format(connection.server.address))
+        if connection.pool:
+            connection.pool.handle(error, connection)
+        if cause is None:
+            raise error
+        else:
+            raise error from cause
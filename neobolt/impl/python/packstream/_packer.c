@@ -1,25 +1,16 @@
-/* Generated by Cython 0.28.4 */
-
-/* BEGIN: Cython Metadata
-{
-    "distutils": {
-        "name": "neobolt.impl.python.packstream._packer",
-        "sources": [
-            "/home/technige/work/neobolt/neobolt/impl/python/packstream/_packer.pyx"
-        ]
-    },
-    "module_name": "neobolt.impl.python.packstream._packer"
-}
-END: Cython Metadata */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_28_4"
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
 #define CYTHON_FUTURE_DIVISION 0
 #include <stddef.h>
 #ifndef offsetof
@@ -58,6 +49,7 @@ END: Cython Metadata */
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -86,14 +78,26 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -127,10 +131,63 @@ END: Cython Metadata */
   #define CYTHON_PEP489_MULTI_PHASE_INIT 0
   #undef CYTHON_USE_TP_FINALIZE
   #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -150,7 +207,7 @@ END: Cython Metadata */
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -158,7 +215,7 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -173,27 +230,47 @@ END: Cython Metadata */
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT (0 && PY_VERSION_HEX >= 0x03050000)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
   #endif
   #ifndef CYTHON_USE_TP_FINALIZE
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
 #endif
 #ifndef __has_attribute
   #define __has_attribute(x) 0
@@ -292,9 +369,6 @@ END: Cython Metadata */
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -304,10 +378,79 @@ END: Cython Metadata */
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -320,6 +463,9 @@ END: Cython Metadata */
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
 #if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
   #ifndef METH_FASTCALL
      #define METH_FASTCALL 0x80
@@ -333,7 +479,7 @@ END: Cython Metadata */
 #endif
 #if CYTHON_FAST_PYCCALL
 #define __Pyx_PyFastCFunction_Check(func)\
-    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)))))
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
 #else
 #define __Pyx_PyFastCFunction_Check(func) 0
 #endif
@@ -342,6 +488,11 @@ END: Cython Metadata */
   #define PyObject_Free(p)     PyMem_Free(p)
   #define PyObject_Realloc(p)  PyMem_Realloc(p)
 #endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
 #if CYTHON_COMPILING_IN_PYSTON
   #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
   #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
@@ -364,7 +515,7 @@ END: Cython Metadata */
 typedef int Py_tss_t;
 static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
   *key = PyThread_create_key();
-  return 0; // PyThread_create_key reports success always
+  return 0;
 }
 static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
   Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
@@ -387,7 +538,7 @@ static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
 static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   return PyThread_get_key_value(*key);
 }
-#endif // TSS (Thread Specific Storage) API
+#endif
 #if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
 #define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
 #else
@@ -407,8 +558,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -416,7 +571,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -449,8 +612,8 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
   #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
 #endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
 #else
@@ -465,8 +628,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -477,6 +642,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -510,13 +682,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -538,8 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -557,11 +731,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -586,7 +759,8 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
                 const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
@@ -602,6 +776,9 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
     (sizeof(type) == sizeof(Py_ssize_t) &&\
           (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
                                v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
 #if defined (__cplusplus) && __cplusplus >= 201103L
     #include <cstdlib>
     #define __Pyx_sst_abs(value) std::abs(value)
@@ -660,11 +837,13 @@ static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
 #define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
 static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
 #define __Pyx_PySequence_Tuple(obj)\
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -740,7 +919,7 @@ static int __Pyx_init_sys_getdefaultencoding_params(void) {
     if (!default_encoding) goto bad;
     default_encoding_c = PyBytes_AsString(default_encoding);
     if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
     if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
     strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
     Py_DECREF(default_encoding);
@@ -777,14 +956,14 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "_packer.pyx",
+  "neobolt/impl/python/packstream/_packer.pyx",
   "stringsource",
 };
 
 /*--- Type declarations ---*/
 struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer;
 
-/* "neobolt/impl/python/packstream/_packer.pyx":46
+/* "neobolt/impl/python/packstream/_packer.pyx":50
  * 
  * 
  * cdef class Packer(object):             # <<<<<<<<<<<<<<
@@ -797,6 +976,7 @@ struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer {
   int supports_bytes;
   PyObject *stream;
   PyObject *_write;
+  PyObject *_write_segment;
 };
 
 
@@ -902,6 +1082,56 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* GetAttr3.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *, PyObject *, PyObject *);
+
 /* PyCFunctionFastCall.proto */
 #if CYTHON_FAST_PYCCALL
 static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
@@ -914,10 +1144,30 @@ static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObje
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
     __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
 #define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
 #endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
+#endif
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCall.proto */
@@ -927,6 +1177,9 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
 #endif
 
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
 /* PyObjectCallMethO.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
@@ -935,14 +1188,58 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
 /* GetModuleGlobalName.proto */
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
 
 /* PyIntBinop.proto */
 #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
+static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
 #else
-#define __Pyx_PyInt_RemainderObjC(op1, op2, intval, inplace)\
+#define __Pyx_PyInt_RemainderObjC(op1, op2, intval, inplace, zerodivision_check)\
     (inplace ? PyNumber_InPlaceRemainder(op1, op2) : PyNumber_Remainder(op1, op2))
 #endif
 
@@ -975,42 +1272,6 @@ static CYTHON_INLINE PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* k
 #define __Pyx_PyObject_GetItem(obj, key)  PyObject_GetItem(obj, key)
 #endif
 
-/* PyThreadStateGet.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
-#else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
-#endif
-
-/* PyErrFetchRestore.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
-#else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
-#endif
-
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
@@ -1056,6 +1317,9 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 /* SetVTable.proto */
 static int __Pyx_SetVtable(PyObject *dict, void *vtable);
 
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
 /* SetupReduce.proto */
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
@@ -1073,7 +1337,7 @@ static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
     if (likely(L->allocated > len)) {
         Py_INCREF(x);
         PyList_SET_ITEM(list, len, x);
-        Py_SIZE(list) = len+1;
+        __Pyx_SET_SIZE(list, len + 1);
         return 0;
     }
     return PyList_Append(list, x);
@@ -1084,9 +1348,9 @@ static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
 
 /* PyIntBinop.proto */
 #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace);
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
 #else
-#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace)\
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
     (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
 #endif
 
@@ -1116,6 +1380,11 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
@@ -1163,6 +1432,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
 static PyTypeObject *__pyx_ptype_7neobolt_4impl_6python_10packstream_7_packer_Packer = 0;
 static PyObject *__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_HI = 0;
 static PyObject *__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO = 0;
+static PyObject *__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_MIN_SEGMENT_SIZE = 0;
 static PyObject *__pyx_7genexpr__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_x;
 static PyObject *__pyx_8genexpr1__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_x;
 static PyObject *__pyx_8genexpr2__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_z;
@@ -1183,97 +1453,97 @@ static const char __pyx_k_I[] = ">I";
 static const char __pyx_k_d[] = ">d";
 static const char __pyx_k_i[] = ">i";
 static const char __pyx_k_q[] = ">q";
-static const char __pyx_k__3[] = "\303";
-static const char __pyx_k__5[] = "\302";
-static const char __pyx_k__7[] = "\301";
-static const char __pyx_k__9[] = "\310";
-static const char __pyx_k__11[] = "\311";
-static const char __pyx_k__13[] = "\312";
-static const char __pyx_k__15[] = "\313";
-static const char __pyx_k__19[] = "\314";
-static const char __pyx_k__21[] = "\315";
-static const char __pyx_k__23[] = "\316";
-static const char __pyx_k__26[] = "\200";
-static const char __pyx_k__28[] = "\201";
-static const char __pyx_k__30[] = "\202";
-static const char __pyx_k__32[] = "\203";
-static const char __pyx_k__34[] = "\204";
-static const char __pyx_k__36[] = "\205";
-static const char __pyx_k__38[] = "\206";
-static const char __pyx_k__40[] = "\207";
-static const char __pyx_k__42[] = "\210";
-static const char __pyx_k__44[] = "\211";
-static const char __pyx_k__46[] = "\212";
-static const char __pyx_k__48[] = "\213";
-static const char __pyx_k__50[] = "\214";
-static const char __pyx_k__52[] = "\215";
-static const char __pyx_k__54[] = "\216";
-static const char __pyx_k__56[] = "\217";
-static const char __pyx_k__58[] = "\320";
-static const char __pyx_k__60[] = "\321";
-static const char __pyx_k__62[] = "\322";
-static const char __pyx_k__65[] = "\220";
-static const char __pyx_k__67[] = "\221";
-static const char __pyx_k__69[] = "\222";
-static const char __pyx_k__71[] = "\223";
-static const char __pyx_k__73[] = "\224";
-static const char __pyx_k__75[] = "\225";
-static const char __pyx_k__77[] = "\226";
-static const char __pyx_k__79[] = "\227";
-static const char __pyx_k__81[] = "\230";
-static const char __pyx_k__83[] = "\231";
-static const char __pyx_k__85[] = "\232";
-static const char __pyx_k__87[] = "\233";
-static const char __pyx_k__89[] = "\234";
-static const char __pyx_k__91[] = "\235";
-static const char __pyx_k__93[] = "\236";
-static const char __pyx_k__95[] = "\237";
-static const char __pyx_k__97[] = "\324";
-static const char __pyx_k__99[] = "\325";
+static const char __pyx_k__2[] = "\303";
+static const char __pyx_k__3[] = "\302";
+static const char __pyx_k__4[] = "\301";
+static const char __pyx_k__5[] = "\310";
+static const char __pyx_k__6[] = "\311";
+static const char __pyx_k__7[] = "\312";
+static const char __pyx_k__8[] = "\313";
+static const char __pyx_k__10[] = "\314";
+static const char __pyx_k__11[] = "\315";
+static const char __pyx_k__12[] = "\316";
+static const char __pyx_k__14[] = "\200";
+static const char __pyx_k__15[] = "\201";
+static const char __pyx_k__16[] = "\202";
+static const char __pyx_k__17[] = "\203";
+static const char __pyx_k__18[] = "\204";
+static const char __pyx_k__19[] = "\205";
+static const char __pyx_k__20[] = "\206";
+static const char __pyx_k__21[] = "\207";
+static const char __pyx_k__22[] = "\210";
+static const char __pyx_k__23[] = "\211";
+static const char __pyx_k__24[] = "\212";
+static const char __pyx_k__25[] = "\213";
+static const char __pyx_k__26[] = "\214";
+static const char __pyx_k__27[] = "\215";
+static const char __pyx_k__28[] = "\216";
+static const char __pyx_k__29[] = "\217";
+static const char __pyx_k__30[] = "\320";
+static const char __pyx_k__31[] = "\321";
+static const char __pyx_k__32[] = "\322";
+static const char __pyx_k__34[] = "\220";
+static const char __pyx_k__35[] = "\221";
+static const char __pyx_k__36[] = "\222";
+static const char __pyx_k__37[] = "\223";
+static const char __pyx_k__38[] = "\224";
+static const char __pyx_k__39[] = "\225";
+static const char __pyx_k__40[] = "\226";
+static const char __pyx_k__41[] = "\227";
+static const char __pyx_k__42[] = "\230";
+static const char __pyx_k__43[] = "\231";
+static const char __pyx_k__44[] = "\232";
+static const char __pyx_k__45[] = "\233";
+static const char __pyx_k__46[] = "\234";
+static const char __pyx_k__47[] = "\235";
+static const char __pyx_k__48[] = "\236";
+static const char __pyx_k__49[] = "\237";
+static const char __pyx_k__50[] = "\324";
+static const char __pyx_k__51[] = "\325";
+static const char __pyx_k__52[] = "\326";
+static const char __pyx_k__54[] = "\327";
+static const char __pyx_k__55[] = "\240";
+static const char __pyx_k__56[] = "\241";
+static const char __pyx_k__57[] = "\242";
+static const char __pyx_k__58[] = "\243";
+static const char __pyx_k__59[] = "\244";
+static const char __pyx_k__60[] = "\245";
+static const char __pyx_k__61[] = "\246";
+static const char __pyx_k__62[] = "\247";
+static const char __pyx_k__63[] = "\250";
+static const char __pyx_k__64[] = "\251";
+static const char __pyx_k__65[] = "\252";
+static const char __pyx_k__66[] = "\253";
+static const char __pyx_k__67[] = "\254";
+static const char __pyx_k__68[] = "\255";
+static const char __pyx_k__69[] = "\256";
+static const char __pyx_k__70[] = "\257";
+static const char __pyx_k__71[] = "\330";
+static const char __pyx_k__72[] = "\331";
+static const char __pyx_k__73[] = "\332";
+static const char __pyx_k__75[] = "\333";
+static const char __pyx_k__77[] = "\260";
+static const char __pyx_k__78[] = "\261";
+static const char __pyx_k__79[] = "\262";
+static const char __pyx_k__80[] = "\263";
+static const char __pyx_k__81[] = "\264";
+static const char __pyx_k__82[] = "\265";
+static const char __pyx_k__83[] = "\266";
+static const char __pyx_k__84[] = "\267";
+static const char __pyx_k__85[] = "\270";
+static const char __pyx_k__86[] = "\271";
+static const char __pyx_k__87[] = "\272";
+static const char __pyx_k__88[] = "\273";
+static const char __pyx_k__89[] = "\274";
+static const char __pyx_k__90[] = "\275";
+static const char __pyx_k__91[] = "\276";
+static const char __pyx_k__92[] = "\277";
+static const char __pyx_k__93[] = "\334";
+static const char __pyx_k__94[] = "\335";
+static const char __pyx_k__96[] = "\337";
 static const char __pyx_k_tag[] = "tag";
 static const char __pyx_k_NULL[] = "NULL_";
 static const char __pyx_k_TRUE[] = "TRUE";
-static const char __pyx_k__101[] = "\326";
-static const char __pyx_k__104[] = "\327";
-static const char __pyx_k__106[] = "\240";
-static const char __pyx_k__108[] = "\241";
-static const char __pyx_k__110[] = "\242";
-static const char __pyx_k__112[] = "\243";
-static const char __pyx_k__114[] = "\244";
-static const char __pyx_k__116[] = "\245";
-static const char __pyx_k__118[] = "\246";
-static const char __pyx_k__120[] = "\247";
-static const char __pyx_k__122[] = "\250";
-static const char __pyx_k__124[] = "\251";
-static const char __pyx_k__126[] = "\252";
-static const char __pyx_k__128[] = "\253";
-static const char __pyx_k__130[] = "\254";
-static const char __pyx_k__132[] = "\255";
-static const char __pyx_k__134[] = "\256";
-static const char __pyx_k__136[] = "\257";
-static const char __pyx_k__138[] = "\330";
-static const char __pyx_k__140[] = "\331";
-static const char __pyx_k__142[] = "\332";
-static const char __pyx_k__145[] = "\333";
-static const char __pyx_k__148[] = "\260";
-static const char __pyx_k__150[] = "\261";
-static const char __pyx_k__152[] = "\262";
-static const char __pyx_k__154[] = "\263";
-static const char __pyx_k__156[] = "\264";
-static const char __pyx_k__158[] = "\265";
-static const char __pyx_k__160[] = "\266";
-static const char __pyx_k__162[] = "\267";
-static const char __pyx_k__164[] = "\270";
-static const char __pyx_k__166[] = "\271";
-static const char __pyx_k__168[] = "\272";
-static const char __pyx_k__170[] = "\273";
-static const char __pyx_k__172[] = "\274";
-static const char __pyx_k__174[] = "\275";
-static const char __pyx_k__176[] = "\276";
-static const char __pyx_k__178[] = "\277";
-static const char __pyx_k__180[] = "\334";
-static const char __pyx_k__182[] = "\335";
-static const char __pyx_k__185[] = "\337";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_pack[] = "pack";
@@ -1284,6 +1554,7 @@ static const char __pyx_k_range[] = "range";
 static const char __pyx_k_utf_8[] = "utf-8";
 static const char __pyx_k_value[] = "value";
 static const char __pyx_k_write[] = "write";
+static const char __pyx_k_Packer[] = "Packer";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_fields[] = "fields";
 static const char __pyx_k_import[] = "__import__";
@@ -1305,6 +1576,7 @@ static const char __pyx_k_OverflowError[] = "OverflowError";
 static const char __pyx_k_PACKED_UINT_8[] = "PACKED_UINT_8";
 static const char __pyx_k_neobolt_types[] = "neobolt.types";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_write_segment[] = "write_segment";
 static const char __pyx_k_PACKED_UINT_16[] = "PACKED_UINT_16";
 static const char __pyx_k_UNPACKED_UINT_8[] = "UNPACKED_UINT_8";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
@@ -1337,6 +1609,7 @@ static PyObject *__pyx_n_s_NULL;
 static PyObject *__pyx_n_s_OverflowError;
 static PyObject *__pyx_n_s_PACKED_UINT_16;
 static PyObject *__pyx_n_s_PACKED_UINT_8;
+static PyObject *__pyx_n_s_Packer;
 static PyObject *__pyx_kp_s_String_header_size_out_of_range;
 static PyObject *__pyx_n_s_Structure;
 static PyObject *__pyx_kp_s_Structure_signature_must_be_a_si;
@@ -1349,94 +1622,94 @@ static PyObject *__pyx_n_s_UNPACKED_UINT_16;
 static PyObject *__pyx_n_s_UNPACKED_UINT_8;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_kp_s_Values_of_type_s_are_not_support;
-static PyObject *__pyx_kp_b__101;
-static PyObject *__pyx_kp_b__104;
-static PyObject *__pyx_kp_b__106;
-static PyObject *__pyx_kp_b__108;
+static PyObject *__pyx_kp_b__10;
 static PyObject *__pyx_kp_b__11;
-static PyObject *__pyx_kp_b__110;
-static PyObject *__pyx_kp_b__112;
-static PyObject *__pyx_kp_b__114;
-static PyObject *__pyx_kp_b__116;
-static PyObject *__pyx_kp_b__118;
-static PyObject *__pyx_kp_b__120;
-static PyObject *__pyx_kp_b__122;
-static PyObject *__pyx_kp_b__124;
-static PyObject *__pyx_kp_b__126;
-static PyObject *__pyx_kp_b__128;
-static PyObject *__pyx_kp_b__13;
-static PyObject *__pyx_kp_b__130;
-static PyObject *__pyx_kp_b__132;
-static PyObject *__pyx_kp_b__134;
-static PyObject *__pyx_kp_b__136;
-static PyObject *__pyx_kp_b__138;
-static PyObject *__pyx_kp_b__140;
-static PyObject *__pyx_kp_b__142;
-static PyObject *__pyx_kp_b__145;
-static PyObject *__pyx_kp_b__148;
+static PyObject *__pyx_kp_b__12;
+static PyObject *__pyx_kp_b__14;
 static PyObject *__pyx_kp_b__15;
-static PyObject *__pyx_kp_b__150;
-static PyObject *__pyx_kp_b__152;
-static PyObject *__pyx_kp_b__154;
-static PyObject *__pyx_kp_b__156;
-static PyObject *__pyx_kp_b__158;
-static PyObject *__pyx_kp_b__160;
-static PyObject *__pyx_kp_b__162;
-static PyObject *__pyx_kp_b__164;
-static PyObject *__pyx_kp_b__166;
-static PyObject *__pyx_kp_b__168;
-static PyObject *__pyx_kp_b__170;
-static PyObject *__pyx_kp_b__172;
-static PyObject *__pyx_kp_b__174;
-static PyObject *__pyx_kp_b__176;
-static PyObject *__pyx_kp_b__178;
-static PyObject *__pyx_kp_b__180;
-static PyObject *__pyx_kp_b__182;
-static PyObject *__pyx_kp_b__185;
+static PyObject *__pyx_kp_b__16;
+static PyObject *__pyx_kp_b__17;
+static PyObject *__pyx_kp_b__18;
 static PyObject *__pyx_kp_b__19;
+static PyObject *__pyx_kp_b__2;
+static PyObject *__pyx_kp_b__20;
 static PyObject *__pyx_kp_b__21;
+static PyObject *__pyx_kp_b__22;
 static PyObject *__pyx_kp_b__23;
+static PyObject *__pyx_kp_b__24;
+static PyObject *__pyx_kp_b__25;
 static PyObject *__pyx_kp_b__26;
+static PyObject *__pyx_kp_b__27;
 static PyObject *__pyx_kp_b__28;
+static PyObject *__pyx_kp_b__29;
 static PyObject *__pyx_kp_b__3;
 static PyObject *__pyx_kp_b__30;
+static PyObject *__pyx_kp_b__31;
 static PyObject *__pyx_kp_b__32;
 static PyObject *__pyx_kp_b__34;
+static PyObject *__pyx_kp_b__35;
 static PyObject *__pyx_kp_b__36;
+static PyObject *__pyx_kp_b__37;
 static PyObject *__pyx_kp_b__38;
+static PyObject *__pyx_kp_b__39;
+static PyObject *__pyx_kp_b__4;
 static PyObject *__pyx_kp_b__40;
+static PyObject *__pyx_kp_b__41;
 static PyObject *__pyx_kp_b__42;
+static PyObject *__pyx_kp_b__43;
 static PyObject *__pyx_kp_b__44;
+static PyObject *__pyx_kp_b__45;
 static PyObject *__pyx_kp_b__46;
+static PyObject *__pyx_kp_b__47;
 static PyObject *__pyx_kp_b__48;
+static PyObject *__pyx_kp_b__49;
 static PyObject *__pyx_kp_b__5;
 static PyObject *__pyx_kp_b__50;
+static PyObject *__pyx_kp_b__51;
 static PyObject *__pyx_kp_b__52;
 static PyObject *__pyx_kp_b__54;
+static PyObject *__pyx_kp_b__55;
 static PyObject *__pyx_kp_b__56;
+static PyObject *__pyx_kp_b__57;
 static PyObject *__pyx_kp_b__58;
+static PyObject *__pyx_kp_b__59;
+static PyObject *__pyx_kp_b__6;
 static PyObject *__pyx_kp_b__60;
+static PyObject *__pyx_kp_b__61;
 static PyObject *__pyx_kp_b__62;
+static PyObject *__pyx_kp_b__63;
+static PyObject *__pyx_kp_b__64;
 static PyObject *__pyx_kp_b__65;
+static PyObject *__pyx_kp_b__66;
 static PyObject *__pyx_kp_b__67;
+static PyObject *__pyx_kp_b__68;
 static PyObject *__pyx_kp_b__69;
 static PyObject *__pyx_kp_b__7;
+static PyObject *__pyx_kp_b__70;
 static PyObject *__pyx_kp_b__71;
+static PyObject *__pyx_kp_b__72;
 static PyObject *__pyx_kp_b__73;
 static PyObject *__pyx_kp_b__75;
 static PyObject *__pyx_kp_b__77;
+static PyObject *__pyx_kp_b__78;
 static PyObject *__pyx_kp_b__79;
+static PyObject *__pyx_kp_b__8;
+static PyObject *__pyx_kp_b__80;
 static PyObject *__pyx_kp_b__81;
+static PyObject *__pyx_kp_b__82;
 static PyObject *__pyx_kp_b__83;
+static PyObject *__pyx_kp_b__84;
 static PyObject *__pyx_kp_b__85;
+static PyObject *__pyx_kp_b__86;
 static PyObject *__pyx_kp_b__87;
+static PyObject *__pyx_kp_b__88;
 static PyObject *__pyx_kp_b__89;
-static PyObject *__pyx_kp_b__9;
+static PyObject *__pyx_kp_b__90;
 static PyObject *__pyx_kp_b__91;
+static PyObject *__pyx_kp_b__92;
 static PyObject *__pyx_kp_b__93;
-static PyObject *__pyx_kp_b__95;
-static PyObject *__pyx_kp_b__97;
-static PyObject *__pyx_kp_b__99;
+static PyObject *__pyx_kp_b__94;
+static PyObject *__pyx_kp_b__96;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_kp_s_d;
 static PyObject *__pyx_n_s_encode;
@@ -1472,6 +1745,7 @@ static PyObject *__pyx_n_s_update;
 static PyObject *__pyx_kp_s_utf_8;
 static PyObject *__pyx_n_s_value;
 static PyObject *__pyx_n_s_write;
+static PyObject *__pyx_n_s_write_segment;
 static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit__(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_stream); /* proto */
 static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_2pack(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_4pack_list_stream_header(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *__pyx_v_self); /* proto */
@@ -1485,6 +1759,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
 static PyObject *__pyx_tp_new_7neobolt_4impl_6python_10packstream_7_packer_Packer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_int_128;
 static PyObject *__pyx_int_256;
+static PyObject *__pyx_int_16384;
 static PyObject *__pyx_int_32768;
 static PyObject *__pyx_int_65536;
 static PyObject *__pyx_int_2147483648;
@@ -1495,109 +1770,19 @@ static PyObject *__pyx_int_neg_128;
 static PyObject *__pyx_int_neg_32768;
 static PyObject *__pyx_int_neg_2147483648;
 static PyObject *__pyx_int_neg_9223372036854775808;
-static PyObject *__pyx_tuple__2;
-static PyObject *__pyx_tuple__4;
-static PyObject *__pyx_tuple__6;
-static PyObject *__pyx_tuple__8;
-static PyObject *__pyx_tuple__10;
-static PyObject *__pyx_tuple__12;
-static PyObject *__pyx_tuple__14;
-static PyObject *__pyx_tuple__16;
-static PyObject *__pyx_tuple__17;
-static PyObject *__pyx_tuple__18;
-static PyObject *__pyx_tuple__20;
-static PyObject *__pyx_tuple__22;
-static PyObject *__pyx_tuple__24;
-static PyObject *__pyx_tuple__25;
-static PyObject *__pyx_tuple__27;
-static PyObject *__pyx_tuple__29;
-static PyObject *__pyx_tuple__31;
+static PyObject *__pyx_tuple__9;
+static PyObject *__pyx_tuple__13;
 static PyObject *__pyx_tuple__33;
-static PyObject *__pyx_tuple__35;
-static PyObject *__pyx_tuple__37;
-static PyObject *__pyx_tuple__39;
-static PyObject *__pyx_tuple__41;
-static PyObject *__pyx_tuple__43;
-static PyObject *__pyx_tuple__45;
-static PyObject *__pyx_tuple__47;
-static PyObject *__pyx_tuple__49;
-static PyObject *__pyx_tuple__51;
 static PyObject *__pyx_tuple__53;
-static PyObject *__pyx_tuple__55;
-static PyObject *__pyx_tuple__57;
-static PyObject *__pyx_tuple__59;
-static PyObject *__pyx_tuple__61;
-static PyObject *__pyx_tuple__63;
-static PyObject *__pyx_tuple__64;
-static PyObject *__pyx_tuple__66;
-static PyObject *__pyx_tuple__68;
-static PyObject *__pyx_tuple__70;
-static PyObject *__pyx_tuple__72;
 static PyObject *__pyx_tuple__74;
 static PyObject *__pyx_tuple__76;
-static PyObject *__pyx_tuple__78;
-static PyObject *__pyx_tuple__80;
-static PyObject *__pyx_tuple__82;
-static PyObject *__pyx_tuple__84;
-static PyObject *__pyx_tuple__86;
-static PyObject *__pyx_tuple__88;
-static PyObject *__pyx_tuple__90;
-static PyObject *__pyx_tuple__92;
-static PyObject *__pyx_tuple__94;
-static PyObject *__pyx_tuple__96;
+static PyObject *__pyx_tuple__95;
+static PyObject *__pyx_tuple__97;
 static PyObject *__pyx_tuple__98;
-static PyObject *__pyx_tuple__100;
-static PyObject *__pyx_tuple__102;
-static PyObject *__pyx_tuple__103;
-static PyObject *__pyx_tuple__105;
-static PyObject *__pyx_tuple__107;
-static PyObject *__pyx_tuple__109;
-static PyObject *__pyx_tuple__111;
-static PyObject *__pyx_tuple__113;
-static PyObject *__pyx_tuple__115;
-static PyObject *__pyx_tuple__117;
-static PyObject *__pyx_tuple__119;
-static PyObject *__pyx_tuple__121;
-static PyObject *__pyx_tuple__123;
-static PyObject *__pyx_tuple__125;
-static PyObject *__pyx_tuple__127;
-static PyObject *__pyx_tuple__129;
-static PyObject *__pyx_tuple__131;
-static PyObject *__pyx_tuple__133;
-static PyObject *__pyx_tuple__135;
-static PyObject *__pyx_tuple__137;
-static PyObject *__pyx_tuple__139;
-static PyObject *__pyx_tuple__141;
-static PyObject *__pyx_tuple__143;
-static PyObject *__pyx_tuple__144;
-static PyObject *__pyx_tuple__146;
-static PyObject *__pyx_tuple__147;
-static PyObject *__pyx_tuple__149;
-static PyObject *__pyx_tuple__151;
-static PyObject *__pyx_tuple__153;
-static PyObject *__pyx_tuple__155;
-static PyObject *__pyx_tuple__157;
-static PyObject *__pyx_tuple__159;
-static PyObject *__pyx_tuple__161;
-static PyObject *__pyx_tuple__163;
-static PyObject *__pyx_tuple__165;
-static PyObject *__pyx_tuple__167;
-static PyObject *__pyx_tuple__169;
-static PyObject *__pyx_tuple__171;
-static PyObject *__pyx_tuple__173;
-static PyObject *__pyx_tuple__175;
-static PyObject *__pyx_tuple__177;
-static PyObject *__pyx_tuple__179;
-static PyObject *__pyx_tuple__181;
-static PyObject *__pyx_tuple__183;
-static PyObject *__pyx_tuple__184;
-static PyObject *__pyx_tuple__186;
-static PyObject *__pyx_tuple__187;
-static PyObject *__pyx_tuple__188;
 /* Late includes */
 
-/* "neobolt/impl/python/packstream/_packer.pyx":53
- *     cdef _write
+/* "neobolt/impl/python/packstream/_packer.pyx":58
+ *     cdef _write_segment
  * 
  *     def __cinit__(self, stream):             # <<<<<<<<<<<<<<
  *         self.supports_bytes = False
@@ -1608,6 +1793,9 @@ static PyObject *__pyx_tuple__188;
 static int __pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static int __pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_stream = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
@@ -1630,7 +1818,7 @@ static int __pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1__cini
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 53, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 58, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 1) {
       goto __pyx_L5_argtuple_error;
@@ -1641,7 +1829,7 @@ static int __pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1__cini
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 53, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 1, 1, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 58, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("neobolt.impl.python.packstream._packer.Packer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1658,9 +1846,13 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":54
+  /* "neobolt/impl/python/packstream/_packer.pyx":59
  * 
  *     def __cinit__(self, stream):
  *         self.supports_bytes = False             # <<<<<<<<<<<<<<
@@ -1669,12 +1861,12 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
  */
   __pyx_v_self->supports_bytes = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":55
+  /* "neobolt/impl/python/packstream/_packer.pyx":60
  *     def __cinit__(self, stream):
  *         self.supports_bytes = False
  *         self.stream = stream             # <<<<<<<<<<<<<<
  *         self._write = self.stream.write
- * 
+ *         self._write_segment = getattr(self.stream, "write_segment", None)
  */
   __Pyx_INCREF(__pyx_v_stream);
   __Pyx_GIVEREF(__pyx_v_stream);
@@ -1682,14 +1874,14 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
   __Pyx_DECREF(__pyx_v_self->stream);
   __pyx_v_self->stream = __pyx_v_stream;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":56
+  /* "neobolt/impl/python/packstream/_packer.pyx":61
  *         self.supports_bytes = False
  *         self.stream = stream
  *         self._write = self.stream.write             # <<<<<<<<<<<<<<
+ *         self._write_segment = getattr(self.stream, "write_segment", None)
  * 
- *     cdef pack_raw(self, data):
  */
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->stream, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->stream, __pyx_n_s_write); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF(__pyx_v_self->_write);
@@ -1697,8 +1889,26 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
   __pyx_v_self->_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":53
- *     cdef _write
+  /* "neobolt/impl/python/packstream/_packer.pyx":62
+ *         self.stream = stream
+ *         self._write = self.stream.write
+ *         self._write_segment = getattr(self.stream, "write_segment", None)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef pack_raw(self, data):
+ */
+  __pyx_t_1 = __pyx_v_self->stream;
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_GetAttr3(__pyx_t_1, __pyx_n_s_write_segment, Py_None); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->_write_segment);
+  __Pyx_DECREF(__pyx_v_self->_write_segment);
+  __pyx_v_self->_write_segment = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "neobolt/impl/python/packstream/_packer.pyx":58
+ *     cdef _write_segment
  * 
  *     def __cinit__(self, stream):             # <<<<<<<<<<<<<<
  *         self.supports_bytes = False
@@ -1710,6 +1920,7 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_AddTraceback("neobolt.impl.python.packstream._packer.Packer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
@@ -1717,92 +1928,132 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer___cinit
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":58
- *         self._write = self.stream.write
+/* "neobolt/impl/python/packstream/_packer.pyx":64
+ *         self._write_segment = getattr(self.stream, "write_segment", None)
  * 
  *     cdef pack_raw(self, data):             # <<<<<<<<<<<<<<
- *         self._write(data)
- * 
+ *         if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:
+ *             self._write_segment(data)
  */
 
 static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_raw(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_data) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_raw", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":59
+  /* "neobolt/impl/python/packstream/_packer.pyx":65
  * 
  *     cdef pack_raw(self, data):
- *         self._write(data)             # <<<<<<<<<<<<<<
- * 
- *     cpdef pack(self, value):
+ *         if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:             # <<<<<<<<<<<<<<
+ *             self._write_segment(data)
+ *         else:
  */
-  __Pyx_INCREF(__pyx_v_self->_write);
-  __pyx_t_2 = __pyx_v_self->_write; __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  if (!__pyx_t_3) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_data); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__pyx_v_self->_write_segment != Py_None);
+  __pyx_t_3 = (__pyx_t_2 != 0);
+  if (__pyx_t_3) {
   } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_data};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_v_data};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else
-    #endif
-    {
-      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 59, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3); __pyx_t_3 = NULL;
-      __Pyx_INCREF(__pyx_v_data);
-      __Pyx_GIVEREF(__pyx_v_data);
-      PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_data);
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_1 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_4 = PyObject_Length(__pyx_v_data); if (unlikely(__pyx_t_4 == ((Py_ssize_t)-1))) __PYX_ERR(0, 65, __pyx_L1_error)
+  __pyx_t_5 = PyInt_FromSsize_t(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = PyObject_RichCompare(__pyx_t_5, __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_MIN_SEGMENT_SIZE, Py_GE); __Pyx_XGOTREF(__pyx_t_6); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_6); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 65, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_1 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "neobolt/impl/python/packstream/_packer.pyx":66
+ *     cdef pack_raw(self, data):
+ *         if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:
+ *             self._write_segment(data)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self._write(data)
+ */
+    __Pyx_INCREF(__pyx_v_self->_write_segment);
+    __pyx_t_5 = __pyx_v_self->_write_segment; __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
     }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_6 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_v_data) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_data);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 66, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":58
- *         self._write = self.stream.write
- * 
- *     cdef pack_raw(self, data):             # <<<<<<<<<<<<<<
- *         self._write(data)
+    /* "neobolt/impl/python/packstream/_packer.pyx":65
  * 
+ *     cdef pack_raw(self, data):
+ *         if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:             # <<<<<<<<<<<<<<
+ *             self._write_segment(data)
+ *         else:
  */
+    goto __pyx_L3;
+  }
 
-  /* function exit code */
+  /* "neobolt/impl/python/packstream/_packer.pyx":68
+ *             self._write_segment(data)
+ *         else:
+ *             self._write(data)             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef pack(self, value):
+ */
+  /*else*/ {
+    __Pyx_INCREF(__pyx_v_self->_write);
+    __pyx_t_5 = __pyx_v_self->_write; __pyx_t_7 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
+      }
+    }
+    __pyx_t_6 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_7, __pyx_v_data) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_data);
+    __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 68, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  }
+  __pyx_L3:;
+
+  /* "neobolt/impl/python/packstream/_packer.pyx":64
+ *         self._write_segment = getattr(self.stream, "write_segment", None)
+ * 
+ *     cdef pack_raw(self, data):             # <<<<<<<<<<<<<<
+ *         if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:
+ *             self._write_segment(data)
+ */
+
+  /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_AddTraceback("neobolt.impl.python.packstream._packer.Packer.pack_raw", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -1811,8 +2062,8 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":61
- *         self._write(data)
+/* "neobolt/impl/python/packstream/_packer.pyx":70
+ *             self._write(data)
  * 
  *     cpdef pack(self, value):             # <<<<<<<<<<<<<<
  *         return self._pack(value)
@@ -1827,69 +2078,58 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_3pack)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_3pack)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
-      }
-      if (!__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_value); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_value) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_value);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 70, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_value};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_v_value};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          __Pyx_GOTREF(__pyx_t_2);
-        } else
-        #endif
-        {
-          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 61, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-          __Pyx_INCREF(__pyx_v_value);
-          __Pyx_GIVEREF(__pyx_v_value);
-          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_v_value);
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 61, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        }
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":62
+  /* "neobolt/impl/python/packstream/_packer.pyx":71
  * 
  *     cpdef pack(self, value):
  *         return self._pack(value)             # <<<<<<<<<<<<<<
@@ -1897,14 +2137,14 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *     cdef _pack(self, value):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":61
- *         self._write(data)
+  /* "neobolt/impl/python/packstream/_packer.pyx":70
+ *             self._write(data)
  * 
  *     cpdef pack(self, value):             # <<<<<<<<<<<<<<
  *         return self._pack(value)
@@ -1917,7 +2157,6 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("neobolt.impl.python.packstream._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
@@ -1943,9 +2182,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_2
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack(__pyx_v_self, __pyx_v_value, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 61, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack(__pyx_v_self, __pyx_v_value, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -1962,7 +2204,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_2
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":64
+/* "neobolt/impl/python/packstream/_packer.pyx":73
  *         return self._pack(value)
  * 
  *     cdef _pack(self, value):             # <<<<<<<<<<<<<<
@@ -1988,9 +2230,12 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   Py_ssize_t __pyx_t_9;
   PyObject *(*__pyx_t_10)(PyObject *);
   PyObject *(*__pyx_t_11)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_pack", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":65
+  /* "neobolt/impl/python/packstream/_packer.pyx":74
  * 
  *     cdef _pack(self, value):
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -2002,7 +2247,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_v_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":68
+  /* "neobolt/impl/python/packstream/_packer.pyx":77
  * 
  *         # None
  *         if value is None:             # <<<<<<<<<<<<<<
@@ -2013,18 +2258,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":69
+    /* "neobolt/impl/python/packstream/_packer.pyx":78
  *         # None
  *         if value is None:
  *             write(b"\xC0")  # NULL             # <<<<<<<<<<<<<<
  * 
  *         # Boolean
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 69, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_b_) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b_);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 78, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":68
+    /* "neobolt/impl/python/packstream/_packer.pyx":77
  * 
  *         # None
  *         if value is None:             # <<<<<<<<<<<<<<
@@ -2034,7 +2293,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":72
+  /* "neobolt/impl/python/packstream/_packer.pyx":81
  * 
  *         # Boolean
  *         elif value is True:             # <<<<<<<<<<<<<<
@@ -2045,18 +2304,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":73
+    /* "neobolt/impl/python/packstream/_packer.pyx":82
  *         # Boolean
  *         elif value is True:
  *             write(b"\xC3")             # <<<<<<<<<<<<<<
  *         elif value is False:
  *             write(b"\xC2")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_b__2) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b__2);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 82, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":72
+    /* "neobolt/impl/python/packstream/_packer.pyx":81
  * 
  *         # Boolean
  *         elif value is True:             # <<<<<<<<<<<<<<
@@ -2066,7 +2339,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":74
+  /* "neobolt/impl/python/packstream/_packer.pyx":83
  *         elif value is True:
  *             write(b"\xC3")
  *         elif value is False:             # <<<<<<<<<<<<<<
@@ -2077,18 +2350,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":75
+    /* "neobolt/impl/python/packstream/_packer.pyx":84
  *             write(b"\xC3")
  *         elif value is False:
  *             write(b"\xC2")             # <<<<<<<<<<<<<<
  * 
  *         # Float (only double precision is supported)
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_b__3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b__3);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":74
+    /* "neobolt/impl/python/packstream/_packer.pyx":83
  *         elif value is True:
  *             write(b"\xC3")
  *         elif value is False:             # <<<<<<<<<<<<<<
@@ -2098,7 +2385,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":78
+  /* "neobolt/impl/python/packstream/_packer.pyx":87
  * 
  *         # Float (only double precision is supported)
  *         elif isinstance(value, float):             # <<<<<<<<<<<<<<
@@ -2109,25 +2396,39 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":79
+    /* "neobolt/impl/python/packstream/_packer.pyx":88
  *         # Float (only double precision is supported)
  *         elif isinstance(value, float):
  *             write(b"\xC1")             # <<<<<<<<<<<<<<
  *             write(struct_pack(">d", value))
  * 
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_b__4) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b__4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":80
+    /* "neobolt/impl/python/packstream/_packer.pyx":89
  *         elif isinstance(value, float):
  *             write(b"\xC1")
  *             write(struct_pack(">d", value))             # <<<<<<<<<<<<<<
  * 
  *         # Integer
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 80, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 89, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
@@ -2144,7 +2445,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_d, __pyx_v_value};
-      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 80, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_4);
     } else
@@ -2152,13 +2453,13 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     #if CYTHON_FAST_PYCCALL
     if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
       PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_d, __pyx_v_value};
-      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 80, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_4);
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 80, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
       if (__pyx_t_6) {
         __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
@@ -2169,7 +2470,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       __Pyx_INCREF(__pyx_v_value);
       __Pyx_GIVEREF(__pyx_v_value);
       PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_v_value);
-      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 80, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 89, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
@@ -2185,45 +2486,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
         __Pyx_DECREF_SET(__pyx_t_5, function);
       }
     }
-    if (!__pyx_t_8) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 80, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 80, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_8, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":78
+    /* "neobolt/impl/python/packstream/_packer.pyx":87
  * 
  *         # Float (only double precision is supported)
  *         elif isinstance(value, float):             # <<<<<<<<<<<<<<
@@ -2233,7 +2504,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":83
+  /* "neobolt/impl/python/packstream/_packer.pyx":92
  * 
  *         # Integer
  *         elif isinstance(value, int):             # <<<<<<<<<<<<<<
@@ -2244,87 +2515,57 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":84
+    /* "neobolt/impl/python/packstream/_packer.pyx":93
  *         # Integer
  *         elif isinstance(value, int):
  *             if -0x10 <= value < 0x80:             # <<<<<<<<<<<<<<
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x80 <= value < -0x10:
  */
-    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_16, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_16, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
     if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
       __Pyx_DECREF(__pyx_t_1);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_128, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_128, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 84, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 93, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (__pyx_t_3) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":85
+      /* "neobolt/impl/python/packstream/_packer.pyx":94
  *         elif isinstance(value, int):
  *             if -0x10 <= value < 0x80:
  *                 write(PACKED_UINT_8[value % 0x100])             # <<<<<<<<<<<<<<
  *             elif -0x80 <= value < -0x10:
  *                 write(b"\xC8")
  */
-      __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 85, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_6 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_256, 0x100, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 85, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_t_5, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_256, 0x100, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = __Pyx_PyObject_GetItem(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 94, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_INCREF(__pyx_v_write);
-      __pyx_t_6 = __pyx_v_write; __pyx_t_5 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+      __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
         if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
           __Pyx_INCREF(__pyx_t_5);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-        }
-      }
-      if (!__pyx_t_5) {
-        __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_6)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_8 = PyTuple_New(1+1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 85, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_8);
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5); __pyx_t_5 = NULL;
-          __Pyx_GIVEREF(__pyx_t_4);
-          PyTuple_SET_ITEM(__pyx_t_8, 0+1, __pyx_t_4);
-          __pyx_t_4 = 0;
-          __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 85, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+          __Pyx_DECREF_SET(__pyx_t_4, function);
         }
       }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_8);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":84
+      /* "neobolt/impl/python/packstream/_packer.pyx":93
  *         # Integer
  *         elif isinstance(value, int):
  *             if -0x10 <= value < 0x80:             # <<<<<<<<<<<<<<
@@ -2334,98 +2575,82 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L4;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":86
+    /* "neobolt/impl/python/packstream/_packer.pyx":95
  *             if -0x10 <= value < 0x80:
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x80 <= value < -0x10:             # <<<<<<<<<<<<<<
  *                 write(b"\xC8")
  *                 write(PACKED_UINT_8[value % 0x100])
  */
-    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_128, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_128, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
     if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
       __Pyx_DECREF(__pyx_t_1);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_neg_16, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 86, __pyx_L1_error)
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_neg_16, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 86, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 95, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (__pyx_t_3) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":87
+      /* "neobolt/impl/python/packstream/_packer.pyx":96
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x80 <= value < -0x10:
  *                 write(b"\xC8")             # <<<<<<<<<<<<<<
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x8000 <= value < 0x8000:
  */
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_INCREF(__pyx_v_write);
+      __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_8);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_kp_b__5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b__5);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":88
+      /* "neobolt/impl/python/packstream/_packer.pyx":97
  *             elif -0x80 <= value < -0x10:
  *                 write(b"\xC8")
  *                 write(PACKED_UINT_8[value % 0x100])             # <<<<<<<<<<<<<<
  *             elif -0x8000 <= value < 0x8000:
  *                 write(b"\xC9")
  */
-      __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 88, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_8 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_256, 0x100, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 88, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 88, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_8 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_256, 0x100, 0, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_4, __pyx_t_8); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_INCREF(__pyx_v_write);
-      __pyx_t_8 = __pyx_v_write; __pyx_t_6 = NULL;
+      __pyx_t_8 = __pyx_v_write; __pyx_t_4 = NULL;
       if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
-        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_8);
-        if (likely(__pyx_t_6)) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_4)) {
           PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
-          __Pyx_INCREF(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_4);
           __Pyx_INCREF(function);
           __Pyx_DECREF_SET(__pyx_t_8, function);
         }
       }
-      if (!__pyx_t_6) {
-        __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_8)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 88, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_6); __pyx_t_6 = NULL;
-          __Pyx_GIVEREF(__pyx_t_4);
-          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_4);
-          __pyx_t_4 = 0;
-          __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 88, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        }
-      }
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":86
+      /* "neobolt/impl/python/packstream/_packer.pyx":95
  *             if -0x10 <= value < 0x80:
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x80 <= value < -0x10:             # <<<<<<<<<<<<<<
@@ -2435,45 +2660,59 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L4;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":89
+    /* "neobolt/impl/python/packstream/_packer.pyx":98
  *                 write(b"\xC8")
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x8000 <= value < 0x8000:             # <<<<<<<<<<<<<<
  *                 write(b"\xC9")
  *                 write(PACKED_UINT_16[value % 0x10000])
  */
-    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_32768, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_32768, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
     if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
       __Pyx_DECREF(__pyx_t_1);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_32768, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_32768, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 89, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 98, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (__pyx_t_3) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":90
+      /* "neobolt/impl/python/packstream/_packer.pyx":99
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x8000 <= value < 0x8000:
  *                 write(b"\xC9")             # <<<<<<<<<<<<<<
  *                 write(PACKED_UINT_16[value % 0x10000])
  *             elif -0x80000000 <= value < 0x80000000:
  */
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
+      __Pyx_INCREF(__pyx_v_write);
+      __pyx_t_8 = __pyx_v_write; __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_8))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_8);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_8, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_5, __pyx_kp_b__6) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_kp_b__6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":91
+      /* "neobolt/impl/python/packstream/_packer.pyx":100
  *             elif -0x8000 <= value < 0x8000:
  *                 write(b"\xC9")
  *                 write(PACKED_UINT_16[value % 0x10000])             # <<<<<<<<<<<<<<
  *             elif -0x80000000 <= value < 0x80000000:
  *                 write(b"\xCA")
  */
-      __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_5 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_65536, 0x10000, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyInt_RemainderObjC(__pyx_v_value, __pyx_int_65536, 0x10000, 0, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
-      __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 91, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyObject_GetItem(__pyx_t_8, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 100, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
@@ -2488,45 +2727,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
           __Pyx_DECREF_SET(__pyx_t_5, function);
         }
       }
-      if (!__pyx_t_8) {
-        __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_5)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_4};
-          __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 91, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-          __Pyx_GIVEREF(__pyx_t_4);
-          PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-          __pyx_t_4 = 0;
-          __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 91, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        }
-      }
+      __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_8, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":89
+      /* "neobolt/impl/python/packstream/_packer.pyx":98
  *                 write(b"\xC8")
  *                 write(PACKED_UINT_8[value % 0x100])
  *             elif -0x8000 <= value < 0x8000:             # <<<<<<<<<<<<<<
@@ -2536,137 +2745,121 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L4;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":92
+    /* "neobolt/impl/python/packstream/_packer.pyx":101
  *                 write(b"\xC9")
  *                 write(PACKED_UINT_16[value % 0x10000])
  *             elif -0x80000000 <= value < 0x80000000:             # <<<<<<<<<<<<<<
  *                 write(b"\xCA")
  *                 write(struct_pack(">i", value))
  */
-    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_2147483648, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_int_neg_2147483648, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
     if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
       __Pyx_DECREF(__pyx_t_1);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_2147483648, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_int_2147483648, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 92, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 101, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (__pyx_t_3) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":93
+      /* "neobolt/impl/python/packstream/_packer.pyx":102
  *                 write(PACKED_UINT_16[value % 0x10000])
  *             elif -0x80000000 <= value < 0x80000000:
  *                 write(b"\xCA")             # <<<<<<<<<<<<<<
  *                 write(struct_pack(">i", value))
  *             elif INT64_LO <= value < INT64_HI:
  */
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-      /* "neobolt/impl/python/packstream/_packer.pyx":94
+      __Pyx_INCREF(__pyx_v_write);
+      __pyx_t_5 = __pyx_v_write; __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_5, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_kp_b__7) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_kp_b__7);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+      /* "neobolt/impl/python/packstream/_packer.pyx":103
  *             elif -0x80000000 <= value < 0x80000000:
  *                 write(b"\xCA")
  *                 write(struct_pack(">i", value))             # <<<<<<<<<<<<<<
  *             elif INT64_LO <= value < INT64_HI:
  *                 write(b"\xCB")
  */
-      __pyx_t_6 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 94, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_4 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 103, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_8 = NULL;
       __pyx_t_7 = 0;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_4);
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_8)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_8);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
           __pyx_t_7 = 1;
         }
       }
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_6)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_i, __pyx_v_value};
-        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (PyFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_s_i, __pyx_v_value};
+        __pyx_t_5 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_i, __pyx_v_value};
-        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_8, __pyx_kp_s_i, __pyx_v_value};
+        __pyx_t_5 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
         __Pyx_GOTREF(__pyx_t_5);
       } else
       #endif
       {
-        __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 94, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        if (__pyx_t_4) {
-          __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+        __pyx_t_6 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 103, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        if (__pyx_t_8) {
+          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
         }
         __Pyx_INCREF(__pyx_kp_s_i);
         __Pyx_GIVEREF(__pyx_kp_s_i);
-        PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_i);
+        PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_7, __pyx_kp_s_i);
         __Pyx_INCREF(__pyx_v_value);
         __Pyx_GIVEREF(__pyx_v_value);
-        PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_v_value);
-        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_8, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 94, __pyx_L1_error)
+        PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_7, __pyx_v_value);
+        __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_6, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_INCREF(__pyx_v_write);
-      __pyx_t_6 = __pyx_v_write; __pyx_t_8 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_8)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_8);
+      __pyx_t_4 = __pyx_v_write; __pyx_t_6 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_6);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
-        }
-      }
-      if (!__pyx_t_8) {
-        __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_6, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_6)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_5};
-          __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_5};
-          __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 94, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
-          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_8); __pyx_t_8 = NULL;
-          __Pyx_GIVEREF(__pyx_t_5);
-          PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_5);
-          __pyx_t_5 = 0;
-          __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF_SET(__pyx_t_4, function);
         }
       }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":92
+      /* "neobolt/impl/python/packstream/_packer.pyx":101
  *                 write(b"\xC9")
  *                 write(PACKED_UINT_16[value % 0x10000])
  *             elif -0x80000000 <= value < 0x80000000:             # <<<<<<<<<<<<<<
@@ -2676,75 +2869,89 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L4;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":95
+    /* "neobolt/impl/python/packstream/_packer.pyx":104
  *                 write(b"\xCA")
  *                 write(struct_pack(">i", value))
  *             elif INT64_LO <= value < INT64_HI:             # <<<<<<<<<<<<<<
  *                 write(b"\xCB")
  *                 write(struct_pack(">q", value))
  */
-    __pyx_t_1 = PyObject_RichCompare(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __pyx_t_1 = PyObject_RichCompare(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO, __pyx_v_value, Py_LE); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
     if (__Pyx_PyObject_IsTrue(__pyx_t_1)) {
       __Pyx_DECREF(__pyx_t_1);
-      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_HI, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
+      __pyx_t_1 = PyObject_RichCompare(__pyx_v_value, __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_HI, Py_LT); __Pyx_XGOTREF(__pyx_t_1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 95, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_1); if (unlikely(__pyx_t_3 < 0)) __PYX_ERR(0, 104, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     if (likely(__pyx_t_3)) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":96
+      /* "neobolt/impl/python/packstream/_packer.pyx":105
  *                 write(struct_pack(">i", value))
  *             elif INT64_LO <= value < INT64_HI:
  *                 write(b"\xCB")             # <<<<<<<<<<<<<<
  *                 write(struct_pack(">q", value))
  *             else:
  */
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 96, __pyx_L1_error)
+      __Pyx_INCREF(__pyx_v_write);
+      __pyx_t_4 = __pyx_v_write; __pyx_t_5 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+        }
+      }
+      __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_kp_b__8) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_kp_b__8);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":97
+      /* "neobolt/impl/python/packstream/_packer.pyx":106
  *             elif INT64_LO <= value < INT64_HI:
  *                 write(b"\xCB")
  *                 write(struct_pack(">q", value))             # <<<<<<<<<<<<<<
  *             else:
  *                 raise OverflowError("Integer %s out of range" % value)
  */
-      __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 97, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_5 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = NULL;
       __pyx_t_7 = 0;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-        if (likely(__pyx_t_5)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-          __Pyx_INCREF(__pyx_t_5);
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+          __Pyx_INCREF(__pyx_t_6);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
+          __Pyx_DECREF_SET(__pyx_t_5, function);
           __pyx_t_7 = 1;
         }
       }
       #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_s_q, __pyx_v_value};
-        __pyx_t_6 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_6);
+      if (PyFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_q, __pyx_v_value};
+        __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
       } else
       #endif
       #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_kp_s_q, __pyx_v_value};
-        __pyx_t_6 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_6);
+      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
+        PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_q, __pyx_v_value};
+        __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_GOTREF(__pyx_t_4);
       } else
       #endif
       {
-        __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 97, __pyx_L1_error)
+        __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 106, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_8);
-        if (__pyx_t_5) {
-          __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5); __pyx_t_5 = NULL;
+        if (__pyx_t_6) {
+          __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
         }
         __Pyx_INCREF(__pyx_kp_s_q);
         __Pyx_GIVEREF(__pyx_kp_s_q);
@@ -2752,61 +2959,31 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
         __Pyx_INCREF(__pyx_v_value);
         __Pyx_GIVEREF(__pyx_v_value);
         PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_v_value);
-        __pyx_t_6 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
       }
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_INCREF(__pyx_v_write);
-      __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
-      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
-        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
+      __pyx_t_5 = __pyx_v_write; __pyx_t_8 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+        __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
         if (likely(__pyx_t_8)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
           __Pyx_INCREF(__pyx_t_8);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_4, function);
-        }
-      }
-      if (!__pyx_t_8) {
-        __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-      } else {
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_4)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_6};
-          __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
-          PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_6};
-          __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 97, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_8); __pyx_t_8 = NULL;
-          __Pyx_GIVEREF(__pyx_t_6);
-          PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-          __pyx_t_6 = 0;
-          __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF_SET(__pyx_t_5, function);
         }
       }
+      __pyx_t_1 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_8, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4);
+      __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":95
+      /* "neobolt/impl/python/packstream/_packer.pyx":104
  *                 write(b"\xCA")
  *                 write(struct_pack(">i", value))
  *             elif INT64_LO <= value < INT64_HI:             # <<<<<<<<<<<<<<
@@ -2816,7 +2993,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L4;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":99
+    /* "neobolt/impl/python/packstream/_packer.pyx":108
  *                 write(struct_pack(">q", value))
  *             else:
  *                 raise OverflowError("Integer %s out of range" % value)             # <<<<<<<<<<<<<<
@@ -2824,18 +3001,18 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  *         # String
  */
     /*else*/ {
-      __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_Integer_s_out_of_range, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_Integer_s_out_of_range, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_OverflowError, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 99, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_builtin_OverflowError, __pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 108, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __PYX_ERR(0, 99, __pyx_L1_error)
+      __Pyx_Raise(__pyx_t_5, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __PYX_ERR(0, 108, __pyx_L1_error)
     }
     __pyx_L4:;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":83
+    /* "neobolt/impl/python/packstream/_packer.pyx":92
  * 
  *         # Integer
  *         elif isinstance(value, int):             # <<<<<<<<<<<<<<
@@ -2845,7 +3022,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":102
+  /* "neobolt/impl/python/packstream/_packer.pyx":111
  * 
  *         # String
  *         elif isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -2856,7 +3033,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":103
+    /* "neobolt/impl/python/packstream/_packer.pyx":112
  *         # String
  *         elif isinstance(value, str):
  *             if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -2867,7 +3044,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     __pyx_t_3 = (__pyx_t_2 != 0);
     if (__pyx_t_3) {
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":104
+      /* "neobolt/impl/python/packstream/_packer.pyx":113
  *         elif isinstance(value, str):
  *             if isinstance(value, bytes):
  *                 value_bytes = value             # <<<<<<<<<<<<<<
@@ -2877,7 +3054,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       __Pyx_INCREF(__pyx_v_value);
       __pyx_v_value_bytes = __pyx_v_value;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":103
+      /* "neobolt/impl/python/packstream/_packer.pyx":112
  *         # String
  *         elif isinstance(value, str):
  *             if isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -2887,7 +3064,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
       goto __pyx_L5;
     }
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":106
+    /* "neobolt/impl/python/packstream/_packer.pyx":115
  *                 value_bytes = value
  *             else:
  *                 value_bytes = value.encode("utf-8")             # <<<<<<<<<<<<<<
@@ -2895,40 +3072,52 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  *             self.pack_raw(value_bytes)
  */
     /*else*/ {
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 106, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 106, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_encode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_v_value_bytes = __pyx_t_1;
-      __pyx_t_1 = 0;
+      __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_1, function);
+        }
+      }
+      __pyx_t_5 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_kp_s_utf_8) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_s_utf_8);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_v_value_bytes = __pyx_t_5;
+      __pyx_t_5 = 0;
     }
     __pyx_L5:;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":107
+    /* "neobolt/impl/python/packstream/_packer.pyx":116
  *             else:
  *                 value_bytes = value.encode("utf-8")
  *             self.pack_string_header(len(value_bytes))             # <<<<<<<<<<<<<<
  *             self.pack_raw(value_bytes)
  * 
  */
-    __pyx_t_9 = PyObject_Length(__pyx_v_value_bytes); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 107, __pyx_L1_error)
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_string_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 107, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = PyObject_Length(__pyx_v_value_bytes); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 116, __pyx_L1_error)
+    __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_string_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 116, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":108
+    /* "neobolt/impl/python/packstream/_packer.pyx":117
  *                 value_bytes = value.encode("utf-8")
  *             self.pack_string_header(len(value_bytes))
  *             self.pack_raw(value_bytes)             # <<<<<<<<<<<<<<
  * 
  *         # Bytes (deliberately listed after String since in
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_v_value_bytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 108, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_v_value_bytes); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":102
+    /* "neobolt/impl/python/packstream/_packer.pyx":111
  * 
  *         # String
  *         elif isinstance(value, str):             # <<<<<<<<<<<<<<
@@ -2938,7 +3127,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":112
+  /* "neobolt/impl/python/packstream/_packer.pyx":121
  *         # Bytes (deliberately listed after String since in
  *         # Python 2, bytes should be treated as a String)
  *         elif isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -2949,30 +3138,30 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":113
+    /* "neobolt/impl/python/packstream/_packer.pyx":122
  *         # Python 2, bytes should be treated as a String)
  *         elif isinstance(value, bytes):
  *             self.pack_bytes_header(len(value))             # <<<<<<<<<<<<<<
  *             self.pack_raw(value)
  *         elif isinstance(value, bytearray):
  */
-    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 113, __pyx_L1_error)
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_bytes_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 113, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 122, __pyx_L1_error)
+    __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_bytes_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":114
+    /* "neobolt/impl/python/packstream/_packer.pyx":123
  *         elif isinstance(value, bytes):
  *             self.pack_bytes_header(len(value))
  *             self.pack_raw(value)             # <<<<<<<<<<<<<<
  *         elif isinstance(value, bytearray):
  *             self.pack_bytes_header(len(value))
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_v_value); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 123, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":112
+    /* "neobolt/impl/python/packstream/_packer.pyx":121
  *         # Bytes (deliberately listed after String since in
  *         # Python 2, bytes should be treated as a String)
  *         elif isinstance(value, bytes):             # <<<<<<<<<<<<<<
@@ -2982,7 +3171,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":115
+  /* "neobolt/impl/python/packstream/_packer.pyx":124
  *             self.pack_bytes_header(len(value))
  *             self.pack_raw(value)
  *         elif isinstance(value, bytearray):             # <<<<<<<<<<<<<<
@@ -2993,33 +3182,33 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":116
+    /* "neobolt/impl/python/packstream/_packer.pyx":125
  *             self.pack_raw(value)
  *         elif isinstance(value, bytearray):
  *             self.pack_bytes_header(len(value))             # <<<<<<<<<<<<<<
  *             self.pack_raw(bytes(value))
  * 
  */
-    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 116, __pyx_L1_error)
-    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_bytes_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 116, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 125, __pyx_L1_error)
+    __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_bytes_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 125, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":117
+    /* "neobolt/impl/python/packstream/_packer.pyx":126
  *         elif isinstance(value, bytearray):
  *             self.pack_bytes_header(len(value))
  *             self.pack_raw(bytes(value))             # <<<<<<<<<<<<<<
  * 
  *         # List
  */
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyBytes_Type)), __pyx_v_value); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 126, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_raw(__pyx_v_self, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 117, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":115
+    /* "neobolt/impl/python/packstream/_packer.pyx":124
  *             self.pack_bytes_header(len(value))
  *             self.pack_raw(value)
  *         elif isinstance(value, bytearray):             # <<<<<<<<<<<<<<
@@ -3029,7 +3218,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":120
+  /* "neobolt/impl/python/packstream/_packer.pyx":129
  * 
  *         # List
  *         elif isinstance(value, list):             # <<<<<<<<<<<<<<
@@ -3040,19 +3229,19 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":121
+    /* "neobolt/impl/python/packstream/_packer.pyx":130
  *         # List
  *         elif isinstance(value, list):
  *             self.pack_list_header(len(value))             # <<<<<<<<<<<<<<
  *             for item in value:
  *                 self._pack(item)
  */
-    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 121, __pyx_L1_error)
-    __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_list_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 121, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 130, __pyx_L1_error)
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_list_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":122
+    /* "neobolt/impl/python/packstream/_packer.pyx":131
  *         elif isinstance(value, list):
  *             self.pack_list_header(len(value))
  *             for item in value:             # <<<<<<<<<<<<<<
@@ -3060,59 +3249,59 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  * 
  */
     if (likely(PyList_CheckExact(__pyx_v_value)) || PyTuple_CheckExact(__pyx_v_value)) {
-      __pyx_t_4 = __pyx_v_value; __Pyx_INCREF(__pyx_t_4); __pyx_t_9 = 0;
+      __pyx_t_1 = __pyx_v_value; __Pyx_INCREF(__pyx_t_1); __pyx_t_9 = 0;
       __pyx_t_10 = NULL;
     } else {
-      __pyx_t_9 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_value); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 122, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_10 = Py_TYPE(__pyx_t_4)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 122, __pyx_L1_error)
+      __pyx_t_9 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_value); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_10 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 131, __pyx_L1_error)
     }
     for (;;) {
       if (likely(!__pyx_t_10)) {
-        if (likely(PyList_CheckExact(__pyx_t_4))) {
-          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_4)) break;
+        if (likely(PyList_CheckExact(__pyx_t_1))) {
+          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_1)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 131, __pyx_L1_error)
           #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
           #endif
         } else {
-          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_4)) break;
+          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 122, __pyx_L1_error)
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_5); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 131, __pyx_L1_error)
           #else
-          __pyx_t_1 = PySequence_ITEM(__pyx_t_4, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_t_5 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
           #endif
         }
       } else {
-        __pyx_t_1 = __pyx_t_10(__pyx_t_4);
-        if (unlikely(!__pyx_t_1)) {
+        __pyx_t_5 = __pyx_t_10(__pyx_t_1);
+        if (unlikely(!__pyx_t_5)) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 122, __pyx_L1_error)
+            else __PYX_ERR(0, 131, __pyx_L1_error)
           }
           break;
         }
-        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_GOTREF(__pyx_t_5);
       }
-      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_1);
-      __pyx_t_1 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_5);
+      __pyx_t_5 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":123
+      /* "neobolt/impl/python/packstream/_packer.pyx":132
  *             self.pack_list_header(len(value))
  *             for item in value:
  *                 self._pack(item)             # <<<<<<<<<<<<<<
  * 
  *         # Map
  */
-      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_item); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 123, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_5 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_item); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 132, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":122
+      /* "neobolt/impl/python/packstream/_packer.pyx":131
  *         elif isinstance(value, list):
  *             self.pack_list_header(len(value))
  *             for item in value:             # <<<<<<<<<<<<<<
@@ -3120,9 +3309,9 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  * 
  */
     }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":120
+    /* "neobolt/impl/python/packstream/_packer.pyx":129
  * 
  *         # List
  *         elif isinstance(value, list):             # <<<<<<<<<<<<<<
@@ -3132,7 +3321,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":126
+  /* "neobolt/impl/python/packstream/_packer.pyx":135
  * 
  *         # Map
  *         elif isinstance(value, dict):             # <<<<<<<<<<<<<<
@@ -3143,159 +3332,156 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   __pyx_t_3 = (__pyx_t_2 != 0);
   if (__pyx_t_3) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":127
+    /* "neobolt/impl/python/packstream/_packer.pyx":136
  *         # Map
  *         elif isinstance(value, dict):
  *             self.pack_map_header(len(value))             # <<<<<<<<<<<<<<
  *             for key, item in value.items():
  *                 self._pack(key)
  */
-    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 127, __pyx_L1_error)
-    __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_map_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 127, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_9 = PyObject_Length(__pyx_v_value); if (unlikely(__pyx_t_9 == ((Py_ssize_t)-1))) __PYX_ERR(0, 136, __pyx_L1_error)
+    __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_map_header(__pyx_v_self, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":128
+    /* "neobolt/impl/python/packstream/_packer.pyx":137
  *         elif isinstance(value, dict):
  *             self.pack_map_header(len(value))
  *             for key, item in value.items():             # <<<<<<<<<<<<<<
  *                 self._pack(key)
  *                 self._pack(item)
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_items); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_5 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
-      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_1);
-      if (likely(__pyx_t_5)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
-        __Pyx_INCREF(__pyx_t_5);
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_items); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_1, function);
+        __Pyx_DECREF_SET(__pyx_t_5, function);
       }
     }
-    if (__pyx_t_5) {
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-    } else {
-      __pyx_t_4 = __Pyx_PyObject_CallNoArg(__pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
-    }
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    if (likely(PyList_CheckExact(__pyx_t_4)) || PyTuple_CheckExact(__pyx_t_4)) {
-      __pyx_t_1 = __pyx_t_4; __Pyx_INCREF(__pyx_t_1); __pyx_t_9 = 0;
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
+      __pyx_t_5 = __pyx_t_1; __Pyx_INCREF(__pyx_t_5); __pyx_t_9 = 0;
       __pyx_t_10 = NULL;
     } else {
-      __pyx_t_9 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_10 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 128, __pyx_L1_error)
+      __pyx_t_9 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_10 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 137, __pyx_L1_error)
     }
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     for (;;) {
       if (likely(!__pyx_t_10)) {
-        if (likely(PyList_CheckExact(__pyx_t_1))) {
-          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_1)) break;
+        if (likely(PyList_CheckExact(__pyx_t_5))) {
+          if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_5)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 128, __pyx_L1_error)
+          __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
           #else
-          __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
           #endif
         } else {
-          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
+          if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 128, __pyx_L1_error)
+          __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_9); __Pyx_INCREF(__pyx_t_1); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
           #else
-          __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
           #endif
         }
       } else {
-        __pyx_t_4 = __pyx_t_10(__pyx_t_1);
-        if (unlikely(!__pyx_t_4)) {
+        __pyx_t_1 = __pyx_t_10(__pyx_t_5);
+        if (unlikely(!__pyx_t_1)) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
             if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 128, __pyx_L1_error)
+            else __PYX_ERR(0, 137, __pyx_L1_error)
           }
           break;
         }
-        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_GOTREF(__pyx_t_1);
       }
-      if ((likely(PyTuple_CheckExact(__pyx_t_4))) || (PyList_CheckExact(__pyx_t_4))) {
-        PyObject* sequence = __pyx_t_4;
+      if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+        PyObject* sequence = __pyx_t_1;
         Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
         if (unlikely(size != 2)) {
           if (size > 2) __Pyx_RaiseTooManyValuesError(2);
           else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 128, __pyx_L1_error)
+          __PYX_ERR(0, 137, __pyx_L1_error)
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
         if (likely(PyTuple_CheckExact(sequence))) {
-          __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
-          __pyx_t_6 = PyTuple_GET_ITEM(sequence, 1); 
+          __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyTuple_GET_ITEM(sequence, 1); 
         } else {
-          __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
-          __pyx_t_6 = PyList_GET_ITEM(sequence, 1); 
+          __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_8 = PyList_GET_ITEM(sequence, 1); 
         }
-        __Pyx_INCREF(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_8);
         #else
-        __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 128, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_6 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_8 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
         #endif
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       } else {
         Py_ssize_t index = -1;
-        __pyx_t_8 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 128, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_11 = Py_TYPE(__pyx_t_8)->tp_iternext;
-        index = 0; __pyx_t_5 = __pyx_t_11(__pyx_t_8); if (unlikely(!__pyx_t_5)) goto __pyx_L10_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_5);
-        index = 1; __pyx_t_6 = __pyx_t_11(__pyx_t_8); if (unlikely(!__pyx_t_6)) goto __pyx_L10_unpacking_failed;
+        __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 137, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_11(__pyx_t_8), 2) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_11 = Py_TYPE(__pyx_t_6)->tp_iternext;
+        index = 0; __pyx_t_4 = __pyx_t_11(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L10_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_4);
+        index = 1; __pyx_t_8 = __pyx_t_11(__pyx_t_6); if (unlikely(!__pyx_t_8)) goto __pyx_L10_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_8);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_11(__pyx_t_6), 2) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
         __pyx_t_11 = NULL;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         goto __pyx_L11_unpacking_done;
         __pyx_L10_unpacking_failed:;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __pyx_t_11 = NULL;
         if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 128, __pyx_L1_error)
+        __PYX_ERR(0, 137, __pyx_L1_error)
         __pyx_L11_unpacking_done:;
       }
-      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_5);
-      __pyx_t_5 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_6);
-      __pyx_t_6 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_item, __pyx_t_8);
+      __pyx_t_8 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":129
+      /* "neobolt/impl/python/packstream/_packer.pyx":138
  *             self.pack_map_header(len(value))
  *             for key, item in value.items():
  *                 self._pack(key)             # <<<<<<<<<<<<<<
  *                 self._pack(item)
  * 
  */
-      __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_key); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":130
+      /* "neobolt/impl/python/packstream/_packer.pyx":139
  *             for key, item in value.items():
  *                 self._pack(key)
  *                 self._pack(item)             # <<<<<<<<<<<<<<
  * 
  *         # Structure
  */
-      __pyx_t_4 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_item); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 130, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_1 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_item); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "neobolt/impl/python/packstream/_packer.pyx":128
+      /* "neobolt/impl/python/packstream/_packer.pyx":137
  *         elif isinstance(value, dict):
  *             self.pack_map_header(len(value))
  *             for key, item in value.items():             # <<<<<<<<<<<<<<
@@ -3303,9 +3489,9 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  *                 self._pack(item)
  */
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":126
+    /* "neobolt/impl/python/packstream/_packer.pyx":135
  * 
  *         # Map
  *         elif isinstance(value, dict):             # <<<<<<<<<<<<<<
@@ -3315,39 +3501,39 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":133
+  /* "neobolt/impl/python/packstream/_packer.pyx":142
  * 
  *         # Structure
  *         elif isinstance(value, Structure):             # <<<<<<<<<<<<<<
  *             self.pack_struct(value.tag, value.fields)
  * 
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_Structure); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_IsInstance(__pyx_v_value, __pyx_t_1); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 133, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_Structure); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_3 = PyObject_IsInstance(__pyx_v_value, __pyx_t_5); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_2 = (__pyx_t_3 != 0);
   if (likely(__pyx_t_2)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":134
+    /* "neobolt/impl/python/packstream/_packer.pyx":143
  *         # Structure
  *         elif isinstance(value, Structure):
  *             self.pack_struct(value.tag, value.fields)             # <<<<<<<<<<<<<<
  * 
  *         # Other
  */
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_tag); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_tag); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    if (!(likely(PyBytes_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 143, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_fields); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_1)->tp_name), 0))) __PYX_ERR(0, 134, __pyx_L1_error)
-    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_value, __pyx_n_s_fields); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_6 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_struct(__pyx_v_self, ((PyObject*)__pyx_t_1), __pyx_t_4, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 134, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_8 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack_struct(__pyx_v_self, ((PyObject*)__pyx_t_5), __pyx_t_1, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 143, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":133
+    /* "neobolt/impl/python/packstream/_packer.pyx":142
  * 
  *         # Structure
  *         elif isinstance(value, Structure):             # <<<<<<<<<<<<<<
@@ -3357,7 +3543,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":138
+  /* "neobolt/impl/python/packstream/_packer.pyx":147
  *         # Other
  *         else:
  *             raise ValueError("Values of type %s are not supported" % type(value))             # <<<<<<<<<<<<<<
@@ -3365,18 +3551,18 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
  *     cdef pack_bytes_header(self, int size):
  */
   /*else*/ {
-    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_Values_of_type_s_are_not_support, ((PyObject *)Py_TYPE(__pyx_v_value))); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 138, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 138, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __PYX_ERR(0, 138, __pyx_L1_error)
+    __pyx_t_8 = __Pyx_PyString_FormatSafe(__pyx_kp_s_Values_of_type_s_are_not_support, ((PyObject *)Py_TYPE(__pyx_v_value))); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 147, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 147, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":64
+  /* "neobolt/impl/python/packstream/_packer.pyx":73
  *         return self._pack(value)
  * 
  *     cdef _pack(self, value):             # <<<<<<<<<<<<<<
@@ -3405,7 +3591,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer__p
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":140
+/* "neobolt/impl/python/packstream/_packer.pyx":149
  *             raise ValueError("Values of type %s are not supported" % type(value))
  * 
  *     cdef pack_bytes_header(self, int size):             # <<<<<<<<<<<<<<
@@ -3425,9 +3611,12 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_bytes_header", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":141
+  /* "neobolt/impl/python/packstream/_packer.pyx":150
  * 
  *     cdef pack_bytes_header(self, int size):
  *         if not self.supports_bytes:             # <<<<<<<<<<<<<<
@@ -3437,20 +3626,20 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_1 = ((!(__pyx_v_self->supports_bytes != 0)) != 0);
   if (unlikely(__pyx_t_1)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":142
+    /* "neobolt/impl/python/packstream/_packer.pyx":151
  *     cdef pack_bytes_header(self, int size):
  *         if not self.supports_bytes:
  *             raise TypeError("This PackSteam channel does not support BYTES (consider upgrading to Neo4j 3.2+)")             # <<<<<<<<<<<<<<
  *         write = self._write
  *         if size < 0x100:
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__18, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 151, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 142, __pyx_L1_error)
+    __PYX_ERR(0, 151, __pyx_L1_error)
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":141
+    /* "neobolt/impl/python/packstream/_packer.pyx":150
  * 
  *     cdef pack_bytes_header(self, int size):
  *         if not self.supports_bytes:             # <<<<<<<<<<<<<<
@@ -3459,7 +3648,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  */
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":143
+  /* "neobolt/impl/python/packstream/_packer.pyx":152
  *         if not self.supports_bytes:
  *             raise TypeError("This PackSteam channel does not support BYTES (consider upgrading to Neo4j 3.2+)")
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -3471,7 +3660,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_v_write = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":144
+  /* "neobolt/impl/python/packstream/_packer.pyx":153
  *             raise TypeError("This PackSteam channel does not support BYTES (consider upgrading to Neo4j 3.2+)")
  *         write = self._write
  *         if size < 0x100:             # <<<<<<<<<<<<<<
@@ -3481,27 +3670,41 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_1 = ((__pyx_v_size < 0x100) != 0);
   if (__pyx_t_1) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":145
+    /* "neobolt/impl/python/packstream/_packer.pyx":154
  *         write = self._write
  *         if size < 0x100:
  *             write(b"\xCC")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__20, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__10) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__10);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 154, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":146
+    /* "neobolt/impl/python/packstream/_packer.pyx":155
  *         if size < 0x100:
  *             write(b"\xCC")
  *             write(PACKED_UINT_8[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x10000:
  *             write(b"\xCD")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
@@ -3515,45 +3718,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_5) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 146, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":144
+    /* "neobolt/impl/python/packstream/_packer.pyx":153
  *             raise TypeError("This PackSteam channel does not support BYTES (consider upgrading to Neo4j 3.2+)")
  *         write = self._write
  *         if size < 0x100:             # <<<<<<<<<<<<<<
@@ -3563,7 +3736,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":147
+  /* "neobolt/impl/python/packstream/_packer.pyx":156
  *             write(b"\xCC")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -3573,79 +3746,63 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_1 = ((__pyx_v_size < 0x10000) != 0);
   if (__pyx_t_1) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":148
+    /* "neobolt/impl/python/packstream/_packer.pyx":157
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  *             write(b"\xCD")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__22, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__11) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__11);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":149
+    /* "neobolt/impl/python/packstream/_packer.pyx":158
  *         elif size < 0x10000:
  *             write(b"\xCD")
  *             write(PACKED_UINT_16[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x100000000:
  *             write(b"\xCE")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 149, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 158, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 149, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    __pyx_t_3 = __pyx_v_write; __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_4) {
-      __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_2);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 149, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-    }
+    __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 158, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":147
+    /* "neobolt/impl/python/packstream/_packer.pyx":156
  *             write(b"\xCC")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -3655,140 +3812,124 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":150
+  /* "neobolt/impl/python/packstream/_packer.pyx":159
  *             write(b"\xCD")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
  *             write(b"\xCE")
  *             write(struct_pack(">I", size))
  */
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 150, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 150, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_1 < 0)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(__pyx_t_1)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":151
+    /* "neobolt/impl/python/packstream/_packer.pyx":160
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  *             write(b"\xCE")             # <<<<<<<<<<<<<<
  *             write(struct_pack(">I", size))
  *         else:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__24, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 151, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_kp_b__12) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__12);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 160, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":152
+    /* "neobolt/impl/python/packstream/_packer.pyx":161
  *         elif size < 0x100000000:
  *             write(b"\xCE")
  *             write(struct_pack(">I", size))             # <<<<<<<<<<<<<<
  *         else:
  *             raise OverflowError("Bytes header size out of range")
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 152, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 161, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 152, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_4 = NULL;
+    __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_4);
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
         __pyx_t_7 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 161, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
       }
       __Pyx_INCREF(__pyx_kp_s_I);
       __Pyx_GIVEREF(__pyx_kp_s_I);
       PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_I);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 161, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_5 = __pyx_v_write; __pyx_t_8 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
       if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_8);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-      }
-    }
-    if (!__pyx_t_8) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_2};
-        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_2};
-        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 152, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_GIVEREF(__pyx_t_2);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_2);
-        __pyx_t_2 = 0;
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 161, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":150
+    /* "neobolt/impl/python/packstream/_packer.pyx":159
  *             write(b"\xCD")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
@@ -3798,7 +3939,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":154
+  /* "neobolt/impl/python/packstream/_packer.pyx":163
  *             write(struct_pack(">I", size))
  *         else:
  *             raise OverflowError("Bytes header size out of range")             # <<<<<<<<<<<<<<
@@ -3806,15 +3947,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *     cdef pack_string_header(self, int size):
  */
   /*else*/ {
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__25, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 154, __pyx_L1_error)
+    __PYX_ERR(0, 163, __pyx_L1_error)
   }
   __pyx_L4:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":140
+  /* "neobolt/impl/python/packstream/_packer.pyx":149
  *             raise ValueError("Values of type %s are not supported" % type(value))
  * 
  *     cdef pack_bytes_header(self, int size):             # <<<<<<<<<<<<<<
@@ -3841,7 +3982,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":156
+/* "neobolt/impl/python/packstream/_packer.pyx":165
  *             raise OverflowError("Bytes header size out of range")
  * 
  *     cdef pack_string_header(self, int size):             # <<<<<<<<<<<<<<
@@ -3861,9 +4002,12 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_string_header", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":157
+  /* "neobolt/impl/python/packstream/_packer.pyx":166
  * 
  *     cdef pack_string_header(self, int size):
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -3875,7 +4019,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_v_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":158
+  /* "neobolt/impl/python/packstream/_packer.pyx":167
  *     cdef pack_string_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -3885,18 +4029,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x00) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":159
+    /* "neobolt/impl/python/packstream/_packer.pyx":168
  *         write = self._write
  *         if size == 0x00:
  *             write(b"\x80")             # <<<<<<<<<<<<<<
  *         elif size == 0x01:
  *             write(b"\x81")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__27, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__14) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__14);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":158
+    /* "neobolt/impl/python/packstream/_packer.pyx":167
  *     cdef pack_string_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -3906,7 +4064,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":160
+  /* "neobolt/impl/python/packstream/_packer.pyx":169
  *         if size == 0x00:
  *             write(b"\x80")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -3916,28 +4074,42 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x01) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":161
+    /* "neobolt/impl/python/packstream/_packer.pyx":170
  *             write(b"\x80")
  *         elif size == 0x01:
  *             write(b"\x81")             # <<<<<<<<<<<<<<
  *         elif size == 0x02:
  *             write(b"\x82")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__29, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 161, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-    /* "neobolt/impl/python/packstream/_packer.pyx":160
- *         if size == 0x00:
- *             write(b"\x80")
- *         elif size == 0x01:             # <<<<<<<<<<<<<<
- *             write(b"\x81")
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__15) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__15);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "neobolt/impl/python/packstream/_packer.pyx":169
+ *         if size == 0x00:
+ *             write(b"\x80")
+ *         elif size == 0x01:             # <<<<<<<<<<<<<<
+ *             write(b"\x81")
  *         elif size == 0x02:
  */
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":162
+  /* "neobolt/impl/python/packstream/_packer.pyx":171
  *         elif size == 0x01:
  *             write(b"\x81")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -3947,18 +4119,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x02) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":163
+    /* "neobolt/impl/python/packstream/_packer.pyx":172
  *             write(b"\x81")
  *         elif size == 0x02:
  *             write(b"\x82")             # <<<<<<<<<<<<<<
  *         elif size == 0x03:
  *             write(b"\x83")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__31, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__16) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__16);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":162
+    /* "neobolt/impl/python/packstream/_packer.pyx":171
  *         elif size == 0x01:
  *             write(b"\x81")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -3968,7 +4154,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":164
+  /* "neobolt/impl/python/packstream/_packer.pyx":173
  *         elif size == 0x02:
  *             write(b"\x82")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -3978,18 +4164,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x03) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":165
+    /* "neobolt/impl/python/packstream/_packer.pyx":174
  *             write(b"\x82")
  *         elif size == 0x03:
  *             write(b"\x83")             # <<<<<<<<<<<<<<
  *         elif size == 0x04:
  *             write(b"\x84")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__33, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 165, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__17) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__17);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":164
+    /* "neobolt/impl/python/packstream/_packer.pyx":173
  *         elif size == 0x02:
  *             write(b"\x82")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -3999,7 +4199,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":166
+  /* "neobolt/impl/python/packstream/_packer.pyx":175
  *         elif size == 0x03:
  *             write(b"\x83")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -4009,18 +4209,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x04) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":167
+    /* "neobolt/impl/python/packstream/_packer.pyx":176
  *             write(b"\x83")
  *         elif size == 0x04:
  *             write(b"\x84")             # <<<<<<<<<<<<<<
  *         elif size == 0x05:
  *             write(b"\x85")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__35, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 167, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__18) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__18);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 176, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":166
+    /* "neobolt/impl/python/packstream/_packer.pyx":175
  *         elif size == 0x03:
  *             write(b"\x83")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -4030,7 +4244,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":168
+  /* "neobolt/impl/python/packstream/_packer.pyx":177
  *         elif size == 0x04:
  *             write(b"\x84")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -4040,18 +4254,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x05) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":169
+    /* "neobolt/impl/python/packstream/_packer.pyx":178
  *             write(b"\x84")
  *         elif size == 0x05:
  *             write(b"\x85")             # <<<<<<<<<<<<<<
  *         elif size == 0x06:
  *             write(b"\x86")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__37, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 169, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__19) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__19);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 178, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":168
+    /* "neobolt/impl/python/packstream/_packer.pyx":177
  *         elif size == 0x04:
  *             write(b"\x84")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -4061,7 +4289,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":170
+  /* "neobolt/impl/python/packstream/_packer.pyx":179
  *         elif size == 0x05:
  *             write(b"\x85")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -4071,18 +4299,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x06) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":171
+    /* "neobolt/impl/python/packstream/_packer.pyx":180
  *             write(b"\x85")
  *         elif size == 0x06:
  *             write(b"\x86")             # <<<<<<<<<<<<<<
  *         elif size == 0x07:
  *             write(b"\x87")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__39, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 171, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__20) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__20);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":170
+    /* "neobolt/impl/python/packstream/_packer.pyx":179
  *         elif size == 0x05:
  *             write(b"\x85")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -4092,7 +4334,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":172
+  /* "neobolt/impl/python/packstream/_packer.pyx":181
  *         elif size == 0x06:
  *             write(b"\x86")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -4102,18 +4344,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x07) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":173
+    /* "neobolt/impl/python/packstream/_packer.pyx":182
  *             write(b"\x86")
  *         elif size == 0x07:
  *             write(b"\x87")             # <<<<<<<<<<<<<<
  *         elif size == 0x08:
  *             write(b"\x88")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__41, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__21) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__21);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":172
+    /* "neobolt/impl/python/packstream/_packer.pyx":181
  *         elif size == 0x06:
  *             write(b"\x86")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -4123,7 +4379,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":174
+  /* "neobolt/impl/python/packstream/_packer.pyx":183
  *         elif size == 0x07:
  *             write(b"\x87")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -4133,18 +4389,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x08) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":175
+    /* "neobolt/impl/python/packstream/_packer.pyx":184
  *             write(b"\x87")
  *         elif size == 0x08:
  *             write(b"\x88")             # <<<<<<<<<<<<<<
  *         elif size == 0x09:
  *             write(b"\x89")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__43, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 175, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__22) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__22);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":174
+    /* "neobolt/impl/python/packstream/_packer.pyx":183
  *         elif size == 0x07:
  *             write(b"\x87")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -4154,7 +4424,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":176
+  /* "neobolt/impl/python/packstream/_packer.pyx":185
  *         elif size == 0x08:
  *             write(b"\x88")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -4164,18 +4434,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x09) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":177
+    /* "neobolt/impl/python/packstream/_packer.pyx":186
  *             write(b"\x88")
  *         elif size == 0x09:
  *             write(b"\x89")             # <<<<<<<<<<<<<<
  *         elif size == 0x0A:
  *             write(b"\x8A")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__45, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 177, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__23) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__23);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":176
+    /* "neobolt/impl/python/packstream/_packer.pyx":185
  *         elif size == 0x08:
  *             write(b"\x88")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -4185,7 +4469,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":178
+  /* "neobolt/impl/python/packstream/_packer.pyx":187
  *         elif size == 0x09:
  *             write(b"\x89")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -4195,18 +4479,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0A) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":179
+    /* "neobolt/impl/python/packstream/_packer.pyx":188
  *             write(b"\x89")
  *         elif size == 0x0A:
  *             write(b"\x8A")             # <<<<<<<<<<<<<<
  *         elif size == 0x0B:
  *             write(b"\x8B")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__47, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__24) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__24);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":178
+    /* "neobolt/impl/python/packstream/_packer.pyx":187
  *         elif size == 0x09:
  *             write(b"\x89")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -4216,7 +4514,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":180
+  /* "neobolt/impl/python/packstream/_packer.pyx":189
  *         elif size == 0x0A:
  *             write(b"\x8A")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -4226,18 +4524,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0B) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":181
+    /* "neobolt/impl/python/packstream/_packer.pyx":190
  *             write(b"\x8A")
  *         elif size == 0x0B:
  *             write(b"\x8B")             # <<<<<<<<<<<<<<
  *         elif size == 0x0C:
  *             write(b"\x8C")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__49, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__25) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__25);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 190, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":180
+    /* "neobolt/impl/python/packstream/_packer.pyx":189
  *         elif size == 0x0A:
  *             write(b"\x8A")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -4247,7 +4559,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":182
+  /* "neobolt/impl/python/packstream/_packer.pyx":191
  *         elif size == 0x0B:
  *             write(b"\x8B")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -4257,18 +4569,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0C) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":183
+    /* "neobolt/impl/python/packstream/_packer.pyx":192
  *             write(b"\x8B")
  *         elif size == 0x0C:
  *             write(b"\x8C")             # <<<<<<<<<<<<<<
  *         elif size == 0x0D:
  *             write(b"\x8D")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__51, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 183, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__26) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__26);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":182
+    /* "neobolt/impl/python/packstream/_packer.pyx":191
  *         elif size == 0x0B:
  *             write(b"\x8B")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -4278,7 +4604,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":184
+  /* "neobolt/impl/python/packstream/_packer.pyx":193
  *         elif size == 0x0C:
  *             write(b"\x8C")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -4288,18 +4614,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0D) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":185
+    /* "neobolt/impl/python/packstream/_packer.pyx":194
  *             write(b"\x8C")
  *         elif size == 0x0D:
  *             write(b"\x8D")             # <<<<<<<<<<<<<<
  *         elif size == 0x0E:
  *             write(b"\x8E")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__53, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__27) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__27);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":184
+    /* "neobolt/impl/python/packstream/_packer.pyx":193
  *         elif size == 0x0C:
  *             write(b"\x8C")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -4309,7 +4649,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":186
+  /* "neobolt/impl/python/packstream/_packer.pyx":195
  *         elif size == 0x0D:
  *             write(b"\x8D")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -4319,18 +4659,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0E) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":187
+    /* "neobolt/impl/python/packstream/_packer.pyx":196
  *             write(b"\x8D")
  *         elif size == 0x0E:
  *             write(b"\x8E")             # <<<<<<<<<<<<<<
  *         elif size == 0x0F:
  *             write(b"\x8F")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__55, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__28) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__28);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":186
+    /* "neobolt/impl/python/packstream/_packer.pyx":195
  *         elif size == 0x0D:
  *             write(b"\x8D")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -4340,7 +4694,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":188
+  /* "neobolt/impl/python/packstream/_packer.pyx":197
  *         elif size == 0x0E:
  *             write(b"\x8E")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -4350,18 +4704,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0F) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":189
+    /* "neobolt/impl/python/packstream/_packer.pyx":198
  *             write(b"\x8E")
  *         elif size == 0x0F:
  *             write(b"\x8F")             # <<<<<<<<<<<<<<
  *         elif size < 0x100:
  *             write(b"\xD0")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__57, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__29) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__29);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":188
+    /* "neobolt/impl/python/packstream/_packer.pyx":197
  *         elif size == 0x0E:
  *             write(b"\x8E")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -4371,7 +4739,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":190
+  /* "neobolt/impl/python/packstream/_packer.pyx":199
  *         elif size == 0x0F:
  *             write(b"\x8F")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -4381,27 +4749,41 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x100) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":191
+    /* "neobolt/impl/python/packstream/_packer.pyx":200
  *             write(b"\x8F")
  *         elif size < 0x100:
  *             write(b"\xD0")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__59, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 191, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__30) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__30);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":192
+    /* "neobolt/impl/python/packstream/_packer.pyx":201
  *         elif size < 0x100:
  *             write(b"\xD0")
  *             write(PACKED_UINT_8[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x10000:
  *             write(b"\xD1")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 192, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 201, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 192, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 201, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
@@ -4415,45 +4797,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_5) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 192, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 192, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 201, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":190
+    /* "neobolt/impl/python/packstream/_packer.pyx":199
  *         elif size == 0x0F:
  *             write(b"\x8F")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -4463,7 +4815,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":193
+  /* "neobolt/impl/python/packstream/_packer.pyx":202
  *             write(b"\xD0")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -4473,79 +4825,63 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x10000) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":194
+    /* "neobolt/impl/python/packstream/_packer.pyx":203
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  *             write(b"\xD1")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__61, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 194, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__31) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__31);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":195
+    /* "neobolt/impl/python/packstream/_packer.pyx":204
  *         elif size < 0x10000:
  *             write(b"\xD1")
  *             write(PACKED_UINT_16[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x100000000:
  *             write(b"\xD2")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 204, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 195, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    __pyx_t_3 = __pyx_v_write; __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 195, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 195, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 204, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":193
+    /* "neobolt/impl/python/packstream/_packer.pyx":202
  *             write(b"\xD0")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -4555,140 +4891,124 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":196
+  /* "neobolt/impl/python/packstream/_packer.pyx":205
  *             write(b"\xD1")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
  *             write(b"\xD2")
  *             write(struct_pack(">I", size))
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 205, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(__pyx_t_2)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":197
+    /* "neobolt/impl/python/packstream/_packer.pyx":206
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  *             write(b"\xD2")             # <<<<<<<<<<<<<<
  *             write(struct_pack(">I", size))
  *         else:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__63, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 197, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_1 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_kp_b__32) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_b__32);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 206, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":198
+    /* "neobolt/impl/python/packstream/_packer.pyx":207
  *         elif size < 0x100000000:
  *             write(b"\xD2")
  *             write(struct_pack(">I", size))             # <<<<<<<<<<<<<<
  *         else:
  *             raise OverflowError("String header size out of range")
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 198, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 207, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_4 = NULL;
+    __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_4);
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
         __pyx_t_7 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 198, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 207, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
       }
       __Pyx_INCREF(__pyx_kp_s_I);
       __Pyx_GIVEREF(__pyx_kp_s_I);
       PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_I);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 198, __pyx_L1_error)
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_5 = __pyx_v_write; __pyx_t_8 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
       if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_8);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-      }
-    }
-    if (!__pyx_t_8) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_GIVEREF(__pyx_t_1);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_1);
-        __pyx_t_1 = 0;
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 198, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":196
+    /* "neobolt/impl/python/packstream/_packer.pyx":205
  *             write(b"\xD1")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
@@ -4698,7 +5018,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":200
+  /* "neobolt/impl/python/packstream/_packer.pyx":209
  *             write(struct_pack(">I", size))
  *         else:
  *             raise OverflowError("String header size out of range")             # <<<<<<<<<<<<<<
@@ -4706,15 +5026,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *     cdef pack_list_header(self, int size):
  */
   /*else*/ {
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__64, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__33, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 209, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 200, __pyx_L1_error)
+    __PYX_ERR(0, 209, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":156
+  /* "neobolt/impl/python/packstream/_packer.pyx":165
  *             raise OverflowError("Bytes header size out of range")
  * 
  *     cdef pack_string_header(self, int size):             # <<<<<<<<<<<<<<
@@ -4741,7 +5061,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":202
+/* "neobolt/impl/python/packstream/_packer.pyx":211
  *             raise OverflowError("String header size out of range")
  * 
  *     cdef pack_list_header(self, int size):             # <<<<<<<<<<<<<<
@@ -4761,9 +5081,12 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_list_header", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":203
+  /* "neobolt/impl/python/packstream/_packer.pyx":212
  * 
  *     cdef pack_list_header(self, int size):
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -4775,7 +5098,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_v_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":204
+  /* "neobolt/impl/python/packstream/_packer.pyx":213
  *     cdef pack_list_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -4785,18 +5108,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x00) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":205
+    /* "neobolt/impl/python/packstream/_packer.pyx":214
  *         write = self._write
  *         if size == 0x00:
  *             write(b"\x90")             # <<<<<<<<<<<<<<
  *         elif size == 0x01:
  *             write(b"\x91")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__66, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 205, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__34) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__34);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 214, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":204
+    /* "neobolt/impl/python/packstream/_packer.pyx":213
  *     cdef pack_list_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -4806,7 +5143,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":206
+  /* "neobolt/impl/python/packstream/_packer.pyx":215
  *         if size == 0x00:
  *             write(b"\x90")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -4816,18 +5153,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x01) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":207
+    /* "neobolt/impl/python/packstream/_packer.pyx":216
  *             write(b"\x90")
  *         elif size == 0x01:
  *             write(b"\x91")             # <<<<<<<<<<<<<<
  *         elif size == 0x02:
  *             write(b"\x92")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__68, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 207, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__35) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__35);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 216, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":206
+    /* "neobolt/impl/python/packstream/_packer.pyx":215
  *         if size == 0x00:
  *             write(b"\x90")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -4837,7 +5188,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":208
+  /* "neobolt/impl/python/packstream/_packer.pyx":217
  *         elif size == 0x01:
  *             write(b"\x91")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -4847,18 +5198,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x02) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":209
+    /* "neobolt/impl/python/packstream/_packer.pyx":218
  *             write(b"\x91")
  *         elif size == 0x02:
  *             write(b"\x92")             # <<<<<<<<<<<<<<
  *         elif size == 0x03:
  *             write(b"\x93")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__70, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 209, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__36) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__36);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 218, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":208
+    /* "neobolt/impl/python/packstream/_packer.pyx":217
  *         elif size == 0x01:
  *             write(b"\x91")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -4868,7 +5233,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":210
+  /* "neobolt/impl/python/packstream/_packer.pyx":219
  *         elif size == 0x02:
  *             write(b"\x92")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -4878,18 +5243,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x03) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":211
+    /* "neobolt/impl/python/packstream/_packer.pyx":220
  *             write(b"\x92")
  *         elif size == 0x03:
  *             write(b"\x93")             # <<<<<<<<<<<<<<
  *         elif size == 0x04:
  *             write(b"\x94")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__72, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__37) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__37);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 220, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":210
+    /* "neobolt/impl/python/packstream/_packer.pyx":219
  *         elif size == 0x02:
  *             write(b"\x92")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -4899,7 +5278,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":212
+  /* "neobolt/impl/python/packstream/_packer.pyx":221
  *         elif size == 0x03:
  *             write(b"\x93")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -4909,18 +5288,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x04) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":213
+    /* "neobolt/impl/python/packstream/_packer.pyx":222
  *             write(b"\x93")
  *         elif size == 0x04:
  *             write(b"\x94")             # <<<<<<<<<<<<<<
  *         elif size == 0x05:
  *             write(b"\x95")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__74, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 213, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__38) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__38);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 222, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":212
+    /* "neobolt/impl/python/packstream/_packer.pyx":221
  *         elif size == 0x03:
  *             write(b"\x93")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -4930,7 +5323,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":214
+  /* "neobolt/impl/python/packstream/_packer.pyx":223
  *         elif size == 0x04:
  *             write(b"\x94")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -4940,18 +5333,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x05) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":215
+    /* "neobolt/impl/python/packstream/_packer.pyx":224
  *             write(b"\x94")
  *         elif size == 0x05:
  *             write(b"\x95")             # <<<<<<<<<<<<<<
  *         elif size == 0x06:
  *             write(b"\x96")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__76, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 215, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__39) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__39);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":214
+    /* "neobolt/impl/python/packstream/_packer.pyx":223
  *         elif size == 0x04:
  *             write(b"\x94")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -4961,7 +5368,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":216
+  /* "neobolt/impl/python/packstream/_packer.pyx":225
  *         elif size == 0x05:
  *             write(b"\x95")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -4971,18 +5378,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x06) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":217
+    /* "neobolt/impl/python/packstream/_packer.pyx":226
  *             write(b"\x95")
  *         elif size == 0x06:
  *             write(b"\x96")             # <<<<<<<<<<<<<<
  *         elif size == 0x07:
  *             write(b"\x97")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__78, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 217, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__40) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__40);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 226, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":216
+    /* "neobolt/impl/python/packstream/_packer.pyx":225
  *         elif size == 0x05:
  *             write(b"\x95")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -4992,7 +5413,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":218
+  /* "neobolt/impl/python/packstream/_packer.pyx":227
  *         elif size == 0x06:
  *             write(b"\x96")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -5002,18 +5423,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x07) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":219
+    /* "neobolt/impl/python/packstream/_packer.pyx":228
  *             write(b"\x96")
  *         elif size == 0x07:
  *             write(b"\x97")             # <<<<<<<<<<<<<<
  *         elif size == 0x08:
  *             write(b"\x98")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__80, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 219, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__41) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__41);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 228, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":218
+    /* "neobolt/impl/python/packstream/_packer.pyx":227
  *         elif size == 0x06:
  *             write(b"\x96")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -5023,7 +5458,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":220
+  /* "neobolt/impl/python/packstream/_packer.pyx":229
  *         elif size == 0x07:
  *             write(b"\x97")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -5033,18 +5468,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x08) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":221
+    /* "neobolt/impl/python/packstream/_packer.pyx":230
  *             write(b"\x97")
  *         elif size == 0x08:
  *             write(b"\x98")             # <<<<<<<<<<<<<<
  *         elif size == 0x09:
  *             write(b"\x99")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__82, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__42) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__42);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":220
+    /* "neobolt/impl/python/packstream/_packer.pyx":229
  *         elif size == 0x07:
  *             write(b"\x97")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -5054,7 +5503,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":222
+  /* "neobolt/impl/python/packstream/_packer.pyx":231
  *         elif size == 0x08:
  *             write(b"\x98")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -5064,18 +5513,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x09) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":223
+    /* "neobolt/impl/python/packstream/_packer.pyx":232
  *             write(b"\x98")
  *         elif size == 0x09:
  *             write(b"\x99")             # <<<<<<<<<<<<<<
  *         elif size == 0x0A:
  *             write(b"\x9A")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__84, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 223, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__43) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__43);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 232, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":222
+    /* "neobolt/impl/python/packstream/_packer.pyx":231
  *         elif size == 0x08:
  *             write(b"\x98")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -5085,7 +5548,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":224
+  /* "neobolt/impl/python/packstream/_packer.pyx":233
  *         elif size == 0x09:
  *             write(b"\x99")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -5095,18 +5558,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0A) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":225
+    /* "neobolt/impl/python/packstream/_packer.pyx":234
  *             write(b"\x99")
  *         elif size == 0x0A:
  *             write(b"\x9A")             # <<<<<<<<<<<<<<
  *         elif size == 0x0B:
  *             write(b"\x9B")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__86, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 225, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__44) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__44);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 234, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":224
+    /* "neobolt/impl/python/packstream/_packer.pyx":233
  *         elif size == 0x09:
  *             write(b"\x99")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -5116,7 +5593,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":226
+  /* "neobolt/impl/python/packstream/_packer.pyx":235
  *         elif size == 0x0A:
  *             write(b"\x9A")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -5126,18 +5603,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0B) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":227
+    /* "neobolt/impl/python/packstream/_packer.pyx":236
  *             write(b"\x9A")
  *         elif size == 0x0B:
  *             write(b"\x9B")             # <<<<<<<<<<<<<<
  *         elif size == 0x0C:
  *             write(b"\x9C")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__88, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__45) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__45);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":226
+    /* "neobolt/impl/python/packstream/_packer.pyx":235
  *         elif size == 0x0A:
  *             write(b"\x9A")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -5147,7 +5638,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":228
+  /* "neobolt/impl/python/packstream/_packer.pyx":237
  *         elif size == 0x0B:
  *             write(b"\x9B")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -5157,18 +5648,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0C) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":229
+    /* "neobolt/impl/python/packstream/_packer.pyx":238
  *             write(b"\x9B")
  *         elif size == 0x0C:
  *             write(b"\x9C")             # <<<<<<<<<<<<<<
  *         elif size == 0x0D:
  *             write(b"\x9D")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__90, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__46) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__46);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":228
+    /* "neobolt/impl/python/packstream/_packer.pyx":237
  *         elif size == 0x0B:
  *             write(b"\x9B")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -5178,7 +5683,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":230
+  /* "neobolt/impl/python/packstream/_packer.pyx":239
  *         elif size == 0x0C:
  *             write(b"\x9C")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -5188,18 +5693,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0D) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":231
+    /* "neobolt/impl/python/packstream/_packer.pyx":240
  *             write(b"\x9C")
  *         elif size == 0x0D:
  *             write(b"\x9D")             # <<<<<<<<<<<<<<
  *         elif size == 0x0E:
  *             write(b"\x9E")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__92, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 231, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__47) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__47);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":230
+    /* "neobolt/impl/python/packstream/_packer.pyx":239
  *         elif size == 0x0C:
  *             write(b"\x9C")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -5209,7 +5728,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":232
+  /* "neobolt/impl/python/packstream/_packer.pyx":241
  *         elif size == 0x0D:
  *             write(b"\x9D")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -5219,18 +5738,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0E) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":233
+    /* "neobolt/impl/python/packstream/_packer.pyx":242
  *             write(b"\x9D")
  *         elif size == 0x0E:
  *             write(b"\x9E")             # <<<<<<<<<<<<<<
  *         elif size == 0x0F:
  *             write(b"\x9F")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__94, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__48) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__48);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":232
+    /* "neobolt/impl/python/packstream/_packer.pyx":241
  *         elif size == 0x0D:
  *             write(b"\x9D")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -5240,7 +5773,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":234
+  /* "neobolt/impl/python/packstream/_packer.pyx":243
  *         elif size == 0x0E:
  *             write(b"\x9E")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -5250,18 +5783,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0F) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":235
+    /* "neobolt/impl/python/packstream/_packer.pyx":244
  *             write(b"\x9E")
  *         elif size == 0x0F:
  *             write(b"\x9F")             # <<<<<<<<<<<<<<
  *         elif size < 0x100:
  *             write(b"\xD4")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__96, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__49) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__49);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":234
+    /* "neobolt/impl/python/packstream/_packer.pyx":243
  *         elif size == 0x0E:
  *             write(b"\x9E")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -5271,7 +5818,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":236
+  /* "neobolt/impl/python/packstream/_packer.pyx":245
  *         elif size == 0x0F:
  *             write(b"\x9F")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -5281,27 +5828,41 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x100) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":237
+    /* "neobolt/impl/python/packstream/_packer.pyx":246
  *             write(b"\x9F")
  *         elif size < 0x100:
  *             write(b"\xD4")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__98, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 237, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__50) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__50);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":238
+    /* "neobolt/impl/python/packstream/_packer.pyx":247
  *         elif size < 0x100:
  *             write(b"\xD4")
  *             write(PACKED_UINT_8[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x10000:
  *             write(b"\xD5")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 238, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 247, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
@@ -5315,45 +5876,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_5) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 238, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":236
+    /* "neobolt/impl/python/packstream/_packer.pyx":245
  *         elif size == 0x0F:
  *             write(b"\x9F")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -5363,7 +5894,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":239
+  /* "neobolt/impl/python/packstream/_packer.pyx":248
  *             write(b"\xD4")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -5373,79 +5904,63 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x10000) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":240
+    /* "neobolt/impl/python/packstream/_packer.pyx":249
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  *             write(b"\xD5")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__100, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__51) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__51);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":241
+    /* "neobolt/impl/python/packstream/_packer.pyx":250
  *         elif size < 0x10000:
  *             write(b"\xD5")
  *             write(PACKED_UINT_16[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x100000000:
  *             write(b"\xD6")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 241, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 250, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 241, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 250, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    __pyx_t_3 = __pyx_v_write; __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 241, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":239
+    /* "neobolt/impl/python/packstream/_packer.pyx":248
  *             write(b"\xD4")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -5455,140 +5970,124 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":242
+  /* "neobolt/impl/python/packstream/_packer.pyx":251
  *             write(b"\xD5")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
  *             write(b"\xD6")
  *             write(struct_pack(">I", size))
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 251, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 251, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(__pyx_t_2)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":243
+    /* "neobolt/impl/python/packstream/_packer.pyx":252
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  *             write(b"\xD6")             # <<<<<<<<<<<<<<
  *             write(struct_pack(">I", size))
  *         else:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__102, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 243, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_1 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_kp_b__52) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_b__52);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 252, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":244
+    /* "neobolt/impl/python/packstream/_packer.pyx":253
  *         elif size < 0x100000000:
  *             write(b"\xD6")
  *             write(struct_pack(">I", size))             # <<<<<<<<<<<<<<
  *         else:
  *             raise OverflowError("List header size out of range")
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 244, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 253, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 253, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 244, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_4 = NULL;
+    __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_4);
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
         __pyx_t_7 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 253, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
       }
       __Pyx_INCREF(__pyx_kp_s_I);
       __Pyx_GIVEREF(__pyx_kp_s_I);
       PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_I);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 244, __pyx_L1_error)
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_5 = __pyx_v_write; __pyx_t_8 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
       if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_8);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-      }
-    }
-    if (!__pyx_t_8) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_GIVEREF(__pyx_t_1);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_1);
-        __pyx_t_1 = 0;
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 244, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 253, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":242
+    /* "neobolt/impl/python/packstream/_packer.pyx":251
  *             write(b"\xD5")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
@@ -5598,7 +6097,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":246
+  /* "neobolt/impl/python/packstream/_packer.pyx":255
  *             write(struct_pack(">I", size))
  *         else:
  *             raise OverflowError("List header size out of range")             # <<<<<<<<<<<<<<
@@ -5606,15 +6105,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *     cpdef pack_list_stream_header(self):
  */
   /*else*/ {
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__103, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 246, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__53, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 255, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 246, __pyx_L1_error)
+    __PYX_ERR(0, 255, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":202
+  /* "neobolt/impl/python/packstream/_packer.pyx":211
  *             raise OverflowError("String header size out of range")
  * 
  *     cdef pack_list_header(self, int size):             # <<<<<<<<<<<<<<
@@ -5641,7 +6140,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":248
+/* "neobolt/impl/python/packstream/_packer.pyx":257
  *             raise OverflowError("List header size out of range")
  * 
  *     cpdef pack_list_stream_header(self):             # <<<<<<<<<<<<<<
@@ -5657,54 +6156,83 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_list_stream_header", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_list_stream_header); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_5pack_list_stream_header)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_list_stream_header); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_5pack_list_stream_header)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 257, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 248, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":249
+  /* "neobolt/impl/python/packstream/_packer.pyx":258
  * 
  *     cpdef pack_list_stream_header(self):
  *         self._write(b"\xD7")             # <<<<<<<<<<<<<<
  * 
  *     cdef pack_map_header(self, int size):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_self->_write, __pyx_tuple__105, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 249, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_self->_write);
+  __pyx_t_2 = __pyx_v_self->_write; __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__54) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__54);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":248
+  /* "neobolt/impl/python/packstream/_packer.pyx":257
  *             raise OverflowError("List header size out of range")
  * 
  *     cpdef pack_list_stream_header(self):             # <<<<<<<<<<<<<<
@@ -5745,9 +6273,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_4
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_list_stream_header", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_list_stream_header(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 248, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_list_stream_header(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 257, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -5764,7 +6295,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_4
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":251
+/* "neobolt/impl/python/packstream/_packer.pyx":260
  *         self._write(b"\xD7")
  * 
  *     cdef pack_map_header(self, int size):             # <<<<<<<<<<<<<<
@@ -5784,9 +6315,12 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_map_header", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":252
+  /* "neobolt/impl/python/packstream/_packer.pyx":261
  * 
  *     cdef pack_map_header(self, int size):
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -5798,7 +6332,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_v_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":253
+  /* "neobolt/impl/python/packstream/_packer.pyx":262
  *     cdef pack_map_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -5808,18 +6342,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x00) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":254
+    /* "neobolt/impl/python/packstream/_packer.pyx":263
  *         write = self._write
  *         if size == 0x00:
  *             write(b"\xA0")             # <<<<<<<<<<<<<<
  *         elif size == 0x01:
  *             write(b"\xA1")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__107, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 254, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__55) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__55);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 263, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":253
+    /* "neobolt/impl/python/packstream/_packer.pyx":262
  *     cdef pack_map_header(self, int size):
  *         write = self._write
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -5829,7 +6377,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":255
+  /* "neobolt/impl/python/packstream/_packer.pyx":264
  *         if size == 0x00:
  *             write(b"\xA0")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -5839,18 +6387,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x01) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":256
+    /* "neobolt/impl/python/packstream/_packer.pyx":265
  *             write(b"\xA0")
  *         elif size == 0x01:
  *             write(b"\xA1")             # <<<<<<<<<<<<<<
  *         elif size == 0x02:
  *             write(b"\xA2")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__109, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__56) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__56);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":255
+    /* "neobolt/impl/python/packstream/_packer.pyx":264
  *         if size == 0x00:
  *             write(b"\xA0")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -5860,7 +6422,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":257
+  /* "neobolt/impl/python/packstream/_packer.pyx":266
  *         elif size == 0x01:
  *             write(b"\xA1")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -5870,18 +6432,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x02) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":258
+    /* "neobolt/impl/python/packstream/_packer.pyx":267
  *             write(b"\xA1")
  *         elif size == 0x02:
  *             write(b"\xA2")             # <<<<<<<<<<<<<<
  *         elif size == 0x03:
  *             write(b"\xA3")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__111, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 258, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__57) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__57);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":257
+    /* "neobolt/impl/python/packstream/_packer.pyx":266
  *         elif size == 0x01:
  *             write(b"\xA1")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -5891,7 +6467,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":259
+  /* "neobolt/impl/python/packstream/_packer.pyx":268
  *         elif size == 0x02:
  *             write(b"\xA2")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -5901,18 +6477,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x03) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":260
+    /* "neobolt/impl/python/packstream/_packer.pyx":269
  *             write(b"\xA2")
  *         elif size == 0x03:
  *             write(b"\xA3")             # <<<<<<<<<<<<<<
  *         elif size == 0x04:
  *             write(b"\xA4")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__113, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__58) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__58);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 269, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":259
+    /* "neobolt/impl/python/packstream/_packer.pyx":268
  *         elif size == 0x02:
  *             write(b"\xA2")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -5922,7 +6512,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":261
+  /* "neobolt/impl/python/packstream/_packer.pyx":270
  *         elif size == 0x03:
  *             write(b"\xA3")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -5932,18 +6522,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x04) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":262
+    /* "neobolt/impl/python/packstream/_packer.pyx":271
  *             write(b"\xA3")
  *         elif size == 0x04:
  *             write(b"\xA4")             # <<<<<<<<<<<<<<
  *         elif size == 0x05:
  *             write(b"\xA5")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__115, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 262, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__59) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__59);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 271, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":261
+    /* "neobolt/impl/python/packstream/_packer.pyx":270
  *         elif size == 0x03:
  *             write(b"\xA3")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -5953,7 +6557,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":263
+  /* "neobolt/impl/python/packstream/_packer.pyx":272
  *         elif size == 0x04:
  *             write(b"\xA4")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -5963,18 +6567,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x05) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":264
+    /* "neobolt/impl/python/packstream/_packer.pyx":273
  *             write(b"\xA4")
  *         elif size == 0x05:
  *             write(b"\xA5")             # <<<<<<<<<<<<<<
  *         elif size == 0x06:
  *             write(b"\xA6")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__117, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 264, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__60) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__60);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 273, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":263
+    /* "neobolt/impl/python/packstream/_packer.pyx":272
  *         elif size == 0x04:
  *             write(b"\xA4")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -5984,7 +6602,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":265
+  /* "neobolt/impl/python/packstream/_packer.pyx":274
  *         elif size == 0x05:
  *             write(b"\xA5")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -5994,18 +6612,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x06) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":266
+    /* "neobolt/impl/python/packstream/_packer.pyx":275
  *             write(b"\xA5")
  *         elif size == 0x06:
  *             write(b"\xA6")             # <<<<<<<<<<<<<<
  *         elif size == 0x07:
  *             write(b"\xA7")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__119, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 266, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__61) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__61);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 275, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":265
+    /* "neobolt/impl/python/packstream/_packer.pyx":274
  *         elif size == 0x05:
  *             write(b"\xA5")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -6015,7 +6647,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":267
+  /* "neobolt/impl/python/packstream/_packer.pyx":276
  *         elif size == 0x06:
  *             write(b"\xA6")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -6025,18 +6657,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x07) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":268
+    /* "neobolt/impl/python/packstream/_packer.pyx":277
  *             write(b"\xA6")
  *         elif size == 0x07:
  *             write(b"\xA7")             # <<<<<<<<<<<<<<
  *         elif size == 0x08:
  *             write(b"\xA8")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__121, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 268, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__62) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__62);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":267
+    /* "neobolt/impl/python/packstream/_packer.pyx":276
  *         elif size == 0x06:
  *             write(b"\xA6")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -6046,7 +6692,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":269
+  /* "neobolt/impl/python/packstream/_packer.pyx":278
  *         elif size == 0x07:
  *             write(b"\xA7")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -6056,18 +6702,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x08) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":270
+    /* "neobolt/impl/python/packstream/_packer.pyx":279
  *             write(b"\xA7")
  *         elif size == 0x08:
  *             write(b"\xA8")             # <<<<<<<<<<<<<<
  *         elif size == 0x09:
  *             write(b"\xA9")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__123, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__63) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__63);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 279, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":269
+    /* "neobolt/impl/python/packstream/_packer.pyx":278
  *         elif size == 0x07:
  *             write(b"\xA7")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -6077,7 +6737,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":271
+  /* "neobolt/impl/python/packstream/_packer.pyx":280
  *         elif size == 0x08:
  *             write(b"\xA8")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -6087,18 +6747,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x09) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":272
+    /* "neobolt/impl/python/packstream/_packer.pyx":281
  *             write(b"\xA8")
  *         elif size == 0x09:
  *             write(b"\xA9")             # <<<<<<<<<<<<<<
  *         elif size == 0x0A:
  *             write(b"\xAA")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__125, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 272, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__64) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__64);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 281, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":271
+    /* "neobolt/impl/python/packstream/_packer.pyx":280
  *         elif size == 0x08:
  *             write(b"\xA8")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -6108,7 +6782,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":273
+  /* "neobolt/impl/python/packstream/_packer.pyx":282
  *         elif size == 0x09:
  *             write(b"\xA9")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -6118,18 +6792,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0A) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":274
+    /* "neobolt/impl/python/packstream/_packer.pyx":283
  *             write(b"\xA9")
  *         elif size == 0x0A:
  *             write(b"\xAA")             # <<<<<<<<<<<<<<
  *         elif size == 0x0B:
  *             write(b"\xAB")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__127, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 274, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__65) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__65);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 283, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":273
+    /* "neobolt/impl/python/packstream/_packer.pyx":282
  *         elif size == 0x09:
  *             write(b"\xA9")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -6139,7 +6827,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":275
+  /* "neobolt/impl/python/packstream/_packer.pyx":284
  *         elif size == 0x0A:
  *             write(b"\xAA")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -6149,18 +6837,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0B) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":276
+    /* "neobolt/impl/python/packstream/_packer.pyx":285
  *             write(b"\xAA")
  *         elif size == 0x0B:
  *             write(b"\xAB")             # <<<<<<<<<<<<<<
  *         elif size == 0x0C:
  *             write(b"\xAC")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__129, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 276, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__66) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__66);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 285, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":275
+    /* "neobolt/impl/python/packstream/_packer.pyx":284
  *         elif size == 0x0A:
  *             write(b"\xAA")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -6170,7 +6872,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":277
+  /* "neobolt/impl/python/packstream/_packer.pyx":286
  *         elif size == 0x0B:
  *             write(b"\xAB")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -6180,18 +6882,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0C) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":278
+    /* "neobolt/impl/python/packstream/_packer.pyx":287
  *             write(b"\xAB")
  *         elif size == 0x0C:
  *             write(b"\xAC")             # <<<<<<<<<<<<<<
  *         elif size == 0x0D:
  *             write(b"\xAD")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__131, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__67) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__67);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":277
+    /* "neobolt/impl/python/packstream/_packer.pyx":286
  *         elif size == 0x0B:
  *             write(b"\xAB")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -6201,7 +6917,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":279
+  /* "neobolt/impl/python/packstream/_packer.pyx":288
  *         elif size == 0x0C:
  *             write(b"\xAC")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -6211,18 +6927,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0D) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":280
+    /* "neobolt/impl/python/packstream/_packer.pyx":289
  *             write(b"\xAC")
  *         elif size == 0x0D:
  *             write(b"\xAD")             # <<<<<<<<<<<<<<
  *         elif size == 0x0E:
  *             write(b"\xAE")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__133, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 280, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__68) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__68);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":279
+    /* "neobolt/impl/python/packstream/_packer.pyx":288
  *         elif size == 0x0C:
  *             write(b"\xAC")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -6232,7 +6962,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":281
+  /* "neobolt/impl/python/packstream/_packer.pyx":290
  *         elif size == 0x0D:
  *             write(b"\xAD")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -6242,18 +6972,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0E) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":282
+    /* "neobolt/impl/python/packstream/_packer.pyx":291
  *             write(b"\xAD")
  *         elif size == 0x0E:
  *             write(b"\xAE")             # <<<<<<<<<<<<<<
  *         elif size == 0x0F:
  *             write(b"\xAF")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__135, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__69) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__69);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 291, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":281
+    /* "neobolt/impl/python/packstream/_packer.pyx":290
  *         elif size == 0x0D:
  *             write(b"\xAD")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -6263,7 +7007,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":283
+  /* "neobolt/impl/python/packstream/_packer.pyx":292
  *         elif size == 0x0E:
  *             write(b"\xAE")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -6273,18 +7017,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size == 0x0F) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":284
+    /* "neobolt/impl/python/packstream/_packer.pyx":293
  *             write(b"\xAE")
  *         elif size == 0x0F:
  *             write(b"\xAF")             # <<<<<<<<<<<<<<
  *         elif size < 0x100:
  *             write(b"\xD8")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__137, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__70) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__70);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":283
+    /* "neobolt/impl/python/packstream/_packer.pyx":292
  *         elif size == 0x0E:
  *             write(b"\xAE")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -6294,7 +7052,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":285
+  /* "neobolt/impl/python/packstream/_packer.pyx":294
  *         elif size == 0x0F:
  *             write(b"\xAF")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -6304,27 +7062,41 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x100) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":286
+    /* "neobolt/impl/python/packstream/_packer.pyx":295
  *             write(b"\xAF")
  *         elif size < 0x100:
  *             write(b"\xD8")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__139, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 286, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__71) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__71);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 295, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":287
+    /* "neobolt/impl/python/packstream/_packer.pyx":296
  *         elif size < 0x100:
  *             write(b"\xD8")
  *             write(PACKED_UINT_8[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x10000:
  *             write(b"\xD9")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 296, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 287, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 296, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
@@ -6338,45 +7110,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_5) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_5, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 287, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_5); __pyx_t_5 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 287, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 296, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":285
+    /* "neobolt/impl/python/packstream/_packer.pyx":294
  *         elif size == 0x0F:
  *             write(b"\xAF")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -6386,7 +7128,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":288
+  /* "neobolt/impl/python/packstream/_packer.pyx":297
  *             write(b"\xD8")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -6396,79 +7138,63 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_2 = ((__pyx_v_size < 0x10000) != 0);
   if (__pyx_t_2) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":289
+    /* "neobolt/impl/python/packstream/_packer.pyx":298
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  *             write(b"\xD9")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__141, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_kp_b__72) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_kp_b__72);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":290
+    /* "neobolt/impl/python/packstream/_packer.pyx":299
  *         elif size < 0x10000:
  *             write(b"\xD9")
  *             write(PACKED_UINT_16[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x100000000:
  *             write(b"\xDA")
  */
-    __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 299, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_6 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 290, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_3, __pyx_v_size, int, 1, __Pyx_PyInt_From_int, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_3 = __pyx_v_write; __pyx_t_4 = NULL;
+    __pyx_t_3 = __pyx_v_write; __pyx_t_5 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_5)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_3, function);
       }
     }
-    if (!__pyx_t_4) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_6); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_4, __pyx_t_6};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_5 = PyTuple_New(1+1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_4); __pyx_t_4 = NULL;
-        __Pyx_GIVEREF(__pyx_t_6);
-        PyTuple_SET_ITEM(__pyx_t_5, 0+1, __pyx_t_6);
-        __pyx_t_6 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 299, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":288
+    /* "neobolt/impl/python/packstream/_packer.pyx":297
  *             write(b"\xD8")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -6478,140 +7204,124 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":291
+  /* "neobolt/impl/python/packstream/_packer.pyx":300
  *             write(b"\xD9")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
  *             write(b"\xDA")
  *             write(struct_pack(">I", size))
  */
-  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_t_3 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967296, Py_LT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 300, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 291, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 300, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   if (likely(__pyx_t_2)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":292
+    /* "neobolt/impl/python/packstream/_packer.pyx":301
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:
  *             write(b"\xDA")             # <<<<<<<<<<<<<<
  *             write(struct_pack(">I", size))
  *         else:
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__143, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 292, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_1 = __pyx_v_write; __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_1))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_1);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_1, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_4, __pyx_kp_b__73) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_kp_b__73);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 301, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":293
+    /* "neobolt/impl/python/packstream/_packer.pyx":302
  *         elif size < 0x100000000:
  *             write(b"\xDA")
  *             write(struct_pack(">I", size))             # <<<<<<<<<<<<<<
  *         else:
  *             raise OverflowError("Map header size out of range")
  */
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 293, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 302, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 302, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_size); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 293, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_4 = NULL;
+    __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-        __Pyx_INCREF(__pyx_t_4);
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
         __pyx_t_7 = 1;
       }
     }
     #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (PyFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-      PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_kp_s_I, __pyx_t_6};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+      PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_kp_s_I, __pyx_t_5};
+      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
       __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     } else
     #endif
     {
-      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 293, __pyx_L1_error)
+      __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 302, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      if (__pyx_t_4) {
-        __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      if (__pyx_t_6) {
+        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6); __pyx_t_6 = NULL;
       }
       __Pyx_INCREF(__pyx_kp_s_I);
       __Pyx_GIVEREF(__pyx_kp_s_I);
       PyTuple_SET_ITEM(__pyx_t_8, 0+__pyx_t_7, __pyx_kp_s_I);
-      __Pyx_GIVEREF(__pyx_t_6);
-      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
+      __Pyx_GIVEREF(__pyx_t_5);
+      PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_t_5);
+      __pyx_t_5 = 0;
+      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_8, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_5 = __pyx_v_write; __pyx_t_8 = NULL;
-    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_5);
+    __pyx_t_4 = __pyx_v_write; __pyx_t_8 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_4);
       if (likely(__pyx_t_8)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
         __Pyx_INCREF(__pyx_t_8);
         __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_5, function);
-      }
-    }
-    if (!__pyx_t_8) {
-      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __Pyx_GOTREF(__pyx_t_3);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_8, __pyx_t_1};
-        __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 293, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_8); __pyx_t_8 = NULL;
-        __Pyx_GIVEREF(__pyx_t_1);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_1);
-        __pyx_t_1 = 0;
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 293, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF_SET(__pyx_t_4, function);
       }
     }
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_3 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_1);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 302, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":291
+    /* "neobolt/impl/python/packstream/_packer.pyx":300
  *             write(b"\xD9")
  *             write(PACKED_UINT_16[size])
  *         elif size < 0x100000000:             # <<<<<<<<<<<<<<
@@ -6621,7 +7331,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L3;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":295
+  /* "neobolt/impl/python/packstream/_packer.pyx":304
  *             write(struct_pack(">I", size))
  *         else:
  *             raise OverflowError("Map header size out of range")             # <<<<<<<<<<<<<<
@@ -6629,15 +7339,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *     cpdef pack_map_stream_header(self):
  */
   /*else*/ {
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__144, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__74, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 304, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 295, __pyx_L1_error)
+    __PYX_ERR(0, 304, __pyx_L1_error)
   }
   __pyx_L3:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":251
+  /* "neobolt/impl/python/packstream/_packer.pyx":260
  *         self._write(b"\xD7")
  * 
  *     cdef pack_map_header(self, int size):             # <<<<<<<<<<<<<<
@@ -6664,7 +7374,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":297
+/* "neobolt/impl/python/packstream/_packer.pyx":306
  *             raise OverflowError("Map header size out of range")
  * 
  *     cpdef pack_map_stream_header(self):             # <<<<<<<<<<<<<<
@@ -6680,54 +7390,83 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_map_stream_header", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_map_stream_header); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_7pack_map_stream_header)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_map_stream_header); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_7pack_map_stream_header)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 297, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":298
+  /* "neobolt/impl/python/packstream/_packer.pyx":307
  * 
  *     cpdef pack_map_stream_header(self):
  *         self._write(b"\xDB")             # <<<<<<<<<<<<<<
  * 
  *     cpdef pack_struct(self, bytes signature, fields):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_self->_write, __pyx_tuple__146, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_self->_write);
+  __pyx_t_2 = __pyx_v_self->_write; __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__75) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__75);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":297
+  /* "neobolt/impl/python/packstream/_packer.pyx":306
  *             raise OverflowError("Map header size out of range")
  * 
  *     cpdef pack_map_stream_header(self):             # <<<<<<<<<<<<<<
@@ -6768,9 +7507,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_6
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_map_stream_header", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_map_stream_header(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 297, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_map_stream_header(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6787,7 +7529,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_6
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":300
+/* "neobolt/impl/python/packstream/_packer.pyx":309
  *         self._write(b"\xDB")
  * 
  *     cpdef pack_struct(self, bytes signature, fields):             # <<<<<<<<<<<<<<
@@ -6811,70 +7553,88 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   Py_ssize_t __pyx_t_7;
   int __pyx_t_8;
   PyObject *(*__pyx_t_9)(PyObject *);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_struct", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_struct); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9pack_struct)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      __pyx_t_5 = 0;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_signature, __pyx_v_fields};
-        __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-      } else
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-        PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_signature, __pyx_v_fields};
-        __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_GOTREF(__pyx_t_2);
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 300, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        if (__pyx_t_4) {
-          __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_struct); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9pack_struct)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        __pyx_t_5 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __pyx_t_5 = 1;
+          }
         }
-        __Pyx_INCREF(__pyx_v_signature);
-        __Pyx_GIVEREF(__pyx_v_signature);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_signature);
-        __Pyx_INCREF(__pyx_v_fields);
-        __Pyx_GIVEREF(__pyx_v_fields);
-        PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_fields);
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_3)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_signature, __pyx_v_fields};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_signature, __pyx_v_fields};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+        } else
+        #endif
+        {
+          __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 309, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          if (__pyx_t_4) {
+            __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+          }
+          __Pyx_INCREF(__pyx_v_signature);
+          __Pyx_GIVEREF(__pyx_v_signature);
+          PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_signature);
+          __Pyx_INCREF(__pyx_v_fields);
+          __Pyx_GIVEREF(__pyx_v_fields);
+          PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_fields);
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 309, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":301
+  /* "neobolt/impl/python/packstream/_packer.pyx":310
  * 
  *     cpdef pack_struct(self, bytes signature, fields):
  *         if len(signature) != 1:             # <<<<<<<<<<<<<<
@@ -6883,26 +7643,26 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  */
   if (unlikely(__pyx_v_signature == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-    __PYX_ERR(0, 301, __pyx_L1_error)
+    __PYX_ERR(0, 310, __pyx_L1_error)
   }
-  __pyx_t_7 = PyBytes_GET_SIZE(__pyx_v_signature); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 301, __pyx_L1_error)
+  __pyx_t_7 = PyBytes_GET_SIZE(__pyx_v_signature); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 310, __pyx_L1_error)
   __pyx_t_8 = ((__pyx_t_7 != 1) != 0);
   if (unlikely(__pyx_t_8)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":302
+    /* "neobolt/impl/python/packstream/_packer.pyx":311
  *     cpdef pack_struct(self, bytes signature, fields):
  *         if len(signature) != 1:
  *             raise ValueError("Structure signature must be a single byte value")             # <<<<<<<<<<<<<<
  *         write = self._write
  *         size = len(fields)
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__147, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 302, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__76, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 311, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 302, __pyx_L1_error)
+    __PYX_ERR(0, 311, __pyx_L1_error)
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":301
+    /* "neobolt/impl/python/packstream/_packer.pyx":310
  * 
  *     cpdef pack_struct(self, bytes signature, fields):
  *         if len(signature) != 1:             # <<<<<<<<<<<<<<
@@ -6911,7 +7671,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  */
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":303
+  /* "neobolt/impl/python/packstream/_packer.pyx":312
  *         if len(signature) != 1:
  *             raise ValueError("Structure signature must be a single byte value")
  *         write = self._write             # <<<<<<<<<<<<<<
@@ -6923,17 +7683,17 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_v_write = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":304
+  /* "neobolt/impl/python/packstream/_packer.pyx":313
  *             raise ValueError("Structure signature must be a single byte value")
  *         write = self._write
  *         size = len(fields)             # <<<<<<<<<<<<<<
  *         if size == 0x00:
  *             write(b"\xB0")
  */
-  __pyx_t_7 = PyObject_Length(__pyx_v_fields); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 304, __pyx_L1_error)
+  __pyx_t_7 = PyObject_Length(__pyx_v_fields); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 313, __pyx_L1_error)
   __pyx_v_size = __pyx_t_7;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":305
+  /* "neobolt/impl/python/packstream/_packer.pyx":314
  *         write = self._write
  *         size = len(fields)
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -6943,18 +7703,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x00) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":306
+    /* "neobolt/impl/python/packstream/_packer.pyx":315
  *         size = len(fields)
  *         if size == 0x00:
  *             write(b"\xB0")             # <<<<<<<<<<<<<<
  *         elif size == 0x01:
  *             write(b"\xB1")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__149, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 306, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__77) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__77);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 315, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":305
+    /* "neobolt/impl/python/packstream/_packer.pyx":314
  *         write = self._write
  *         size = len(fields)
  *         if size == 0x00:             # <<<<<<<<<<<<<<
@@ -6964,7 +7738,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":307
+  /* "neobolt/impl/python/packstream/_packer.pyx":316
  *         if size == 0x00:
  *             write(b"\xB0")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -6974,18 +7748,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x01) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":308
+    /* "neobolt/impl/python/packstream/_packer.pyx":317
  *             write(b"\xB0")
  *         elif size == 0x01:
  *             write(b"\xB1")             # <<<<<<<<<<<<<<
  *         elif size == 0x02:
  *             write(b"\xB2")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__151, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 308, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__78) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__78);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 317, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":307
+    /* "neobolt/impl/python/packstream/_packer.pyx":316
  *         if size == 0x00:
  *             write(b"\xB0")
  *         elif size == 0x01:             # <<<<<<<<<<<<<<
@@ -6995,7 +7783,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":309
+  /* "neobolt/impl/python/packstream/_packer.pyx":318
  *         elif size == 0x01:
  *             write(b"\xB1")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -7005,18 +7793,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x02) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":310
+    /* "neobolt/impl/python/packstream/_packer.pyx":319
  *             write(b"\xB1")
  *         elif size == 0x02:
  *             write(b"\xB2")             # <<<<<<<<<<<<<<
  *         elif size == 0x03:
  *             write(b"\xB3")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__153, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 310, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__79) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__79);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 319, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":309
+    /* "neobolt/impl/python/packstream/_packer.pyx":318
  *         elif size == 0x01:
  *             write(b"\xB1")
  *         elif size == 0x02:             # <<<<<<<<<<<<<<
@@ -7026,7 +7828,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":311
+  /* "neobolt/impl/python/packstream/_packer.pyx":320
  *         elif size == 0x02:
  *             write(b"\xB2")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -7036,18 +7838,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x03) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":312
+    /* "neobolt/impl/python/packstream/_packer.pyx":321
  *             write(b"\xB2")
  *         elif size == 0x03:
  *             write(b"\xB3")             # <<<<<<<<<<<<<<
  *         elif size == 0x04:
  *             write(b"\xB4")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__155, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 312, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__80) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__80);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 321, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":311
+    /* "neobolt/impl/python/packstream/_packer.pyx":320
  *         elif size == 0x02:
  *             write(b"\xB2")
  *         elif size == 0x03:             # <<<<<<<<<<<<<<
@@ -7057,7 +7873,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":313
+  /* "neobolt/impl/python/packstream/_packer.pyx":322
  *         elif size == 0x03:
  *             write(b"\xB3")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -7067,18 +7883,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x04) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":314
+    /* "neobolt/impl/python/packstream/_packer.pyx":323
  *             write(b"\xB3")
  *         elif size == 0x04:
  *             write(b"\xB4")             # <<<<<<<<<<<<<<
  *         elif size == 0x05:
  *             write(b"\xB5")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__157, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 314, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__81) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__81);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 323, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":313
+    /* "neobolt/impl/python/packstream/_packer.pyx":322
  *         elif size == 0x03:
  *             write(b"\xB3")
  *         elif size == 0x04:             # <<<<<<<<<<<<<<
@@ -7088,7 +7918,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":315
+  /* "neobolt/impl/python/packstream/_packer.pyx":324
  *         elif size == 0x04:
  *             write(b"\xB4")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -7098,18 +7928,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x05) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":316
+    /* "neobolt/impl/python/packstream/_packer.pyx":325
  *             write(b"\xB4")
  *         elif size == 0x05:
  *             write(b"\xB5")             # <<<<<<<<<<<<<<
  *         elif size == 0x06:
  *             write(b"\xB6")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__159, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__82) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__82);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 325, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":315
+    /* "neobolt/impl/python/packstream/_packer.pyx":324
  *         elif size == 0x04:
  *             write(b"\xB4")
  *         elif size == 0x05:             # <<<<<<<<<<<<<<
@@ -7119,7 +7963,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":317
+  /* "neobolt/impl/python/packstream/_packer.pyx":326
  *         elif size == 0x05:
  *             write(b"\xB5")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -7129,18 +7973,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x06) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":318
+    /* "neobolt/impl/python/packstream/_packer.pyx":327
  *             write(b"\xB5")
  *         elif size == 0x06:
  *             write(b"\xB6")             # <<<<<<<<<<<<<<
  *         elif size == 0x07:
  *             write(b"\xB7")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__161, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__83) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__83);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 327, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":317
+    /* "neobolt/impl/python/packstream/_packer.pyx":326
  *         elif size == 0x05:
  *             write(b"\xB5")
  *         elif size == 0x06:             # <<<<<<<<<<<<<<
@@ -7150,7 +8008,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":319
+  /* "neobolt/impl/python/packstream/_packer.pyx":328
  *         elif size == 0x06:
  *             write(b"\xB6")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -7160,18 +8018,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x07) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":320
+    /* "neobolt/impl/python/packstream/_packer.pyx":329
  *             write(b"\xB6")
  *         elif size == 0x07:
  *             write(b"\xB7")             # <<<<<<<<<<<<<<
  *         elif size == 0x08:
  *             write(b"\xB8")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__163, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 320, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__84) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__84);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 329, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":319
+    /* "neobolt/impl/python/packstream/_packer.pyx":328
  *         elif size == 0x06:
  *             write(b"\xB6")
  *         elif size == 0x07:             # <<<<<<<<<<<<<<
@@ -7181,7 +8053,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":321
+  /* "neobolt/impl/python/packstream/_packer.pyx":330
  *         elif size == 0x07:
  *             write(b"\xB7")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -7191,18 +8063,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x08) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":322
+    /* "neobolt/impl/python/packstream/_packer.pyx":331
  *             write(b"\xB7")
  *         elif size == 0x08:
  *             write(b"\xB8")             # <<<<<<<<<<<<<<
  *         elif size == 0x09:
  *             write(b"\xB9")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__165, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 322, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__85) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__85);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 331, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":321
+    /* "neobolt/impl/python/packstream/_packer.pyx":330
  *         elif size == 0x07:
  *             write(b"\xB7")
  *         elif size == 0x08:             # <<<<<<<<<<<<<<
@@ -7212,7 +8098,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":323
+  /* "neobolt/impl/python/packstream/_packer.pyx":332
  *         elif size == 0x08:
  *             write(b"\xB8")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -7222,18 +8108,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x09) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":324
+    /* "neobolt/impl/python/packstream/_packer.pyx":333
  *             write(b"\xB8")
  *         elif size == 0x09:
  *             write(b"\xB9")             # <<<<<<<<<<<<<<
  *         elif size == 0x0A:
  *             write(b"\xBA")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__167, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 324, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__86) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__86);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 333, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":323
+    /* "neobolt/impl/python/packstream/_packer.pyx":332
  *         elif size == 0x08:
  *             write(b"\xB8")
  *         elif size == 0x09:             # <<<<<<<<<<<<<<
@@ -7243,7 +8143,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":325
+  /* "neobolt/impl/python/packstream/_packer.pyx":334
  *         elif size == 0x09:
  *             write(b"\xB9")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -7253,18 +8153,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0A) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":326
+    /* "neobolt/impl/python/packstream/_packer.pyx":335
  *             write(b"\xB9")
  *         elif size == 0x0A:
  *             write(b"\xBA")             # <<<<<<<<<<<<<<
  *         elif size == 0x0B:
  *             write(b"\xBB")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__169, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 326, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__87) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__87);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 335, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":325
+    /* "neobolt/impl/python/packstream/_packer.pyx":334
  *         elif size == 0x09:
  *             write(b"\xB9")
  *         elif size == 0x0A:             # <<<<<<<<<<<<<<
@@ -7274,7 +8188,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":327
+  /* "neobolt/impl/python/packstream/_packer.pyx":336
  *         elif size == 0x0A:
  *             write(b"\xBA")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -7284,18 +8198,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0B) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":328
+    /* "neobolt/impl/python/packstream/_packer.pyx":337
  *             write(b"\xBA")
  *         elif size == 0x0B:
  *             write(b"\xBB")             # <<<<<<<<<<<<<<
  *         elif size == 0x0C:
  *             write(b"\xBC")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__171, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__88) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__88);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 337, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":327
+    /* "neobolt/impl/python/packstream/_packer.pyx":336
  *         elif size == 0x0A:
  *             write(b"\xBA")
  *         elif size == 0x0B:             # <<<<<<<<<<<<<<
@@ -7305,7 +8233,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":329
+  /* "neobolt/impl/python/packstream/_packer.pyx":338
  *         elif size == 0x0B:
  *             write(b"\xBB")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -7315,18 +8243,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0C) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":330
+    /* "neobolt/impl/python/packstream/_packer.pyx":339
  *             write(b"\xBB")
  *         elif size == 0x0C:
  *             write(b"\xBC")             # <<<<<<<<<<<<<<
  *         elif size == 0x0D:
  *             write(b"\xBD")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__173, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 330, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__89) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__89);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":329
+    /* "neobolt/impl/python/packstream/_packer.pyx":338
  *         elif size == 0x0B:
  *             write(b"\xBB")
  *         elif size == 0x0C:             # <<<<<<<<<<<<<<
@@ -7336,7 +8278,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":331
+  /* "neobolt/impl/python/packstream/_packer.pyx":340
  *         elif size == 0x0C:
  *             write(b"\xBC")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -7346,18 +8288,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0D) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":332
+    /* "neobolt/impl/python/packstream/_packer.pyx":341
  *             write(b"\xBC")
  *         elif size == 0x0D:
  *             write(b"\xBD")             # <<<<<<<<<<<<<<
  *         elif size == 0x0E:
  *             write(b"\xBE")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__175, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 332, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__90) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__90);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":331
+    /* "neobolt/impl/python/packstream/_packer.pyx":340
  *         elif size == 0x0C:
  *             write(b"\xBC")
  *         elif size == 0x0D:             # <<<<<<<<<<<<<<
@@ -7367,7 +8323,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":333
+  /* "neobolt/impl/python/packstream/_packer.pyx":342
  *         elif size == 0x0D:
  *             write(b"\xBD")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -7377,18 +8333,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0E) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":334
+    /* "neobolt/impl/python/packstream/_packer.pyx":343
  *             write(b"\xBD")
  *         elif size == 0x0E:
  *             write(b"\xBE")             # <<<<<<<<<<<<<<
  *         elif size == 0x0F:
  *             write(b"\xBF")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__177, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 334, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__91) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__91);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 343, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":333
+    /* "neobolt/impl/python/packstream/_packer.pyx":342
  *         elif size == 0x0D:
  *             write(b"\xBD")
  *         elif size == 0x0E:             # <<<<<<<<<<<<<<
@@ -7398,7 +8368,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":335
+  /* "neobolt/impl/python/packstream/_packer.pyx":344
  *         elif size == 0x0E:
  *             write(b"\xBE")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -7408,18 +8378,32 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size == 0x0F) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":336
+    /* "neobolt/impl/python/packstream/_packer.pyx":345
  *             write(b"\xBE")
  *         elif size == 0x0F:
  *             write(b"\xBF")             # <<<<<<<<<<<<<<
  *         elif size < 0x100:
  *             write(b"\xDC")
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__179, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 336, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__92) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__92);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":335
+    /* "neobolt/impl/python/packstream/_packer.pyx":344
  *         elif size == 0x0E:
  *             write(b"\xBE")
  *         elif size == 0x0F:             # <<<<<<<<<<<<<<
@@ -7429,7 +8413,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":337
+  /* "neobolt/impl/python/packstream/_packer.pyx":346
  *         elif size == 0x0F:
  *             write(b"\xBF")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -7439,27 +8423,41 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size < 0x100) != 0);
   if (__pyx_t_8) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":338
+    /* "neobolt/impl/python/packstream/_packer.pyx":347
  *             write(b"\xBF")
  *         elif size < 0x100:
  *             write(b"\xDC")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__181, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 338, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__93) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__93);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 347, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":339
+    /* "neobolt/impl/python/packstream/_packer.pyx":348
  *         elif size < 0x100:
  *             write(b"\xDC")
  *             write(PACKED_UINT_8[size])             # <<<<<<<<<<<<<<
  *         elif size < 0x10000:
  *             write(b"\xDD")
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_PACKED_UINT_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 348, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_size, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_size, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 348, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_INCREF(__pyx_v_write);
@@ -7473,45 +8471,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         __Pyx_DECREF_SET(__pyx_t_2, function);
       }
     }
-    if (!__pyx_t_6) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_2)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_3};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_t_3};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
-        __Pyx_GIVEREF(__pyx_t_3);
-        PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_t_3);
-        __pyx_t_3 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 339, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 348, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":337
+    /* "neobolt/impl/python/packstream/_packer.pyx":346
  *         elif size == 0x0F:
  *             write(b"\xBF")
  *         elif size < 0x100:             # <<<<<<<<<<<<<<
@@ -7521,7 +8489,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":340
+  /* "neobolt/impl/python/packstream/_packer.pyx":349
  *             write(b"\xDC")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -7531,79 +8499,63 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   __pyx_t_8 = ((__pyx_v_size < 0x10000) != 0);
   if (likely(__pyx_t_8)) {
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":341
+    /* "neobolt/impl/python/packstream/_packer.pyx":350
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:
  *             write(b"\xDD")             # <<<<<<<<<<<<<<
  *             write(PACKED_UINT_16[size])
  *         else:
  */
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_write, __pyx_tuple__183, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 341, __pyx_L1_error)
+    __Pyx_INCREF(__pyx_v_write);
+    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_3)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_2, function);
+      }
+    }
+    __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__94) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__94);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":342
+    /* "neobolt/impl/python/packstream/_packer.pyx":351
  *         elif size < 0x10000:
  *             write(b"\xDD")
  *             write(PACKED_UINT_16[size])             # <<<<<<<<<<<<<<
  *         else:
  *             raise OverflowError("Structure size out of range")
  */
-    __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 342, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_PACKED_UINT_16); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 351, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_size, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 342, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_3 = __Pyx_GetItemInt(__pyx_t_2, __pyx_v_size, Py_ssize_t, 1, PyInt_FromSsize_t, 0, 1, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_INCREF(__pyx_v_write);
-    __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
+    __pyx_t_2 = __pyx_v_write; __pyx_t_6 = NULL;
     if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-      __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-      if (likely(__pyx_t_3)) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+      if (likely(__pyx_t_6)) {
         PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_6);
         __Pyx_INCREF(function);
         __Pyx_DECREF_SET(__pyx_t_2, function);
       }
     }
-    if (!__pyx_t_3) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_2)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_3, __pyx_t_4};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_6 = PyTuple_New(1+1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 342, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3); __pyx_t_3 = NULL;
-        __Pyx_GIVEREF(__pyx_t_4);
-        PyTuple_SET_ITEM(__pyx_t_6, 0+1, __pyx_t_4);
-        __pyx_t_4 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 342, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      }
-    }
+    __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 351, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":340
+    /* "neobolt/impl/python/packstream/_packer.pyx":349
  *             write(b"\xDC")
  *             write(PACKED_UINT_8[size])
  *         elif size < 0x10000:             # <<<<<<<<<<<<<<
@@ -7613,7 +8565,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     goto __pyx_L4;
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":344
+  /* "neobolt/impl/python/packstream/_packer.pyx":353
  *             write(PACKED_UINT_16[size])
  *         else:
  *             raise OverflowError("Structure size out of range")             # <<<<<<<<<<<<<<
@@ -7621,15 +8573,15 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *         for field in fields:
  */
   /*else*/ {
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__184, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 344, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_OverflowError, __pyx_tuple__95, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 353, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 344, __pyx_L1_error)
+    __PYX_ERR(0, 353, __pyx_L1_error)
   }
   __pyx_L4:;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":345
+  /* "neobolt/impl/python/packstream/_packer.pyx":354
  *         else:
  *             raise OverflowError("Structure size out of range")
  *         write(signature)             # <<<<<<<<<<<<<<
@@ -7637,82 +8589,54 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
  *             self._pack(field)
  */
   __Pyx_INCREF(__pyx_v_write);
-  __pyx_t_2 = __pyx_v_write; __pyx_t_6 = NULL;
+  __pyx_t_2 = __pyx_v_write; __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_6)) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
       PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(function);
       __Pyx_DECREF_SET(__pyx_t_2, function);
     }
   }
-  if (!__pyx_t_6) {
-    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_signature); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_signature) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_signature);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "neobolt/impl/python/packstream/_packer.pyx":355
+ *             raise OverflowError("Structure size out of range")
+ *         write(signature)
+ *         for field in fields:             # <<<<<<<<<<<<<<
+ *             self._pack(field)
+ * 
+ */
+  if (likely(PyList_CheckExact(__pyx_v_fields)) || PyTuple_CheckExact(__pyx_v_fields)) {
+    __pyx_t_1 = __pyx_v_fields; __Pyx_INCREF(__pyx_t_1); __pyx_t_7 = 0;
+    __pyx_t_9 = NULL;
   } else {
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_signature};
-      __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-      PyObject *__pyx_temp[2] = {__pyx_t_6, __pyx_v_signature};
-      __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
-      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else
-    #endif
-    {
-      __pyx_t_4 = PyTuple_New(1+1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 345, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_6); __pyx_t_6 = NULL;
-      __Pyx_INCREF(__pyx_v_signature);
-      __Pyx_GIVEREF(__pyx_v_signature);
-      PyTuple_SET_ITEM(__pyx_t_4, 0+1, __pyx_v_signature);
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 345, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    }
-  }
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":346
- *             raise OverflowError("Structure size out of range")
- *         write(signature)
- *         for field in fields:             # <<<<<<<<<<<<<<
- *             self._pack(field)
- * 
- */
-  if (likely(PyList_CheckExact(__pyx_v_fields)) || PyTuple_CheckExact(__pyx_v_fields)) {
-    __pyx_t_1 = __pyx_v_fields; __Pyx_INCREF(__pyx_t_1); __pyx_t_7 = 0;
-    __pyx_t_9 = NULL;
-  } else {
-    __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_fields); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_7 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_fields); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 355, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_9 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 346, __pyx_L1_error)
+    __pyx_t_9 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 355, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_9)) {
       if (likely(PyList_CheckExact(__pyx_t_1))) {
         if (__pyx_t_7 >= PyList_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 346, __pyx_L1_error)
+        __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 355, __pyx_L1_error)
         #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 346, __pyx_L1_error)
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 355, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         #endif
       } else {
         if (__pyx_t_7 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 346, __pyx_L1_error)
+        __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_7); __Pyx_INCREF(__pyx_t_2); __pyx_t_7++; if (unlikely(0 < 0)) __PYX_ERR(0, 355, __pyx_L1_error)
         #else
-        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 346, __pyx_L1_error)
+        __pyx_t_2 = PySequence_ITEM(__pyx_t_1, __pyx_t_7); __pyx_t_7++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 355, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         #endif
       }
@@ -7722,7 +8646,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 346, __pyx_L1_error)
+          else __PYX_ERR(0, 355, __pyx_L1_error)
         }
         break;
       }
@@ -7731,18 +8655,18 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
     __Pyx_XDECREF_SET(__pyx_v_field, __pyx_t_2);
     __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":347
+    /* "neobolt/impl/python/packstream/_packer.pyx":356
  *         write(signature)
  *         for field in fields:
  *             self._pack(field)             # <<<<<<<<<<<<<<
  * 
  *     cpdef pack_end_of_stream(self):
  */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_field); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __pyx_t_2 = ((struct __pyx_vtabstruct_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_field); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 356, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "neobolt/impl/python/packstream/_packer.pyx":346
+    /* "neobolt/impl/python/packstream/_packer.pyx":355
  *             raise OverflowError("Structure size out of range")
  *         write(signature)
  *         for field in fields:             # <<<<<<<<<<<<<<
@@ -7752,7 +8676,7 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":300
+  /* "neobolt/impl/python/packstream/_packer.pyx":309
  *         self._write(b"\xDB")
  * 
  *     cpdef pack_struct(self, bytes signature, fields):             # <<<<<<<<<<<<<<
@@ -7784,6 +8708,9 @@ static PyObject *__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9
 static PyObject *__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9pack_struct(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_signature = 0;
   PyObject *__pyx_v_fields = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("pack_struct (wrapper)", 0);
@@ -7810,11 +8737,11 @@ static PyObject *__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_fields)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("pack_struct", 1, 2, 2, 1); __PYX_ERR(0, 300, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("pack_struct", 1, 2, 2, 1); __PYX_ERR(0, 309, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pack_struct") < 0)) __PYX_ERR(0, 300, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "pack_struct") < 0)) __PYX_ERR(0, 309, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -7827,13 +8754,13 @@ static PyObject *__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_struct", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 300, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("pack_struct", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 309, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("neobolt.impl.python.packstream._packer.Packer.pack_struct", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_signature), (&PyBytes_Type), 1, "signature", 1))) __PYX_ERR(0, 300, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_signature), (&PyBytes_Type), 1, "signature", 1))) __PYX_ERR(0, 309, __pyx_L1_error)
   __pyx_r = __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_8pack_struct(((struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *)__pyx_v_self), __pyx_v_signature, __pyx_v_fields);
 
   /* function exit code */
@@ -7849,9 +8776,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_8
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_struct", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_struct(__pyx_v_self, __pyx_v_signature, __pyx_v_fields, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 300, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_struct(__pyx_v_self, __pyx_v_signature, __pyx_v_fields, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 309, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7868,7 +8798,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_8
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":349
+/* "neobolt/impl/python/packstream/_packer.pyx":358
  *             self._pack(field)
  * 
  *     cpdef pack_end_of_stream(self):             # <<<<<<<<<<<<<<
@@ -7883,52 +8813,81 @@ static PyObject *__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pa
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_end_of_stream", 0);
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
   /* Check if overridden in Python */
-  else if (unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0)) {
-    __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_end_of_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_11pack_end_of_stream)) {
-      __Pyx_XDECREF(__pyx_r);
-      __Pyx_INCREF(__pyx_t_1);
-      __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack_end_of_stream); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_11pack_end_of_stream)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+          }
         }
+        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 358, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
       }
-      if (__pyx_t_4) {
-        __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_2 = __Pyx_PyObject_CallNoArg(__pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 349, __pyx_L1_error)
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
       }
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_r = __pyx_t_2;
-      __pyx_t_2 = 0;
+      #endif
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      goto __pyx_L0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
     }
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    #endif
   }
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":350
+  /* "neobolt/impl/python/packstream/_packer.pyx":359
  * 
  *     cpdef pack_end_of_stream(self):
  *         self._write(b"\xDF")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_v_self->_write, __pyx_tuple__186, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 350, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_self->_write);
+  __pyx_t_2 = __pyx_v_self->_write; __pyx_t_3 = NULL;
+  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_kp_b__96) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_kp_b__96);
+  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 359, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":349
+  /* "neobolt/impl/python/packstream/_packer.pyx":358
  *             self._pack(field)
  * 
  *     cpdef pack_end_of_stream(self):             # <<<<<<<<<<<<<<
@@ -7968,9 +8927,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pack_end_of_stream", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_end_of_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 349, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_end_of_stream(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 358, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -7987,7 +8949,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
   return __pyx_r;
 }
 
-/* "neobolt/impl/python/packstream/_packer.pyx":48
+/* "neobolt/impl/python/packstream/_packer.pyx":52
  * cdef class Packer(object):
  * 
  *     cdef public bint supports_bytes             # <<<<<<<<<<<<<<
@@ -8012,9 +8974,12 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->supports_bytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->supports_bytes); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 52, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -8048,8 +9013,11 @@ static int __pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_14suppo
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__set__", 0);
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 52, __pyx_L1_error)
   __pyx_v_self->supports_bytes = __pyx_t_1;
 
   /* function exit code */
@@ -8086,6 +9054,9 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__reduce_cython__", 0);
 
   /* "(tree fragment)":2
@@ -8094,7 +9065,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__187, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__97, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -8140,6 +9111,9 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__setstate_cython__", 0);
 
   /* "(tree fragment)":4
@@ -8147,7 +9121,7 @@ static PyObject *__pyx_pf_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__188, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__98, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_Raise(__pyx_t_1, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -8184,6 +9158,7 @@ static PyObject *__pyx_tp_new_7neobolt_4impl_6python_10packstream_7_packer_Packe
   p->__pyx_vtab = __pyx_vtabptr_7neobolt_4impl_6python_10packstream_7_packer_Packer;
   p->stream = Py_None; Py_INCREF(Py_None);
   p->_write = Py_None; Py_INCREF(Py_None);
+  p->_write_segment = Py_None; Py_INCREF(Py_None);
   if (unlikely(__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_1__cinit__(o, a, k) < 0)) goto bad;
   return o;
   bad:
@@ -8194,13 +9169,14 @@ static PyObject *__pyx_tp_new_7neobolt_4impl_6python_10packstream_7_packer_Packe
 static void __pyx_tp_dealloc_7neobolt_4impl_6python_10packstream_7_packer_Packer(PyObject *o) {
   struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *p = (struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
   PyObject_GC_UnTrack(o);
   Py_CLEAR(p->stream);
   Py_CLEAR(p->_write);
+  Py_CLEAR(p->_write_segment);
   (*Py_TYPE(o)->tp_free)(o);
 }
 
@@ -8213,6 +9189,9 @@ static int __pyx_tp_traverse_7neobolt_4impl_6python_10packstream_7_packer_Packer
   if (p->_write) {
     e = (*v)(p->_write, a); if (e) return e;
   }
+  if (p->_write_segment) {
+    e = (*v)(p->_write_segment, a); if (e) return e;
+  }
   return 0;
 }
 
@@ -8225,6 +9204,9 @@ static int __pyx_tp_clear_7neobolt_4impl_6python_10packstream_7_packer_Packer(Py
   tmp = ((PyObject*)p->_write);
   p->_write = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_write_segment);
+  p->_write_segment = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
   return 0;
 }
 
@@ -8246,7 +9228,7 @@ static PyMethodDef __pyx_methods_7neobolt_4impl_6python_10packstream_7_packer_Pa
   {"pack", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_3pack, METH_O, 0},
   {"pack_list_stream_header", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_5pack_list_stream_header, METH_NOARGS, 0},
   {"pack_map_stream_header", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_7pack_map_stream_header, METH_NOARGS, 0},
-  {"pack_struct", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9pack_struct, METH_VARARGS|METH_KEYWORDS, 0},
+  {"pack_struct", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_9pack_struct, METH_VARARGS|METH_KEYWORDS, 0},
   {"pack_end_of_stream", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_11pack_end_of_stream, METH_NOARGS, 0},
   {"__reduce_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_13__reduce_cython__, METH_NOARGS, 0},
   {"__setstate_cython__", (PyCFunction)__pyx_pw_7neobolt_4impl_6python_10packstream_7_packer_6Packer_15__setstate_cython__, METH_O, 0},
@@ -8264,7 +9246,12 @@ static PyTypeObject __pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Pack
   sizeof(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_7neobolt_4impl_6python_10packstream_7_packer_Packer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -8314,6 +9301,15 @@ static PyTypeObject __pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Pack
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -8351,6 +9347,15 @@ static struct PyModuleDef __pyx_moduledef = {
     NULL /* m_free */
 };
 #endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_b_, __pyx_k_, sizeof(__pyx_k_), 0, 0, 0, 0},
@@ -8366,6 +9371,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_OverflowError, __pyx_k_OverflowError, sizeof(__pyx_k_OverflowError), 0, 0, 1, 1},
   {&__pyx_n_s_PACKED_UINT_16, __pyx_k_PACKED_UINT_16, sizeof(__pyx_k_PACKED_UINT_16), 0, 0, 1, 1},
   {&__pyx_n_s_PACKED_UINT_8, __pyx_k_PACKED_UINT_8, sizeof(__pyx_k_PACKED_UINT_8), 0, 0, 1, 1},
+  {&__pyx_n_s_Packer, __pyx_k_Packer, sizeof(__pyx_k_Packer), 0, 0, 1, 1},
   {&__pyx_kp_s_String_header_size_out_of_range, __pyx_k_String_header_size_out_of_range, sizeof(__pyx_k_String_header_size_out_of_range), 0, 0, 1, 0},
   {&__pyx_n_s_Structure, __pyx_k_Structure, sizeof(__pyx_k_Structure), 0, 0, 1, 1},
   {&__pyx_kp_s_Structure_signature_must_be_a_si, __pyx_k_Structure_signature_must_be_a_si, sizeof(__pyx_k_Structure_signature_must_be_a_si), 0, 0, 1, 0},
@@ -8378,94 +9384,94 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_UNPACKED_UINT_8, __pyx_k_UNPACKED_UINT_8, sizeof(__pyx_k_UNPACKED_UINT_8), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_kp_s_Values_of_type_s_are_not_support, __pyx_k_Values_of_type_s_are_not_support, sizeof(__pyx_k_Values_of_type_s_are_not_support), 0, 0, 1, 0},
-  {&__pyx_kp_b__101, __pyx_k__101, sizeof(__pyx_k__101), 0, 0, 0, 0},
-  {&__pyx_kp_b__104, __pyx_k__104, sizeof(__pyx_k__104), 0, 0, 0, 0},
-  {&__pyx_kp_b__106, __pyx_k__106, sizeof(__pyx_k__106), 0, 0, 0, 0},
-  {&__pyx_kp_b__108, __pyx_k__108, sizeof(__pyx_k__108), 0, 0, 0, 0},
+  {&__pyx_kp_b__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 0, 0, 0},
   {&__pyx_kp_b__11, __pyx_k__11, sizeof(__pyx_k__11), 0, 0, 0, 0},
-  {&__pyx_kp_b__110, __pyx_k__110, sizeof(__pyx_k__110), 0, 0, 0, 0},
-  {&__pyx_kp_b__112, __pyx_k__112, sizeof(__pyx_k__112), 0, 0, 0, 0},
-  {&__pyx_kp_b__114, __pyx_k__114, sizeof(__pyx_k__114), 0, 0, 0, 0},
-  {&__pyx_kp_b__116, __pyx_k__116, sizeof(__pyx_k__116), 0, 0, 0, 0},
-  {&__pyx_kp_b__118, __pyx_k__118, sizeof(__pyx_k__118), 0, 0, 0, 0},
-  {&__pyx_kp_b__120, __pyx_k__120, sizeof(__pyx_k__120), 0, 0, 0, 0},
-  {&__pyx_kp_b__122, __pyx_k__122, sizeof(__pyx_k__122), 0, 0, 0, 0},
-  {&__pyx_kp_b__124, __pyx_k__124, sizeof(__pyx_k__124), 0, 0, 0, 0},
-  {&__pyx_kp_b__126, __pyx_k__126, sizeof(__pyx_k__126), 0, 0, 0, 0},
-  {&__pyx_kp_b__128, __pyx_k__128, sizeof(__pyx_k__128), 0, 0, 0, 0},
-  {&__pyx_kp_b__13, __pyx_k__13, sizeof(__pyx_k__13), 0, 0, 0, 0},
-  {&__pyx_kp_b__130, __pyx_k__130, sizeof(__pyx_k__130), 0, 0, 0, 0},
-  {&__pyx_kp_b__132, __pyx_k__132, sizeof(__pyx_k__132), 0, 0, 0, 0},
-  {&__pyx_kp_b__134, __pyx_k__134, sizeof(__pyx_k__134), 0, 0, 0, 0},
-  {&__pyx_kp_b__136, __pyx_k__136, sizeof(__pyx_k__136), 0, 0, 0, 0},
-  {&__pyx_kp_b__138, __pyx_k__138, sizeof(__pyx_k__138), 0, 0, 0, 0},
-  {&__pyx_kp_b__140, __pyx_k__140, sizeof(__pyx_k__140), 0, 0, 0, 0},
-  {&__pyx_kp_b__142, __pyx_k__142, sizeof(__pyx_k__142), 0, 0, 0, 0},
-  {&__pyx_kp_b__145, __pyx_k__145, sizeof(__pyx_k__145), 0, 0, 0, 0},
-  {&__pyx_kp_b__148, __pyx_k__148, sizeof(__pyx_k__148), 0, 0, 0, 0},
+  {&__pyx_kp_b__12, __pyx_k__12, sizeof(__pyx_k__12), 0, 0, 0, 0},
+  {&__pyx_kp_b__14, __pyx_k__14, sizeof(__pyx_k__14), 0, 0, 0, 0},
   {&__pyx_kp_b__15, __pyx_k__15, sizeof(__pyx_k__15), 0, 0, 0, 0},
-  {&__pyx_kp_b__150, __pyx_k__150, sizeof(__pyx_k__150), 0, 0, 0, 0},
-  {&__pyx_kp_b__152, __pyx_k__152, sizeof(__pyx_k__152), 0, 0, 0, 0},
-  {&__pyx_kp_b__154, __pyx_k__154, sizeof(__pyx_k__154), 0, 0, 0, 0},
-  {&__pyx_kp_b__156, __pyx_k__156, sizeof(__pyx_k__156), 0, 0, 0, 0},
-  {&__pyx_kp_b__158, __pyx_k__158, sizeof(__pyx_k__158), 0, 0, 0, 0},
-  {&__pyx_kp_b__160, __pyx_k__160, sizeof(__pyx_k__160), 0, 0, 0, 0},
-  {&__pyx_kp_b__162, __pyx_k__162, sizeof(__pyx_k__162), 0, 0, 0, 0},
-  {&__pyx_kp_b__164, __pyx_k__164, sizeof(__pyx_k__164), 0, 0, 0, 0},
-  {&__pyx_kp_b__166, __pyx_k__166, sizeof(__pyx_k__166), 0, 0, 0, 0},
-  {&__pyx_kp_b__168, __pyx_k__168, sizeof(__pyx_k__168), 0, 0, 0, 0},
-  {&__pyx_kp_b__170, __pyx_k__170, sizeof(__pyx_k__170), 0, 0, 0, 0},
-  {&__pyx_kp_b__172, __pyx_k__172, sizeof(__pyx_k__172), 0, 0, 0, 0},
-  {&__pyx_kp_b__174, __pyx_k__174, sizeof(__pyx_k__174), 0, 0, 0, 0},
-  {&__pyx_kp_b__176, __pyx_k__176, sizeof(__pyx_k__176), 0, 0, 0, 0},
-  {&__pyx_kp_b__178, __pyx_k__178, sizeof(__pyx_k__178), 0, 0, 0, 0},
-  {&__pyx_kp_b__180, __pyx_k__180, sizeof(__pyx_k__180), 0, 0, 0, 0},
-  {&__pyx_kp_b__182, __pyx_k__182, sizeof(__pyx_k__182), 0, 0, 0, 0},
-  {&__pyx_kp_b__185, __pyx_k__185, sizeof(__pyx_k__185), 0, 0, 0, 0},
+  {&__pyx_kp_b__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 0, 0, 0},
+  {&__pyx_kp_b__17, __pyx_k__17, sizeof(__pyx_k__17), 0, 0, 0, 0},
+  {&__pyx_kp_b__18, __pyx_k__18, sizeof(__pyx_k__18), 0, 0, 0, 0},
   {&__pyx_kp_b__19, __pyx_k__19, sizeof(__pyx_k__19), 0, 0, 0, 0},
+  {&__pyx_kp_b__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 0, 0},
+  {&__pyx_kp_b__20, __pyx_k__20, sizeof(__pyx_k__20), 0, 0, 0, 0},
   {&__pyx_kp_b__21, __pyx_k__21, sizeof(__pyx_k__21), 0, 0, 0, 0},
+  {&__pyx_kp_b__22, __pyx_k__22, sizeof(__pyx_k__22), 0, 0, 0, 0},
   {&__pyx_kp_b__23, __pyx_k__23, sizeof(__pyx_k__23), 0, 0, 0, 0},
+  {&__pyx_kp_b__24, __pyx_k__24, sizeof(__pyx_k__24), 0, 0, 0, 0},
+  {&__pyx_kp_b__25, __pyx_k__25, sizeof(__pyx_k__25), 0, 0, 0, 0},
   {&__pyx_kp_b__26, __pyx_k__26, sizeof(__pyx_k__26), 0, 0, 0, 0},
+  {&__pyx_kp_b__27, __pyx_k__27, sizeof(__pyx_k__27), 0, 0, 0, 0},
   {&__pyx_kp_b__28, __pyx_k__28, sizeof(__pyx_k__28), 0, 0, 0, 0},
+  {&__pyx_kp_b__29, __pyx_k__29, sizeof(__pyx_k__29), 0, 0, 0, 0},
   {&__pyx_kp_b__3, __pyx_k__3, sizeof(__pyx_k__3), 0, 0, 0, 0},
   {&__pyx_kp_b__30, __pyx_k__30, sizeof(__pyx_k__30), 0, 0, 0, 0},
+  {&__pyx_kp_b__31, __pyx_k__31, sizeof(__pyx_k__31), 0, 0, 0, 0},
   {&__pyx_kp_b__32, __pyx_k__32, sizeof(__pyx_k__32), 0, 0, 0, 0},
   {&__pyx_kp_b__34, __pyx_k__34, sizeof(__pyx_k__34), 0, 0, 0, 0},
+  {&__pyx_kp_b__35, __pyx_k__35, sizeof(__pyx_k__35), 0, 0, 0, 0},
   {&__pyx_kp_b__36, __pyx_k__36, sizeof(__pyx_k__36), 0, 0, 0, 0},
+  {&__pyx_kp_b__37, __pyx_k__37, sizeof(__pyx_k__37), 0, 0, 0, 0},
   {&__pyx_kp_b__38, __pyx_k__38, sizeof(__pyx_k__38), 0, 0, 0, 0},
+  {&__pyx_kp_b__39, __pyx_k__39, sizeof(__pyx_k__39), 0, 0, 0, 0},
+  {&__pyx_kp_b__4, __pyx_k__4, sizeof(__pyx_k__4), 0, 0, 0, 0},
   {&__pyx_kp_b__40, __pyx_k__40, sizeof(__pyx_k__40), 0, 0, 0, 0},
+  {&__pyx_kp_b__41, __pyx_k__41, sizeof(__pyx_k__41), 0, 0, 0, 0},
   {&__pyx_kp_b__42, __pyx_k__42, sizeof(__pyx_k__42), 0, 0, 0, 0},
+  {&__pyx_kp_b__43, __pyx_k__43, sizeof(__pyx_k__43), 0, 0, 0, 0},
   {&__pyx_kp_b__44, __pyx_k__44, sizeof(__pyx_k__44), 0, 0, 0, 0},
+  {&__pyx_kp_b__45, __pyx_k__45, sizeof(__pyx_k__45), 0, 0, 0, 0},
   {&__pyx_kp_b__46, __pyx_k__46, sizeof(__pyx_k__46), 0, 0, 0, 0},
+  {&__pyx_kp_b__47, __pyx_k__47, sizeof(__pyx_k__47), 0, 0, 0, 0},
   {&__pyx_kp_b__48, __pyx_k__48, sizeof(__pyx_k__48), 0, 0, 0, 0},
+  {&__pyx_kp_b__49, __pyx_k__49, sizeof(__pyx_k__49), 0, 0, 0, 0},
   {&__pyx_kp_b__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 0, 0},
   {&__pyx_kp_b__50, __pyx_k__50, sizeof(__pyx_k__50), 0, 0, 0, 0},
+  {&__pyx_kp_b__51, __pyx_k__51, sizeof(__pyx_k__51), 0, 0, 0, 0},
   {&__pyx_kp_b__52, __pyx_k__52, sizeof(__pyx_k__52), 0, 0, 0, 0},
   {&__pyx_kp_b__54, __pyx_k__54, sizeof(__pyx_k__54), 0, 0, 0, 0},
+  {&__pyx_kp_b__55, __pyx_k__55, sizeof(__pyx_k__55), 0, 0, 0, 0},
   {&__pyx_kp_b__56, __pyx_k__56, sizeof(__pyx_k__56), 0, 0, 0, 0},
+  {&__pyx_kp_b__57, __pyx_k__57, sizeof(__pyx_k__57), 0, 0, 0, 0},
   {&__pyx_kp_b__58, __pyx_k__58, sizeof(__pyx_k__58), 0, 0, 0, 0},
+  {&__pyx_kp_b__59, __pyx_k__59, sizeof(__pyx_k__59), 0, 0, 0, 0},
+  {&__pyx_kp_b__6, __pyx_k__6, sizeof(__pyx_k__6), 0, 0, 0, 0},
   {&__pyx_kp_b__60, __pyx_k__60, sizeof(__pyx_k__60), 0, 0, 0, 0},
+  {&__pyx_kp_b__61, __pyx_k__61, sizeof(__pyx_k__61), 0, 0, 0, 0},
   {&__pyx_kp_b__62, __pyx_k__62, sizeof(__pyx_k__62), 0, 0, 0, 0},
+  {&__pyx_kp_b__63, __pyx_k__63, sizeof(__pyx_k__63), 0, 0, 0, 0},
+  {&__pyx_kp_b__64, __pyx_k__64, sizeof(__pyx_k__64), 0, 0, 0, 0},
   {&__pyx_kp_b__65, __pyx_k__65, sizeof(__pyx_k__65), 0, 0, 0, 0},
+  {&__pyx_kp_b__66, __pyx_k__66, sizeof(__pyx_k__66), 0, 0, 0, 0},
   {&__pyx_kp_b__67, __pyx_k__67, sizeof(__pyx_k__67), 0, 0, 0, 0},
+  {&__pyx_kp_b__68, __pyx_k__68, sizeof(__pyx_k__68), 0, 0, 0, 0},
   {&__pyx_kp_b__69, __pyx_k__69, sizeof(__pyx_k__69), 0, 0, 0, 0},
   {&__pyx_kp_b__7, __pyx_k__7, sizeof(__pyx_k__7), 0, 0, 0, 0},
+  {&__pyx_kp_b__70, __pyx_k__70, sizeof(__pyx_k__70), 0, 0, 0, 0},
   {&__pyx_kp_b__71, __pyx_k__71, sizeof(__pyx_k__71), 0, 0, 0, 0},
+  {&__pyx_kp_b__72, __pyx_k__72, sizeof(__pyx_k__72), 0, 0, 0, 0},
   {&__pyx_kp_b__73, __pyx_k__73, sizeof(__pyx_k__73), 0, 0, 0, 0},
   {&__pyx_kp_b__75, __pyx_k__75, sizeof(__pyx_k__75), 0, 0, 0, 0},
   {&__pyx_kp_b__77, __pyx_k__77, sizeof(__pyx_k__77), 0, 0, 0, 0},
+  {&__pyx_kp_b__78, __pyx_k__78, sizeof(__pyx_k__78), 0, 0, 0, 0},
   {&__pyx_kp_b__79, __pyx_k__79, sizeof(__pyx_k__79), 0, 0, 0, 0},
+  {&__pyx_kp_b__8, __pyx_k__8, sizeof(__pyx_k__8), 0, 0, 0, 0},
+  {&__pyx_kp_b__80, __pyx_k__80, sizeof(__pyx_k__80), 0, 0, 0, 0},
   {&__pyx_kp_b__81, __pyx_k__81, sizeof(__pyx_k__81), 0, 0, 0, 0},
+  {&__pyx_kp_b__82, __pyx_k__82, sizeof(__pyx_k__82), 0, 0, 0, 0},
   {&__pyx_kp_b__83, __pyx_k__83, sizeof(__pyx_k__83), 0, 0, 0, 0},
+  {&__pyx_kp_b__84, __pyx_k__84, sizeof(__pyx_k__84), 0, 0, 0, 0},
   {&__pyx_kp_b__85, __pyx_k__85, sizeof(__pyx_k__85), 0, 0, 0, 0},
+  {&__pyx_kp_b__86, __pyx_k__86, sizeof(__pyx_k__86), 0, 0, 0, 0},
   {&__pyx_kp_b__87, __pyx_k__87, sizeof(__pyx_k__87), 0, 0, 0, 0},
+  {&__pyx_kp_b__88, __pyx_k__88, sizeof(__pyx_k__88), 0, 0, 0, 0},
   {&__pyx_kp_b__89, __pyx_k__89, sizeof(__pyx_k__89), 0, 0, 0, 0},
-  {&__pyx_kp_b__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 0, 0, 0},
+  {&__pyx_kp_b__90, __pyx_k__90, sizeof(__pyx_k__90), 0, 0, 0, 0},
   {&__pyx_kp_b__91, __pyx_k__91, sizeof(__pyx_k__91), 0, 0, 0, 0},
+  {&__pyx_kp_b__92, __pyx_k__92, sizeof(__pyx_k__92), 0, 0, 0, 0},
   {&__pyx_kp_b__93, __pyx_k__93, sizeof(__pyx_k__93), 0, 0, 0, 0},
-  {&__pyx_kp_b__95, __pyx_k__95, sizeof(__pyx_k__95), 0, 0, 0, 0},
-  {&__pyx_kp_b__97, __pyx_k__97, sizeof(__pyx_k__97), 0, 0, 0, 0},
-  {&__pyx_kp_b__99, __pyx_k__99, sizeof(__pyx_k__99), 0, 0, 0, 0},
+  {&__pyx_kp_b__94, __pyx_k__94, sizeof(__pyx_k__94), 0, 0, 0, 0},
+  {&__pyx_kp_b__96, __pyx_k__96, sizeof(__pyx_k__96), 0, 0, 0, 0},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_kp_s_d, __pyx_k_d, sizeof(__pyx_k_d), 0, 0, 1, 0},
   {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
@@ -8501,1086 +9507,99 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
   {&__pyx_n_s_value, __pyx_k_value, sizeof(__pyx_k_value), 0, 0, 1, 1},
   {&__pyx_n_s_write, __pyx_k_write, sizeof(__pyx_k_write), 0, 0, 1, 1},
+  {&__pyx_n_s_write_segment, __pyx_k_write_segment, sizeof(__pyx_k_write_segment), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
-static int __Pyx_InitCachedBuiltins(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
   __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 31, __pyx_L1_error)
-  __pyx_builtin_OverflowError = __Pyx_GetBuiltinName(__pyx_n_s_OverflowError); if (!__pyx_builtin_OverflowError) __PYX_ERR(0, 99, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 138, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_builtin_OverflowError = __Pyx_GetBuiltinName(__pyx_n_s_OverflowError); if (!__pyx_builtin_OverflowError) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 151, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_InitCachedConstants(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":69
- *         # None
- *         if value is None:
- *             write(b"\xC0")  # NULL             # <<<<<<<<<<<<<<
- * 
- *         # Boolean
- */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_b_); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 69, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":73
- *         # Boolean
- *         elif value is True:
- *             write(b"\xC3")             # <<<<<<<<<<<<<<
- *         elif value is False:
- *             write(b"\xC2")
- */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_b__3); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":75
- *             write(b"\xC3")
- *         elif value is False:
- *             write(b"\xC2")             # <<<<<<<<<<<<<<
- * 
- *         # Float (only double precision is supported)
- */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_b__5); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 75, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":79
- *         # Float (only double precision is supported)
- *         elif isinstance(value, float):
- *             write(b"\xC1")             # <<<<<<<<<<<<<<
- *             write(struct_pack(">d", value))
- * 
- */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_b__7); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 79, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":87
- *                 write(PACKED_UINT_8[value % 0x100])
- *             elif -0x80 <= value < -0x10:
- *                 write(b"\xC8")             # <<<<<<<<<<<<<<
- *                 write(PACKED_UINT_8[value % 0x100])
- *             elif -0x8000 <= value < 0x8000:
- */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_b__9); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 87, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":90
- *                 write(PACKED_UINT_8[value % 0x100])
- *             elif -0x8000 <= value < 0x8000:
- *                 write(b"\xC9")             # <<<<<<<<<<<<<<
- *                 write(PACKED_UINT_16[value % 0x10000])
- *             elif -0x80000000 <= value < 0x80000000:
- */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_b__11); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 90, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":93
- *                 write(PACKED_UINT_16[value % 0x10000])
- *             elif -0x80000000 <= value < 0x80000000:
- *                 write(b"\xCA")             # <<<<<<<<<<<<<<
- *                 write(struct_pack(">i", value))
- *             elif INT64_LO <= value < INT64_HI:
- */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_b__13); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 93, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":96
- *                 write(struct_pack(">i", value))
- *             elif INT64_LO <= value < INT64_HI:
- *                 write(b"\xCB")             # <<<<<<<<<<<<<<
- *                 write(struct_pack(">q", value))
- *             else:
- */
-  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_b__15); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 96, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":106
- *                 value_bytes = value
- *             else:
- *                 value_bytes = value.encode("utf-8")             # <<<<<<<<<<<<<<
- *             self.pack_string_header(len(value_bytes))
- *             self.pack_raw(value_bytes)
- */
-  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_utf_8); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 106, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__17);
-  __Pyx_GIVEREF(__pyx_tuple__17);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":142
+  /* "neobolt/impl/python/packstream/_packer.pyx":151
  *     cdef pack_bytes_header(self, int size):
  *         if not self.supports_bytes:
  *             raise TypeError("This PackSteam channel does not support BYTES (consider upgrading to Neo4j 3.2+)")             # <<<<<<<<<<<<<<
  *         write = self._write
  *         if size < 0x100:
  */
-  __pyx_tuple__18 = PyTuple_Pack(1, __pyx_kp_s_This_PackSteam_channel_does_not); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 142, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":145
- *         write = self._write
- *         if size < 0x100:
- *             write(b"\xCC")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_kp_b__19); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 145, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":148
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- *             write(b"\xCD")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- */
-  __pyx_tuple__22 = PyTuple_Pack(1, __pyx_kp_b__21); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 148, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":151
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- *             write(b"\xCE")             # <<<<<<<<<<<<<<
- *             write(struct_pack(">I", size))
- *         else:
- */
-  __pyx_tuple__24 = PyTuple_Pack(1, __pyx_kp_b__23); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 151, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_This_PackSteam_channel_does_not); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 151, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":154
+  /* "neobolt/impl/python/packstream/_packer.pyx":163
  *             write(struct_pack(">I", size))
  *         else:
  *             raise OverflowError("Bytes header size out of range")             # <<<<<<<<<<<<<<
  * 
  *     cdef pack_string_header(self, int size):
  */
-  __pyx_tuple__25 = PyTuple_Pack(1, __pyx_kp_s_Bytes_header_size_out_of_range); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 154, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":159
- *         write = self._write
- *         if size == 0x00:
- *             write(b"\x80")             # <<<<<<<<<<<<<<
- *         elif size == 0x01:
- *             write(b"\x81")
- */
-  __pyx_tuple__27 = PyTuple_Pack(1, __pyx_kp_b__26); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 159, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":161
- *             write(b"\x80")
- *         elif size == 0x01:
- *             write(b"\x81")             # <<<<<<<<<<<<<<
- *         elif size == 0x02:
- *             write(b"\x82")
- */
-  __pyx_tuple__29 = PyTuple_Pack(1, __pyx_kp_b__28); if (unlikely(!__pyx_tuple__29)) __PYX_ERR(0, 161, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":163
- *             write(b"\x81")
- *         elif size == 0x02:
- *             write(b"\x82")             # <<<<<<<<<<<<<<
- *         elif size == 0x03:
- *             write(b"\x83")
- */
-  __pyx_tuple__31 = PyTuple_Pack(1, __pyx_kp_b__30); if (unlikely(!__pyx_tuple__31)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_Bytes_header_size_out_of_range); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":165
- *             write(b"\x82")
- *         elif size == 0x03:
- *             write(b"\x83")             # <<<<<<<<<<<<<<
- *         elif size == 0x04:
- *             write(b"\x84")
+  /* "neobolt/impl/python/packstream/_packer.pyx":209
+ *             write(struct_pack(">I", size))
+ *         else:
+ *             raise OverflowError("String header size out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     cdef pack_list_header(self, int size):
  */
-  __pyx_tuple__33 = PyTuple_Pack(1, __pyx_kp_b__32); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 165, __pyx_L1_error)
+  __pyx_tuple__33 = PyTuple_Pack(1, __pyx_kp_s_String_header_size_out_of_range); if (unlikely(!__pyx_tuple__33)) __PYX_ERR(0, 209, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__33);
   __Pyx_GIVEREF(__pyx_tuple__33);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":167
- *             write(b"\x83")
- *         elif size == 0x04:
- *             write(b"\x84")             # <<<<<<<<<<<<<<
- *         elif size == 0x05:
- *             write(b"\x85")
- */
-  __pyx_tuple__35 = PyTuple_Pack(1, __pyx_kp_b__34); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(0, 167, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":169
- *             write(b"\x84")
- *         elif size == 0x05:
- *             write(b"\x85")             # <<<<<<<<<<<<<<
- *         elif size == 0x06:
- *             write(b"\x86")
- */
-  __pyx_tuple__37 = PyTuple_Pack(1, __pyx_kp_b__36); if (unlikely(!__pyx_tuple__37)) __PYX_ERR(0, 169, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":171
- *             write(b"\x85")
- *         elif size == 0x06:
- *             write(b"\x86")             # <<<<<<<<<<<<<<
- *         elif size == 0x07:
- *             write(b"\x87")
- */
-  __pyx_tuple__39 = PyTuple_Pack(1, __pyx_kp_b__38); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(0, 171, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":173
- *             write(b"\x86")
- *         elif size == 0x07:
- *             write(b"\x87")             # <<<<<<<<<<<<<<
- *         elif size == 0x08:
- *             write(b"\x88")
+  /* "neobolt/impl/python/packstream/_packer.pyx":255
+ *             write(struct_pack(">I", size))
+ *         else:
+ *             raise OverflowError("List header size out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef pack_list_stream_header(self):
  */
-  __pyx_tuple__41 = PyTuple_Pack(1, __pyx_kp_b__40); if (unlikely(!__pyx_tuple__41)) __PYX_ERR(0, 173, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__41);
-  __Pyx_GIVEREF(__pyx_tuple__41);
+  __pyx_tuple__53 = PyTuple_Pack(1, __pyx_kp_s_List_header_size_out_of_range); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__53);
+  __Pyx_GIVEREF(__pyx_tuple__53);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":175
- *             write(b"\x87")
- *         elif size == 0x08:
- *             write(b"\x88")             # <<<<<<<<<<<<<<
- *         elif size == 0x09:
- *             write(b"\x89")
+  /* "neobolt/impl/python/packstream/_packer.pyx":304
+ *             write(struct_pack(">I", size))
+ *         else:
+ *             raise OverflowError("Map header size out of range")             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef pack_map_stream_header(self):
  */
-  __pyx_tuple__43 = PyTuple_Pack(1, __pyx_kp_b__42); if (unlikely(!__pyx_tuple__43)) __PYX_ERR(0, 175, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__43);
-  __Pyx_GIVEREF(__pyx_tuple__43);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":177
- *             write(b"\x88")
- *         elif size == 0x09:
- *             write(b"\x89")             # <<<<<<<<<<<<<<
- *         elif size == 0x0A:
- *             write(b"\x8A")
- */
-  __pyx_tuple__45 = PyTuple_Pack(1, __pyx_kp_b__44); if (unlikely(!__pyx_tuple__45)) __PYX_ERR(0, 177, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__45);
-  __Pyx_GIVEREF(__pyx_tuple__45);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":179
- *             write(b"\x89")
- *         elif size == 0x0A:
- *             write(b"\x8A")             # <<<<<<<<<<<<<<
- *         elif size == 0x0B:
- *             write(b"\x8B")
- */
-  __pyx_tuple__47 = PyTuple_Pack(1, __pyx_kp_b__46); if (unlikely(!__pyx_tuple__47)) __PYX_ERR(0, 179, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__47);
-  __Pyx_GIVEREF(__pyx_tuple__47);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":181
- *             write(b"\x8A")
- *         elif size == 0x0B:
- *             write(b"\x8B")             # <<<<<<<<<<<<<<
- *         elif size == 0x0C:
- *             write(b"\x8C")
- */
-  __pyx_tuple__49 = PyTuple_Pack(1, __pyx_kp_b__48); if (unlikely(!__pyx_tuple__49)) __PYX_ERR(0, 181, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__49);
-  __Pyx_GIVEREF(__pyx_tuple__49);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":183
- *             write(b"\x8B")
- *         elif size == 0x0C:
- *             write(b"\x8C")             # <<<<<<<<<<<<<<
- *         elif size == 0x0D:
- *             write(b"\x8D")
- */
-  __pyx_tuple__51 = PyTuple_Pack(1, __pyx_kp_b__50); if (unlikely(!__pyx_tuple__51)) __PYX_ERR(0, 183, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__51);
-  __Pyx_GIVEREF(__pyx_tuple__51);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":185
- *             write(b"\x8C")
- *         elif size == 0x0D:
- *             write(b"\x8D")             # <<<<<<<<<<<<<<
- *         elif size == 0x0E:
- *             write(b"\x8E")
- */
-  __pyx_tuple__53 = PyTuple_Pack(1, __pyx_kp_b__52); if (unlikely(!__pyx_tuple__53)) __PYX_ERR(0, 185, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__53);
-  __Pyx_GIVEREF(__pyx_tuple__53);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":187
- *             write(b"\x8D")
- *         elif size == 0x0E:
- *             write(b"\x8E")             # <<<<<<<<<<<<<<
- *         elif size == 0x0F:
- *             write(b"\x8F")
- */
-  __pyx_tuple__55 = PyTuple_Pack(1, __pyx_kp_b__54); if (unlikely(!__pyx_tuple__55)) __PYX_ERR(0, 187, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__55);
-  __Pyx_GIVEREF(__pyx_tuple__55);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":189
- *             write(b"\x8E")
- *         elif size == 0x0F:
- *             write(b"\x8F")             # <<<<<<<<<<<<<<
- *         elif size < 0x100:
- *             write(b"\xD0")
- */
-  __pyx_tuple__57 = PyTuple_Pack(1, __pyx_kp_b__56); if (unlikely(!__pyx_tuple__57)) __PYX_ERR(0, 189, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__57);
-  __Pyx_GIVEREF(__pyx_tuple__57);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":191
- *             write(b"\x8F")
- *         elif size < 0x100:
- *             write(b"\xD0")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- */
-  __pyx_tuple__59 = PyTuple_Pack(1, __pyx_kp_b__58); if (unlikely(!__pyx_tuple__59)) __PYX_ERR(0, 191, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__59);
-  __Pyx_GIVEREF(__pyx_tuple__59);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":194
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- *             write(b"\xD1")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- */
-  __pyx_tuple__61 = PyTuple_Pack(1, __pyx_kp_b__60); if (unlikely(!__pyx_tuple__61)) __PYX_ERR(0, 194, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__61);
-  __Pyx_GIVEREF(__pyx_tuple__61);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":197
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- *             write(b"\xD2")             # <<<<<<<<<<<<<<
- *             write(struct_pack(">I", size))
- *         else:
- */
-  __pyx_tuple__63 = PyTuple_Pack(1, __pyx_kp_b__62); if (unlikely(!__pyx_tuple__63)) __PYX_ERR(0, 197, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__63);
-  __Pyx_GIVEREF(__pyx_tuple__63);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":200
- *             write(struct_pack(">I", size))
- *         else:
- *             raise OverflowError("String header size out of range")             # <<<<<<<<<<<<<<
- * 
- *     cdef pack_list_header(self, int size):
- */
-  __pyx_tuple__64 = PyTuple_Pack(1, __pyx_kp_s_String_header_size_out_of_range); if (unlikely(!__pyx_tuple__64)) __PYX_ERR(0, 200, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__64);
-  __Pyx_GIVEREF(__pyx_tuple__64);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":205
- *         write = self._write
- *         if size == 0x00:
- *             write(b"\x90")             # <<<<<<<<<<<<<<
- *         elif size == 0x01:
- *             write(b"\x91")
- */
-  __pyx_tuple__66 = PyTuple_Pack(1, __pyx_kp_b__65); if (unlikely(!__pyx_tuple__66)) __PYX_ERR(0, 205, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__66);
-  __Pyx_GIVEREF(__pyx_tuple__66);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":207
- *             write(b"\x90")
- *         elif size == 0x01:
- *             write(b"\x91")             # <<<<<<<<<<<<<<
- *         elif size == 0x02:
- *             write(b"\x92")
- */
-  __pyx_tuple__68 = PyTuple_Pack(1, __pyx_kp_b__67); if (unlikely(!__pyx_tuple__68)) __PYX_ERR(0, 207, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__68);
-  __Pyx_GIVEREF(__pyx_tuple__68);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":209
- *             write(b"\x91")
- *         elif size == 0x02:
- *             write(b"\x92")             # <<<<<<<<<<<<<<
- *         elif size == 0x03:
- *             write(b"\x93")
- */
-  __pyx_tuple__70 = PyTuple_Pack(1, __pyx_kp_b__69); if (unlikely(!__pyx_tuple__70)) __PYX_ERR(0, 209, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__70);
-  __Pyx_GIVEREF(__pyx_tuple__70);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":211
- *             write(b"\x92")
- *         elif size == 0x03:
- *             write(b"\x93")             # <<<<<<<<<<<<<<
- *         elif size == 0x04:
- *             write(b"\x94")
- */
-  __pyx_tuple__72 = PyTuple_Pack(1, __pyx_kp_b__71); if (unlikely(!__pyx_tuple__72)) __PYX_ERR(0, 211, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__72);
-  __Pyx_GIVEREF(__pyx_tuple__72);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":213
- *             write(b"\x93")
- *         elif size == 0x04:
- *             write(b"\x94")             # <<<<<<<<<<<<<<
- *         elif size == 0x05:
- *             write(b"\x95")
- */
-  __pyx_tuple__74 = PyTuple_Pack(1, __pyx_kp_b__73); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 213, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__74);
-  __Pyx_GIVEREF(__pyx_tuple__74);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":215
- *             write(b"\x94")
- *         elif size == 0x05:
- *             write(b"\x95")             # <<<<<<<<<<<<<<
- *         elif size == 0x06:
- *             write(b"\x96")
- */
-  __pyx_tuple__76 = PyTuple_Pack(1, __pyx_kp_b__75); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(0, 215, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__76);
-  __Pyx_GIVEREF(__pyx_tuple__76);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":217
- *             write(b"\x95")
- *         elif size == 0x06:
- *             write(b"\x96")             # <<<<<<<<<<<<<<
- *         elif size == 0x07:
- *             write(b"\x97")
- */
-  __pyx_tuple__78 = PyTuple_Pack(1, __pyx_kp_b__77); if (unlikely(!__pyx_tuple__78)) __PYX_ERR(0, 217, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__78);
-  __Pyx_GIVEREF(__pyx_tuple__78);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":219
- *             write(b"\x96")
- *         elif size == 0x07:
- *             write(b"\x97")             # <<<<<<<<<<<<<<
- *         elif size == 0x08:
- *             write(b"\x98")
- */
-  __pyx_tuple__80 = PyTuple_Pack(1, __pyx_kp_b__79); if (unlikely(!__pyx_tuple__80)) __PYX_ERR(0, 219, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__80);
-  __Pyx_GIVEREF(__pyx_tuple__80);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":221
- *             write(b"\x97")
- *         elif size == 0x08:
- *             write(b"\x98")             # <<<<<<<<<<<<<<
- *         elif size == 0x09:
- *             write(b"\x99")
- */
-  __pyx_tuple__82 = PyTuple_Pack(1, __pyx_kp_b__81); if (unlikely(!__pyx_tuple__82)) __PYX_ERR(0, 221, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__82);
-  __Pyx_GIVEREF(__pyx_tuple__82);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":223
- *             write(b"\x98")
- *         elif size == 0x09:
- *             write(b"\x99")             # <<<<<<<<<<<<<<
- *         elif size == 0x0A:
- *             write(b"\x9A")
- */
-  __pyx_tuple__84 = PyTuple_Pack(1, __pyx_kp_b__83); if (unlikely(!__pyx_tuple__84)) __PYX_ERR(0, 223, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__84);
-  __Pyx_GIVEREF(__pyx_tuple__84);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":225
- *             write(b"\x99")
- *         elif size == 0x0A:
- *             write(b"\x9A")             # <<<<<<<<<<<<<<
- *         elif size == 0x0B:
- *             write(b"\x9B")
- */
-  __pyx_tuple__86 = PyTuple_Pack(1, __pyx_kp_b__85); if (unlikely(!__pyx_tuple__86)) __PYX_ERR(0, 225, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__86);
-  __Pyx_GIVEREF(__pyx_tuple__86);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":227
- *             write(b"\x9A")
- *         elif size == 0x0B:
- *             write(b"\x9B")             # <<<<<<<<<<<<<<
- *         elif size == 0x0C:
- *             write(b"\x9C")
- */
-  __pyx_tuple__88 = PyTuple_Pack(1, __pyx_kp_b__87); if (unlikely(!__pyx_tuple__88)) __PYX_ERR(0, 227, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__88);
-  __Pyx_GIVEREF(__pyx_tuple__88);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":229
- *             write(b"\x9B")
- *         elif size == 0x0C:
- *             write(b"\x9C")             # <<<<<<<<<<<<<<
- *         elif size == 0x0D:
- *             write(b"\x9D")
- */
-  __pyx_tuple__90 = PyTuple_Pack(1, __pyx_kp_b__89); if (unlikely(!__pyx_tuple__90)) __PYX_ERR(0, 229, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__90);
-  __Pyx_GIVEREF(__pyx_tuple__90);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":231
- *             write(b"\x9C")
- *         elif size == 0x0D:
- *             write(b"\x9D")             # <<<<<<<<<<<<<<
- *         elif size == 0x0E:
- *             write(b"\x9E")
- */
-  __pyx_tuple__92 = PyTuple_Pack(1, __pyx_kp_b__91); if (unlikely(!__pyx_tuple__92)) __PYX_ERR(0, 231, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__92);
-  __Pyx_GIVEREF(__pyx_tuple__92);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":233
- *             write(b"\x9D")
- *         elif size == 0x0E:
- *             write(b"\x9E")             # <<<<<<<<<<<<<<
- *         elif size == 0x0F:
- *             write(b"\x9F")
- */
-  __pyx_tuple__94 = PyTuple_Pack(1, __pyx_kp_b__93); if (unlikely(!__pyx_tuple__94)) __PYX_ERR(0, 233, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__94);
-  __Pyx_GIVEREF(__pyx_tuple__94);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":235
- *             write(b"\x9E")
- *         elif size == 0x0F:
- *             write(b"\x9F")             # <<<<<<<<<<<<<<
- *         elif size < 0x100:
- *             write(b"\xD4")
- */
-  __pyx_tuple__96 = PyTuple_Pack(1, __pyx_kp_b__95); if (unlikely(!__pyx_tuple__96)) __PYX_ERR(0, 235, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__96);
-  __Pyx_GIVEREF(__pyx_tuple__96);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":237
- *             write(b"\x9F")
- *         elif size < 0x100:
- *             write(b"\xD4")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- */
-  __pyx_tuple__98 = PyTuple_Pack(1, __pyx_kp_b__97); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(0, 237, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__98);
-  __Pyx_GIVEREF(__pyx_tuple__98);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":240
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- *             write(b"\xD5")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- */
-  __pyx_tuple__100 = PyTuple_Pack(1, __pyx_kp_b__99); if (unlikely(!__pyx_tuple__100)) __PYX_ERR(0, 240, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__100);
-  __Pyx_GIVEREF(__pyx_tuple__100);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":243
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- *             write(b"\xD6")             # <<<<<<<<<<<<<<
- *             write(struct_pack(">I", size))
- *         else:
- */
-  __pyx_tuple__102 = PyTuple_Pack(1, __pyx_kp_b__101); if (unlikely(!__pyx_tuple__102)) __PYX_ERR(0, 243, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__102);
-  __Pyx_GIVEREF(__pyx_tuple__102);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":246
- *             write(struct_pack(">I", size))
- *         else:
- *             raise OverflowError("List header size out of range")             # <<<<<<<<<<<<<<
- * 
- *     cpdef pack_list_stream_header(self):
- */
-  __pyx_tuple__103 = PyTuple_Pack(1, __pyx_kp_s_List_header_size_out_of_range); if (unlikely(!__pyx_tuple__103)) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__103);
-  __Pyx_GIVEREF(__pyx_tuple__103);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":249
- * 
- *     cpdef pack_list_stream_header(self):
- *         self._write(b"\xD7")             # <<<<<<<<<<<<<<
- * 
- *     cdef pack_map_header(self, int size):
- */
-  __pyx_tuple__105 = PyTuple_Pack(1, __pyx_kp_b__104); if (unlikely(!__pyx_tuple__105)) __PYX_ERR(0, 249, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__105);
-  __Pyx_GIVEREF(__pyx_tuple__105);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":254
- *         write = self._write
- *         if size == 0x00:
- *             write(b"\xA0")             # <<<<<<<<<<<<<<
- *         elif size == 0x01:
- *             write(b"\xA1")
- */
-  __pyx_tuple__107 = PyTuple_Pack(1, __pyx_kp_b__106); if (unlikely(!__pyx_tuple__107)) __PYX_ERR(0, 254, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__107);
-  __Pyx_GIVEREF(__pyx_tuple__107);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":256
- *             write(b"\xA0")
- *         elif size == 0x01:
- *             write(b"\xA1")             # <<<<<<<<<<<<<<
- *         elif size == 0x02:
- *             write(b"\xA2")
- */
-  __pyx_tuple__109 = PyTuple_Pack(1, __pyx_kp_b__108); if (unlikely(!__pyx_tuple__109)) __PYX_ERR(0, 256, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__109);
-  __Pyx_GIVEREF(__pyx_tuple__109);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":258
- *             write(b"\xA1")
- *         elif size == 0x02:
- *             write(b"\xA2")             # <<<<<<<<<<<<<<
- *         elif size == 0x03:
- *             write(b"\xA3")
- */
-  __pyx_tuple__111 = PyTuple_Pack(1, __pyx_kp_b__110); if (unlikely(!__pyx_tuple__111)) __PYX_ERR(0, 258, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__111);
-  __Pyx_GIVEREF(__pyx_tuple__111);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":260
- *             write(b"\xA2")
- *         elif size == 0x03:
- *             write(b"\xA3")             # <<<<<<<<<<<<<<
- *         elif size == 0x04:
- *             write(b"\xA4")
- */
-  __pyx_tuple__113 = PyTuple_Pack(1, __pyx_kp_b__112); if (unlikely(!__pyx_tuple__113)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__113);
-  __Pyx_GIVEREF(__pyx_tuple__113);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":262
- *             write(b"\xA3")
- *         elif size == 0x04:
- *             write(b"\xA4")             # <<<<<<<<<<<<<<
- *         elif size == 0x05:
- *             write(b"\xA5")
- */
-  __pyx_tuple__115 = PyTuple_Pack(1, __pyx_kp_b__114); if (unlikely(!__pyx_tuple__115)) __PYX_ERR(0, 262, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__115);
-  __Pyx_GIVEREF(__pyx_tuple__115);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":264
- *             write(b"\xA4")
- *         elif size == 0x05:
- *             write(b"\xA5")             # <<<<<<<<<<<<<<
- *         elif size == 0x06:
- *             write(b"\xA6")
- */
-  __pyx_tuple__117 = PyTuple_Pack(1, __pyx_kp_b__116); if (unlikely(!__pyx_tuple__117)) __PYX_ERR(0, 264, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__117);
-  __Pyx_GIVEREF(__pyx_tuple__117);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":266
- *             write(b"\xA5")
- *         elif size == 0x06:
- *             write(b"\xA6")             # <<<<<<<<<<<<<<
- *         elif size == 0x07:
- *             write(b"\xA7")
- */
-  __pyx_tuple__119 = PyTuple_Pack(1, __pyx_kp_b__118); if (unlikely(!__pyx_tuple__119)) __PYX_ERR(0, 266, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__119);
-  __Pyx_GIVEREF(__pyx_tuple__119);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":268
- *             write(b"\xA6")
- *         elif size == 0x07:
- *             write(b"\xA7")             # <<<<<<<<<<<<<<
- *         elif size == 0x08:
- *             write(b"\xA8")
- */
-  __pyx_tuple__121 = PyTuple_Pack(1, __pyx_kp_b__120); if (unlikely(!__pyx_tuple__121)) __PYX_ERR(0, 268, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__121);
-  __Pyx_GIVEREF(__pyx_tuple__121);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":270
- *             write(b"\xA7")
- *         elif size == 0x08:
- *             write(b"\xA8")             # <<<<<<<<<<<<<<
- *         elif size == 0x09:
- *             write(b"\xA9")
- */
-  __pyx_tuple__123 = PyTuple_Pack(1, __pyx_kp_b__122); if (unlikely(!__pyx_tuple__123)) __PYX_ERR(0, 270, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__123);
-  __Pyx_GIVEREF(__pyx_tuple__123);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":272
- *             write(b"\xA8")
- *         elif size == 0x09:
- *             write(b"\xA9")             # <<<<<<<<<<<<<<
- *         elif size == 0x0A:
- *             write(b"\xAA")
- */
-  __pyx_tuple__125 = PyTuple_Pack(1, __pyx_kp_b__124); if (unlikely(!__pyx_tuple__125)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__125);
-  __Pyx_GIVEREF(__pyx_tuple__125);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":274
- *             write(b"\xA9")
- *         elif size == 0x0A:
- *             write(b"\xAA")             # <<<<<<<<<<<<<<
- *         elif size == 0x0B:
- *             write(b"\xAB")
- */
-  __pyx_tuple__127 = PyTuple_Pack(1, __pyx_kp_b__126); if (unlikely(!__pyx_tuple__127)) __PYX_ERR(0, 274, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__127);
-  __Pyx_GIVEREF(__pyx_tuple__127);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":276
- *             write(b"\xAA")
- *         elif size == 0x0B:
- *             write(b"\xAB")             # <<<<<<<<<<<<<<
- *         elif size == 0x0C:
- *             write(b"\xAC")
- */
-  __pyx_tuple__129 = PyTuple_Pack(1, __pyx_kp_b__128); if (unlikely(!__pyx_tuple__129)) __PYX_ERR(0, 276, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__129);
-  __Pyx_GIVEREF(__pyx_tuple__129);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":278
- *             write(b"\xAB")
- *         elif size == 0x0C:
- *             write(b"\xAC")             # <<<<<<<<<<<<<<
- *         elif size == 0x0D:
- *             write(b"\xAD")
- */
-  __pyx_tuple__131 = PyTuple_Pack(1, __pyx_kp_b__130); if (unlikely(!__pyx_tuple__131)) __PYX_ERR(0, 278, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__131);
-  __Pyx_GIVEREF(__pyx_tuple__131);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":280
- *             write(b"\xAC")
- *         elif size == 0x0D:
- *             write(b"\xAD")             # <<<<<<<<<<<<<<
- *         elif size == 0x0E:
- *             write(b"\xAE")
- */
-  __pyx_tuple__133 = PyTuple_Pack(1, __pyx_kp_b__132); if (unlikely(!__pyx_tuple__133)) __PYX_ERR(0, 280, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__133);
-  __Pyx_GIVEREF(__pyx_tuple__133);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":282
- *             write(b"\xAD")
- *         elif size == 0x0E:
- *             write(b"\xAE")             # <<<<<<<<<<<<<<
- *         elif size == 0x0F:
- *             write(b"\xAF")
- */
-  __pyx_tuple__135 = PyTuple_Pack(1, __pyx_kp_b__134); if (unlikely(!__pyx_tuple__135)) __PYX_ERR(0, 282, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__135);
-  __Pyx_GIVEREF(__pyx_tuple__135);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":284
- *             write(b"\xAE")
- *         elif size == 0x0F:
- *             write(b"\xAF")             # <<<<<<<<<<<<<<
- *         elif size < 0x100:
- *             write(b"\xD8")
- */
-  __pyx_tuple__137 = PyTuple_Pack(1, __pyx_kp_b__136); if (unlikely(!__pyx_tuple__137)) __PYX_ERR(0, 284, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__137);
-  __Pyx_GIVEREF(__pyx_tuple__137);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":286
- *             write(b"\xAF")
- *         elif size < 0x100:
- *             write(b"\xD8")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- */
-  __pyx_tuple__139 = PyTuple_Pack(1, __pyx_kp_b__138); if (unlikely(!__pyx_tuple__139)) __PYX_ERR(0, 286, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__139);
-  __Pyx_GIVEREF(__pyx_tuple__139);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":289
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- *             write(b"\xD9")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- */
-  __pyx_tuple__141 = PyTuple_Pack(1, __pyx_kp_b__140); if (unlikely(!__pyx_tuple__141)) __PYX_ERR(0, 289, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__141);
-  __Pyx_GIVEREF(__pyx_tuple__141);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":292
- *             write(PACKED_UINT_16[size])
- *         elif size < 0x100000000:
- *             write(b"\xDA")             # <<<<<<<<<<<<<<
- *             write(struct_pack(">I", size))
- *         else:
- */
-  __pyx_tuple__143 = PyTuple_Pack(1, __pyx_kp_b__142); if (unlikely(!__pyx_tuple__143)) __PYX_ERR(0, 292, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__143);
-  __Pyx_GIVEREF(__pyx_tuple__143);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":295
- *             write(struct_pack(">I", size))
- *         else:
- *             raise OverflowError("Map header size out of range")             # <<<<<<<<<<<<<<
- * 
- *     cpdef pack_map_stream_header(self):
- */
-  __pyx_tuple__144 = PyTuple_Pack(1, __pyx_kp_s_Map_header_size_out_of_range); if (unlikely(!__pyx_tuple__144)) __PYX_ERR(0, 295, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__144);
-  __Pyx_GIVEREF(__pyx_tuple__144);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":298
- * 
- *     cpdef pack_map_stream_header(self):
- *         self._write(b"\xDB")             # <<<<<<<<<<<<<<
- * 
- *     cpdef pack_struct(self, bytes signature, fields):
- */
-  __pyx_tuple__146 = PyTuple_Pack(1, __pyx_kp_b__145); if (unlikely(!__pyx_tuple__146)) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__146);
-  __Pyx_GIVEREF(__pyx_tuple__146);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":302
- *     cpdef pack_struct(self, bytes signature, fields):
- *         if len(signature) != 1:
- *             raise ValueError("Structure signature must be a single byte value")             # <<<<<<<<<<<<<<
- *         write = self._write
- *         size = len(fields)
- */
-  __pyx_tuple__147 = PyTuple_Pack(1, __pyx_kp_s_Structure_signature_must_be_a_si); if (unlikely(!__pyx_tuple__147)) __PYX_ERR(0, 302, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__147);
-  __Pyx_GIVEREF(__pyx_tuple__147);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":306
- *         size = len(fields)
- *         if size == 0x00:
- *             write(b"\xB0")             # <<<<<<<<<<<<<<
- *         elif size == 0x01:
- *             write(b"\xB1")
- */
-  __pyx_tuple__149 = PyTuple_Pack(1, __pyx_kp_b__148); if (unlikely(!__pyx_tuple__149)) __PYX_ERR(0, 306, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__149);
-  __Pyx_GIVEREF(__pyx_tuple__149);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":308
- *             write(b"\xB0")
- *         elif size == 0x01:
- *             write(b"\xB1")             # <<<<<<<<<<<<<<
- *         elif size == 0x02:
- *             write(b"\xB2")
- */
-  __pyx_tuple__151 = PyTuple_Pack(1, __pyx_kp_b__150); if (unlikely(!__pyx_tuple__151)) __PYX_ERR(0, 308, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__151);
-  __Pyx_GIVEREF(__pyx_tuple__151);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":310
- *             write(b"\xB1")
- *         elif size == 0x02:
- *             write(b"\xB2")             # <<<<<<<<<<<<<<
- *         elif size == 0x03:
- *             write(b"\xB3")
- */
-  __pyx_tuple__153 = PyTuple_Pack(1, __pyx_kp_b__152); if (unlikely(!__pyx_tuple__153)) __PYX_ERR(0, 310, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__153);
-  __Pyx_GIVEREF(__pyx_tuple__153);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":312
- *             write(b"\xB2")
- *         elif size == 0x03:
- *             write(b"\xB3")             # <<<<<<<<<<<<<<
- *         elif size == 0x04:
- *             write(b"\xB4")
- */
-  __pyx_tuple__155 = PyTuple_Pack(1, __pyx_kp_b__154); if (unlikely(!__pyx_tuple__155)) __PYX_ERR(0, 312, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__155);
-  __Pyx_GIVEREF(__pyx_tuple__155);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":314
- *             write(b"\xB3")
- *         elif size == 0x04:
- *             write(b"\xB4")             # <<<<<<<<<<<<<<
- *         elif size == 0x05:
- *             write(b"\xB5")
- */
-  __pyx_tuple__157 = PyTuple_Pack(1, __pyx_kp_b__156); if (unlikely(!__pyx_tuple__157)) __PYX_ERR(0, 314, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__157);
-  __Pyx_GIVEREF(__pyx_tuple__157);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":316
- *             write(b"\xB4")
- *         elif size == 0x05:
- *             write(b"\xB5")             # <<<<<<<<<<<<<<
- *         elif size == 0x06:
- *             write(b"\xB6")
- */
-  __pyx_tuple__159 = PyTuple_Pack(1, __pyx_kp_b__158); if (unlikely(!__pyx_tuple__159)) __PYX_ERR(0, 316, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__159);
-  __Pyx_GIVEREF(__pyx_tuple__159);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":318
- *             write(b"\xB5")
- *         elif size == 0x06:
- *             write(b"\xB6")             # <<<<<<<<<<<<<<
- *         elif size == 0x07:
- *             write(b"\xB7")
- */
-  __pyx_tuple__161 = PyTuple_Pack(1, __pyx_kp_b__160); if (unlikely(!__pyx_tuple__161)) __PYX_ERR(0, 318, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__161);
-  __Pyx_GIVEREF(__pyx_tuple__161);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":320
- *             write(b"\xB6")
- *         elif size == 0x07:
- *             write(b"\xB7")             # <<<<<<<<<<<<<<
- *         elif size == 0x08:
- *             write(b"\xB8")
- */
-  __pyx_tuple__163 = PyTuple_Pack(1, __pyx_kp_b__162); if (unlikely(!__pyx_tuple__163)) __PYX_ERR(0, 320, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__163);
-  __Pyx_GIVEREF(__pyx_tuple__163);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":322
- *             write(b"\xB7")
- *         elif size == 0x08:
- *             write(b"\xB8")             # <<<<<<<<<<<<<<
- *         elif size == 0x09:
- *             write(b"\xB9")
- */
-  __pyx_tuple__165 = PyTuple_Pack(1, __pyx_kp_b__164); if (unlikely(!__pyx_tuple__165)) __PYX_ERR(0, 322, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__165);
-  __Pyx_GIVEREF(__pyx_tuple__165);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":324
- *             write(b"\xB8")
- *         elif size == 0x09:
- *             write(b"\xB9")             # <<<<<<<<<<<<<<
- *         elif size == 0x0A:
- *             write(b"\xBA")
- */
-  __pyx_tuple__167 = PyTuple_Pack(1, __pyx_kp_b__166); if (unlikely(!__pyx_tuple__167)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__167);
-  __Pyx_GIVEREF(__pyx_tuple__167);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":326
- *             write(b"\xB9")
- *         elif size == 0x0A:
- *             write(b"\xBA")             # <<<<<<<<<<<<<<
- *         elif size == 0x0B:
- *             write(b"\xBB")
- */
-  __pyx_tuple__169 = PyTuple_Pack(1, __pyx_kp_b__168); if (unlikely(!__pyx_tuple__169)) __PYX_ERR(0, 326, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__169);
-  __Pyx_GIVEREF(__pyx_tuple__169);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":328
- *             write(b"\xBA")
- *         elif size == 0x0B:
- *             write(b"\xBB")             # <<<<<<<<<<<<<<
- *         elif size == 0x0C:
- *             write(b"\xBC")
- */
-  __pyx_tuple__171 = PyTuple_Pack(1, __pyx_kp_b__170); if (unlikely(!__pyx_tuple__171)) __PYX_ERR(0, 328, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__171);
-  __Pyx_GIVEREF(__pyx_tuple__171);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":330
- *             write(b"\xBB")
- *         elif size == 0x0C:
- *             write(b"\xBC")             # <<<<<<<<<<<<<<
- *         elif size == 0x0D:
- *             write(b"\xBD")
- */
-  __pyx_tuple__173 = PyTuple_Pack(1, __pyx_kp_b__172); if (unlikely(!__pyx_tuple__173)) __PYX_ERR(0, 330, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__173);
-  __Pyx_GIVEREF(__pyx_tuple__173);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":332
- *             write(b"\xBC")
- *         elif size == 0x0D:
- *             write(b"\xBD")             # <<<<<<<<<<<<<<
- *         elif size == 0x0E:
- *             write(b"\xBE")
- */
-  __pyx_tuple__175 = PyTuple_Pack(1, __pyx_kp_b__174); if (unlikely(!__pyx_tuple__175)) __PYX_ERR(0, 332, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__175);
-  __Pyx_GIVEREF(__pyx_tuple__175);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":334
- *             write(b"\xBD")
- *         elif size == 0x0E:
- *             write(b"\xBE")             # <<<<<<<<<<<<<<
- *         elif size == 0x0F:
- *             write(b"\xBF")
- */
-  __pyx_tuple__177 = PyTuple_Pack(1, __pyx_kp_b__176); if (unlikely(!__pyx_tuple__177)) __PYX_ERR(0, 334, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__177);
-  __Pyx_GIVEREF(__pyx_tuple__177);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":336
- *             write(b"\xBE")
- *         elif size == 0x0F:
- *             write(b"\xBF")             # <<<<<<<<<<<<<<
- *         elif size < 0x100:
- *             write(b"\xDC")
- */
-  __pyx_tuple__179 = PyTuple_Pack(1, __pyx_kp_b__178); if (unlikely(!__pyx_tuple__179)) __PYX_ERR(0, 336, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__179);
-  __Pyx_GIVEREF(__pyx_tuple__179);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":338
- *             write(b"\xBF")
- *         elif size < 0x100:
- *             write(b"\xDC")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- */
-  __pyx_tuple__181 = PyTuple_Pack(1, __pyx_kp_b__180); if (unlikely(!__pyx_tuple__181)) __PYX_ERR(0, 338, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__181);
-  __Pyx_GIVEREF(__pyx_tuple__181);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":341
- *             write(PACKED_UINT_8[size])
- *         elif size < 0x10000:
- *             write(b"\xDD")             # <<<<<<<<<<<<<<
- *             write(PACKED_UINT_16[size])
- *         else:
+  __pyx_tuple__74 = PyTuple_Pack(1, __pyx_kp_s_Map_header_size_out_of_range); if (unlikely(!__pyx_tuple__74)) __PYX_ERR(0, 304, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__74);
+  __Pyx_GIVEREF(__pyx_tuple__74);
+
+  /* "neobolt/impl/python/packstream/_packer.pyx":311
+ *     cpdef pack_struct(self, bytes signature, fields):
+ *         if len(signature) != 1:
+ *             raise ValueError("Structure signature must be a single byte value")             # <<<<<<<<<<<<<<
+ *         write = self._write
+ *         size = len(fields)
  */
-  __pyx_tuple__183 = PyTuple_Pack(1, __pyx_kp_b__182); if (unlikely(!__pyx_tuple__183)) __PYX_ERR(0, 341, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__183);
-  __Pyx_GIVEREF(__pyx_tuple__183);
+  __pyx_tuple__76 = PyTuple_Pack(1, __pyx_kp_s_Structure_signature_must_be_a_si); if (unlikely(!__pyx_tuple__76)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__76);
+  __Pyx_GIVEREF(__pyx_tuple__76);
 
-  /* "neobolt/impl/python/packstream/_packer.pyx":344
+  /* "neobolt/impl/python/packstream/_packer.pyx":353
  *             write(PACKED_UINT_16[size])
  *         else:
  *             raise OverflowError("Structure size out of range")             # <<<<<<<<<<<<<<
  *         write(signature)
  *         for field in fields:
  */
-  __pyx_tuple__184 = PyTuple_Pack(1, __pyx_kp_s_Structure_size_out_of_range); if (unlikely(!__pyx_tuple__184)) __PYX_ERR(0, 344, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__184);
-  __Pyx_GIVEREF(__pyx_tuple__184);
-
-  /* "neobolt/impl/python/packstream/_packer.pyx":350
- * 
- *     cpdef pack_end_of_stream(self):
- *         self._write(b"\xDF")             # <<<<<<<<<<<<<<
- */
-  __pyx_tuple__186 = PyTuple_Pack(1, __pyx_kp_b__185); if (unlikely(!__pyx_tuple__186)) __PYX_ERR(0, 350, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__186);
-  __Pyx_GIVEREF(__pyx_tuple__186);
+  __pyx_tuple__95 = PyTuple_Pack(1, __pyx_kp_s_Structure_size_out_of_range); if (unlikely(!__pyx_tuple__95)) __PYX_ERR(0, 353, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__95);
+  __Pyx_GIVEREF(__pyx_tuple__95);
 
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
@@ -9588,18 +9607,18 @@ static int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__187 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__187)) __PYX_ERR(1, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__187);
-  __Pyx_GIVEREF(__pyx_tuple__187);
+  __pyx_tuple__97 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__97)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__97);
+  __Pyx_GIVEREF(__pyx_tuple__97);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__188 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__188)) __PYX_ERR(1, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__188);
-  __Pyx_GIVEREF(__pyx_tuple__188);
+  __pyx_tuple__98 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__98)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__98);
+  __Pyx_GIVEREF(__pyx_tuple__98);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -9607,10 +9626,11 @@ static int __Pyx_InitCachedConstants(void) {
   return -1;
 }
 
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_128 = PyInt_FromLong(128); if (unlikely(!__pyx_int_128)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_256 = PyInt_FromLong(256); if (unlikely(!__pyx_int_256)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_16384 = PyInt_FromLong(16384L); if (unlikely(!__pyx_int_16384)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_32768 = PyInt_FromLong(32768L); if (unlikely(!__pyx_int_32768)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_65536 = PyInt_FromLong(65536L); if (unlikely(!__pyx_int_65536)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2147483648 = PyInt_FromString((char *)"2147483648", 0, 0); if (unlikely(!__pyx_int_2147483648)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -9626,13 +9646,13 @@ static int __Pyx_InitGlobals(void) {
   return -1;
 }
 
-static int __Pyx_modinit_global_init_code(void); /*proto*/
-static int __Pyx_modinit_variable_export_code(void); /*proto*/
-static int __Pyx_modinit_function_export_code(void); /*proto*/
-static int __Pyx_modinit_type_init_code(void); /*proto*/
-static int __Pyx_modinit_type_import_code(void); /*proto*/
-static int __Pyx_modinit_variable_import_code(void); /*proto*/
-static int __Pyx_modinit_function_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
 
 static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
@@ -9640,6 +9660,7 @@ static int __Pyx_modinit_global_init_code(void) {
   /*--- Global init code ---*/
   __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_HI = Py_None; Py_INCREF(Py_None);
   __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO = Py_None; Py_INCREF(Py_None);
+  __pyx_v_7neobolt_4impl_6python_10packstream_7_packer_MIN_SEGMENT_SIZE = Py_None; Py_INCREF(Py_None);
   __pyx_7genexpr__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_x = Py_None; Py_INCREF(Py_None);
   __pyx_8genexpr1__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_x = Py_None; Py_INCREF(Py_None);
   __pyx_8genexpr2__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_z = Py_None; Py_INCREF(Py_None);
@@ -9666,6 +9687,9 @@ static int __Pyx_modinit_function_export_code(void) {
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
   __pyx_vtabptr_7neobolt_4impl_6python_10packstream_7_packer_Packer = &__pyx_vtable_7neobolt_4impl_6python_10packstream_7_packer_Packer;
@@ -9680,14 +9704,16 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtable_7neobolt_4impl_6python_10packstream_7_packer_Packer.pack_map_stream_header = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_map_stream_header;
   __pyx_vtable_7neobolt_4impl_6python_10packstream_7_packer_Packer.pack_struct = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *, PyObject *, PyObject *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_struct;
   __pyx_vtable_7neobolt_4impl_6python_10packstream_7_packer_Packer.pack_end_of_stream = (PyObject *(*)(struct __pyx_obj_7neobolt_4impl_6python_10packstream_7_packer_Packer *, int __pyx_skip_dispatch))__pyx_f_7neobolt_4impl_6python_10packstream_7_packer_6Packer_pack_end_of_stream;
-  if (PyType_Ready(&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_print = 0;
+  #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_dictoffset && __pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_dict, __pyx_vtabptr_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "Packer", (PyObject *)&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer.tp_dict, __pyx_vtabptr_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Packer, (PyObject *)&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer) < 0) __PYX_ERR(0, 50, __pyx_L1_error)
   __pyx_ptype_7neobolt_4impl_6python_10packstream_7_packer_Packer = &__pyx_type_7neobolt_4impl_6python_10packstream_7_packer_Packer;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -9721,26 +9747,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
 #else
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyObject *
-#else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
+#define __Pyx_PyMODINIT_FUNC void
 #endif
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (!(defined(__cplusplus)) || (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ > 4)))
-    #define CYTHON_SMALL_CODE __attribute__((optimize("Os")))
 #else
-    #define CYTHON_SMALL_CODE
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
 #endif
 #endif
 
@@ -9755,11 +9774,36 @@ __Pyx_PyMODINIT_FUNC PyInit__packer(void)
 {
   return PyModuleDef_Init(&__pyx_moduledef);
 }
-static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name) {
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
     PyObject *value = PyObject_GetAttrString(spec, from_name);
     int result = 0;
     if (likely(value)) {
-        result = PyDict_SetItemString(moddict, to_name, value);
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
         Py_DECREF(value);
     } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Clear();
@@ -9768,8 +9812,10 @@ static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const ch
     }
     return result;
 }
-static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
     PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
     if (__pyx_m)
         return __Pyx_NewRef(__pyx_m);
     modname = PyObject_GetAttrString(spec, "name");
@@ -9779,10 +9825,10 @@ static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *d
     if (unlikely(!module)) goto bad;
     moddict = PyModule_GetDict(module);
     if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
     return module;
 bad:
     Py_XDECREF(module);
@@ -9790,7 +9836,7 @@ bad:
 }
 
 
-static int __pyx_pymod_exec__packer(PyObject *__pyx_pyinit_module)
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__packer(PyObject *__pyx_pyinit_module)
 #endif
 #endif
 {
@@ -9802,9 +9848,16 @@ static int __pyx_pymod_exec__packer(PyObject *__pyx_pyinit_module)
   PyObject *__pyx_t_6 = NULL;
   int __pyx_t_7;
   PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_packer' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
   #elif PY_MAJOR_VERSION >= 3
   if (__pyx_m) return __Pyx_NewRef(__pyx_m);
   #endif
@@ -9819,6 +9872,9 @@ if (!__Pyx_RefNanny) {
 #endif
   __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__packer(void)", 0);
   if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
   __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -9842,11 +9898,9 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -9862,18 +9916,17 @@ if (!__Pyx_RefNanny) {
   __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_d);
   __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if CYTHON_COMPILING_IN_PYPY
   Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   if (__pyx_module_is_main_neobolt__impl__python__packstream___packer) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
@@ -9891,7 +9944,7 @@ if (!__Pyx_RefNanny) {
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_type_import_code();
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
@@ -9958,7 +10011,7 @@ if (!__Pyx_RefNanny) {
  * TRUE = b"\xC3"
  * 
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FALSE, __pyx_kp_b__5) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_FALSE, __pyx_kp_b__3) < 0) __PYX_ERR(0, 28, __pyx_L1_error)
 
   /* "neobolt/impl/python/packstream/_packer.pyx":29
  * NULL_ = b"\xC0"
@@ -9967,7 +10020,7 @@ if (!__Pyx_RefNanny) {
  * 
  * PACKED_UINT_8 = [struct_pack(">B", value) for value in range(0x100)]
  */
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_TRUE, __pyx_kp_b__3) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_TRUE, __pyx_kp_b__2) < 0) __PYX_ERR(0, 29, __pyx_L1_error)
 
   /* "neobolt/impl/python/packstream/_packer.pyx":31
  * TRUE = b"\xC3"
@@ -9983,9 +10036,9 @@ if (!__Pyx_RefNanny) {
     __Pyx_GOTREF(__pyx_t_2);
     if (PyDict_SetItem(__pyx_d, __pyx_n_s_value, __pyx_t_2) < 0) __PYX_ERR(0, 31, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 31, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 31, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = __Pyx_GetModuleGlobalName(__pyx_n_s_value); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 31, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_value); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 31, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     __pyx_t_6 = NULL;
     __pyx_t_7 = 0;
@@ -10054,9 +10107,9 @@ if (!__Pyx_RefNanny) {
     __Pyx_GOTREF(__pyx_t_2);
     if (PyDict_SetItem(__pyx_d, __pyx_n_s_value, __pyx_t_2) < 0) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_value); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 32, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_n_s_value); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 32, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __pyx_t_5 = NULL;
     __pyx_t_7 = 0;
@@ -10171,7 +10224,7 @@ if (!__Pyx_RefNanny) {
       __Pyx_DECREF_SET(__pyx_8genexpr1__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_x, __pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_2);
       __pyx_t_2 = 0;
-      __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 35, __pyx_L14_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_struct_pack); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 35, __pyx_L14_error)
       __Pyx_GOTREF(__pyx_t_4);
       __pyx_t_6 = NULL;
       __pyx_t_7 = 0;
@@ -10242,15 +10295,15 @@ if (!__Pyx_RefNanny) {
  */
   __pyx_t_1 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, Py_None) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_TRUE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_TRUE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, Py_True) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_FALSE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_FALSE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_t_1, __pyx_t_2, Py_False) < 0) __PYX_ERR(0, 37, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10264,7 +10317,7 @@ if (!__Pyx_RefNanny) {
  * UNPACKED_MARKERS.update({bytes(bytearray([z + 256])): z for z in range(-0x10, 0x00)})
  * 
  */
-  __pyx_t_1 = __Pyx_GetModuleGlobalName(__pyx_n_s_UNPACKED_MARKERS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_UNPACKED_MARKERS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_update); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 38, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
@@ -10315,7 +10368,7 @@ if (!__Pyx_RefNanny) {
  * 
  * 
  */
-  __pyx_t_4 = __Pyx_GetModuleGlobalName(__pyx_n_s_UNPACKED_MARKERS); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_UNPACKED_MARKERS); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_update); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
@@ -10330,7 +10383,7 @@ if (!__Pyx_RefNanny) {
       __Pyx_DECREF_SET(__pyx_8genexpr3__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_z, __pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_2);
       __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_8genexpr3__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_z, __pyx_int_256, 0x100, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L26_error)
+      __pyx_t_2 = __Pyx_PyInt_AddObjC(__pyx_8genexpr3__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_z, __pyx_int_256, 0x100, 0, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L26_error)
       __Pyx_GOTREF(__pyx_t_2);
       __pyx_t_8 = PyList_New(1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 39, __pyx_L26_error)
       __Pyx_GOTREF(__pyx_t_8);
@@ -10378,13 +10431,25 @@ if (!__Pyx_RefNanny) {
  * cdef INT64_HI = 2 ** 63
  * cdef INT64_LO = -(2 ** 63)             # <<<<<<<<<<<<<<
  * 
- * 
+ * # Raw data of at least this size is passed to the stream by
  */
   __Pyx_INCREF(__pyx_int_neg_9223372036854775808);
   __Pyx_XGOTREF(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO);
   __Pyx_DECREF_SET(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_INT64_LO, __pyx_int_neg_9223372036854775808);
   __Pyx_GIVEREF(__pyx_int_neg_9223372036854775808);
 
+  /* "neobolt/impl/python/packstream/_packer.pyx":47
+ * # Raw data of at least this size is passed to the stream by
+ * # reference (where supported) rather than being copied into it
+ * cdef MIN_SEGMENT_SIZE = 0x4000             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_INCREF(__pyx_int_16384);
+  __Pyx_XGOTREF(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_MIN_SEGMENT_SIZE);
+  __Pyx_DECREF_SET(__pyx_v_7neobolt_4impl_6python_10packstream_7_packer_MIN_SEGMENT_SIZE, __pyx_int_16384);
+  __Pyx_GIVEREF(__pyx_int_16384);
+
   /* "neobolt/impl/python/packstream/_packer.pyx":1
  * #!/usr/bin/env python             # <<<<<<<<<<<<<<
  * # -*- encoding: utf-8 -*-
@@ -10407,9 +10472,9 @@ if (!__Pyx_RefNanny) {
   __Pyx_XDECREF(__pyx_t_8);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init neobolt.impl.python.packstream._packer", 0, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init neobolt.impl.python.packstream._packer", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
+    Py_CLEAR(__pyx_m);
   } else if (!PyErr_Occurred()) {
     PyErr_SetString(PyExc_ImportError, "init neobolt.impl.python.packstream._packer");
   }
@@ -10430,9 +10495,9 @@ if (!__Pyx_RefNanny) {
 static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
     PyObject *m = NULL, *p = NULL;
     void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
+    m = PyImport_ImportModule(modname);
     if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
     if (!p) goto end;
     r = PyLong_AsVoidPtr(p);
 end:
@@ -10506,7 +10571,7 @@ static int __Pyx_ParseOptionalKeywords(
         }
         name = first_kw_arg;
         #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+        if (likely(PyString_Check(key))) {
             while (*name) {
                 if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
                         && _PyString_Eq(**name, key)) {
@@ -10533,7 +10598,7 @@ static int __Pyx_ParseOptionalKeywords(
             while (*name) {
                 int cmp = (**name == key) ? 0 :
                 #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                 #endif
                     PyUnicode_Compare(**name, key);
                 if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -10549,7 +10614,7 @@ static int __Pyx_ParseOptionalKeywords(
                 while (argname != first_kw_arg) {
                     int cmp = (**argname == key) ? 0 :
                     #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                     #endif
                         PyUnicode_Compare(**argname, key);
                     if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -10612,6 +10677,83 @@ static void __Pyx_RaiseArgtupleInvalid(
                  (num_expected == 1) ? "" : "s", num_found);
 }
 
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* GetAttr3 */
+static PyObject *__Pyx_GetAttr3Default(PyObject *d) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (unlikely(!__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        return NULL;
+    __Pyx_PyErr_Clear();
+    Py_INCREF(d);
+    return d;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetAttr3(PyObject *o, PyObject *n, PyObject *d) {
+    PyObject *r = __Pyx_GetAttr(o, n);
+    return (likely(r)) ? r : __Pyx_GetAttr3Default(d);
+}
+
 /* PyCFunctionFastCall */
 #if CYTHON_FAST_PYCCALL
 static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
@@ -10620,7 +10762,7 @@ static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, P
     PyObject *self = PyCFunction_GET_SELF(func);
     int flags = PyCFunction_GET_FLAGS(func);
     assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
     assert(nargs >= 0);
     assert(nargs == 0 || args != NULL);
     /* _PyCFunction_FastCallDict() must not be called with an exception set,
@@ -10628,16 +10770,15 @@ static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, P
        caller loses its exception */
     assert(!PyErr_Occurred());
     if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
     } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
     }
 }
 #endif
 
 /* PyFunctionFastCall */
 #if CYTHON_FAST_PYCALL
-#include "frameobject.h"
 static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
                                                PyObject *globals) {
     PyFrameObject *f;
@@ -10655,7 +10796,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     if (f == NULL) {
         return NULL;
     }
-    fastlocals = f->f_localsplus;
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
     for (i = 0; i < na; i++) {
         Py_INCREF(*args);
         fastlocals[i] = *args++;
@@ -10667,7 +10808,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     return result;
 }
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
     PyObject *globals = PyFunction_GET_GLOBALS(func);
     PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
@@ -10738,12 +10879,12 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
     }
 #if PY_MAJOR_VERSION >= 3
     result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, kwdefs, closure);
 #else
     result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, closure);
 #endif
@@ -10759,7 +10900,7 @@ done:
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -10775,6 +10916,35 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 }
 #endif
 
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
+
 /* PyObjectCallMethO */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
@@ -10817,7 +10987,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
         if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
             return __Pyx_PyObject_CallMethO(func, arg);
 #if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
             return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
         }
@@ -10835,41 +11005,85 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
 /* GetModuleGlobalName */
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
     PyObject *result;
 #if !CYTHON_AVOID_BORROWED_REFS
 #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
     result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
-        Py_INCREF(result);
+        return __Pyx_NewRef(result);
     } else if (unlikely(PyErr_Occurred())) {
-        result = NULL;
-    } else {
+        return NULL;
+    }
 #else
     result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
-        Py_INCREF(result);
-    } else {
+        return __Pyx_NewRef(result);
+    }
 #endif
 #else
     result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
-#endif
-        result = __Pyx_GetBuiltinName(name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
     }
-    return result;
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
 }
 
 /* PyIntBinop */
-    #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
+#if !CYTHON_COMPILING_IN_PYPY
+#if PY_MAJOR_VERSION < 3 || CYTHON_USE_PYLONG_INTERNALS
+#define __Pyx_PyInt_RemainderObjC_ZeroDivisionError(operand)\
+    if (unlikely(zerodivision_check && ((operand) == 0))) {\
+        PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");\
+        return NULL;\
+    }
+#endif
+static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
     #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_CheckExact(op1))) {
         const long b = intval;
         long x;
         long a = PyInt_AS_LONG(op1);
+            __Pyx_PyInt_RemainderObjC_ZeroDivisionError(b)
             x = a % b;
             x += ((x != 0) & ((x ^ b) < 0)) * b;
             return PyInt_FromLong(x);
@@ -10959,6 +11173,7 @@ static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, CYTHON_
                 default: return PyLong_Type.tp_as_number->nb_remainder(op1, op2);
             }
         }
+                __Pyx_PyInt_RemainderObjC_ZeroDivisionError(b)
                 x = a % b;
                 x += ((x != 0) & ((x ^ b) < 0)) * b;
             return PyLong_FromLong(x);
@@ -10977,7 +11192,7 @@ static PyObject* __Pyx_PyInt_RemainderObjC(PyObject *op1, PyObject *op2, CYTHON_
 #endif
 
 /* GetItemInt */
-    static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
     PyObject *r;
     if (!j) return NULL;
     r = PyObject_GetItem(o, j);
@@ -10992,7 +11207,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_
     if (wraparound & unlikely(i < 0)) {
         wrapped_i += PyList_GET_SIZE(o);
     }
-    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyList_GET_SIZE(o)))) {
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
         PyObject *r = PyList_GET_ITEM(o, wrapped_i);
         Py_INCREF(r);
         return r;
@@ -11010,7 +11225,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize
     if (wraparound & unlikely(i < 0)) {
         wrapped_i += PyTuple_GET_SIZE(o);
     }
-    if ((!boundscheck) || likely((0 <= wrapped_i) & (wrapped_i < PyTuple_GET_SIZE(o)))) {
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
         PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
         Py_INCREF(r);
         return r;
@@ -11026,7 +11241,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
 #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
     if (is_list || PyList_CheckExact(o)) {
         Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
-        if ((!boundscheck) || (likely((n >= 0) & (n < PyList_GET_SIZE(o))))) {
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
             PyObject *r = PyList_GET_ITEM(o, n);
             Py_INCREF(r);
             return r;
@@ -11034,7 +11249,7 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
     }
     else if (PyTuple_CheckExact(o)) {
         Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
-        if ((!boundscheck) || likely((n >= 0) & (n < PyTuple_GET_SIZE(o)))) {
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
             PyObject *r = PyTuple_GET_ITEM(o, n);
             Py_INCREF(r);
             return r;
@@ -11064,9 +11279,9 @@ static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
 }
 
 /* ObjectGetItem */
-    #if CYTHON_USE_TYPE_SLOTS
+#if CYTHON_USE_TYPE_SLOTS
 static PyObject *__Pyx_PyObject_GetIndex(PyObject *obj, PyObject* index) {
-    PyObject *runerr;
+    PyObject *runerr = NULL;
     Py_ssize_t key_value;
     PySequenceMethods *m = Py_TYPE(obj)->tp_as_sequence;
     if (unlikely(!(m && m->sq_item))) {
@@ -11092,32 +11307,8 @@ static PyObject *__Pyx_PyObject_GetItem(PyObject *obj, PyObject* key) {
 }
 #endif
 
-/* PyErrFetchRestore */
-    #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-#endif
-
 /* RaiseException */
-    #if PY_MAJOR_VERSION < 3
+#if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
                         CYTHON_UNUSED PyObject *cause) {
     __Pyx_PyThreadState_declare
@@ -11253,13 +11444,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -11267,6 +11452,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -11276,18 +11467,19 @@ bad:
 #endif
 
 /* PyObjectCallNoArg */
-    #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
 #if CYTHON_FAST_PYCALL
     if (PyFunction_Check(func)) {
         return __Pyx_PyFunction_FastCall(func, NULL, 0);
     }
 #endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_TypeCheck(func, __pyx_CyFunctionType))) {
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
 #else
-    if (likely(PyCFunction_Check(func))) {
+    if (likely(PyCFunction_Check(func)))
 #endif
+    {
         if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
             return __Pyx_PyObject_CallMethO(func, NULL);
         }
@@ -11297,20 +11489,20 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
 #endif
 
 /* RaiseTooManyValuesToUnpack */
-      static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-      static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
 /* IterFinish */
-      static CYTHON_INLINE int __Pyx_IterFinish(void) {
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
 #if CYTHON_FAST_THREAD_STATE
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
     PyObject* exc_type = tstate->curexc_type;
@@ -11345,19 +11537,17 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
 }
 
 /* UnpackItemEndCheck */
-      static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
     if (unlikely(retval)) {
         Py_DECREF(retval);
         __Pyx_RaiseTooManyValuesError(expected);
         return -1;
-    } else {
-        return __Pyx_IterFinish();
     }
-    return 0;
+    return __Pyx_IterFinish();
 }
 
 /* ArgTypeTest */
-      static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
 {
     if (unlikely(!type)) {
         PyErr_SetString(PyExc_SystemError, "Missing type object");
@@ -11378,7 +11568,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
 }
 
 /* PyObject_GenericGetAttrNoDict */
-      #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
     PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
@@ -11418,7 +11608,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 #endif
 
 /* PyObject_GenericGetAttr */
-      #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
     if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
         return PyObject_GenericGetAttr(obj, attr_name);
@@ -11428,7 +11618,7 @@ static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_nam
 #endif
 
 /* SetVTable */
-      static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
 #if PY_VERSION_HEX >= 0x02070000
     PyObject *ob = PyCapsule_New(vtable, 0, 0);
 #else
@@ -11445,8 +11635,30 @@ bad:
     return -1;
 }
 
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
 /* SetupReduce */
-      static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
   int ret;
   PyObject *name_attr;
   name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
@@ -11465,53 +11677,81 @@ bad:
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
-    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
-    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto BAD;
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #endif
-    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto BAD;
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
     if (reduce_ex == object_reduce_ex) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #else
-        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto BAD;
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
 #endif
-        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto BAD;
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
         if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
-            reduce_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_cython); if (unlikely(!reduce_cython)) goto BAD;
-            ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto BAD;
-            ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto BAD;
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
             setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
             if (!setstate) PyErr_Clear();
             if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
-                setstate_cython = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate_cython); if (unlikely(!setstate_cython)) goto BAD;
-                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto BAD;
-                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto BAD;
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
             }
             PyType_Modified((PyTypeObject*)type_obj);
         }
     }
-    goto GOOD;
-BAD:
+    goto __PYX_GOOD;
+__PYX_BAD:
     if (!PyErr_Occurred())
         PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
     ret = -1;
-GOOD:
+__PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -11522,7 +11762,7 @@ GOOD:
 }
 
 /* Import */
-      static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -11551,7 +11791,7 @@ GOOD:
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
                 module = PyImport_ImportModuleLevelObject(
                     name, global_dict, empty_dict, list, 1);
                 if (!module) {
@@ -11569,7 +11809,7 @@ GOOD:
             if (!py_level)
                 goto bad;
             module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
             Py_DECREF(py_level);
             #else
             module = PyImport_ImportModuleLevelObject(
@@ -11587,7 +11827,7 @@ bad:
 }
 
 /* ImportFrom */
-      static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -11601,8 +11841,10 @@ bad:
 }
 
 /* PyIntBinop */
-      #if !CYTHON_COMPILING_IN_PYPY
-static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, CYTHON_UNUSED int inplace) {
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED long intval, int inplace, int zerodivision_check) {
+    (void)inplace;
+    (void)zerodivision_check;
     #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_CheckExact(op1))) {
         const long b = intval;
@@ -11723,7 +11965,7 @@ static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, CYTHON_UNUSED
 #endif
 
 /* CLineInTraceback */
-      #ifndef CYTHON_CLINE_IN_TRACEBACK
+#ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -11737,7 +11979,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #if CYTHON_COMPILING_IN_CPYTHON
     cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
     if (likely(cython_runtime_dict)) {
-      use_cline = __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback);
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
     } else
 #endif
     {
@@ -11752,9 +11996,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
-    else if (PyObject_Not(use_cline) != 0) {
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
     }
     __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
@@ -11763,7 +12007,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-      static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -11826,7 +12070,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -11843,36 +12087,43 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-      #include "compile.h"
+#include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -11891,11 +12142,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -11903,14 +12159,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -11928,8 +12194,15 @@ bad:
 }
 
 /* CIntToPy */
-      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(int) < sizeof(long)) {
@@ -11959,8 +12232,15 @@ bad:
 }
 
 /* CIntToPy */
-      static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -11990,7 +12270,7 @@ bad:
 }
 
 /* CIntFromPyVerify */
-      #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
@@ -12012,8 +12292,15 @@ bad:
     }
 
 /* CIntFromPy */
-      static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -12064,7 +12351,7 @@ bad:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -12201,8 +12488,15 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-      static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -12253,7 +12547,7 @@ raise_neg_overflow:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -12390,7 +12684,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-      #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -12490,12 +12784,34 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* CheckBinaryVersion */
-      static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -12506,7 +12822,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 }
 
 /* InitStrings */
-      static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -12615,6 +12931,13 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
    else return PyObject_IsTrue(x);
 }
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
 static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
 #if PY_MAJOR_VERSION >= 3
     if (PyLong_Check(result)) {
@@ -12692,7 +13015,7 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
     if (sizeof(Py_ssize_t) >= sizeof(long))
         return PyInt_AS_LONG(b);
     else
-        return PyInt_AsSsize_t(x);
+        return PyInt_AsSsize_t(b);
   }
 #endif
   if (likely(PyLong_CheckExact(b))) {
@@ -12746,6 +13069,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -42,6 +42,10 @@ UNPACKED_MARKERS.update({bytes(bytearray([z + 256])): z for z in range(-0x10, 0x
 cdef INT64_HI = 2 ** 63
 cdef INT64_LO = -(2 ** 63)
 
+# Raw data of at least this size is passed to the stream by
+# reference (where supported) rather than being copied into it
+cdef MIN_SEGMENT_SIZE = 0x4000
+
 
 cdef class Packer(object):
 
@@ -49,14 +53,19 @@ cdef class Packer(object):
 
     cdef stream
     cdef _write
+    cdef _write_segment
 
     def __cinit__(self, stream):
         self.supports_bytes = False
         self.stream = stream
         self._write = self.stream.write
+        self._write_segment = getattr(self.stream, "write_segment", None)
 
     cdef pack_raw(self, data):
-        self._write(data)
+        if self._write_segment is not None and len(data) >= MIN_SEGMENT_SIZE:
+            self._write_segment(data)
+        else:
+            self._write(data)
 
     cpdef pack(self, value):
         return self._pack(value)
@@ -30,7 +30,6 @@ from neobolt.exceptions import ConnectionExpired, DatabaseUnavailableError, \
     NotALeaderError, ForbiddenOnReadOnlyDatabaseError, ServiceUnavailable
 from neobolt.direct import DEFAULT_PORT
 from neobolt.routing import READ_ACCESS, WRITE_ACCESS, RoutingProtocolError
-from neobolt.versioning import Version
 
 from .addressing import SocketAddress
 from .direct import AbstractConnectionPool
@@ -41,6 +40,16 @@ log = getLogger("neobolt")
 log_debug = log.debug
 
 
+def _routing_table_statement(protocol_version):
+    """ Return the statement that fetches the routing table, using
+    the parameter syntax accepted by the server. Neo4j 4.0, the first
+    version to speak Bolt v4, no longer accepts `{param}`.
+    """
+    if protocol_version >= 4:
+        return "CALL dbms.cluster.routing.getRoutingTable($context)"
+    return "CALL dbms.cluster.routing.getRoutingTable({context})"
+
+
 class OrderedSet(MutableSet):
 
     def __init__(self, elements=()):
@@ -239,11 +248,10 @@ class RoutingConnectionPool(AbstractConnectionPool):
 
         try:
             with self.acquire_direct(address) as cx:
-                _, _, server_version = (cx.server.agent or "").partition("/")
                 # TODO 2.0: remove old routing procedure
-                if server_version and Version.parse(server_version) >= Version((3, 2)):
+                if cx.server.capabilities.routing_context:
                     log_debug("[#%04X]  C: <ROUTING> query=%r", cx.local_port, self.routing_context or {})
-                    cx.run("CALL dbms.cluster.routing.getRoutingTable({context})",
+                    cx.run(_routing_table_statement(cx.protocol_version),
                            {"context": self.routing_context}, on_success=metadata.update, on_failure=fail)
                 else:
                     log_debug("[#%04X]  C: <ROUTING> query={}", cx.local_port)
@@ -334,6 +342,9 @@ class RoutingConnectionPool(AbstractConnectionPool):
         for address in list(self.connections):
             if address not in servers:
                 super(RoutingConnectionPool, self).deactivate(address)
+        if self._min_idle_connections:
+            for address in servers:
+                self.warm(address)
 
     def ensure_routing_table_is_fresh(self, access_mode):
         """ Update the routing table if stale.
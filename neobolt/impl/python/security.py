@@ -20,6 +20,7 @@
 
 
 from ssl import SSLContext, PROTOCOL_SSLv23, OP_NO_SSLv2, CERT_REQUIRED
+from threading import Lock
 
 
 # TODO 2.0: tidy these up
@@ -29,20 +30,39 @@ TRUST_SYSTEM_CA_SIGNED_CERTIFICATES = 4
 TRUST_DEFAULT = TRUST_ALL_CERTIFICATES
 
 
+# SSL contexts already built, keyed by trust setting. Building a
+# context loads and parses the system CA certificates, so each one
+# is shared by every connection with the same trust configuration.
+_ssl_contexts = {}
+_ssl_contexts_lock = Lock()
+
+
 def make_ssl_context(**config):
     if config.get("encrypted") or config.get("secure"):
-        ssl_context = SSLContext(PROTOCOL_SSLv23)
-        ssl_context.options |= OP_NO_SSLv2
         trust = config.get("trust", TRUST_DEFAULT)
-        if trust == TRUST_ALL_CERTIFICATES:
-            pass
-        elif trust == TRUST_CUSTOM_CA_SIGNED_CERTIFICATES:
-            raise NotImplementedError("Custom CA support is not implemented")
-        elif trust == TRUST_SYSTEM_CA_SIGNED_CERTIFICATES:
-            ssl_context.verify_mode = CERT_REQUIRED
-        else:
-            raise ValueError("Unknown trust mode")
-        ssl_context.set_default_verify_paths()
-        return ssl_context
+        try:
+            return _ssl_contexts[trust]
+        except KeyError:
+            with _ssl_contexts_lock:
+                try:
+                    return _ssl_contexts[trust]
+                except KeyError:
+                    ssl_context = _ssl_contexts[trust] = _make_ssl_context(trust)
+                    return ssl_context
     else:
         return None
+
+
+def _make_ssl_context(trust):
+    ssl_context = SSLContext(PROTOCOL_SSLv23)
+    ssl_context.options |= OP_NO_SSLv2
+    if trust == TRUST_ALL_CERTIFICATES:
+        pass
+    elif trust == TRUST_CUSTOM_CA_SIGNED_CERTIFICATES:
+        raise NotImplementedError("Custom CA support is not implemented")
+    elif trust == TRUST_SYSTEM_CA_SIGNED_CERTIFICATES:
+        ssl_context.verify_mode = CERT_REQUIRED
+    else:
+        raise ValueError("Unknown trust mode")
+    ssl_context.set_default_verify_paths()
+    return ssl_context
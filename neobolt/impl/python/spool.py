@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+This module provides a record sink that spills raw RECORD messages to
+disk, allowing results larger than available memory to be received
+and then decoded lazily from a memory-mapped file.
+"""
+
+
+__all__ = [
+    "RecordSpool",
+    "SpooledRecordCursor",
+]
+
+
+from array import array
+from mmap import mmap, ACCESS_READ
+from struct import pack as struct_pack, unpack_from as struct_unpack_from
+from tempfile import TemporaryFile
+
+from neobolt.exceptions import ProtocolError
+from neobolt.meta import import_best
+
+from .packstream import Unpacker
+
+
+MessageFrame = import_best("neobolt.impl.python.bolt._io", "neobolt.impl.python.bolt.io").MessageFrame
+
+
+class RecordSpool(object):
+    """ Sink for RECORD messages that appends each message, exactly as
+    received, to a temporary file.
+
+    A spool is attached to a response by passing its :meth:`.append`
+    method as the `on_record_frame` handler::
+
+        spool = RecordSpool()
+        cx.run("MATCH (a) RETURN a", {})
+        cx.pull_all(on_record_frame=spool.append)
+        cx.sync()
+        with spool.cursor() as cursor:
+            for record in cursor:
+                ...
+
+    Each message is stored as a four byte length followed by the
+    message data, with chunk headers removed.
+    """
+
+    def __init__(self, dir=None):
+        self._file = TemporaryFile(dir=dir)
+        self._offsets = array("Q")
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def append(self, frame):
+        """ Append the message framed by a :class:`.MessageFrame`.
+        """
+        view = frame.view()
+        panes = frame.panes()
+        size = sum(q - p for p, q in panes)
+        write = self._file.write
+        write(struct_pack(">I", size))
+        for p, q in panes:
+            write(view[p:q])
+        self._offsets.append(self._size)
+        self._size += 4 + size
+
+    def cursor(self):
+        """ Return a new cursor over all messages appended so far.
+        """
+        self._file.flush()
+        return SpooledRecordCursor(self._file, self._offsets[:])
+
+    def close(self):
+        self._file.close()
+
+
+class SpooledRecordCursor(object):
+    """ Read-only, memory-mapped view of the records held in a
+    :class:`.RecordSpool`. Records are decoded on access and can be
+    read sequentially, by iteration, or randomly, by index.
+    """
+
+    def __init__(self, file, offsets):
+        self._offsets = offsets
+        if offsets:
+            self._map = mmap(file.fileno(), 0, access=ACCESS_READ)
+            self._view = memoryview(self._map)
+        else:
+            self._map = None
+            self._view = memoryview(b"")
+        self._unpacker = Unpacker()
+        self._position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        for i in range(len(self._offsets)):
+            yield self._unpack(i)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._offsets)
+        if not 0 <= index < len(self._offsets):
+            raise IndexError("Record index out of range")
+        return self._unpack(index)
+
+    def position(self):
+        """ Return the index of the record that will be returned by
+        the next call to :meth:`.fetch_one`.
+        """
+        return self._position
+
+    def seek(self, index):
+        """ Move to a given record index for sequential access.
+        """
+        if not 0 <= index <= len(self._offsets):
+            raise IndexError("Record index out of range")
+        self._position = index
+
+    def fetch_one(self):
+        """ Return the next record in sequence, or :const:`None` if all
+        records have been read.
+        """
+        if self._position >= len(self._offsets):
+            return None
+        record = self._unpack(self._position)
+        self._position += 1
+        return record
+
+    def _unpack(self, index):
+        offset = self._offsets[index]
+        size, = struct_unpack_from(">I", self._view, offset)
+        start = offset + 4
+        unpacker = self._unpacker
+        unpacker.attach(MessageFrame(self._view[start:(start + size)], [(0, size)]))
+        _, signature = unpacker.unpack_structure_header()
+        if signature != b"\x71":
+            raise ProtocolError("Expected RECORD message in spool, found signature %r" % signature)
+        return unpacker.unpack_list()
+
+    def close(self):
+        self._unpacker.attach(None)
+        self._view.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
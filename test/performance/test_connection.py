@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Benchmarks for the per-message overhead of a Connection, run with
+pytest-benchmark::
+
+    python -m pytest test/performance
+"""
+
+
+from logging import DEBUG, NOTSET, NullHandler, getLogger
+from tracemalloc import start as start_tracing, stop as stop_tracing, take_snapshot
+
+from pytest import fixture
+
+from neobolt.direct import Connection
+from neobolt.impl.python.direct import Response
+
+from test.performance.tools import fastest
+
+
+STATEMENT = u"MATCH (a:Person {name: $name}) RETURN a"
+PARAMETERS = {u"name": u"Alice", u"tags": [u"x", u"y", u"z"], u"age": 33}
+
+
+class NullSocket(object):
+
+    def getpeername(self):
+        return "127.0.0.1", 7687
+
+    def getsockname(self):
+        return "127.0.0.1", 51234
+
+    def close(self):
+        pass
+
+
+@fixture
+def connection():
+    cx = Connection(3, ("127.0.0.1", 7687), NullSocket())
+    yield cx
+    cx._closed = True
+
+
+@fixture
+def debug_logging():
+    log = getLogger("neobolt")
+    handler = NullHandler()
+    log.addHandler(handler)
+    log.setLevel(DEBUG)
+    yield
+    log.setLevel(NOTSET)
+    log.removeHandler(handler)
+
+
+def run(cx, n=1000):
+    for _ in range(n):
+        cx.run(STATEMENT, PARAMETERS)
+    cx.responses.clear()
+    cx.output_buffer.clear()
+
+
+def append(cx, n=1000):
+    for _ in range(n):
+        cx._append(b"\x10", (STATEMENT, PARAMETERS, {}), Response(cx))
+    cx.responses.clear()
+    cx.output_buffer.clear()
+
+
+def test_append_without_logging(benchmark, connection):
+    """ Baseline: queue RUN messages without any logging.
+    """
+    benchmark(append, connection)
+
+
+def test_run_with_debug_disabled(benchmark, connection):
+    """ Should be indistinguishable from the baseline.
+    """
+    benchmark(run, connection)
+
+
+def test_run_with_debug_enabled(benchmark, connection, debug_logging):
+    benchmark(run, connection)
+
+
+def test_run_with_debug_disabled_is_close_to_baseline(connection):
+    """ Formatting the RUN fields for the log, even with no handler to
+    receive it, adds about 7% to the baseline, so this fails if that
+    work creeps back onto the path taken with debug logging disabled.
+    """
+    baseline, disabled = fastest([lambda: append(connection, 200), lambda: run(connection, 200)])
+    assert disabled < 1.05 * baseline
+
+
+def test_query_allocations(connection):
+    """ Count the memory blocks still held for each RUN and PULL_ALL
+    pair queued, before any response has been received.
+    """
+    query_count = 1000
+    records = []
+    run(connection, 10)
+    start_tracing()
+    try:
+        before = take_snapshot()
+        for _ in range(query_count):
+            connection.run(STATEMENT, PARAMETERS)
+            connection.pull_all(on_records=records.extend)
+        after = take_snapshot()
+    finally:
+        stop_tracing()
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    assert len(connection.responses) == 2 * query_count
+    assert retained_blocks < 4 * query_count
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Benchmarks for the Bolt I/O buffers, run with pytest-benchmark::
+
+    python -m pytest test/performance
+"""
+
+
+from tracemalloc import start as start_tracing, stop as stop_tracing, take_snapshot
+
+from pytest import fixture
+
+from neobolt.impl.python.bolt import io as py_io
+from neobolt.impl.python.packstream.packer import Packer
+
+try:
+    from neobolt.impl.python.bolt import _io as c_io
+except ImportError:
+    IMPLEMENTATIONS = [py_io]
+else:
+    IMPLEMENTATIONS = [py_io, c_io]
+
+
+RECORD_COUNT = 10000
+
+
+def packed_records(count):
+    """ Return the chunked form of `count` small RECORD messages.
+    """
+    output_buffer = py_io.ChunkedOutputBuffer()
+    packer = Packer(output_buffer)
+    for i in range(count):
+        packer.pack_struct(b"\x71", ([i, u"Alice", 33],))
+        output_buffer.chunk()
+        output_buffer.chunk()
+    return output_buffer.view().tobytes()
+
+
+def frame_all(input_buffer, data):
+    """ Load data and frame every message in it, retaining each frame
+    object handed out by the buffer.
+    """
+    input_buffer.load(data)
+    frames = []
+    while input_buffer.frame_message():
+        frames.append(input_buffer.frame())
+    input_buffer.discard_message()
+    return frames
+
+
+@fixture(scope="module")
+def data():
+    return packed_records(RECORD_COUNT)
+
+
+@fixture(params=IMPLEMENTATIONS, ids=lambda module: module.__name__.rpartition(".")[-1])
+def io(request):
+    return request.param
+
+
+def test_frame_small_records(benchmark, io, data):
+
+    def setup():
+        return (io.ChunkedInputBuffer(capacity=2 * len(data)), data), {}
+
+    frames = benchmark.pedantic(frame_all, setup=setup, rounds=20)
+    assert len(frames) == RECORD_COUNT
+
+
+def test_frame_allocations(io, data):
+    input_buffer = io.ChunkedInputBuffer(capacity=2 * len(data))
+    start_tracing()
+    try:
+        before = take_snapshot()
+        frames = frame_all(input_buffer, data)
+        after = take_snapshot()
+    finally:
+        stop_tracing()
+    retained_blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    assert len(set(map(id, frames))) == 1
+    assert retained_blocks < RECORD_COUNT
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+"""
+Loopback benchmarks for the socket profiles, run with pytest-benchmark::
+
+    python -m pytest test/performance/test_socket.py
+
+The request/response benchmark writes each request in two parts, as
+a pipelining client does, which is where Nagle's algorithm and delayed
+acknowledgements combine to hold up small exchanges.
+"""
+
+
+from socket import socket
+from threading import Thread
+
+from pytest import fixture, mark
+
+import neobolt.direct  # must be imported ahead of the implementation module
+from neobolt.impl.python.direct import _connect
+
+from test.performance.tools import fastest
+
+
+REQUEST_HEAD = b"\x00\x08"
+REQUEST_BODY = b"\xB1\x10\x83abc\x00\x00"
+REQUEST_SIZE = len(REQUEST_HEAD) + len(REQUEST_BODY)
+BULK_SIZE = 32 * 1024 * 1024
+
+
+class LoopbackServer(Thread):
+    """ Server that either answers each fixed-size request with a
+    single byte or, in bulk mode, sends a large block of data.
+    """
+
+    def __init__(self, bulk=False):
+        super(LoopbackServer, self).__init__()
+        self.daemon = True
+        self.bulk = bulk
+        self.listener = socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(1)
+        self.address = self.listener.getsockname()
+
+    def run(self):
+        s, _ = self.listener.accept()
+        try:
+            if self.bulk:
+                data = bytes(BULK_SIZE)
+                while s.recv(1):
+                    s.sendall(data)
+            else:
+                while True:
+                    request = b""
+                    while len(request) < REQUEST_SIZE:
+                        data = s.recv(REQUEST_SIZE - len(request))
+                        if not data:
+                            return
+                        request += data
+                    s.sendall(b"\x00")
+        finally:
+            s.close()
+            self.listener.close()
+
+
+def exchange(s, n=25):
+    for _ in range(n):
+        s.sendall(REQUEST_HEAD)
+        s.sendall(REQUEST_BODY)
+        s.recv(1)
+
+
+def download(s, buffer):
+    s.sendall(b"\x00")
+    view = memoryview(buffer)
+    received = 0
+    while received < BULK_SIZE:
+        received += s.recv_into(view[received:])
+
+
+@fixture(params=[None, "latency", "bulk"], ids=lambda profile: profile or "default")
+def profile(request):
+    return request.param
+
+
+@mark.parametrize("bulk", [False, True], ids=["request_response", "bulk_transfer"])
+def test_profile(benchmark, profile, bulk):
+    server = LoopbackServer(bulk=bulk)
+    server.start()
+    s = _connect(server.address, socket_profile=profile)
+    try:
+        if bulk:
+            buffer = bytearray(BULK_SIZE)
+            benchmark.pedantic(download, (s, buffer), rounds=10)
+        else:
+            benchmark.pedantic(exchange, (s,), rounds=5)
+    finally:
+        s.close()
+        server.join(5)
+
+
+@mark.parametrize("profile", ["latency", "bulk"])
+@mark.parametrize("bulk", [False, True], ids=["request_response", "bulk_transfer"])
+def test_profile_is_no_slower_than_default(profile, bulk):
+    """ Neither profile may cost more than the default for either kind
+    of traffic, allowing for the noise of bulk transfers.
+    """
+    servers = [LoopbackServer(bulk=bulk), LoopbackServer(bulk=bulk)]
+    for server in servers:
+        server.start()
+    default_socket = _connect(servers[0].address, socket_profile=None)
+    profile_socket = _connect(servers[1].address, socket_profile=profile)
+    try:
+        if bulk:
+            buffer = bytearray(BULK_SIZE)
+            default_time, profile_time = fastest([lambda: download(default_socket, buffer),
+                                                  lambda: download(profile_socket, buffer)], rounds=5)
+        else:
+            default_time, profile_time = fastest([lambda: exchange(default_socket, 5),
+                                                  lambda: exchange(profile_socket, 5)], rounds=3)
+        assert profile_time < 1.5 * default_time
+    finally:
+        default_socket.close()
+        profile_socket.close()
+        for server in servers:
+            server.join(5)
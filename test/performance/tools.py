@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from gc import disable as disable_gc, enable as enable_gc, isenabled as gc_isenabled
+from time import perf_counter
+
+
+def fastest(functions, rounds=50):
+    """ Time each of a number of functions, taking turns so that any
+    change in load affects them all alike, and return the fastest time
+    for each. Garbage collection is paused while timing, as it would
+    otherwise land on whichever function happens to be running.
+    """
+    times = [float("inf")] * len(functions)
+    gc_was_enabled = gc_isenabled()
+    disable_gc()
+    try:
+        for _ in range(rounds):
+            for i, function in enumerate(functions):
+                t0 = perf_counter()
+                function()
+                times[i] = min(times[i], perf_counter() - t0)
+    finally:
+        if gc_was_enabled:
+            enable_gc()
+    return times
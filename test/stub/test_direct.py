@@ -19,12 +19,30 @@
 # limitations under the License.
 
 
-from neobolt.direct import connect, Connection
-from neobolt.exceptions import ServiceUnavailable
+from tempfile import NamedTemporaryFile
+
+from neobolt.direct import connect, Connection, ConnectionPool, RecordSpool
+from neobolt.exceptions import ClientError, ServiceUnavailable, CypherSyntaxError, TransientError
 
 from test.stub.tools import StubTestCase, StubCluster
 
 
+# Generated on the fly, with a parameter value too large to fit
+# into a chunk of the default size
+LARGE_PARAMETER_SCRIPT = """\
+!: BOLT 3
+!: AUTO HELLO
+!: AUTO GOODBYE
+!: AUTO RESET
+
+C: RUN "RETURN $x" {"x": "%s"} {}
+   PULL_ALL
+S: SUCCESS {"fields": ["x"]}
+   RECORD [1]
+   SUCCESS {}
+"""
+
+
 class ConnectionV1TestCase(StubTestCase):
 
     def test_construction(self):
@@ -93,6 +111,122 @@ class ConnectionV3TestCase(StubTestCase):
                 cx.sync()
                 self.assertEqual([[1]], records)
 
+    def test_return_1_into_spool(self):
+        with StubCluster({9001: "v3/return_1.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                metadata = {}
+                records = []
+                with RecordSpool() as spool:
+                    cx.run("RETURN $x", {"x": 1}, on_success=metadata.update)
+                    cx.pull_all(on_success=metadata.update, on_records=records.extend,
+                                on_record_frame=spool.append)
+                    detail_count, _ = cx.sync()
+                    with spool.cursor() as cursor:
+                        self.assertEqual([[1]], list(cursor))
+                self.assertEqual(1, detail_count)
+                self.assertEqual([], records)
+
+    def test_return_1_with_small_chunks(self):
+        with StubCluster({9001: "v3/return_1.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, max_chunk_size=3) as cx:
+                metadata = {}
+                records = []
+                cx.run("RETURN $x", {"x": 1}, on_success=metadata.update)
+                cx.pull_all(on_success=metadata.update, on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1]], records)
+
+    def test_large_parameter_in_large_chunks(self):
+        value = "x" * 50000
+        with NamedTemporaryFile("w", suffix=".script") as script:
+            script.write(LARGE_PARAMETER_SCRIPT % value)
+            script.flush()
+            with StubCluster({9001: script.name}):
+                address = ("127.0.0.1", 9001)
+                with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                    self.assertEqual(cx.output_buffer.max_chunk_size(), 65535)
+                    metadata = {}
+                    records = []
+                    cx.run("RETURN $x", {"x": value}, on_success=metadata.update)
+                    cx.pull_all(on_success=metadata.update, on_records=records.extend)
+                    cx.sync()
+                    self.assertEqual([[1]], records)
+
+    def test_run_many(self):
+        with StubCluster({9001: "v3/return_1_2_3_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                results = list(cx.run_many("RETURN $x", ({"x": x} for x in (1, 2, 3)), max_in_flight=2))
+                self.assertEqual([
+                    ([[1]], {"fields": ["x"], "type": "r"}),
+                    ([[2]], {"fields": ["x"], "type": "r"}),
+                    ([[3]], {"fields": ["x"], "type": "r"}),
+                ], results)
+
+    def test_run_many_keeps_no_more_than_max_in_flight_statements_outstanding(self):
+        with StubCluster({9001: "v3/return_1_2_3_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                outstanding = []
+
+                def parameters():
+                    for x in (1, 2, 3):
+                        # Each statement is a RUN and a PULL_ALL
+                        outstanding.append(len(cx.responses) // 2)
+                        yield {"x": x}
+
+                results = list(cx.run_many("RETURN $x", parameters(), max_in_flight=2))
+                self.assertEqual([[[1]], [[2]], [[3]]], [records for records, _ in results])
+                self.assertEqual([0, 1, 1], outstanding)
+
+    def test_run_many_with_error(self):
+        with StubCluster({9001: "v3/error_in_run_many_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                results = cx.run_many("RETURN 1 / $x", ({"x": x} for x in (1, 0, 2, 3)), max_in_flight=4)
+                self.assertEqual(([[1]], {"fields": ["1 / $x"], "type": "r"}), next(results))
+                with self.assertRaises(ClientError) as context:
+                    next(results)
+                self.assertEqual("Neo.ClientError.Statement.ArithmeticError", context.exception.code)
+                self.assertEqual([], list(results))
+                self.assertFalse(cx.responses)
+                self.assertFalse(cx.defunct())
+                records = []
+                cx.run("RETURN 1 / $x", {"x": 4})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[0]], records)
+
+    def test_stream(self):
+        with StubCluster({9001: "v3/return_1_2_3_streamed.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                with cx.stream("UNWIND [1, 2, 3] AS x RETURN x") as stream:
+                    self.assertEqual(["x"], stream.keys())
+                    self.assertEqual([[1], [2], [3]], list(stream))
+                    self.assertEqual({"fields": ["x"], "type": "r"}, stream.metadata)
+                records = []
+                cx.run("RETURN $x", {"x": 4})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[4]], records)
+
+    def test_stream_closed_early(self):
+        with StubCluster({9001: "v3/return_1_2_3_streamed.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                with cx.stream("UNWIND [1, 2, 3] AS x RETURN x") as stream:
+                    self.assertEqual([1], next(stream))
+                self.assertTrue(stream.response.complete)
+                self.assertEqual([], list(stream))
+                records = []
+                cx.run("RETURN $x", {"x": 4})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[4]], records)
+
     def test_return_1_in_tx(self):
         with StubCluster({9001: "v3/return_1_in_tx.script"}):
             address = ("127.0.0.1", 9001)
@@ -107,6 +241,96 @@ class ConnectionV3TestCase(StubTestCase):
                 self.assertEqual([[1]], records)
                 self.assertEqual({"fields": ["x"], "bookmark": "bookmark:1"}, metadata)
 
+    def test_run_in_transaction(self):
+        with StubCluster({9001: "v3/return_1_in_tx_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                records, metadata = cx.run_in_transaction("RETURN $x", {"x": 1})
+                self.assertEqual([[1]], records)
+                self.assertEqual({"fields": ["x"], "bookmark": "bookmark:1"}, metadata)
+
+    def test_run_in_transaction_with_error_on_run(self):
+        with StubCluster({9001: "v3/error_in_tx_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                with self.assertRaises(CypherSyntaxError):
+                    cx.run_in_transaction("X")
+                self.assertFalse(cx.responses)
+                self.assertFalse(cx.defunct())
+
+    def test_run_in_transaction_with_error_on_begin(self):
+        with StubCluster({9001: "v3/error_on_begin_pipelined.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                with self.assertRaises(TransientError):
+                    cx.run_in_transaction("RETURN $x", {"x": 1}, bookmarks=["bookmark:X"])
+                self.assertFalse(cx.responses)
+                self.assertFalse(cx.defunct())
+
+    def test_failure_defers_reset_to_next_message(self):
+        with StubCluster({9001: "v3/error_then_return_1.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                ignored = []
+                cx.run("X")
+                cx.pull_all(on_ignored=ignored.append)
+                with self.assertRaises(CypherSyntaxError):
+                    cx.sync()
+                self.assertEqual([{}], ignored)
+                self.assertFalse(cx.responses)
+                self.assertEqual(b"", cx.output_buffer.view().tobytes())
+                records = []
+                cx.run("RETURN $x", {"x": 1})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1]], records)
+
+    def test_deferred_reset_is_sent_on_release(self):
+
+        def connector(address, **config):
+            return connect(address, auth=self.auth_token, encrypted=False, **config)
+
+        with StubCluster({9001: "v3/error_then_release.script"}):
+            address = ("127.0.0.1", 9001)
+            with ConnectionPool(connector, address) as pool:
+                cx = pool.acquire()
+                cx.run("X")
+                cx.pull_all()
+                with self.assertRaises(CypherSyntaxError):
+                    cx.sync()
+                pool.release(cx)
+                self.assertEqual(1, len(cx.responses))
+                cx = pool.acquire()
+                records = []
+                cx.run("RETURN $x", {"x": 1})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1]], records)
+                pool.release(cx)
+
+    def test_liveness_check_receives_deferred_reset(self):
+
+        def connector(address, **config):
+            return connect(address, auth=self.auth_token, encrypted=False, **config)
+
+        with StubCluster({9001: "v3/error_then_release.script"}):
+            address = ("127.0.0.1", 9001)
+            with ConnectionPool(connector, address, liveness_check_timeout=0) as pool:
+                cx = pool.acquire()
+                cx.run("X")
+                cx.pull_all()
+                with self.assertRaises(CypherSyntaxError):
+                    cx.sync()
+                pool.release(cx)
+                self.assertIs(cx, pool.acquire())
+                self.assertFalse(cx.responses)
+                records = []
+                cx.run("RETURN $x", {"x": 1})
+                cx.pull_all(on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1]], records)
+                pool.release(cx)
+
     def test_begin_with_metadata(self):
         with StubCluster({9001: "v3/begin_with_metadata.script"}):
             address = ("127.0.0.1", 9001)
@@ -196,3 +420,85 @@ class ConnectionV3TestCase(StubTestCase):
                     metadata = {}
                     cx.run("RETURN $x", {"x": 1}, on_success=metadata.update)
                     cx.sync()
+
+
+class ConnectionV4TestCase(StubTestCase):
+
+    def test_construction(self):
+        with StubCluster({9001: "v4/empty.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                self.assertIsInstance(cx, Connection)
+                self.assertEqual(4, cx.protocol_version)
+
+    def test_return_1(self):
+        with StubCluster({9001: "v4/return_1.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False) as cx:
+                metadata = {}
+                records = []
+                cx.run("RETURN $x", {"x": 1}, on_success=metadata.update)
+                cx.pull_all(on_success=metadata.update, on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1]], records)
+
+    def test_pull_in_batches(self):
+        with StubCluster({9001: "v4/return_1_to_5_in_batches.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, fetch_size=2) as cx:
+                metadata = {}
+                records = []
+                cx.run("UNWIND range(1, 5) AS x RETURN x", on_success=metadata.update)
+                cx.pull(on_success=metadata.update, on_records=records.extend)
+                cx.sync()
+                self.assertEqual([[1], [2], [3], [4], [5]], records)
+                self.assertEqual({"fields": ["x"], "type": "r"}, metadata)
+
+    def test_pull_in_batches_behind_pipelined_statement(self):
+        with StubCluster({9001: "v4/return_1_to_3_in_batches_behind_pipelined_statement.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, fetch_size=2) as cx:
+                records_x = []
+                records_y = []
+                cx.begin()
+                cx.run("UNWIND range(1, 3) AS x RETURN x")
+                cx.pull(on_records=records_x.extend)
+                cx.run("RETURN 4 AS y")
+                cx.pull(on_records=records_y.extend)
+                cx.sync()
+                self.assertEqual([[1], [2], [3]], records_x)
+                self.assertEqual([[4]], records_y)
+                cx.commit()
+                cx.sync()
+
+    def test_remaining_batches_are_ignored_after_pipelined_failure(self):
+        with StubCluster({9001: "v4/error_behind_first_batch.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, fetch_size=2) as cx:
+                records = []
+                ignored = []
+                cx.begin()
+                cx.run("UNWIND range(1, 3) AS x RETURN x")
+                cx.pull(on_records=records.extend, on_ignored=ignored.append)
+                cx.run("X")
+                cx.pull()
+                with self.assertRaises(CypherSyntaxError):
+                    cx.sync()
+                self.assertEqual([[1], [2]], records)
+                self.assertEqual([{}], ignored)
+                self.assertFalse(cx.responses)
+
+    def test_stream_in_batches(self):
+        with StubCluster({9001: "v4/return_1_to_5_in_batches.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, fetch_size=2) as cx:
+                with cx.stream("UNWIND range(1, 5) AS x RETURN x") as stream:
+                    self.assertEqual([[1], [2], [3], [4], [5]], list(stream))
+
+    def test_stream_closed_early_discards_remaining_batches(self):
+        with StubCluster({9001: "v4/return_1_to_5_discarded_after_first_batch.script"}):
+            address = ("127.0.0.1", 9001)
+            with connect(address, auth=self.auth_token, encrypted=False, fetch_size=2) as cx:
+                with cx.stream("UNWIND range(1, 5) AS x RETURN x") as stream:
+                    self.assertEqual([1], next(stream))
+                self.assertEqual({"fields": ["x"], "type": "r"}, stream.metadata)
@@ -143,6 +143,14 @@ class RoutingConnectionPoolFetchRoutingInfoTestCase(StubTestCase):
             with RoutingConnectionPool(connector, UNREACHABLE_ADDRESS, routing_context) as pool:
                 pool.fetch_routing_info(address)
 
+    def test_should_call_get_routing_tables_with_context_over_bolt_v4(self):
+        with StubCluster({9001: "v4/get_routing_table_with_context.script"}):
+            address = ("127.0.0.1", 9001)
+            routing_context = {"name": "molly", "age": "1"}
+            with RoutingConnectionPool(connector, UNREACHABLE_ADDRESS, routing_context) as pool:
+                routing_info = pool.fetch_routing_info(address)
+                self.assertEqual(300, routing_info[0]["ttl"])
+
     def test_should_call_get_routing_tables(self):
         with StubCluster({9001: "v1/get_routing_table.script"}):
             address = ("127.0.0.1", 9001)
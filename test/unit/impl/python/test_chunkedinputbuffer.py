@@ -94,6 +94,37 @@ class ChunkedInputBufferTestCase(TestCase):
         # Then
         assert buffer.capacity() == 16
 
+    def test_should_be_able_to_receive_into_reserved_space(self):
+        # Given
+        buffer = self.ChunkedInputBuffer(capacity=10)
+        buffer.load(b"\x00\x05")
+
+        # When
+        view = buffer.reserve(7)
+        view[:7] = b"hello\x00\x00"
+        buffer.advance(7)
+
+        # Then
+        assert buffer.capacity() >= 9
+        assert buffer.frame_message()
+        assert buffer.frame().panes() == [(2, 7)]
+
+    def test_reserve_should_recycle_discarded_messages(self):
+        # Given
+        buffer = self.ChunkedInputBuffer(capacity=10)
+        buffer.load(b"\x00\x01a\x00\x00\x00\x01")
+        assert buffer.frame_message()
+
+        # When
+        view = buffer.reserve(4)
+        view[:3] = b"b\x00\x00"
+        buffer.advance(3)
+
+        # Then
+        assert buffer.capacity() == 10
+        assert buffer.frame_message()
+        assert buffer.view().tobytes() == b"\x00\x01b\x00\x00"
+
     def test_should_start_with_no_frame(self):
         # Given
         buffer = self.ChunkedInputBuffer()
@@ -116,6 +147,28 @@ class ChunkedInputBufferTestCase(TestCase):
         assert framed
         assert buffer.frame().panes() == [(2, 7)]
 
+    def test_should_coalesce_multi_chunk_message_into_one_pane(self):
+        # Given
+        buffer = self.ChunkedInputBuffer()
+        buffer.load(b"\x00\x03hel\x00\x02lo\x00\x01!\x00\x00")
+        buffer.load(b"\x00\x07bonjour\x00\x00")
+
+        # When
+        framed = buffer.frame_message()
+        frame = buffer.frame()
+
+        # Then
+        assert framed
+        assert frame.panes() == [(2, 8)]
+        assert bytearray(frame.read(6)) == bytearray(b"hello!")
+
+        # When
+        framed = buffer.frame_message()
+
+        # Then
+        assert framed
+        assert bytearray(buffer.frame().read(7)) == bytearray(b"bonjour")
+
     def test_should_be_able_to_frame_empty_message(self):
         # Given
         buffer = self.ChunkedInputBuffer()
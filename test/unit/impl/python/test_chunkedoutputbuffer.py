@@ -120,6 +120,64 @@ class ChunkedOutputBufferTestCase(TestCase):
         # Then
         assert buffer.view().tobytes() == b"\x00\x05hello\x00\x00"
 
+    def test_segment_should_be_framed_in_its_own_chunks(self):
+        # Given
+        buffer = self.ChunkedOutputBuffer(max_chunk_size=4)
+
+        # When
+        buffer.write(b"ab")
+        buffer.write_segment(b"octopus")
+        buffer.chunk()
+        buffer.chunk()
+
+        # Then
+        assert buffer.view().tobytes() == b"\x00\x02ab\x00\x04octo\x00\x03pus\x00\x00"
+
+    def test_segment_should_be_held_by_reference(self):
+        # Given
+        buffer = self.ChunkedOutputBuffer()
+        segment = b"octopus"
+
+        # When
+        buffer.write(b"hello")
+        buffer.write_segment(segment)
+        buffer.write(b"world")
+        buffer.chunk()
+        buffer.chunk()
+        views = buffer.views()
+
+        # Then
+        assert [bytes(view) for view in views] == [b"\x00\x05hello", b"\x00\x07", b"octopus",
+                                                   b"\x00\x05world\x00\x00"]
+        assert views[2].obj is segment
+
+    def test_segment_at_start_of_message_should_not_leave_empty_chunk(self):
+        # Given
+        buffer = self.ChunkedOutputBuffer()
+
+        # When
+        buffer.write(b"hello")
+        buffer.chunk()
+        buffer.chunk()
+        buffer.write_segment(b"world")
+        buffer.chunk()
+        buffer.chunk()
+
+        # Then
+        assert buffer.view().tobytes() == b"\x00\x05hello\x00\x00\x00\x05world\x00\x00"
+
+    def test_clear_should_clear_segments(self):
+        # Given
+        buffer = self.ChunkedOutputBuffer()
+
+        # When
+        buffer.write_segment(b"redacted")
+        buffer.clear()
+        buffer.write(b"Linux")
+
+        # Then
+        assert buffer.views() == [b"\x00\x05Linux"]
+
 
 try:
     from neo4j.bolt._io import ChunkedOutputBuffer as CChunkedOutputBuffer
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from socket import socket
+from threading import Thread
+from time import sleep
+from unittest import TestCase
+
+from neobolt.direct import Connection, ConnectionMultiplexer
+from neobolt.exceptions import CypherSyntaxError, ServiceUnavailable
+
+from test.unit.tools import StubBoltServer
+
+
+class StubServer(StubBoltServer, Thread):
+    """ Thread serving a single, already handshaken connection, in
+    which each response is delayed by `delay` seconds.
+    """
+
+    def __init__(self, s, delay=0):
+        StubBoltServer.__init__(self)
+        Thread.__init__(self)
+        self.daemon = True
+        self.socket = s
+        self.delay = delay
+
+    def run(self):
+        while self.input_buffer.receive_message(self.socket, 8192):
+            self.handle()
+            if self.goodbye:
+                break
+            sleep(self.delay)
+            self.socket.sendall(self.flush())
+        self.socket.close()
+
+
+class ConnectionMultiplexerTestCase(TestCase):
+
+    def setUp(self):
+        self.listener = socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(16)
+        self.connections = []
+        self.servers = []
+
+    def tearDown(self):
+        for cx in self.connections:
+            cx.close()
+        for server in self.servers:
+            if server.is_alive():
+                server.join(5)
+        self.listener.close()
+
+    def open(self, delay=0, start=True):
+        s = socket()
+        s.connect(self.listener.getsockname())
+        cx = Connection(3, s.getpeername(), s)
+        self.connections.append(cx)
+        server = StubServer(self.listener.accept()[0], delay)
+        self.servers.append(server)
+        if start:
+            server.start()
+        return cx, server
+
+    def test_responses_are_dispatched_as_they_arrive(self):
+        finished = []
+        with ConnectionMultiplexer() as mux:
+            for x, delay in enumerate([0.3, 0.0, 0.15]):
+                cx, _ = self.open(delay)
+                cx.run("RETURN $x", {"x": x})
+                cx.pull_all(on_records=lambda records: finished.extend(r[0] for r in records))
+                mux.add(cx)
+            self.assertTrue(mux.sync())
+        self.assertEqual([1, 2, 0], finished)
+
+    def test_one_thread_can_drive_many_connections(self):
+        records = {}
+        with ConnectionMultiplexer() as mux:
+            for x in range(40):
+                cx, _ = self.open(0.05)
+                cx.run("RETURN $x", {"x": x})
+                cx.pull_all(on_records=records.setdefault(x, []).extend)
+                mux.add(cx)
+            self.assertTrue(mux.sync(timeout=10))
+        self.assertEqual({x: [[x]] for x in range(40)}, records)
+
+    def test_large_messages_are_written_without_blocking(self):
+        value = "x" * 8000000
+        records = []
+        with ConnectionMultiplexer() as mux:
+            cx, server = self.open(start=False)
+            cx.run("RETURN $x", {"x": value})
+            cx.pull_all(on_records=records.extend)
+            mux.add(cx)
+            mux.poll(0)
+            self.assertTrue(mux.outstanding())
+            server.start()
+            self.assertTrue(mux.sync())
+        self.assertEqual([[value]], records)
+
+    def test_sync_returns_false_on_timeout(self):
+        with ConnectionMultiplexer() as mux:
+            cx, _ = self.open(0.5)
+            cx.run("RETURN $x", {"x": 1})
+            cx.pull_all()
+            mux.add(cx)
+            self.assertFalse(mux.sync(timeout=0.1))
+            self.assertTrue(mux.sync())
+
+    def test_failure_is_raised_and_connection_remains_usable(self):
+        records = []
+        with ConnectionMultiplexer() as mux:
+            cx, server = self.open()
+            cx.run("X")
+            cx.pull_all()
+            mux.add(cx)
+            with self.assertRaises(CypherSyntaxError):
+                mux.sync()
+            self.assertEqual(1, len(cx.responses))      # the PULL_ALL, to be ignored
+            cx.run("RETURN $x", {"x": 2})
+            cx.pull_all(on_records=records.extend)
+            self.assertTrue(mux.sync())
+        self.assertEqual([[2]], records)
+        self.assertEqual([b"\x10", b"\x3F", b"\x0F", b"\x10", b"\x3F"], server.requests)
+
+    def test_closed_connection_is_removed(self):
+        with ConnectionMultiplexer() as mux:
+            cx, server = self.open(start=False)
+            other, _ = self.open()
+            server.socket.close()
+            for connection in (cx, other):
+                connection.run("RETURN $x", {"x": 1})
+                connection.pull_all()
+                mux.add(connection)
+            with self.assertRaises(ServiceUnavailable):
+                mux.sync()
+            self.assertNotIn(cx, mux)
+            self.assertTrue(cx.defunct())
+            self.assertTrue(mux.sync())
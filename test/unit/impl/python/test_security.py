@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from ssl import CERT_NONE, CERT_REQUIRED
+from unittest import TestCase
+
+from neobolt.impl.python.security import make_ssl_context, TRUST_ALL_CERTIFICATES, \
+    TRUST_SYSTEM_CA_SIGNED_CERTIFICATES
+
+
+class MakeSSLContextTestCase(TestCase):
+
+    def test_no_context_without_encryption(self):
+        self.assertIsNone(make_ssl_context())
+        self.assertIsNone(make_ssl_context(encrypted=False, trust=TRUST_ALL_CERTIFICATES))
+
+    def test_context_is_shared_for_same_trust(self):
+        ssl_context = make_ssl_context(encrypted=True, trust=TRUST_SYSTEM_CA_SIGNED_CERTIFICATES)
+        self.assertIs(make_ssl_context(encrypted=True, trust=TRUST_SYSTEM_CA_SIGNED_CERTIFICATES), ssl_context)
+        self.assertIs(make_ssl_context(secure=True, trust=TRUST_SYSTEM_CA_SIGNED_CERTIFICATES), ssl_context)
+
+    def test_contexts_differ_by_trust(self):
+        trust_all = make_ssl_context(encrypted=True, trust=TRUST_ALL_CERTIFICATES)
+        trust_system = make_ssl_context(encrypted=True, trust=TRUST_SYSTEM_CA_SIGNED_CERTIFICATES)
+        self.assertIsNot(trust_all, trust_system)
+        self.assertEqual(trust_all.verify_mode, CERT_NONE)
+        self.assertEqual(trust_system.verify_mode, CERT_REQUIRED)
+
+    def test_unknown_trust_mode(self):
+        with self.assertRaises(ValueError):
+            _ = make_ssl_context(encrypted=True, trust=99)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+
+from unittest import TestCase
+
+from neobolt.impl.python.bolt.io import ChunkedInputBuffer, ChunkedOutputBuffer
+from neobolt.impl.python.packstream.packer import Packer
+from neobolt.impl.python.spool import RecordSpool
+from neobolt.types import Structure
+
+
+RECORDS = [
+    [1, u"two", [3.0], {u"four": None}],
+    [Structure(b"N", 5, [u"Person"], {u"name": u"Alice"}), u"x" * 50, True, -6],
+]
+
+
+def spool_records(records, max_chunk_size=16):
+    output_buffer = ChunkedOutputBuffer(max_chunk_size=max_chunk_size)
+    packer = Packer(output_buffer)
+    for record in records:
+        packer.pack_struct(b"\x71", (record,))
+        output_buffer.chunk()
+        output_buffer.chunk()
+    input_buffer = ChunkedInputBuffer()
+    input_buffer.load(output_buffer.view().tobytes())
+    spool = RecordSpool()
+    while input_buffer.frame_message():
+        spool.append(input_buffer.frame())
+    return spool
+
+
+class RecordSpoolTestCase(TestCase):
+
+    def test_should_count_appended_records(self):
+        with spool_records(RECORDS) as spool:
+            assert len(spool) == 2
+
+    def test_should_be_able_to_iterate_records(self):
+        with spool_records(RECORDS) as spool:
+            with spool.cursor() as cursor:
+                assert list(cursor) == RECORDS
+
+    def test_should_be_able_to_iterate_records_more_than_once(self):
+        with spool_records(RECORDS) as spool:
+            with spool.cursor() as cursor:
+                assert list(cursor) == RECORDS
+                assert list(cursor) == RECORDS
+
+    def test_should_be_able_to_access_records_by_index(self):
+        with spool_records(RECORDS) as spool:
+            with spool.cursor() as cursor:
+                assert cursor[1] == RECORDS[1]
+                assert cursor[0] == RECORDS[0]
+                assert cursor[-1] == RECORDS[1]
+                with self.assertRaises(IndexError):
+                    _ = cursor[2]
+
+    def test_should_be_able_to_fetch_records_in_sequence(self):
+        with spool_records(RECORDS) as spool:
+            with spool.cursor() as cursor:
+                assert cursor.fetch_one() == RECORDS[0]
+                assert cursor.fetch_one() == RECORDS[1]
+                assert cursor.fetch_one() is None
+                cursor.seek(1)
+                assert cursor.position() == 1
+                assert cursor.fetch_one() == RECORDS[1]
+
+    def test_empty_spool_should_give_empty_cursor(self):
+        with spool_records([]) as spool:
+            with spool.cursor() as cursor:
+                assert len(cursor) == 0
+                assert list(cursor) == []
+                assert cursor.fetch_one() is None
@@ -19,9 +19,14 @@
 # limitations under the License.
 
 
+import gc
+from socket import gaierror, AF_INET, SOCK_STREAM, IPPROTO_TCP
+from threading import Semaphore
 from unittest import TestCase
+from unittest.mock import patch
 
-from neobolt.addressing import SocketAddress
+from neobolt.addressing import Resolver, SocketAddress
+from neobolt.impl.python.addressing import AddressError, DNSRefresher, dns_cache
 
 
 class RoutingTableParseAddressTestCase(TestCase):
@@ -66,3 +71,188 @@ class RoutingTableParseAddressTestCase(TestCase):
     def test_should_error_when_key_duplicate(self):
         with self.assertRaises(ValueError):
             SocketAddress.parse_routing_context("neo4j://127.0.0.1/?name=molly&name=white")
+
+
+class DNSCacheTestCase(TestCase):
+    """ Runs each test against an empty DNS cache, the clock of which
+    only moves on when `now` is changed.
+    """
+
+    def setUp(self):
+        dns_cache.clear()
+        self.now = 0.0
+        self.clock = dns_cache.clock
+        dns_cache.clock = lambda: self.now
+
+    def tearDown(self):
+        dns_cache.clock = self.clock
+        dns_cache.clear()
+
+
+class ResolverTestCase(DNSCacheTestCase):
+
+    def resolve(self, address, **config):
+        resolver = Resolver(**config)
+        resolver.addresses.append(address)
+        resolver.custom_resolve()
+        resolver.dns_resolve()
+        return resolver.addresses
+
+    def patch_getaddrinfo(self, **kwargs):
+        return patch("neobolt.impl.python.addressing.getaddrinfo", **kwargs)
+
+    def test_ip_addresses_are_not_looked_up(self):
+        with self.patch_getaddrinfo(side_effect=AssertionError) as getaddrinfo:
+            self.assertEqual(self.resolve(("127.0.0.1", 7687)), [("127.0.0.1", 7687)])
+            self.assertEqual(self.resolve(("::1", 7687)), [("::1", 7687, 0, 0)])
+            self.assertEqual(self.resolve(("::1", 7687, 0, 0)), [("::1", 7687, 0, 0)])
+        getaddrinfo.assert_not_called()
+
+    def test_resolved_addresses_are_cached(self):
+        info = [(AF_INET, SOCK_STREAM, IPPROTO_TCP, "", ("10.0.0.1", 7687))]
+        with self.patch_getaddrinfo(return_value=info) as getaddrinfo:
+            self.assertEqual(self.resolve(("example.com", 7687), ttl=30), [("10.0.0.1", 7687)])
+            self.assertEqual(self.resolve(("example.com", 7687), ttl=30), [("10.0.0.1", 7687)])
+        self.assertEqual(getaddrinfo.call_count, 1)
+
+    def test_cached_addresses_expire(self):
+        info = [(AF_INET, SOCK_STREAM, IPPROTO_TCP, "", ("10.0.0.1", 7687))]
+        with self.patch_getaddrinfo(return_value=info) as getaddrinfo:
+            self.resolve(("example.com", 7687), ttl=30)
+            self.now = 31
+            self.resolve(("example.com", 7687), ttl=30)
+        self.assertEqual(getaddrinfo.call_count, 2)
+
+    def test_addresses_are_not_cached_by_default(self):
+        info = [(AF_INET, SOCK_STREAM, IPPROTO_TCP, "", ("10.0.0.1", 7687))]
+        with self.patch_getaddrinfo(return_value=info) as getaddrinfo:
+            self.resolve(("example.com", 7687))
+            self.resolve(("example.com", 7687))
+        self.assertEqual(getaddrinfo.call_count, 2)
+
+    def test_failures_are_cached(self):
+        with self.patch_getaddrinfo(side_effect=gaierror) as getaddrinfo:
+            for _ in range(2):
+                with self.assertRaises(AddressError):
+                    self.resolve(("example.invalid", 7687), ttl=30, negative_ttl=5)
+        self.assertEqual(getaddrinfo.call_count, 1)
+
+    def test_custom_resolver_results_are_memoised(self):
+        calls = []
+
+        def custom_resolver(address):
+            calls.append(address)
+            return [("127.0.0.1", address[1])]
+
+        for _ in range(2):
+            self.assertEqual(self.resolve(("example.com", 7687), custom_resolver=custom_resolver, ttl=30),
+                             [("127.0.0.1", 7687)])
+        self.assertEqual(calls, [("example.com", 7687)])
+
+    def test_custom_resolver_results_are_dropped_with_the_resolver(self):
+
+        def custom_resolver(address):
+            return [("127.0.0.1", address[1])]
+
+        self.resolve(("example.com", 7687), custom_resolver=custom_resolver, ttl=30)
+        self.assertEqual(len(dns_cache), 1)
+        del custom_resolver
+        gc.collect()
+        self.assertEqual(len(dns_cache), 0)
+
+    def test_expired_entries_are_evicted(self):
+        dns_cache.put(("example.com", 7687), [("10.0.0.1", 7687)], keep_for=0)
+        self.assertIsNone(dns_cache.get(("example.com", 7687), 30, 0))
+        self.assertEqual(len(dns_cache), 0)
+
+    def test_cache_size_is_capped(self):
+        capacity = dns_cache.capacity
+        dns_cache.capacity = 3
+        try:
+            for i in range(5):
+                dns_cache.put(("host%d" % i, 7687), [("10.0.0.%d" % i, 7687)], keep_for=30)
+        finally:
+            dns_cache.capacity = capacity
+        self.assertEqual(len(dns_cache), 3)
+        self.assertIsNone(dns_cache.get(("host0", 7687), 30, 0))
+        self.assertEqual(dns_cache.get(("host4", 7687), 30, 0), [("10.0.0.4", 7687)])
+
+
+class DNSRefreshTestCase(DNSCacheTestCase):
+
+    address = ("example.com", 7687)
+    info = [(AF_INET, SOCK_STREAM, IPPROTO_TCP, "", ("10.0.0.1", 7687))]
+
+    def setUp(self):
+        super(DNSRefreshTestCase, self).setUp()
+        self.refresher = DNSRefresher(ttl=30, negative_ttl=0)
+
+    def tearDown(self):
+        self.refresher.stop()
+        if self.refresher.is_alive():
+            self.refresher.join(1)
+        super(DNSRefreshTestCase, self).tearDown()
+
+    def resolve(self, **config):
+        resolver = Resolver(**config)
+        resolver.addresses.append(self.address)
+        resolver.dns_resolve()
+        return resolver.addresses
+
+    def patch_getaddrinfo(self, **kwargs):
+        return patch("neobolt.impl.python.addressing.getaddrinfo", **kwargs)
+
+    def test_stale_addresses_are_only_used_while_watched(self):
+        dns_cache.put(self.address, [("10.0.0.1", 7687)], keep_for=35)
+        self.now = 31
+        self.assertIsNone(dns_cache.get(self.address, 30, 0, 5))
+        dns_cache.watch(self.address)
+        self.assertEqual(dns_cache.get(self.address, 30, 0, 5), [("10.0.0.1", 7687)])
+        dns_cache.unwatch(self.address)
+        self.assertIsNone(dns_cache.get(self.address, 30, 0, 5))
+
+    def test_failure_keeps_last_addresses(self):
+        dns_cache.watch(self.address)
+        dns_cache.put(self.address, [("10.0.0.1", 7687)])
+        dns_cache.put(self.address, error=AddressError("Cannot resolve address"))
+        self.assertEqual(dns_cache.get(self.address, 30, 5), [("10.0.0.1", 7687)])
+        dns_cache.unwatch(self.address)
+
+    def test_watched_addresses_are_refreshed_before_expiry(self):
+        with self.patch_getaddrinfo(return_value=self.info) as getaddrinfo:
+            self.resolve(ttl=30)
+            self.refresher.watch(self.address)
+            self.now = 15
+            self.refresher.refresh()
+            self.now = 40
+            self.assertEqual(self.resolve(ttl=30), [("10.0.0.1", 7687)])
+        self.assertEqual(getaddrinfo.call_count, 2)
+
+    def test_last_addresses_are_used_while_refresh_fails(self):
+        with self.patch_getaddrinfo(return_value=self.info) as getaddrinfo:
+            self.resolve(ttl=30)
+            self.refresher.watch(self.address)
+            self.now = 15
+            self.refresher.refresh()
+            getaddrinfo.side_effect = gaierror
+            self.now = 30
+            self.refresher.refresh()
+            self.now = 48
+            self.assertEqual(self.resolve(ttl=30, stale_ttl=5), [("10.0.0.1", 7687)])
+            self.refresher.stop()
+            with self.assertRaises(AddressError):
+                self.resolve(ttl=30, stale_ttl=5)
+
+    def test_thread_refreshes_every_half_ttl(self):
+        lookups = Semaphore(0)
+
+        def getaddrinfo(*_):
+            lookups.release()
+            return self.info
+
+        self.refresher = DNSRefresher(ttl=0.02, negative_ttl=0)
+        with self.patch_getaddrinfo(side_effect=getaddrinfo):
+            self.refresher.watch(self.address)
+            self.refresher.start()
+            for _ in range(3):
+                self.assertTrue(lookups.acquire(timeout=5))
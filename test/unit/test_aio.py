@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from asyncio import Protocol, gather, new_event_loop, sleep
+from socket import socket
+from struct import pack as struct_pack
+from unittest import TestCase
+
+from neobolt.aio import AsyncConnection, AsyncConnectionPool, AsyncRoutingConnectionPool, connect
+from neobolt.exceptions import ClientError, CypherSyntaxError
+from neobolt.impl.python.addressing import dns_cache
+from neobolt.routing import READ_ACCESS
+
+from test.unit.tools import StubBoltServer
+
+
+class StubServerProtocol(StubBoltServer, Protocol):
+    """ Serves a single connection, including the handshake, from
+    within an event loop.
+    """
+
+    def __init__(self, address=None, routing_requests=None):
+        super(StubServerProtocol, self).__init__(address, routing_requests)
+        self.transport = None
+        self.handshaken = False
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        if not self.handshaken:
+            self.handshaken = True
+            data = data[20:]
+            self.transport.write(struct_pack(">I", 3))
+        self.input_buffer.load(data)
+        while self.input_buffer.frame_message():
+            self.handle()
+        self.transport.write(self.flush())
+        if self.goodbye:
+            self.transport.close()
+
+
+class StubServerTestCase(TestCase):
+
+    def setUp(self):
+        self.loop = new_event_loop()
+        self.server_protocol = None
+        self.server_protocols = []
+        self.routing_requests = []
+
+        def factory():
+            self.server_protocol = StubServerProtocol(self.address, self.routing_requests)
+            self.server_protocols.append(self.server_protocol)
+            return self.server_protocol
+
+        self.server = self.loop.run_until_complete(self.loop.create_server(factory, "127.0.0.1", 0))
+        self.address = self.server.sockets[0].getsockname()
+
+    def connector(self, address, **config):
+        return connect(address, auth=("neo4j", "password"), loop=self.loop, **config)
+
+    def tearDown(self):
+        self.server.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.close()
+
+
+class AsyncConnectionTestCase(StubServerTestCase):
+
+    def test_connect(self):
+
+        async def f():
+            cx = await connect(self.address, auth=("neo4j", "password"), loop=self.loop)
+            self.assertIsInstance(cx, AsyncConnection)
+            self.assertEqual(3, cx.protocol_version)
+            self.assertEqual("Neo4j/3.5.0", cx.server.agent)
+            cx.close()
+
+        self.loop.run_until_complete(f())
+
+    def test_return_1(self):
+
+        async def f():
+            cx = await connect(self.address, auth=("neo4j", "password"), loop=self.loop)
+            metadata = {}
+            records = []
+            await cx.run("RETURN $x", {"x": 1}, on_success=metadata.update)
+            await cx.pull_all(on_success=metadata.update, on_records=records.extend)
+            await cx.sync()
+            cx.close()
+            return metadata, records
+
+        metadata, records = self.loop.run_until_complete(f())
+        self.assertEqual([[1]], records)
+        self.assertEqual({"fields": ["x"], "type": "r"}, metadata)
+
+    def test_resolved_addresses_are_cached(self):
+        queries = []
+        getaddrinfo = self.loop.getaddrinfo
+
+        async def counting_getaddrinfo(host, port, **kwargs):
+            queries.append((host, port))
+            return await getaddrinfo(host, port, **kwargs)
+
+        self.loop.getaddrinfo = counting_getaddrinfo
+
+        async def f():
+            for _ in range(2):
+                cx = await self.connector(("localhost", self.address[1]), dns_cache_ttl=30)
+                cx.close()
+
+        try:
+            self.loop.run_until_complete(f())
+        finally:
+            dns_cache.clear()
+        self.assertEqual([("localhost", self.address[1])], queries)
+
+    def test_connect_is_not_held_up_by_blackholed_address(self):
+        # Once the accept queue is full, further connection attempts
+        # receive no response at all
+        listener = socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(0)
+        blackhole = listener.getsockname()
+        fillers = []
+        for _ in range(3):
+            filler = socket()
+            filler.setblocking(False)
+            filler.connect_ex(blackhole)
+            fillers.append(filler)
+
+        async def f():
+            await sleep(0.1)
+            t0 = self.loop.time()
+            cx = await connect(("localhost", 7687), auth=("neo4j", "password"), loop=self.loop,
+                               resolver=lambda _: [blackhole, self.address], connection_attempt_delay=0.05)
+            self.assertLess(self.loop.time() - t0, 1)
+            self.assertEqual(self.address, cx.address)
+            cx.close()
+
+        try:
+            self.loop.run_until_complete(f())
+        finally:
+            for filler in fillers:
+                filler.close()
+            listener.close()
+
+    def test_large_record_is_received_in_place(self):
+        value = "x" * 100000
+
+        async def f():
+            cx = await connect(self.address, auth=("neo4j", "password"), loop=self.loop)
+            records = []
+            await cx.run("RETURN $x", {"x": value})
+            await cx.pull_all(on_records=records.extend)
+            await cx.sync()
+            cx.close()
+            return records
+
+        self.assertEqual([[value]], self.loop.run_until_complete(f()))
+
+    def test_failure_is_raised_after_reset(self):
+
+        async def f():
+            cx = await connect(self.address, auth=("neo4j", "password"), loop=self.loop)
+            records = []
+            await cx.run("X")
+            await cx.pull_all()
+            with self.assertRaises(CypherSyntaxError):
+                await cx.sync()
+            self.assertFalse(cx.responses)
+            await cx.run("RETURN $x", {"x": 2})
+            await cx.pull_all(on_records=records.extend)
+            await cx.sync()
+            cx.close()
+            return records
+
+        self.assertEqual([[2]], self.loop.run_until_complete(f()))
+        self.assertEqual([b"\x01", b"\x10", b"\x3F", b"\x0F", b"\x10", b"\x3F", b"\x02"],
+                         self.server_protocol.requests)
+
+
+class AsyncConnectionPoolTestCase(StubServerTestCase):
+
+    def test_many_coroutines_share_few_connections(self):
+
+        async def query(pool, x):
+            cx = await pool.acquire()
+            try:
+                records = []
+                await cx.run("RETURN $x", {"x": x})
+                await cx.pull_all(on_records=records.extend)
+                await cx.sync()
+                return records[0][0]
+            finally:
+                pool.release(cx)
+
+        async def f():
+            async with AsyncConnectionPool(self.connector, self.address, max_connection_pool_size=3) as pool:
+                results = await gather(*(query(pool, x) for x in range(500)))
+                self.assertEqual(3, len(pool.connections[self.address]))
+                return results
+
+        self.assertEqual(list(range(500)), self.loop.run_until_complete(f()))
+        self.assertEqual(3, len(self.server_protocols))
+
+    def test_acquire_times_out_when_pool_is_full(self):
+
+        async def f():
+            async with AsyncConnectionPool(self.connector, self.address, max_connection_pool_size=1,
+                                           connection_acquisition_timeout=0.1) as pool:
+                cx = await pool.acquire()
+                with self.assertRaises(ClientError):
+                    await pool.acquire()
+                pool.release(cx)
+                self.assertIs(cx, await pool.acquire())
+
+        self.loop.run_until_complete(f())
+
+    def test_released_connection_is_handed_to_waiter(self):
+
+        async def f():
+            async with AsyncConnectionPool(self.connector, self.address, max_connection_pool_size=1) as pool:
+                cx = await pool.acquire()
+                waiter = self.loop.create_task(pool.acquire())
+                await sleep(0)
+                self.assertFalse(waiter.done())
+                pool.release(cx)
+                self.assertIs(cx, await waiter)
+                self.assertTrue(cx.in_use)
+
+        self.loop.run_until_complete(f())
+
+    def test_pool_opens_min_idle_connections_in_background(self):
+
+        async def f():
+            async with AsyncConnectionPool(self.connector, self.address, min_idle_connections=2) as pool:
+                while pool._warming.get(self.address):
+                    await sleep(0.01)
+                self.assertEqual(2, len(self.server_protocols))
+                cx = await pool.acquire()
+                self.assertEqual(2, len(self.server_protocols))
+                while pool._warming.get(self.address):
+                    await sleep(0.01)
+                pool.release(cx)
+                self.assertEqual(3, len(pool.connections[self.address]))
+
+        self.loop.run_until_complete(f())
+
+    def test_routing_table_is_refreshed_once_for_concurrent_acquirers(self):
+
+        async def f():
+            async with AsyncRoutingConnectionPool(self.connector, self.address, {},
+                                                  max_connection_pool_size=2) as pool:
+
+                async def acquire_and_release():
+                    cx = await pool.acquire(READ_ACCESS)
+                    pool.release(cx)
+                    return cx.pool_address
+
+                addresses = await gather(*(acquire_and_release() for _ in range(100)))
+                self.assertEqual({("127.0.0.1", self.address[1])}, set(addresses))
+
+        self.loop.run_until_complete(f())
+        self.assertEqual([{"context": {}}], self.routing_requests)
@@ -21,11 +21,22 @@
 
 from __future__ import print_function
 
+from os.path import dirname, join as path_join
+from socket import socket, SOL_SOCKET, SO_RCVBUF, IPPROTO_TCP, TCP_NODELAY
+from ssl import SSLContext, PROTOCOL_TLS_SERVER
+from time import perf_counter, sleep
 from unittest import TestCase
+from weakref import ref
 from threading import Thread, Event
 
-from neobolt.direct import Connection, ConnectionPool
-from neobolt.exceptions import ClientError, ServiceUnavailable
+from neobolt.direct import Connection, ConnectionPool, ServerInfo
+from neobolt.exceptions import ClientError, ConnectionTimedOut, ServiceUnavailable
+from neobolt.routing import RoutingConnectionPool
+from neobolt.impl.python.direct import Response, _connect, _connect_any, _interleave, _secure, _sendmsg_all, _socket_options
+from neobolt.impl.python.security import make_ssl_context, TRUST_ALL_CERTIFICATES
+
+
+CERTIFICATE = path_join(dirname(__file__), "certificates", "localhost.pem")
 
 
 class FakeSocket(object):
@@ -35,6 +46,9 @@ class FakeSocket(object):
     def getpeername(self):
         return self.address
 
+    def getsockname(self):
+        return "127.0.0.1", 51234
+
     def sendall(self, data):
         return
 
@@ -47,10 +61,19 @@ class QuickConnection(object):
     def __init__(self, socket):
         self.socket = socket
         self.address = socket.getpeername()
+        self.idle_since = 0
+        self.live = True
+        self.local_port = 0
+
+    def alive(self, timeout=None):
+        return self.live
 
     def reset(self):
         pass
 
+    def send_reset(self):
+        pass
+
     def close(self):
         self.socket.close()
 
@@ -88,6 +111,478 @@ class ConnectionTestCase(TestCase):
                                 max_connection_lifetime=999999999)
         self.assertEqual(connection.timedout(), False)
 
+    def test_conn_chunk_size_adapts_up_to_bolt_maximum_by_default(self):
+        address = ("127.0.0.1", 7687)
+        connection = Connection(1, address, FakeSocket(address))
+        self.assertEqual(connection.output_buffer.max_chunk_size(), 65535)
+
+    def test_conn_chunk_size_can_be_configured(self):
+        address = ("127.0.0.1", 7687)
+        connection = Connection(1, address, FakeSocket(address), max_chunk_size=1024)
+        self.assertEqual(connection.output_buffer.max_chunk_size(), 1024)
+
+    def test_conn_chunk_size_cannot_exceed_bolt_maximum(self):
+        address = ("127.0.0.1", 7687)
+        with self.assertRaises(ValueError):
+            _ = Connection(1, address, FakeSocket(address), max_chunk_size=65536)
+
+    def test_conn_fetch_size_can_be_configured(self):
+        address = ("127.0.0.1", 7687)
+        connection = Connection(4, address, FakeSocket(address), fetch_size=-1)
+        self.assertEqual(connection.fetch_size, -1)
+
+    def test_conn_fetch_size_must_be_positive_or_all(self):
+        address = ("127.0.0.1", 7687)
+        with self.assertRaises(ValueError):
+            _ = Connection(4, address, FakeSocket(address), fetch_size=0)
+
+    def test_conn_local_port_is_cached(self):
+        address = ("127.0.0.1", 7687)
+        socket = FakeSocket(address)
+        connection = Connection(3, address, socket)
+        socket.getsockname = None
+        self.assertEqual(connection.local_port, 51234)
+
+    def test_conn_run_does_not_format_log_message_when_debug_is_disabled(self):
+
+        class Parameter(str):
+
+            def __repr__(self):
+                raise AssertionError("Parameter formatted for logging")
+
+        address = ("127.0.0.1", 7687)
+        connection = Connection(3, address, FakeSocket(address))
+        connection.run("RETURN $x", {"x": Parameter("x")})
+        self.assertEqual(len(connection.responses), 1)
+
+    def test_conn_can_be_weakly_referenced(self):
+        address = ("127.0.0.1", 7687)
+        connection = Connection(3, address, FakeSocket(address))
+        self.assertIs(ref(connection)(), connection)
+
+
+class ResponseTestCase(TestCase):
+
+    def test_response_can_be_weakly_referenced(self):
+        response = Response(None)
+        self.assertIs(ref(response)(), response)
+
+    def test_response_keeps_handlers_it_does_not_use(self):
+        on_foo = object()
+        response = Response(None, on_success=print, on_foo=on_foo)
+        self.assertIs(response.handlers["on_success"], print)
+        self.assertIs(response.handlers["on_foo"], on_foo)
+
+    def test_response_ignores_handlers_that_are_not_callable(self):
+        address = ("127.0.0.1", 7687)
+        connection = Connection(3, address, FakeSocket(address))
+        metadata = {}
+        response = Response(connection, on_success=metadata.update, on_ignored="not callable")
+        response.on_success({"fields": []})
+        response.on_ignored({})
+        self.assertEqual(metadata, {"fields": []})
+
+
+class ConnectionTimeoutTestCase(TestCase):
+    """ Tests against a server that accepts connections but never
+    sends anything back.
+    """
+
+    def setUp(self):
+        self.listener = socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(1)
+        self.socket = socket()
+        self.socket.connect(self.listener.getsockname())
+        self.server_socket, _ = self.listener.accept()
+
+    def tearDown(self):
+        self.socket.close()
+        self.server_socket.close()
+        self.listener.close()
+
+    def test_sync_times_out_after_deadline(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket)
+        connection.run("RETURN 1", {})
+        connection.pull_all()
+        t0 = perf_counter()
+        with self.assertRaises(ConnectionTimedOut):
+            connection.sync(timeout=0.2)
+        self.assertLess(perf_counter() - t0, 2)
+        self.assertTrue(connection.defunct())
+        self.assertTrue(connection.closed())
+
+    def test_sync_restores_read_timeout_after_deadline(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket, read_timeout=30)
+        connection.sync(timeout=0.2)
+        self.assertEqual(self.socket.gettimeout(), 30)
+
+    def test_read_timeout_applies_to_each_read(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket, read_timeout=0.2)
+        connection.run("RETURN 1", {})
+        connection.pull_all()
+        with self.assertRaises(ConnectionTimedOut):
+            connection.sync()
+        self.assertTrue(connection.defunct())
+
+    def test_read_timeout_applies_within_longer_deadline(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket, read_timeout=0.2)
+        connection.run("RETURN 1", {})
+        connection.pull_all()
+        t0 = perf_counter()
+        with self.assertRaises(ConnectionTimedOut):
+            connection.sync(timeout=30)
+        self.assertLess(perf_counter() - t0, 2)
+        self.assertTrue(connection.defunct())
+
+    def test_read_timeout_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            _ = Connection(3, self.socket.getpeername(), self.socket, read_timeout=0)
+
+    def test_idle_connection_is_alive_while_server_is_open(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket)
+        self.assertTrue(connection.alive())
+        self.assertFalse(connection.defunct())
+
+    def test_idle_connection_is_dead_once_server_has_closed(self):
+        connection = Connection(3, self.socket.getpeername(), self.socket)
+        self.server_socket.close()
+        for _ in range(100):
+            if not connection.alive():
+                break
+            sleep(0.01)
+        self.assertFalse(connection.alive())
+        self.assertTrue(connection.defunct())
+
+    def test_failed_liveness_probe_leaves_routing_pool_consistent(self):
+        address = self.listener.getsockname()
+
+        def connector(a, **config):
+            s = socket()
+            s.connect(a)
+            return Connection(3, a, s, **config)
+
+        with RoutingConnectionPool(connector, address, {}, liveness_check_timeout=0) as pool:
+            connection_1 = pool.acquire_direct(address)
+            server_socket, _ = self.listener.accept()
+            server_socket.close()
+            # A RESET deferred after a failure is sent on release,
+            # so its response is outstanding when the probe runs
+            connection_1._reset_pending = True
+            pool.release(connection_1)
+            connection_2 = pool.acquire_direct(address)
+            self.assertIsNot(connection_1, connection_2)
+            self.assertIs(pool.connections[address][0], connection_2)
+            self.assertEqual(len(pool.connections[address]), 1)
+
+    def test_sync_timeout_leaves_server_in_routing_table(self):
+        address = self.listener.getsockname()
+        server_sockets = []
+
+        def connector(a, **config):
+            s = socket()
+            s.connect(a)
+            server_sockets.append(self.listener.accept()[0])
+            return Connection(3, a, s, **config)
+
+        with RoutingConnectionPool(connector, address, {}) as pool:
+            pool.routing_table.routers.add(address)
+            pool.routing_table.readers.add(address)
+            idle = pool.acquire_direct(address)
+            connection = pool.acquire_direct(address)
+            pool.release(idle)
+            connection.run("RETURN 1", {})
+            connection.pull_all()
+            with self.assertRaises(ConnectionTimedOut):
+                connection.sync(timeout=0.2)
+            self.assertTrue(connection.defunct())
+            self.assertIn(address, pool.routing_table.routers)
+            self.assertIn(address, pool.routing_table.readers)
+            self.assertFalse(idle.closed())
+        for server_socket in server_sockets:
+            server_socket.close()
+
+    def test_liveness_probe_times_out_without_blocking_the_pool(self):
+        address = self.listener.getsockname()
+        server_sockets = []
+
+        def connector(a, **config):
+            s = socket()
+            s.connect(a)
+            server_sockets.append(self.listener.accept()[0])
+            return Connection(3, a, s, **config)
+
+        with ConnectionPool(connector, address, liveness_check_timeout=0, liveness_probe_timeout=2) as pool:
+            connection_1 = pool.acquire_direct(address)
+            # The RESET sent on release is never answered
+            connection_1._reset_pending = True
+            pool.release(connection_1)
+            acquired = []
+            t0 = perf_counter()
+            thread = Thread(target=lambda: acquired.append(pool.acquire_direct(address)))
+            thread.start()
+            while not connection_1.in_use:
+                sleep(0.01)
+            connection_2 = pool.acquire_direct(address)
+            self.assertIsNot(connection_2, connection_1)
+            self.assertTrue(thread.is_alive())
+            thread.join(10)
+            self.assertLess(perf_counter() - t0, 10)
+            self.assertTrue(connection_1.defunct())
+            self.assertNotIn(acquired[0], (connection_1, connection_2))
+        for server_socket in server_sockets:
+            server_socket.close()
+
+
+class SocketOptionsTestCase(TestCase):
+
+    def test_no_options_by_default(self):
+        self.assertEqual(_socket_options({}), {})
+
+    def test_profile_provides_options(self):
+        options = _socket_options({"socket_profile": "latency"})
+        self.assertTrue(options["tcp_nodelay"])
+
+    def test_individual_options_override_profile(self):
+        options = _socket_options({"socket_profile": "bulk", "receive_buffer_size": 65536})
+        self.assertEqual(options["receive_buffer_size"], 65536)
+        self.assertEqual(options["send_buffer_size"], 4194304)
+
+    def test_unknown_profile(self):
+        with self.assertRaises(ValueError):
+            _ = _socket_options({"socket_profile": "fastest"})
+
+    def test_options_are_applied_on_connect(self):
+        listener = socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        try:
+            s = _connect(listener.getsockname(), tcp_nodelay=True, receive_buffer_size=262144)
+            try:
+                self.assertTrue(s.getsockopt(IPPROTO_TCP, TCP_NODELAY))
+                self.assertGreaterEqual(s.getsockopt(SOL_SOCKET, SO_RCVBUF), 262144)
+            finally:
+                s.close()
+        finally:
+            listener.close()
+
+
+class ConnectAnyTestCase(TestCase):
+
+    def listen(self, backlog=1):
+        listener = socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(backlog)
+        self.addCleanup(listener.close)
+        return listener.getsockname()
+
+    def blackhole(self):
+        # Once the accept queue is full, further connection attempts
+        # receive no response at all
+        address = self.listen(backlog=0)
+        for _ in range(3):
+            s = socket()
+            s.setblocking(False)
+            s.connect_ex(address)
+            self.addCleanup(s.close)
+        sleep(0.1)
+        return address
+
+    def refused(self):
+        s = socket()
+        s.bind(("127.0.0.1", 0))
+        address = s.getsockname()
+        s.close()
+        return address
+
+    def connect_any(self, addresses, **config):
+        s, address = _connect_any(addresses, **config)
+        s.close()
+        return address
+
+    def test_first_address_to_connect_is_used(self):
+        live_1 = self.listen()
+        live_2 = self.listen()
+        self.assertEqual(self.connect_any([live_1, live_2]), live_1)
+
+    def test_blackholed_address_does_not_hold_up_others(self):
+        blackhole = self.blackhole()
+        live = self.listen()
+        t0 = perf_counter()
+        address = self.connect_any([blackhole, live], connection_attempt_delay=0.05, connection_timeout=5)
+        self.assertEqual(address, live)
+        self.assertLess(perf_counter() - t0, 1)
+
+    def test_refused_address_starts_next_attempt_at_once(self):
+        refused = self.refused()
+        live = self.listen()
+        t0 = perf_counter()
+        address = self.connect_any([refused, live], connection_attempt_delay=5)
+        self.assertEqual(address, live)
+        self.assertLess(perf_counter() - t0, 1)
+
+    def test_attempts_time_out(self):
+        blackhole = self.blackhole()
+        with self.assertRaises(ServiceUnavailable) as context:
+            _connect_any([blackhole], connection_timeout=0.1)
+        self.assertIn("Timed out", str(context.exception))
+
+    def test_last_failure_is_raised_when_all_addresses_fail(self):
+        with self.assertRaises(ServiceUnavailable) as context:
+            _connect_any([self.refused(), self.refused()])
+        self.assertIn("Failed to establish connection", str(context.exception))
+
+    def test_address_families_are_interleaved(self):
+        addresses = [("10.0.0.1", 7687), ("10.0.0.2", 7687), ("::1", 7687, 0, 0), ("::2", 7687, 0, 0)]
+        self.assertEqual(_interleave(addresses), [addresses[0], addresses[2], addresses[1], addresses[3]])
+
+
+class TLSEchoServer(Thread):
+    """ Server that secures each connection it accepts with a
+    self-signed certificate and echoes back everything received.
+    """
+
+    def __init__(self):
+        super(TLSEchoServer, self).__init__()
+        self.daemon = True
+        self.ssl_context = SSLContext(PROTOCOL_TLS_SERVER)
+        self.ssl_context.load_cert_chain(CERTIFICATE)
+        self.listener = socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(5)
+        self.address = self.listener.getsockname()
+
+    def run(self):
+        while True:
+            try:
+                s, _ = self.listener.accept()
+            except OSError:
+                return
+            Thread(target=self.echo, args=(s,), daemon=True).start()
+
+    def echo(self, s):
+        try:
+            s = self.ssl_context.wrap_socket(s, server_side=True)
+            while True:
+                data = s.recv(1024)
+                if not data:
+                    break
+                s.sendall(data)
+        except OSError:
+            pass
+        finally:
+            s.close()
+
+    def close(self):
+        self.listener.close()
+
+
+class TLSSessionResumptionTestCase(TestCase):
+
+    def setUp(self):
+        self.server = TLSEchoServer()
+        self.server.start()
+        self.ssl_context = make_ssl_context(encrypted=True, trust=TRUST_ALL_CERTIFICATES)
+
+    def tearDown(self):
+        self.server.close()
+
+    def connector(self, address, tls_session=None, **config):
+        s, _ = _secure(_connect(address), "localhost", self.ssl_context, tls_session)
+        # Any TLS 1.3 session ticket arrives after the handshake
+        s.sendall(b"x")
+        s.recv(1)
+        return QuickConnection(s)
+
+    def test_session_is_resumed(self):
+        connection_1 = self.connector(self.server.address)
+        self.assertFalse(connection_1.socket.session_reused)
+        connection_2 = self.connector(self.server.address, tls_session=connection_1.socket.session)
+        self.assertTrue(connection_2.socket.session_reused)
+        connection_1.close()
+        connection_2.close()
+
+    def test_pool_offers_last_session_to_reconnect(self):
+        address = self.server.address
+        with ConnectionPool(self.connector, address) as pool:
+            self.assertIsNone(pool.tls_session_hit_rate())
+            connection_1 = pool.acquire_direct(address)
+            connection_2 = pool.acquire_direct(address)
+            connection_3 = pool.acquire_direct(address)
+            self.assertFalse(connection_1.socket.session_reused)
+            self.assertTrue(connection_2.socket.session_reused)
+            self.assertTrue(connection_3.socket.session_reused)
+            self.assertEqual(pool.tls_session_offers, 2)
+            self.assertEqual(pool.tls_session_hits, 2)
+            self.assertEqual(pool.tls_session_hit_rate(), 1.0)
+
+    def test_plain_connections_are_not_counted(self):
+        address = ("127.0.0.1", 7687)
+        with ConnectionPool(connector, address) as pool:
+            pool.acquire_direct(address)
+            pool.acquire_direct(address)
+            self.assertEqual(pool.tls_session_offers, 0)
+            self.assertIsNone(pool.tls_session_hit_rate())
+
+
+class ServerInfoTestCase(TestCase):
+
+    def test_capabilities_are_unknown_before_init(self):
+        server = ServerInfo(("127.0.0.1", 7687), 3)
+        self.assertEqual(set(server.capabilities), {None})
+        self.assertIsNone(server.supports("bytes"))
+
+    def test_capabilities_are_resolved_on_update(self):
+        server = ServerInfo(("127.0.0.1", 7687), 3)
+        server.update({"server": "Neo4j/3.1.4"})
+        self.assertTrue(server.capabilities.bookmarking)
+        self.assertFalse(server.capabilities.statement_reuse)
+        self.assertTrue(server.capabilities.run_metadata)
+        self.assertFalse(server.capabilities.flow_control)
+        self.assertEqual(server.supports("bookmarking"), server.capabilities.bookmarking)
+        self.assertIsNone(server.supports("time_travel"))
+
+    def test_capabilities_cannot_be_modified(self):
+        server = ServerInfo(("127.0.0.1", 7687), 4)
+        server.update({"server": "Neo4j/4.0.0"})
+        with self.assertRaises(AttributeError):
+            server.capabilities.flow_control = False
+
+    def test_non_neo4j_server_has_no_capabilities(self):
+        server = ServerInfo(("127.0.0.1", 7687), 3)
+        server.update({"server": "Other/3.5.0"})
+        self.assertEqual(set(server.capabilities), {None})
+
+
+class ScatterGatherTestCase(TestCase):
+
+    class TrickleSocket(object):
+        """ Socket that accepts at most a few bytes per write.
+        """
+
+        def __init__(self, max_write):
+            self.max_write = max_write
+            self.data = bytearray()
+            self.calls = 0
+
+        def sendmsg(self, buffers):
+            self.calls += 1
+            data = b"".join(map(bytes, buffers))[:self.max_write]
+            self.data.extend(data)
+            return len(data)
+
+    def test_sendmsg_all_sends_everything(self):
+        s = self.TrickleSocket(max_write=1024)
+        _sendmsg_all(s, [b"\x00\x05", b"hello", memoryview(b"\x00\x05world\x00\x00")])
+        self.assertEqual(s.data, b"\x00\x05hello\x00\x05world\x00\x00")
+        self.assertEqual(s.calls, 1)
+
+    def test_sendmsg_all_resumes_after_partial_writes(self):
+        s = self.TrickleSocket(max_write=3)
+        _sendmsg_all(s, [b"\x00\x05", b"hello", memoryview(b"\x00\x05world\x00\x00")])
+        self.assertEqual(s.data, b"\x00\x05hello\x00\x05world\x00\x00")
+        self.assertEqual(s.calls, 6)
+
 
 class ConnectionPoolTestCase(TestCase):
 
@@ -173,6 +668,88 @@ class ConnectionPoolTestCase(TestCase):
                 pool.acquire_direct(address)
             self.assertEqual(pool.in_use_connection_count(address), 1)
 
+    def test_pool_passes_connection_config_to_connector(self):
+        received_config = {}
+
+        def config_connector(address, **config):
+            received_config.update(config)
+            return connector(address)
+
+        with ConnectionPool(config_connector, None, max_chunk_size=1024, read_timeout=5.0,
+                            max_connection_pool_size=1) as pool:
+            pool.acquire_direct(("127.0.0.1", 7687))
+            self.assertEqual(received_config, {"max_chunk_size": 1024, "read_timeout": 5.0})
+
+    def test_idle_connection_is_checked_before_reuse(self):
+        with ConnectionPool(connector, None, liveness_check_timeout=0) as pool:
+            address = ("127.0.0.1", 7687)
+            connection_1 = pool.acquire_direct(address)
+            pool.release(connection_1)
+            connection_1.live = False
+            connection_2 = pool.acquire_direct(address)
+            self.assertIsNot(connection_1, connection_2)
+            self.assert_pool_size(address, 1, 0, pool)
+
+    def test_recently_used_connection_is_not_checked(self):
+        with ConnectionPool(connector, None, liveness_check_timeout=3600) as pool:
+            address = ("127.0.0.1", 7687)
+            connection_1 = pool.acquire_direct(address)
+            pool.release(connection_1)
+            connection_1.live = False
+            connection_2 = pool.acquire_direct(address)
+            self.assertIs(connection_1, connection_2)
+
+    def wait_for_warming(self, pool, address):
+        deadline = perf_counter() + 5
+        while pool._warming.get(address) and perf_counter() < deadline:
+            sleep(0.01)
+
+    def test_pool_opens_min_idle_connections_when_created(self):
+        address = ("127.0.0.1", 7687)
+        with ConnectionPool(connector, address, min_idle_connections=2) as pool:
+            self.wait_for_warming(pool, address)
+            self.assert_pool_size(address, 0, 2, pool)
+
+    def test_min_idle_connections_are_topped_up_after_acquire(self):
+        address = ("127.0.0.1", 7687)
+        with ConnectionPool(connector, address, min_idle_connections=2) as pool:
+            self.wait_for_warming(pool, address)
+            pool.acquire_direct(address)
+            self.wait_for_warming(pool, address)
+            self.assert_pool_size(address, 1, 2, pool)
+
+    def test_min_idle_connections_do_not_exceed_max_pool_size(self):
+        address = ("127.0.0.1", 7687)
+        with ConnectionPool(connector, address, min_idle_connections=3, max_connection_pool_size=2) as pool:
+            self.wait_for_warming(pool, address)
+            self.assert_pool_size(address, 0, 2, pool)
+
+    def test_failure_to_warm_pool_is_not_raised(self):
+
+        def failing_connector(address, **config):
+            raise ServiceUnavailable("Failed to establish connection")
+
+        address = ("127.0.0.1", 7687)
+        with ConnectionPool(failing_connector, address, min_idle_connections=2) as pool:
+            self.wait_for_warming(pool, address)
+            self.assert_pool_size(address, 0, 0, pool)
+            with self.assertRaises(ServiceUnavailable):
+                pool.acquire_direct(address)
+
+    def test_host_names_are_kept_resolved_in_background(self):
+        with ConnectionPool(connector, None) as pool:
+            pool.acquire_direct(("localhost", 7687))
+            refresher = pool._dns_refresher
+            self.assertTrue(refresher.is_alive())
+            self.assertEqual(refresher.addresses, {("localhost", 7687)})
+        refresher.join(1)
+        self.assertFalse(refresher.is_alive())
+
+    def test_ip_addresses_are_not_kept_resolved(self):
+        with ConnectionPool(connector, None) as pool:
+            pool.acquire_direct(("127.0.0.1", 7687))
+            self.assertIsNone(pool._dns_refresher)
+
     def test_multithread(self):
         with ConnectionPool(connector, None,
                             max_connection_pool_size=5, connection_acquisition_timeout=10) as pool:
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- encoding: utf-8 -*-
+
+# Copyright (c) 2002-2019 "Neo4j,"
+# Neo4j Sweden AB [http://neo4j.com]
+#
+# This file is part of Neo4j.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from neobolt.impl.python.bolt.io import ChunkedInputBuffer, ChunkedOutputBuffer
+from neobolt.impl.python.packstream import Packer, Unpacker
+
+
+class StubBoltServer(object):
+    """ Minimal Bolt v3 server, which returns each parameter `x`
+    passed to RUN as a single record and fails any statement "X".
+    Routing table requests return `address` in every role.
+
+    This holds the server side of a single connection, without any
+    transport. Subclasses load incoming data into `input_buffer`,
+    call :meth:`handle` for each message framed, and write out the
+    data returned by :meth:`flush`.
+    """
+
+    def __init__(self, address=None, routing_requests=None):
+        self.address = address
+        self.routing_requests = routing_requests
+        self.input_buffer = ChunkedInputBuffer()
+        self.output_buffer = ChunkedOutputBuffer()
+        self.packer = Packer(self.output_buffer)
+        self.unpacker = Unpacker()
+        self.failed = False
+        self.goodbye = False
+        self.x = None
+        self.requests = []
+
+    def handle(self):
+        """ Respond to the message currently framed in the input buffer.
+        """
+        self.unpacker.attach(self.input_buffer.frame())
+        size, signature = self.unpacker.unpack_structure_header()
+        fields = [self.unpacker.unpack() for _ in range(size)]
+        self.requests.append(signature)
+        self.respond(signature, fields)
+
+    def flush(self):
+        """ Return, and clear, all data queued for the client.
+        """
+        data = self.output_buffer.view().tobytes()
+        self.output_buffer.clear()
+        return data
+
+    def respond(self, signature, fields):
+        if signature == b"\x02":        # GOODBYE
+            self.goodbye = True
+        elif signature == b"\x0F":      # RESET
+            self.failed = False
+            self.send(b"\x70", {})
+        elif self.failed:
+            self.send(b"\x7E", {})
+        elif signature == b"\x01":      # HELLO
+            self.send(b"\x70", {"server": "Neo4j/3.5.0"})
+        elif signature == b"\x10":      # RUN
+            if fields[0] == "X":
+                self.failed = True
+                self.send(b"\x7F", {"code": "Neo.ClientError.Statement.SyntaxError", "message": "X"})
+            elif fields[0].startswith("CALL dbms.cluster.routing.getRoutingTable"):
+                self.routing_requests.append(fields[1])
+                address = "%s:%d" % self.address
+                self.x = {"ttl": 300, "servers": [{"role": role, "addresses": [address]}
+                                                  for role in ("ROUTE", "READ", "WRITE")]}
+                self.send(b"\x70", {"fields": ["ttl", "servers"]})
+            else:
+                self.x = fields[1].get("x")
+                self.send(b"\x70", {"fields": ["x"]})
+        elif signature == b"\x3F":      # PULL_ALL
+            if isinstance(self.x, dict):
+                self.send(b"\x71", [self.x["ttl"], self.x["servers"]])
+            else:
+                self.send(b"\x71", [self.x])
+            self.send(b"\x70", {"type": "r"})
+        else:
+            self.send(b"\x70", {})
+
+    def send(self, signature, value):
+        self.packer.pack_struct(signature, (value,))
+        self.output_buffer.chunk()
+        self.output_buffer.chunk()